@@ -0,0 +1,103 @@
+# importing libraries:
+import benchScene
+from maya import cmds
+from dpAutoRigSystem.Modules.Library import dpUtils
+
+CONTROL_COUNT = 1000
+# each Nth control gets an infinite rotation, that the schema can't write in mel:
+NOT_FINITE_STEP = 100
+
+
+# the addControlInfo attributes before the batched schema, kept to compare the results:
+def legacyControlInfo(cvNode, cvID="id_007_FkLine", className="dpFkLine", cvSize=1.0, cvDegree=1, cvDirection="+Y", cvRot=(0, 0, 0)):
+    """ Add the control information attributes with one addAttr and setAttr call for each attribute.
+    """
+    cmds.addAttr(cvNode, longName="dpControl", attributeType='bool')
+    cmds.setAttr(cvNode+".dpControl", 1)
+    cmds.addAttr(cvNode, longName="version", dataType='string')
+    cmds.setAttr(cvNode+".version", benchScene.dpAutoRig.DPAR_VERSION_PY3, type="string")
+    cmds.addAttr(cvNode, longName="controlID", dataType='string')
+    cmds.setAttr(cvNode+".controlID", cvID, type="string")
+    cmds.addAttr(cvNode, longName="className", dataType='string')
+    cmds.setAttr(cvNode+".className", className, type="string")
+    cmds.addAttr(cvNode, longName="size", attributeType='float')
+    cmds.setAttr(cvNode+".size", cvSize)
+    cmds.addAttr(cvNode, longName="degree", attributeType='short')
+    cmds.setAttr(cvNode+".degree", cvDegree)
+    cmds.addAttr(cvNode, longName="direction", dataType='string')
+    cmds.setAttr(cvNode+".direction", cvDirection, type="string")
+    cmds.addAttr(cvNode, longName="cvRotX", attributeType='double')
+    cmds.addAttr(cvNode, longName="cvRotY", attributeType='double')
+    cmds.addAttr(cvNode, longName="cvRotZ", attributeType='double')
+    cmds.setAttr(cvNode+".cvRotX", cvRot[0])
+    cmds.setAttr(cvNode+".cvRotY", cvRot[1])
+    cmds.setAttr(cvNode+".cvRotZ", cvRot[2])
+
+
+def schemaControlInfo(cvNode, cvID="id_007_FkLine", className="dpFkLine", cvSize=1.0, cvDegree=1, cvDirection="+Y", cvRot=(0, 0, 0)):
+    """ Add the same control information attributes running one batched schema.
+    """
+    dpUtils.addAttrSchema(cvNode, [
+                                    ("dpControl", "bool", 1),
+                                    ("version", "string", benchScene.dpAutoRig.DPAR_VERSION_PY3),
+                                    ("controlID", "string", cvID),
+                                    ("className", "string", className),
+                                    ("size", "float", cvSize),
+                                    ("degree", "short", cvDegree),
+                                    ("direction", "string", cvDirection),
+                                    ("cvRotX", "double", cvRot[0]),
+                                    ("cvRotY", "double", cvRot[1]),
+                                    ("cvRotZ", "double", cvRot[2])
+                                ])
+
+
+def getControlRot(n):
+    """ Return the control rotation of the given control index, infinite for each NOT_FINITE_STEP control.
+    """
+    if n % NOT_FINITE_STEP == 0:
+        return (0, 0, float("inf"))
+    return (0, 0, 0)
+
+
+def createNodeList(controlCount):
+    """ Create a new fake scene with the given number of transforms.
+    """
+    cmds.newScene()
+    return [cmds.createNode("transform", name="Bench_"+str(n)+"_Ctrl") for n in range(controlCount)]
+
+
+def getAttrValueList(nodeList):
+    """ Return the user defined attributes and values of the given nodes to compare the results.
+    """
+    return [[(attr, cmds.getAttr(node+"."+attr)) for attr in cmds.listAttr(node, userDefined=True)] for node in nodeList]
+
+
+def run(controlCount=CONTROL_COUNT, repeat=3):
+    """ Benchmark the legacy and the batched control information attributes.
+        Return a dictionary with the results.
+    """
+    nodeList = []
+    def setup():
+        nodeList[:] = createNodeList(controlCount)
+    legacyTime, legacyCalls, legacyResult = benchScene.timeIt(lambda: [legacyControlInfo(node, cvRot=getControlRot(n)) for n, node in enumerate(nodeList)], repeat, setup)
+    legacyValueList = getAttrValueList(nodeList)
+    newTime, newCalls, newResult = benchScene.timeIt(lambda: [schemaControlInfo(node, cvRot=getControlRot(n)) for n, node in enumerate(nodeList)], repeat, setup)
+    newValueList = getAttrValueList(nodeList)
+    resultDic = {
+                    "controls" : controlCount,
+                    "legacyTime" : legacyTime,
+                    "legacyCalls" : legacyCalls,
+                    "newTime" : newTime,
+                    "newCalls" : newCalls,
+                    "sameResult" : legacyValueList == newValueList
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("addControlInfo benchmark with %i controls:" % resultDic["controls"])
+    print("    legacy: %.4f s, %i cmds calls" % (resultDic["legacyTime"], resultDic["legacyCalls"]))
+    print("    schema: %.4f s, %i cmds calls" % (resultDic["newTime"], resultDic["newCalls"]))
+    print("    same attributes and values: %s" % resultDic["sameResult"])
+    print("    the fake time only measures Python overhead, in Maya each saved call is a round trip to the command engine.")
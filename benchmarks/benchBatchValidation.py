@@ -0,0 +1,97 @@
+# importing libraries:
+import benchScene
+import os
+import time
+import shutil
+import tempfile
+from maya import cmds
+from dpAutoRigSystem.Validator import dpValidatorBatch
+
+SCENE_COUNT = 12
+# node count of the scenes, repeated to get small and big scenes in the list:
+SCENE_SIZE_LIST = [2000, 100, 200, 1000, 100, 300]
+WORKER_COUNT = 3
+PRESET = "AllOn"
+# the scene result keys changing on each run:
+IGNORE_KEY_LIST = ["time"]
+
+
+def createScenes(sceneFolder, sceneCount=SCENE_COUNT):
+    """ Save the given number of fake rigged scenes with different sizes and a broken scene file.
+        Return the scene list.
+    """
+    for n in range(sceneCount):
+        benchScene.createRiggedScene(SCENE_SIZE_LIST[n % len(SCENE_SIZE_LIST)])
+        cmds.file(rename=os.path.join(sceneFolder, "dpAsset_%02i_Rig.ma" % n))
+        cmds.file(save=True)
+    with open(os.path.join(sceneFolder, "dpBroken_Rig.ma"), "w") as brokenFile:
+        brokenFile.write("not a scene")
+    cmds.newScene()
+    return dpValidatorBatch.findScenes([sceneFolder])
+
+
+def chunkScenes(sceneList, workerCount):
+    """ Split the scene list in consecutive chunks with the same number of scenes, without looking at their sizes.
+    """
+    chunkSize = -(-len(sceneList) // workerCount)
+    return [[[index, scene] for index, scene in enumerate(sceneList)][c:c+chunkSize] for c in range(0, len(sceneList), chunkSize)]
+
+
+def getMaxLoad(jobListList):
+    """ Return the scene file size of the worker with more work.
+    """
+    return max(sum(os.path.getsize(scene) for index, scene in jobList) for jobList in jobListList)
+
+
+def getComparableScenes(reportDic):
+    """ Return the scene results without the keys changing on each run and the error traceback.
+    """
+    return [dict((key, value) for key, value in sceneResult.items() if not key in IGNORE_KEY_LIST and key != "error") for sceneResult in reportDic["scenes"]]
+
+
+def run(sceneCount=SCENE_COUNT, workerCount=WORKER_COUNT):
+    """ Benchmark the batch validation of saved fake scenes in this process and with a pool of worker processes.
+        The workers run this Python with the fake Maya, like the mayapy workers run with Maya.
+        Return a dictionary with the results.
+    """
+    tempDir = tempfile.mkdtemp()
+    pythonPath = os.environ.get("PYTHONPATH", "")
+    try:
+        sceneList = createScenes(tempDir, sceneCount)
+        chunkLoad = getMaxLoad(chunkScenes(sceneList, workerCount))
+        scheduleLoad = getMaxLoad(dpValidatorBatch.scheduleScenes(sceneList, workerCount))
+        reportPath = os.path.join(tempDir, "report.json")
+        startTime = time.perf_counter()
+        singleReport = dpValidatorBatch.runBatch(sceneList, PRESET, reportPath)
+        singleTime = time.perf_counter()-startTime
+        os.environ["PYTHONPATH"] = os.pathsep.join([benchScene.FAKE_MAYA_PATH, pythonPath])
+        startTime = time.perf_counter()
+        poolReport = dpValidatorBatch.runBatch(sceneList, PRESET, reportPath, workerCount)
+        poolTime = time.perf_counter()-startTime
+        resultDic = {
+                        "scenes" : len(sceneList),
+                        "workers" : poolReport["workers"],
+                        "chunkLoad" : chunkLoad,
+                        "scheduleLoad" : scheduleLoad,
+                        "singleTime" : singleTime,
+                        "poolTime" : poolTime,
+                        "summary" : poolReport["summary"],
+                        "issueValidators" : sorted(name for name, validatorSummary in poolReport["validators"].items() if validatorSummary["issueScenes"]),
+                        "sameResult" : getComparableScenes(singleReport) == getComparableScenes(poolReport),
+                        "reportSize" : os.path.getsize(reportPath)
+                    }
+    finally:
+        os.environ["PYTHONPATH"] = pythonPath
+        shutil.rmtree(tempDir, ignore_errors=True)
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("batch validation benchmark with %i scenes:" % resultDic["scenes"])
+    print("    biggest worker load: %i bytes by scene count chunks, %i bytes scheduled by size" % (resultDic["chunkLoad"], resultDic["scheduleLoad"]))
+    print("    this process:        %.4f s" % resultDic["singleTime"])
+    print("    %i workers:           %.4f s" % (resultDic["workers"], resultDic["poolTime"]))
+    print("    summary: %s" % ", ".join("%s %s" % (key, value) for key, value in resultDic["summary"].items() if key != "time"))
+    print("    validators with issues: %s" % ", ".join(resultDic["issueValidators"]))
+    print("    same results: %s, report %i bytes" % (resultDic["sameResult"], resultDic["reportSize"]))
@@ -0,0 +1,171 @@
+# importing libraries:
+import benchScene
+from maya import cmds
+from dpAutoRigSystem.Controls import dpBaseControlClass
+
+CONTROL_COUNT = 500
+DIRECTION_LIST = ["+Y", "-X", "+X", "-Y", "-Z", "+Z"]
+ROTATION_LIST = [(0, 0, 0), (0, 0, 90), (30, 45, 60)]
+COMBINED_TYPE_LIST = ["Arrow", "Ball", "Diamond", "DiamondFlat", "Dodecagram", "EyeFlat", "Hexagram", "Octagram", "OvalDisc", "Smile"]
+
+
+# the cvCreate curve path before the template cache, kept to compare the results:
+def legacyCombineCurves(controlInstance, curveList):
+    """ Combine all guiven curve to just one main curve and return it.
+    """
+    mainCurve = curveList[0]
+    cmds.makeIdentity(mainCurve, translate=True, rotate=True, scale=True, apply=True)
+    for item in curveList[1:]:
+        cmds.makeIdentity(item, translate=True, rotate=True, scale=True, apply=True)
+        controlInstance.ctrls.transferShape(True, False, item, [mainCurve])
+    cmds.setAttr(mainCurve+".className", controlInstance.guideModuleName, type="string")
+    return mainCurve
+
+
+def legacySetControlDirection(controlInstance, cvNode, cvDirection):
+    """ Rotate the node given to have the correct direction orientation.
+    """
+    if cvDirection == "-X":
+        cmds.setAttr(cvNode+".rotateX", 90)
+        cmds.setAttr(cvNode+".rotateY", -90)
+    elif cvDirection == "+X":
+        cmds.setAttr(cvNode+".rotateX", -90)
+        cmds.setAttr(cvNode+".rotateY", -90)
+    elif cvDirection == "-Y":
+        cmds.setAttr(cvNode+".rotateZ", 180)
+    elif cvDirection == "-Z":
+        cmds.setAttr(cvNode+".rotateX", -90)
+    elif cvDirection == "+Z":
+        cmds.setAttr(cvNode+".rotateX", 90)
+    else:
+        pass #default +Y, just pass
+    cmds.makeIdentity(cvNode, rotate=True, apply=True)
+    # rotate and freezeTransformation from given cvRot vector:
+    cmds.rotate(controlInstance.cvRot[0], controlInstance.cvRot[1], controlInstance.cvRot[2], controlInstance.cvCurve)
+    cmds.makeIdentity(controlInstance.cvCurve, rotate=True, apply=True)
+
+
+def legacyCurve(controlInstance, cvName, cvSize, cvDegree, cvDirection, cvRot, combine=False):
+    """ Create the control curve with sized points, freeze the combined shape transformations
+        and orient it by rotating and freezing the transform, like the cvCreate did.
+    """
+    controlInstance.cvName = cvName
+    controlInstance.cvID = None
+    controlInstance.cvSize = cvSize
+    controlInstance.cvDegree = cvDegree
+    controlInstance.cvDirection = cvDirection
+    controlInstance.cvRot = cvRot
+    if combine:
+        curveList = []
+        for shapeModule, sizeFactor, transformList in controlInstance.getCombineShapeList():
+            shapeInstance = controlInstance.dpUIinst.initExtraModule(shapeModule, controlInstance.controlsGuideDir)
+            shapeCurve = legacyCurve(shapeInstance, cvName, cvSize*sizeFactor, cvDegree, "+Y", (0, 0, 0))
+            for transformDic in transformList:
+                for attr in ["translate", "rotate", "scale"]:
+                    if attr in transformDic:
+                        for axis, value in zip("XYZ", transformDic[attr]):
+                            value = value*cvSize if attr == "translate" else value
+                            cmds.setAttr(shapeCurve+"."+attr+axis, value)
+                cmds.makeIdentity(shapeCurve, apply=True)
+            curveList.append(shapeCurve)
+        controlInstance.cvCurve = legacyCombineCurves(controlInstance, curveList)
+    else:
+        if cvDegree == 1:
+            controlInstance.getLinearPoints()
+        else:
+            controlInstance.getCubicPoints()
+        controlInstance.cvCurve = controlInstance.createCurve(cvName, cvDegree, controlInstance.cvPointList, controlInstance.cvKnotList, controlInstance.cvPeriodic, False)
+    legacySetControlDirection(controlInstance, controlInstance.cvCurve, cvDirection)
+    return controlInstance.cvCurve
+
+
+def getShapePointList(curve):
+    """ Return the point list of each fake curve shape.
+    """
+    return [cmds.getNode(shape).pointList for shape in cmds.listRelatives(curve, shapes=True, fullPath=True) or []]
+
+
+def comparePointList(legacyPointList, newPointList, tolerance=1e-6):
+    """ Return True if both shape point lists have the same points.
+    """
+    if len(legacyPointList) != len(newPointList):
+        return False
+    for legacyShape, newShape in zip(legacyPointList, newPointList):
+        if len(legacyShape) != len(newShape):
+            return False
+        for legacyPoint, newPoint in zip(legacyShape, newShape):
+            if any(abs(a-b) > tolerance for a, b in zip(legacyPoint, newPoint)):
+                return False
+    return True
+
+
+def getControlInstanceDic(fakeUI):
+    """ Return a dictionary with the control class name as key and its instance as value.
+    """
+    return dict((controlInstance.guideModuleName, controlInstance) for controlInstance in fakeUI.controlInstanceList)
+
+
+def checkTemplates(fakeUI):
+    """ Compare the legacy curves with the template curves for all controls, degrees, directions and some rotations.
+        Return the list of different parameters.
+    """
+    diffList = []
+    for ctrlType, controlInstance in sorted(getControlInstanceDic(fakeUI).items()):
+        combine = ctrlType in COMBINED_TYPE_LIST
+        for cvDegree in [1, 3]:
+            for cvDirection in DIRECTION_LIST:
+                for cvRot in ROTATION_LIST:
+                    cmds.newScene()
+                    legacyPointList = getShapePointList(legacyCurve(controlInstance, "Legacy_Ctrl", 2.5, cvDegree, cvDirection, cvRot, combine))
+                    newCurve = fakeUI.ctrls.cvControl(ctrlType, "New_Ctrl", 2.5, cvDegree, cvDirection, cvRot)
+                    if not comparePointList(legacyPointList, getShapePointList(newCurve)):
+                        diffList.append((ctrlType, cvDegree, cvDirection, cvRot))
+    return diffList
+
+
+def run(controlCount=CONTROL_COUNT, repeat=3):
+    """ Benchmark the control creation with the legacy path, the template path without cache and the cached templates.
+        Return a dictionary with the results.
+    """
+    fakeUI = benchScene.FakeUI()
+    controlInstanceDic = getControlInstanceDic(fakeUI)
+    ctrlTypeList = sorted(controlInstanceDic)
+    def getParameters(n):
+        ctrlType = ctrlTypeList[n % len(ctrlTypeList)]
+        return ctrlType, 1+n%3, 1+2*(n%2), DIRECTION_LIST[n % len(DIRECTION_LIST)], ROTATION_LIST[n % len(ROTATION_LIST)]
+    def createLegacy():
+        for n in range(controlCount):
+            ctrlType, cvSize, cvDegree, cvDirection, cvRot = getParameters(n)
+            legacyCurve(controlInstanceDic[ctrlType], ctrlType+"_"+str(n)+"_Ctrl", cvSize, cvDegree, cvDirection, cvRot, ctrlType in COMBINED_TYPE_LIST)
+    def createTemplate(clearCache):
+        for n in range(controlCount):
+            ctrlType, cvSize, cvDegree, cvDirection, cvRot = getParameters(n)
+            if clearCache:
+                dpBaseControlClass.clearCurveTemplateCache()
+            fakeUI.ctrls.cvControl(ctrlType, ctrlType+"_"+str(n)+"_Ctrl", cvSize, cvDegree, cvDirection, cvRot)
+    legacyTime, legacyCalls, legacyResult = benchScene.timeIt(createLegacy, repeat, cmds.newScene)
+    missTime, missCalls, missResult = benchScene.timeIt(lambda: createTemplate(True), repeat, cmds.newScene)
+    dpBaseControlClass.clearCurveTemplateCache()
+    createTemplate(False)
+    cachedTime, cachedCalls, cachedResult = benchScene.timeIt(lambda: createTemplate(False), repeat, cmds.newScene)
+    resultDic = {
+                    "controls" : controlCount,
+                    "legacyTime" : legacyTime,
+                    "legacyCalls" : legacyCalls,
+                    "missTime" : missTime,
+                    "missCalls" : missCalls,
+                    "cachedTime" : cachedTime,
+                    "cachedCalls" : cachedCalls,
+                    "cachedTemplates" : len(dpBaseControlClass.CURVE_TEMPLATE_CACHE),
+                    "diffControls" : checkTemplates(fakeUI)
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("control curve benchmark with %i controls:" % resultDic["controls"])
+    print("    legacy:     %.4f s, %i cmds calls" % (resultDic["legacyTime"], resultDic["legacyCalls"]))
+    print("    no cache:   %.4f s, %i cmds calls" % (resultDic["missTime"], resultDic["missCalls"]))
+    print("    cached:     %.4f s, %i cmds calls, %i templates" % (resultDic["cachedTime"], resultDic["cachedCalls"], resultDic["cachedTemplates"]))
+    print("    different controls: %s" % (resultDic["diffControls"] or "none"))
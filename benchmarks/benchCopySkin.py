@@ -0,0 +1,113 @@
+# importing libraries:
+import benchScene
+import types
+from maya import cmds
+from dpAutoRigSystem.Deforms import dpSkinning
+
+MESH_COUNT = 1000
+JOINT_COUNT = 20
+# meshes only in the render group and not skinned same name meshes in both groups:
+UNMATCHED_COUNT = 10
+NOT_SKINNED_COUNT = 10
+# proxy meshes with a different topology, copied by the surface association:
+CHANGED_COUNT = 10
+
+
+# the serializeCopySkin same name loop before the short name dictionary, kept to compare the results:
+def legacySerializeCopySkin(self, sourceList, destinationList, oneSource=True, byUVs=False, *args):
+    """ Serialize the copy skinning for many items with the same name comparing each source with all destinations.
+    """
+    ranList = []
+    for sourceItem in sourceList:
+        if not sourceItem in ranList:
+            for item in reversed(destinationList): #to avoid find the same item in the same given list
+                if not sourceItem == item:
+                    if sourceItem[sourceItem.rfind("|")+1:] == item[item.rfind("|")+1:]:
+                        if self.checkExistingSkinClusterNode(sourceItem)[0]:
+                            self.runCopySkin(sourceItem, item, byUVs)
+                        elif self.checkExistingSkinClusterNode(item)[0]:
+                            self.runCopySkin(item, sourceItem, byUVs)
+                        # To avoid repeat the same item in the same given list
+                        ranList.append(item)
+                        break
+            ranList.append(sourceItem)
+
+
+def createSkinScene(meshCount=MESH_COUNT, jointCount=JOINT_COUNT):
+    """ Create a new fake scene with a skinned render group and a proxy group with the same mesh names not skinned yet.
+        Some render meshes don't have a proxy, some meshes with the same name aren't skinned and some proxies have another topology.
+    """
+    cmds.newScene()
+    jointList = benchScene.createJointList(jointCount)
+    renderGrp = cmds.createNode("transform", name="Render_Grp")
+    proxyGrp = cmds.createNode("transform", name="Proxy_Grp")
+    for n in range(meshCount):
+        renderMesh = benchScene.createGridMesh("Body_"+str(n)+"_Geo", 2, 2, renderGrp)
+        if n < meshCount-NOT_SKINNED_COUNT:
+            cmds.skinCluster(jointList[n % jointCount:]+jointList[:n % jointCount], renderMesh, name="Body_"+str(n)+"_SC")
+        if n >= UNMATCHED_COUNT+CHANGED_COUNT:
+            benchScene.createGridMesh("Body_"+str(n)+"_Geo", 2, 2, proxyGrp)
+        elif n >= UNMATCHED_COUNT:
+            benchScene.createGridMesh("Body_"+str(n)+"_Geo", 3, 3, proxyGrp)
+
+
+def getSkinData():
+    """ Return the influences and weights of each skinned mesh by its long name.
+    """
+    skinDataDic = {}
+    for skinClusterNode in cmds.ls(type="skinCluster"):
+        node = cmds.getNode(skinClusterNode)
+        skinDataDic[cmds.longName(node.geometry)] = ([influenceNode.name for influenceNode in node.influenceList], node.weightList)
+    return skinDataDic
+
+
+def run(meshCount=MESH_COUNT, repeat=1):
+    """ Benchmark the copy skin same name between a skinned render group and a proxy group with the legacy pair search and the short name dictionary.
+        Return a dictionary with the results.
+    """
+    fakeUI = benchScene.FakeUI()
+    skinInst = dpSkinning.Skinning(fakeUI)
+    setup = lambda: createSkinScene(meshCount)
+    newTime, newCalls, reportDic = benchScene.timeIt(lambda: skinInst.serializeCopySkin(cmds.ls(type="transform", long=True), cmds.ls(type="transform", long=True), False), repeat, setup)
+    newCallDic = cmds.getCallCountDic()
+    newSkinData = getSkinData()
+    # without the topology hash all the meshes use the surface association:
+    associationInst = dpSkinning.Skinning(fakeUI)
+    associationInst.getTopologyHash = lambda *args: None
+    associationTime, associationCalls, associationResult = benchScene.timeIt(lambda: associationInst.serializeCopySkin(cmds.ls(type="transform", long=True), cmds.ls(type="transform", long=True), False), repeat, setup)
+    associationCallDic = cmds.getCallCountDic()
+    associationSkinData = getSkinData()
+    legacyInst = dpSkinning.Skinning(fakeUI)
+    legacyInst.serializeCopySkin = types.MethodType(legacySerializeCopySkin, legacyInst)
+    legacyTime, legacyCalls, legacyResult = benchScene.timeIt(lambda: legacyInst.serializeCopySkin(cmds.ls(type="transform", long=True), cmds.ls(type="transform", long=True), False), repeat, setup)
+    legacyCallDic = cmds.getCallCountDic()
+    resultDic = {
+                    "meshes" : meshCount*2-UNMATCHED_COUNT,
+                    "legacyTime" : legacyTime,
+                    "legacyCalls" : legacyCalls,
+                    "legacyHistory" : legacyCallDic.get("listHistory", 0),
+                    "newTime" : newTime,
+                    "newCalls" : newCalls,
+                    "newHistory" : newCallDic.get("listHistory", 0),
+                    "newCopySkinWeights" : newCallDic.get("copySkinWeights", 0),
+                    "associationTime" : associationTime,
+                    "associationCopySkinWeights" : associationCallDic.get("copySkinWeights", 0),
+                    "byIndex" : len(reportDic["byIndex"]),
+                    "sameAssociation" : newSkinData == associationSkinData,
+                    "copied" : len(reportDic["copied"]),
+                    "notSkinned" : len(reportDic["notSkinned"]),
+                    "unmatched" : len(reportDic["unmatched"]),
+                    "sameSkin" : newSkinData == getSkinData()
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    for meshCount in [300, MESH_COUNT, 3000]:
+        resultDic = run(meshCount)
+        print("copy skin same name benchmark with %i meshes:" % resultDic["meshes"])
+        print("    legacy pair search: %.4f s, %i cmds calls, %i history queries" % (resultDic["legacyTime"], resultDic["legacyCalls"], resultDic["legacyHistory"]))
+        print("    name dictionary:    %.4f s, %i cmds calls, %i history queries" % (resultDic["newTime"], resultDic["newCalls"], resultDic["newHistory"]))
+        print("    report: %i copied, %i same name without skinning, %i unmatched, same skinning: %s" % (resultDic["copied"], resultDic["notSkinned"], resultDic["unmatched"], resultDic["sameSkin"]))
+        print("    surface association only: %.4f s, %i copySkinWeights calls" % (resultDic["associationTime"], resultDic["associationCopySkinWeights"]))
+        print("    topology hash:            %.4f s, %i copySkinWeights calls, %i copied by vertex index, same skinning: %s" % (resultDic["newTime"], resultDic["newCopySkinWeights"], resultDic["byIndex"], resultDic["sameAssociation"]))
@@ -0,0 +1,93 @@
+# importing libraries:
+import benchScene
+import sys
+from maya import cmds
+
+NODE_COUNT_LIST = [1000, 10000, 100000]
+# the legacy validator is quadratic, so it only runs in the smaller scenes:
+LEGACY_MAX_COUNT = 1000
+VALIDATOR_MODULE = "dpAutoRigSystem.Validator.CheckIn.dpDuplicatedName"
+
+
+# the runValidator duplicated name search before the short name grouping, kept to compare the results:
+def legacyDuplicatedName():
+    """ Find the duplicated names comparing each short name with all next ones like the validator did in verify mode.
+        Return the list of found nodes.
+    """
+    foundList = []
+    toCheckList = cmds.ls(selection=False, long=False)
+    if toCheckList:
+        foundDuplicated = False
+        for node in toCheckList:
+            if "|" in node:
+                foundDuplicated = True
+                break
+        if foundDuplicated:
+            sizeList = []
+            for element in toCheckList:
+                sizeList.append([element.count("|"), element])
+            sizeList.sort()
+            sizeList.reverse()
+            orderedObjList = [value[1] for value in sizeList]
+            shortNameList = []
+            for longName in orderedObjList:
+                if "|" in longName:
+                    shortNameList.append(longName[longName.rfind("|")+1:])
+                else:
+                    shortNameList.append(longName)
+            for i, obj in enumerate(shortNameList):
+                anotherList = shortNameList[i+1:]
+                for item in anotherList:
+                    if cmds.objExists(orderedObjList[i]):
+                        if obj == item:
+                            foundList.append(orderedObjList[i])
+    return foundList
+
+
+def createDuplicatedScene(nodeCount):
+    """ Create a new fake scene with blocks of 10 nodes, a unique block group with a chain of 9 children.
+        Each pair of blocks has the same children names, so 90% of the nodes have a duplicated name.
+    """
+    cmds.newScene()
+    for b in range(nodeCount // 10):
+        parentNode = cmds.createNode("transform", name="Block_"+str(b)+"_Grp")
+        for c in range(9):
+            parentNode = cmds.createNode("transform", name="Item_"+str(b // 2)+"_"+str(c), parent=parentNode)
+
+
+def getDuplicatedCount():
+    """ Return the number of nodes that have the same short name of another node.
+    """
+    shortNameList = [longName[longName.rfind("|")+1:] for longName in cmds.ls(long=True)]
+    return len(shortNameList)-len(set(shortNameList))
+
+
+def run(nodeCountList=NODE_COUNT_LIST, repeat=3):
+    """ Benchmark the duplicated name validator in verify and fix modes.
+        Return a list with a result dictionary for each scene size.
+    """
+    validatorInst = benchScene.FakeUI().initValidatorModule(VALIDATOR_MODULE)
+    resultList = []
+    for nodeCount in nodeCountList:
+        resultDic = {"nodes" : nodeCount}
+        createDuplicatedScene(nodeCount)
+        resultDic["duplicated"] = getDuplicatedCount()
+        if nodeCount <= LEGACY_MAX_COUNT:
+            legacyTime, legacyCalls, legacyFoundList = benchScene.timeIt(legacyDuplicatedName, repeat)
+            resultDic.update({"legacyTime" : legacyTime, "legacyCalls" : legacyCalls, "legacyFound" : len(set(legacyFoundList))})
+        verifyTime, verifyCalls, dataLogDic = benchScene.timeIt(validatorInst.runValidator, repeat)
+        resultDic.update({"verifyTime" : verifyTime, "verifyCalls" : verifyCalls, "verifyFound" : len(validatorInst.checkedObjList)})
+        fixTime, fixCalls, dataLogDic = benchScene.timeIt(lambda: validatorInst.runValidator(verifyMode=False), 1, lambda: createDuplicatedScene(nodeCount))
+        resultDic.update({"fixTime" : fixTime, "fixCalls" : fixCalls, "fixed" : validatorInst.resultOkList.count(True), "duplicatedAfterFix" : getDuplicatedCount()})
+        resultList.append(resultDic)
+    return resultList
+
+
+if __name__ == "__main__":
+    nodeCountList = [int(arg) for arg in sys.argv[1:]] or NODE_COUNT_LIST
+    for resultDic in run(nodeCountList):
+        print("duplicated name validator with %i nodes, %i duplicated:" % (resultDic["nodes"], resultDic["duplicated"]))
+        if "legacyTime" in resultDic:
+            print("    legacy verify: %.4f s, %i cmds calls, %i found" % (resultDic["legacyTime"], resultDic["legacyCalls"], resultDic["legacyFound"]))
+        print("    verify:        %.4f s, %i cmds calls, %i found" % (resultDic["verifyTime"], resultDic["verifyCalls"], resultDic["verifyFound"]))
+        print("    fix:           %.4f s, %i cmds calls, %i fixed, %i duplicated after fix" % (resultDic["fixTime"], resultDic["fixCalls"], resultDic["fixed"], resultDic["duplicatedAfterFix"]))
@@ -0,0 +1,141 @@
+# importing libraries:
+import benchScene
+from maya import cmds
+from dpAutoRigSystem.Modules.Library import dpUtils
+
+GUIDE_COUNT = 500
+SIBLING_COUNT = 3
+
+
+# the hook function before the top-down walk, kept to compare the results:
+def legacyHook():
+    """ Mount a dictionary with guide modules hierarchies.
+        Return a dictionary with the father and children lists inside of each guide like:
+        {guide{'guideModuleNamespace':"...", 'guideModuleName':"...", 'guideCustomName':"...", 'guideMirrorAxis':"...", 'guideMirrorName':"...", 'fatherGuide':"...", 'fatherNode':"...", 'fatherModule':"...", 'fatherCustomName':"...", 'fatherMirrorAxis':"...", 'fatherMirrorName':"...", 'fatherGuideLoc':"...", 'childrenList':[...]}}
+    """
+    hookDic = {}
+    allList = cmds.ls(type='transform')
+    for item in allList:
+        if cmds.objExists(item+".guideBase") and cmds.getAttr(item+".guideBase") == 1:
+            # module info:
+            guideModuleNamespace = item[:item.find(":")]
+            guideModuleName      = item[:item.find("__")]
+            guideInstance        = item[item.rfind("__")+2:item.find(":")]
+            guideCustomName      = cmds.getAttr(item+".customName")
+            guideMirrorAxis      = cmds.getAttr(item+".mirrorAxis")
+            tempAMirrorName      = cmds.getAttr(item+".mirrorName")
+            guideMirrorName      = [tempAMirrorName[0]+"_" , tempAMirrorName[len(tempAMirrorName)-1:]+"_"]
+            
+            # get children:
+            guideChildrenList = []
+            childrenList = cmds.listRelatives(item, allDescendents=True, type='transform')
+            if childrenList:
+                for child in childrenList:
+                    if cmds.objExists(child+".guideBase"):
+                        if cmds.getAttr(child+".guideBase"):
+                            if cmds.getAttr(child+".guideBase") == 1:
+                                guideChildrenList.append(child)
+                    if cmds.objExists(child+".hookNode"):
+                        hookNode = cmds.getAttr(child+".hookNode")
+            
+            # get father:
+            guideParentList = []
+            fatherNodeList = []
+            parentNode = ""
+            parentList = cmds.listRelatives(item, parent=True, type='transform')
+            if parentList:
+                nextLoop = True
+                while nextLoop:
+                    if cmds.objExists(parentList[0]+".guideBase") and cmds.getAttr(parentList[0]+".guideBase") == 1:
+                        guideParentList.append(parentList[0])
+                        nextLoop = False
+                    else:
+                        if not fatherNodeList:
+                            fatherNodeList.append(parentList[0])
+                        parentList = cmds.listRelatives(parentList[0], parent=True, type='transform')
+                        if parentList:
+                            nextLoop = True
+                        else:
+                            nextLoop = False
+                if guideParentList:
+                    # father info:
+                    guideParent      = guideParentList[0]
+                    fatherModule     = guideParent[:guideParent.find("__")]
+                    fatherInstance   = guideParent[guideParent.rfind("__")+2:guideParent.find(":")]
+                    fatherCustomName = cmds.getAttr(guideParent+".customName")
+                    fatherMirrorAxis = cmds.getAttr(guideParent+".mirrorAxis")
+                    tempBMirrorName  = cmds.getAttr(guideParent+".mirrorName")
+                    fatherMirrorName = [tempBMirrorName[0]+"_" , tempBMirrorName[len(tempBMirrorName)-1:]+"_"]
+                    if fatherNodeList:
+                        fatherGuideLoc = fatherNodeList[0][fatherNodeList[0].find("Guide_")+6:]
+                    else:
+                        guideParentChildrenList = cmds.listRelatives(guideParent, children=True, type='transform')
+                        if guideParentChildrenList:
+                            for guideParentChild in guideParentChildrenList:
+                                if cmds.objExists(guideParentChild+'.nJoint'):
+                                    if cmds.getAttr(guideParentChild+'.nJoint') == 1:
+                                        if guideParent[:guideParent.rfind(":")] in guideParentChild:
+                                            fatherNodeList = [guideParentChild]
+                                            fatherGuideLoc = guideParentChild[guideParentChild.find("Guide_")+6:]
+                
+                # parentNode info:
+                parentNode = cmds.listRelatives(item, parent=True, type='transform')[0]
+            
+            # mounting dictionary:
+            if guideParentList and guideChildrenList:
+                hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":guideParent, "fatherNode":fatherNodeList[0], "fatherModule":fatherModule, "fatherInstance":fatherInstance, "fatherCustomName":fatherCustomName, "fatherMirrorAxis":fatherMirrorAxis, "fatherMirrorName":fatherMirrorName, "fatherGuideLoc":fatherGuideLoc, "parentNode":parentNode, "childrenList":guideChildrenList}
+            elif guideParentList:
+                hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":guideParent, "fatherNode":fatherNodeList[0], "fatherModule":fatherModule, "fatherInstance":fatherInstance, "fatherCustomName":fatherCustomName, "fatherMirrorAxis":fatherMirrorAxis, "fatherMirrorName":fatherMirrorName, "fatherGuideLoc":fatherGuideLoc, "parentNode":parentNode, "childrenList":[]}
+            elif guideChildrenList:
+                hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":"", "fatherNode":"", "fatherModule":"", "fatherInstance":"", "fatherCustomName":"", "fatherMirrorAxis":"", "fatherMirrorName":"", "fatherGuideLoc":"", "parentNode":parentNode, "childrenList":guideChildrenList}
+            else:
+                hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":"", "fatherNode":"", "fatherModule":"", "fatherInstance":"", "fatherCustomName":"", "fatherMirrorAxis":"", "fatherMirrorName":"", "fatherGuideLoc":"", "parentNode":parentNode, "childrenList":[]}
+    return hookDic
+
+
+
+
+def createSiblingGuides(fatherGuide, guideCount=GUIDE_COUNT, siblingCount=SIBLING_COUNT):
+    """ Parent sibling guides to the given guide base in the reverse name order and add a second joint guide with nJoint 1 after them.
+        The hook must keep the scene order of the children and use the last joint guide with nJoint 1, like the legacy hook.
+    """
+    for s in reversed(range(siblingCount)):
+        benchScene.createGuide(benchScene.MODULE_LIST[0], guideCount+s+1, fatherGuide)
+    jointGuide = cmds.createNode("transform", name=fatherGuide[:fatherGuide.rfind(":")]+":Guide_JointEnd", parent=fatherGuide)
+    cmds.addAttr(jointGuide, longName="nJoint", attributeType="long")
+    cmds.setAttr(jointGuide+".nJoint", 1)
+
+
+def compareHookDic(legacyDic, newDic):
+    """ Compare the hook dictionaries, including the order of the children lists.
+        Return a list with the different guides.
+    """
+    return [guide for guide in set(legacyDic) | set(newDic) if legacyDic.get(guide) != newDic.get(guide)]
+
+
+def run(guideCount=GUIDE_COUNT, repeat=3):
+    """ Benchmark the legacy and the current hook function in a synthetic guide hierarchy.
+        Return a dictionary with the results.
+    """
+    guideBaseList = benchScene.createGuideHierarchy(guideCount)
+    createSiblingGuides(guideBaseList[0], guideCount)
+    legacyTime, legacyCalls, legacyDic = benchScene.timeIt(legacyHook, repeat)
+    newTime, newCalls, newDic = benchScene.timeIt(dpUtils.hook, repeat)
+    resultDic = {
+                    "guides" : guideCount+SIBLING_COUNT,
+                    "legacyTime" : legacyTime,
+                    "legacyCalls" : legacyCalls,
+                    "newTime" : newTime,
+                    "newCalls" : newCalls,
+                    "speedUp" : legacyTime/newTime if newTime else None,
+                    "diffGuides" : len(compareHookDic(legacyDic, newDic))
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("hook benchmark with %i guides:" % resultDic["guides"])
+    print("    legacy: %.4f s, %i cmds calls" % (resultDic["legacyTime"], resultDic["legacyCalls"]))
+    print("    new:    %.4f s, %i cmds calls" % (resultDic["newTime"], resultDic["newCalls"]))
+    print("    speed up: %.1fx, different guides: %i" % (resultDic["speedUp"], resultDic["diffGuides"]))
@@ -0,0 +1,95 @@
+# importing libraries:
+import benchScene
+import benchInvertedNormals
+from maya import cmds
+from dpAutoRigSystem.Validator import dpValidationCache
+
+VALIDATOR_MODULE = benchInvertedNormals.VALIDATOR_MODULE
+MESH_COUNT = 16
+MESH_FACE_COUNT = 40000
+# the log keys compared between the full and the incremental runs:
+COMPARE_KEY_LIST = ["checkedObjList", "foundIssueList", "resultOkList"]
+
+
+def createMeshes(meshCount=MESH_COUNT, meshFaceCount=MESH_FACE_COUNT, prefix="Body"):
+    """ Create big fake meshes, the first one with inverted normals.
+    """
+    side = int(meshFaceCount**0.5)
+    for m in range(meshCount):
+        benchInvertedNormals.createMesh(prefix+"_"+str(m)+"_Geo", *benchInvertedNormals.getGridFaces(side, side, set([side*side // 2]) if m == 0 else None))
+
+
+def createSameNameMeshes(meshFaceCount=MESH_FACE_COUNT):
+    """ Create a mesh with inverted normals named like a clean one in another group
+        and an intermediate shape with inverted normals in a clean mesh, that isn't verified.
+    """
+    side = int(meshFaceCount**0.5)
+    transform = cmds.createNode("transform", name="Body_1_Geo", parent=cmds.group(empty=True, name="Same_Grp"))
+    shapeNode = cmds.getNode(cmds.createNode("mesh", name="Body_1_GeoShape", parent=transform))
+    shapeNode.vertexCountList, shapeNode.vertexList = benchInvertedNormals.getGridFaces(side, side, set([0]))
+    origNode = cmds.getNode(cmds.createNode("mesh", name="Body_2_GeoShapeOrig", parent="Body_2_Geo"))
+    origNode.attrDic["intermediateObject"] = True
+    origNode.vertexCountList, origNode.vertexList = benchInvertedNormals.getGridFaces(side, side, set([0]))
+
+
+def getComparableData(dataLogDic):
+    """ Return the validation result keys that must be the same in the full and the incremental runs.
+    """
+    return dict((key, dataLogDic[key]) for key in COMPARE_KEY_LIST)
+
+
+def run(meshCount=MESH_COUNT, repeat=3):
+    """ Benchmark the inverted normals verify with a full run, an incremental run without changes
+        and an incremental run after adding new meshes to the scene, one of them with the name of a verified mesh.
+        Then it checks that an incremental verify of selected meshes keeps the stored results of the other meshes.
+        Return a dictionary with the results.
+    """
+    cmds.newScene()
+    createMeshes(meshCount)
+    validatorInst = benchScene.FakeUI().initValidatorModule(VALIDATOR_MODULE)
+    fullTime, fullCalls, fullData = benchScene.timeIt(validatorInst.runValidator, repeat)
+    fullData = getComparableData(fullData)
+    validatorInst.incremental = True
+    # the unsaved scene cache is kept in memory, start it with a full analysis:
+    dpValidationCache.getCache(validatorInst.dpUIinst.dpData+"/"+validatorInst.dpUIinst.dpLog).clear()
+    firstTime, firstCalls, firstData = benchScene.timeIt(validatorInst.runValidator, 1)
+    firstSkipped = firstData["skippedCount"]
+    unchangedTime, unchangedCalls, unchangedData = benchScene.timeIt(validatorInst.runValidator, repeat)
+    unchangedSkipped = unchangedData["skippedCount"]
+    # change the scene with new meshes to analyze only them:
+    createMeshes(2, prefix="New")
+    createSameNameMeshes()
+    changedTime, changedCalls, changedData = benchScene.timeIt(validatorInst.runValidator, 1)
+    # a selected mesh verify must not drop the stored results of the not selected meshes:
+    validatorInst.runValidator(objList=["New_0_Geo"])
+    afterSelectionSkipped = validatorInst.runValidator()["skippedCount"]
+    allSkipped = validatorInst.runValidator()["skippedCount"]
+    validatorInst.incremental = False
+    changedFullData = getComparableData(validatorInst.runValidator())
+    resultDic = {
+                    "meshes" : meshCount,
+                    "fullTime" : fullTime,
+                    "firstTime" : firstTime,
+                    "firstSkipped" : firstSkipped,
+                    "unchangedTime" : unchangedTime,
+                    "unchangedSkipped" : unchangedSkipped,
+                    "changedTime" : changedTime,
+                    "changedSkipped" : changedData["skippedCount"],
+                    "afterSelectionSkipped" : afterSelectionSkipped,
+                    "keptAfterSelection" : afterSelectionSkipped == allSkipped,
+                    "changedIssues" : [item for item, found in zip(changedData["checkedObjList"], changedData["foundIssueList"]) if found],
+                    "sameResult" : fullData == getComparableData(firstData) == getComparableData(unchangedData) and changedFullData == getComparableData(changedData)
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("incremental validation benchmark with %i meshes:" % resultDic["meshes"])
+    print("    full verify:                  %.4f s" % resultDic["fullTime"])
+    print("    first incremental verify:     %.4f s, %i skipped nodes" % (resultDic["firstTime"], resultDic["firstSkipped"]))
+    print("    incremental without changes:  %.4f s, %i skipped nodes" % (resultDic["unchangedTime"], resultDic["unchangedSkipped"]))
+    print("    incremental after 3 new meshes: %.4f s, %i skipped nodes" % (resultDic["changedTime"], resultDic["changedSkipped"]))
+    print("    inverted after the change:    %s" % ", ".join(resultDic["changedIssues"]))
+    print("    incremental after a selection: %i skipped nodes, kept results: %s" % (resultDic["afterSelectionSkipped"], resultDic["keptAfterSelection"]))
+    print("    same results: %s" % resultDic["sameResult"])
@@ -0,0 +1,143 @@
+# importing libraries:
+import benchScene
+import random
+import time
+from maya import cmds
+from dpAutoRigSystem.Validator.CheckIn import dpInvertedNormals
+
+FACE_COUNT = 500000
+CHECK_COUNT = 200
+VALIDATOR_MODULE = "dpAutoRigSystem.Validator.CheckIn.dpInvertedNormals"
+
+
+# the face iteration before the half-edge sort, kept to compare the results:
+def legacyInvertedNormals(vertexCountList, vertexList):
+    """ Compare the consecutive vertex pairs of each face with the ones of its connected faces as strings, like the validator did with MItMeshPolygon.
+        Returns True if found inverted normals.
+    """
+    faceVertexList = []
+    first = 0
+    for count in vertexCountList:
+        faceVertexList.append(vertexList[first:first+count])
+        first += count
+    # connected faces are the ones sharing an edge:
+    edgeFaceDic = {}
+    for f, faceVertices in enumerate(faceVertexList):
+        for i in range(len(faceVertices)):
+            edgeFaceDic.setdefault(frozenset([faceVertices[i], faceVertices[(i+1)%len(faceVertices)]]), []).append(f)
+    for f, faceVertices in enumerate(faceVertexList):
+        vtxIntArray = faceVertices+[faceVertices[0]]
+        conFacesIntArray = sorted(set(c for i in range(len(faceVertices)) for c in edgeFaceDic[frozenset([faceVertices[i], faceVertices[(i+1)%len(faceVertices)]])] if c != f))
+        for c in conFacesIntArray:
+            conVtxIntArray = faceVertexList[c]+[faceVertexList[c][0]]
+            for i in range(0, len(vtxIntArray)-1):
+                iPair = str(vtxIntArray[i])+","+str(vtxIntArray[i+1])
+                for k in range(0, len(conVtxIntArray)-1):
+                    cPair = str(conVtxIntArray[k])+","+str(conVtxIntArray[k+1])
+                    if iPair == cPair:
+                        return True
+    return False
+
+
+def getGridFaces(rows, columns, flipList=None, triangleList=None):
+    """ Return the vertex count and vertex lists of a grid with consistent winding.
+        The faces in the flipList get the inverted winding and the ones in the triangleList are split in two triangles.
+    """
+    vertexCountList = []
+    vertexList = []
+    for r in range(rows):
+        for c in range(columns):
+            f = r*columns+c
+            a, b, d, e = r*(columns+1)+c, r*(columns+1)+c+1, (r+1)*(columns+1)+c+1, (r+1)*(columns+1)+c
+            faceList = [[a, b, d], [a, d, e]] if triangleList and f in triangleList else [[a, b, d, e]]
+            for faceVertices in faceList:
+                if flipList and f in flipList:
+                    faceVertices.reverse()
+                vertexCountList.append(len(faceVertices))
+                vertexList.extend(faceVertices)
+    return vertexCountList, vertexList
+
+
+def createMesh(name, vertexCountList, vertexList):
+    """ Create a fake mesh with the given faces.
+        Returns the transform name.
+    """
+    transform = cmds.polyCube(name=name)[0]
+    shapeNode = cmds.getNode(cmds.listRelatives(transform, shapes=True, fullPath=True)[0])
+    shapeNode.vertexCountList = vertexCountList
+    shapeNode.vertexList = vertexList
+    return transform
+
+
+def checkResults(checkCount=CHECK_COUNT):
+    """ Compare the legacy search with the NumPy and the pure Python half-edge search in random grids.
+        Returns the number of different results and the number of meshes with inverted normals.
+    """
+    randomGen = random.Random(7)
+    numpyModule = dpInvertedNormals.numpy
+    diffCount = 0
+    invertedCount = 0
+    for n in range(checkCount):
+        rows, columns = randomGen.randint(1, 12), randomGen.randint(1, 12)
+        faceCount = rows*columns
+        flipList = set(randomGen.sample(range(faceCount), randomGen.choice([0, 1, faceCount, randomGen.randint(0, faceCount)])))
+        triangleList = set(randomGen.sample(range(faceCount), randomGen.randint(0, faceCount)))
+        vertexCountList, vertexList = getGridFaces(rows, columns, flipList, triangleList)
+        legacyResult = legacyInvertedNormals(vertexCountList, vertexList)
+        resultList = []
+        for useNumpy in [True, False]:
+            dpInvertedNormals.numpy = numpyModule if useNumpy else None
+            resultList.append(dpInvertedNormals.hasInvertedNormals(vertexCountList, vertexList))
+        dpInvertedNormals.numpy = numpyModule
+        if any(result != legacyResult for result in resultList):
+            diffCount += 1
+        invertedCount += legacyResult
+    return diffCount, invertedCount
+
+
+def timeSearch(vertexCountList, vertexList, useNumpy, repeat=3):
+    """ Return the best time of the half-edge search with or without NumPy.
+    """
+    numpyModule = dpInvertedNormals.numpy
+    dpInvertedNormals.numpy = numpyModule if useNumpy else None
+    try:
+        return benchScene.timeIt(lambda: dpInvertedNormals.hasInvertedNormals(vertexCountList, vertexList), repeat)[0]
+    finally:
+        dpInvertedNormals.numpy = numpyModule
+
+
+def run(faceCount=FACE_COUNT, repeat=3):
+    """ Benchmark the inverted normals search in a big grid with one flipped face and check the results in random grids.
+        Return a dictionary with the results.
+    """
+    side = int(faceCount**0.5)
+    vertexCountList, vertexList = getGridFaces(side, side, set([side*side // 2]))
+    resultDic = {"faces" : len(vertexCountList), "numpy" : dpInvertedNormals.numpy is not None}
+    if dpInvertedNormals.numpy is not None:
+        resultDic["numpyTime"] = timeSearch(vertexCountList, vertexList, True, repeat)
+    resultDic["pythonTime"] = timeSearch(vertexCountList, vertexList, False, repeat)
+    startTime = time.perf_counter()
+    resultDic["legacyFound"] = legacyInvertedNormals(vertexCountList, vertexList)
+    resultDic["legacyTime"] = time.perf_counter()-startTime
+    # run the validator in a scene with the big mesh and a clean one:
+    cmds.newScene()
+    createMesh("Inverted_Geo", vertexCountList, vertexList)
+    createMesh("Clean_Geo", *getGridFaces(side, side))
+    validatorInst = benchScene.FakeUI().initValidatorModule(VALIDATOR_MODULE)
+    resultDic["validatorTime"], resultDic["validatorCalls"], dataLogDic = benchScene.timeIt(validatorInst.runValidator, repeat)
+    resultDic["validatorFound"] = list(validatorInst.checkedObjList)
+    resultDic["diffResults"], resultDic["invertedMeshes"] = checkResults()
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("inverted normals benchmark with %i faces:" % resultDic["faces"])
+    print("    legacy comparison: %.4f s, found %s" % (resultDic["legacyTime"], resultDic["legacyFound"]))
+    if resultDic["numpy"]:
+        print("    numpy half-edges:  %.4f s" % resultDic["numpyTime"])
+    else:
+        print("    numpy isn't installed")
+    print("    python half-edges: %.4f s" % resultDic["pythonTime"])
+    print("    validator with 2 meshes: %.4f s, %i cmds calls, found %s" % (resultDic["validatorTime"], resultDic["validatorCalls"], resultDic["validatorFound"]))
+    print("    random grids: %i different results in %i checks, %i with inverted normals" % (resultDic["diffResults"], CHECK_COUNT, resultDic["invertedMeshes"]))
@@ -0,0 +1,159 @@
+# importing libraries:
+import benchScene
+import os
+import json
+import time
+import shutil
+import datetime
+import tempfile
+from maya import cmds
+from dpAutoRigSystem.Modules.Library import dpLogStream
+
+SCENE_NAME = "dpAsset_Rig"
+LOG_COUNT = 3000
+DAY_COUNT = 90
+RETENTION_DAYS = 30
+VALIDATOR_LIST = ["DuplicatedName", "ResetPose", "InvertedNormals", "FreezeTransform", "NamespaceCleaner", "UnusedNodeCleaner"]
+NODE_COUNT = 200
+
+
+def createLooseLogs(logFolder, logCount=LOG_COUNT, dayCount=DAY_COUNT, sceneName=SCENE_NAME, today=None):
+    """ Write the given number of loose json log files like the exportLogDicToJson did, spread in the last days.
+        Each log has the data of all validators, one of them with issues.
+    """
+    today = today or datetime.date.today()
+    if not os.path.exists(logFolder):
+        os.makedirs(logFolder)
+    for n in range(logCount):
+        logDate = today-datetime.timedelta(days=n % dayCount)
+        logTime = logDate.isoformat()+"_"+"%02i-%02i-%02i" % (n // 3600 % 24, n // 60 % 60, n % 60)
+        logDic = {}
+        for v, validator in enumerate(VALIDATOR_LIST):
+            found = v == n % len(VALIDATOR_LIST)
+            logDic[validator] = {"validator" : validator, "name" : validator, "mode" : "VERIFY", "time" : logTime,
+                                "checkedObjList" : ["Node_"+str(i)+"_Jnt" for i in range(NODE_COUNT)],
+                                "foundIssueList" : [found and i == 0 for i in range(NODE_COUNT)],
+                                "resultOkList" : [not (found and i == 0) for i in range(NODE_COUNT)],
+                                "messageList" : [], "logText" : ""}
+        with open(logFolder+"/"+dpLogStream.LOG_PREFIX+sceneName+"_"+logTime+".json", "w") as logFile:
+            json.dump(logDic, logFile, indent=4)
+
+
+def scanLooseLogs(logFolder, validator, sceneName=SCENE_NAME):
+    """ Return the loose log files with issues in the given validator by reading all of them, like it was needed without index.
+    """
+    foundList = []
+    for fileName in sorted(os.listdir(logFolder)):
+        match = dpLogStream.LOOSE_LOG_PATTERN.match(fileName)
+        if match and match.group(1) == sceneName:
+            logDic = dpLogStream.readLog(logFolder+"/"+fileName)
+            if True in logDic.get(validator, {}).get("foundIssueList", []):
+                foundList.append(fileName)
+    return foundList
+
+
+def checkInterruptedWrite(logFolder, sceneName="dpInterrupted_Rig"):
+    """ Return True if the logs before and after an interrupted record in the same archive can still be read.
+    """
+    logStore = dpLogStream.LogStore(logFolder, sceneName)
+    logDic = {VALIDATOR_LIST[0] : {"validator" : VALIDATOR_LIST[0], "checkedObjList" : ["Node_0_Jnt"], "foundIssueList" : [True]}}
+    firstId = logStore.exportLogDic(logDic, compress=False)
+    # a record cut in the middle of the line, like a crash while writing:
+    with open(logStore.getArchivePath(firstId[:10], False), "a") as archiveFile:
+        archiveFile.write('{"path":[],"dic":{"'+VALIDATOR_LIST[0])
+    lastId = logStore.exportLogDic(logDic, compress=False)
+    return logStore.readLog(firstId) == logDic and logStore.readLog(lastId) == logDic
+
+
+def checkSharedPrefix(logFolder, sceneName="char", otherSceneName="char_001", today=None):
+    """ Return True if the retention and the rebuilt index of a scene don't use the archives of another scene
+        whose name starts with the same name.
+    """
+    today = today or datetime.date.today()
+    oldTime = (today-datetime.timedelta(days=RETENTION_DAYS*2)).isoformat()+"_00-00-00"
+    logDic = {VALIDATOR_LIST[0] : {"validator" : VALIDATOR_LIST[0], "checkedObjList" : ["Node_0_Jnt"], "foundIssueList" : [False]}}
+    logStore = dpLogStream.LogStore(logFolder, sceneName)
+    otherStore = dpLogStream.LogStore(logFolder, otherSceneName)
+    for store in (logStore, otherStore):
+        store.exportLogDic(logDic, oldTime, compress=False)
+        store.exportLogDic(logDic, compress=False)
+    otherFileList = sorted(fileName for fileName in os.listdir(logFolder) if fileName.startswith(dpLogStream.ARCHIVE_PREFIX+otherSceneName+"_"))
+    rebuiltCount = len(dpLogStream.LogStore(logFolder, sceneName).rebuildIndex()["logs"])
+    logStore.applyRetention(RETENTION_DAYS, today)
+    keptFileList = sorted(fileName for fileName in os.listdir(logFolder) if fileName.startswith(dpLogStream.ARCHIVE_PREFIX+otherSceneName+"_"))
+    return rebuiltCount == 2 and len(otherFileList) == 2 and keptFileList == otherFileList and len(logStore.findLogs()) == 1
+
+
+def timeListDir(logFolder, repeat=5):
+    """ Return the best time to list the log folder.
+    """
+    return benchScene.timeIt(lambda: os.listdir(logFolder), repeat)[0]
+
+
+def run(logCount=LOG_COUNT, repeat=3):
+    """ Benchmark the log folder before and after rolling the loose logs into the daily archives,
+        the lookup of the logs with issues by validator and the retention of the old archives.
+        It also checks that an interrupted record doesn't hide the next logs of the archive
+        and that the scenes with the same name prefix keep their own archives.
+        Return a dictionary with the results.
+    """
+    tempDir = tempfile.mkdtemp()
+    logFolder = tempDir+"/dpData/dpLog"
+    try:
+        dpLogStream.setCompressMode(True)
+        createLooseLogs(logFolder, logCount)
+        looseFiles = len(os.listdir(logFolder))
+        looseListTime = timeListDir(logFolder)
+        startTime = time.perf_counter()
+        scanList = scanLooseLogs(logFolder, VALIDATOR_LIST[0])
+        scanTime = time.perf_counter()-startTime
+        logStore = dpLogStream.LogStore(logFolder, SCENE_NAME)
+        startTime = time.perf_counter()
+        rolledCount = logStore.compact()
+        compactTime = time.perf_counter()-startTime
+        archiveFiles = len(os.listdir(logFolder))
+        archiveListTime = timeListDir(logFolder)
+        # lookup from a new store reading the index file:
+        indexTime, indexCalls, entryList = benchScene.timeIt(lambda: dpLogStream.LogStore(logFolder, SCENE_NAME).findLogs(VALIDATOR_LIST[0], issues=True), repeat)
+        startTime = time.perf_counter()
+        readDic = logStore.readLog(entryList[0])
+        readTime = time.perf_counter()-startTime
+        startTime = time.perf_counter()
+        removedCount = logStore.applyRetention(RETENTION_DAYS)
+        retentionTime = time.perf_counter()-startTime
+        resultDic = {
+                        "logs" : logCount,
+                        "days" : DAY_COUNT,
+                        "looseFiles" : looseFiles,
+                        "looseListTime" : looseListTime,
+                        "scanTime" : scanTime,
+                        "rolledLogs" : rolledCount,
+                        "compactTime" : compactTime,
+                        "archiveFiles" : archiveFiles,
+                        "archiveListTime" : archiveListTime,
+                        "indexTime" : indexTime,
+                        "readTime" : readTime,
+                        "sameLookup" : len(scanList) == len(entryList) and readDic[VALIDATOR_LIST[0]]["foundIssueList"][0] is True,
+                        "removedArchives" : removedCount,
+                        "retentionTime" : retentionTime,
+                        "keptLogs" : len(logStore.findLogs()),
+                        "rebuiltLogs" : len(dpLogStream.LogStore(logFolder, SCENE_NAME).rebuildIndex()["logs"]),
+                        "readAfterInterrupt" : checkInterruptedWrite(logFolder),
+                        "sharedPrefix" : checkSharedPrefix(logFolder)
+                    }
+    finally:
+        dpLogStream.setCompressMode(False)
+        shutil.rmtree(tempDir, ignore_errors=True)
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("log store benchmark with %i logs in %i days:" % (resultDic["logs"], resultDic["days"]))
+    print("    loose files:     %i files, list %.4f s, scan for issues %.4f s" % (resultDic["looseFiles"], resultDic["looseListTime"], resultDic["scanTime"]))
+    print("    compact:         %i logs rolled in %.4f s" % (resultDic["rolledLogs"], resultDic["compactTime"]))
+    print("    archives:        %i files, list %.4f s, index lookup %.4f s, read one log %.4f s" % (resultDic["archiveFiles"], resultDic["archiveListTime"], resultDic["indexTime"], resultDic["readTime"]))
+    print("    same lookup: %s" % resultDic["sameLookup"])
+    print("    retention of %i days: %i archives removed in %.4f s, %i logs kept, %i logs in the rebuilt index" % (RETENTION_DAYS, resultDic["removedArchives"], resultDic["retentionTime"], resultDic["keptLogs"], resultDic["rebuiltLogs"]))
+    print("    logs read after an interrupted record: %s" % resultDic["readAfterInterrupt"])
+    print("    scenes with the same name prefix kept apart: %s" % resultDic["sharedPrefix"])
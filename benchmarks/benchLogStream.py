@@ -0,0 +1,122 @@
+# importing libraries:
+import benchScene
+import os
+import json
+import time
+import shutil
+import tempfile
+from maya import cmds
+from dpAutoRigSystem.Modules.Library import dpLogStream
+
+VALIDATOR_MODULE = "dpAutoRigSystem.Validator.CheckIn.dpDuplicatedName"
+NODE_COUNT = 50000
+VALIDATOR_COUNT = 4
+
+
+# the reportLog text and the json export before the log stream, kept to compare the results:
+def legacyLogText(validatorInst):
+    """ Return the validator log text concatenated like the reportLog did.
+    """
+    lang = validatorInst.dpUIinst.lang
+    logText = "\n"+lang['m006_name']+": "+lang[validatorInst.title]+"\n"
+    logText += lang['v003_mode']+": "
+    checkText = lang['c052_fix'].upper()
+    if validatorInst.verifyMode:
+        checkText = lang['i210_verify'].upper()
+    logText += checkText+"\n"
+    if True in validatorInst.foundIssueList:
+        logText += lang['v006_foundIssue']+":\n"
+        for i, item in enumerate(validatorInst.foundIssueList):
+            if item == True:
+                logText += validatorInst.checkedObjList[i]
+                if i != len(validatorInst.checkedObjList)-1:
+                    logText += "\n"
+    else:
+        logText += lang['v007_allOk']
+    if validatorInst.messageList:
+        for msg in validatorInst.messageList:
+            logText += "\n"+msg
+    return logText
+
+
+def legacyExport(dic, pathFile):
+    """ Dump the whole dictionary to a json file like the exportLogDicToJson did.
+    """
+    outFile = open(pathFile, "w")
+    json.dump(dic, outFile, indent=4)
+    outFile.close()
+    return pathFile
+
+
+def createResultData(validatorInst, nodeCount=NODE_COUNT, validatorCount=VALIDATOR_COUNT):
+    """ Fill the validator lists with the given number of checked nodes, every 3rd one with an issue,
+        and return a validation result dictionary with the same data for the given number of validators.
+    """
+    validatorInst.verifyMode = True
+    validatorInst.checkedObjList = ["|All_Grp|Node_"+str(n)+"_Grp|Node_"+str(n)+"_Jnt" for n in range(nodeCount)]
+    validatorInst.foundIssueList = [n % 3 == 0 for n in range(nodeCount)]
+    validatorInst.resultOkList = [n % 3 != 0 for n in range(nodeCount)]
+    validatorInst.messageList = ["Message "+str(n) for n in range(nodeCount // 100)]
+    validatorInst.reportLog()
+    return dict(("Validator"+str(v), dict(validatorInst.dataLogDic)) for v in range(validatorCount))
+
+
+def run(nodeCount=NODE_COUNT, repeat=3):
+    """ Benchmark the validator log text and the log export with the legacy json dump and the JSON Lines stream.
+        Return a dictionary with the results.
+    """
+    cmds.newScene()
+    validatorInst = benchScene.FakeUI().initValidatorModule(VALIDATOR_MODULE)
+    resultData = createResultData(validatorInst, nodeCount)
+    tempDir = tempfile.mkdtemp()
+    try:
+        legacyTextTime, legacyTextCalls, legacyText = benchScene.timeIt(lambda: legacyLogText(validatorInst), repeat)
+        textTime, textCalls, text = benchScene.timeIt(lambda: [validatorInst.reportLog(), validatorInst.dataLogDic["logText"]][1], repeat)
+        legacyPath = os.path.join(tempDir, "legacy.json")
+        legacyTime = benchScene.timeIt(lambda: legacyExport(resultData, legacyPath), repeat)[0]
+        sizeDic = {}
+        timeDic = {}
+        sameData = True
+        for compress in [False, True]:
+            pathFile = os.path.join(tempDir, "stream"+dpLogStream.LOG_EXTENSION+(dpLogStream.GZIP_EXTENSION if compress else ""))
+            def writeStream():
+                if os.path.exists(pathFile):
+                    os.remove(pathFile)
+                with dpLogStream.LogWriter(pathFile) as logWriter:
+                    for name, dataLogDic in resultData.items():
+                        logWriter.writeDic(dataLogDic, [name])
+            timeDic[compress] = benchScene.timeIt(writeStream, repeat)[0]
+            sizeDic[compress] = os.path.getsize(pathFile)
+            startTime = time.perf_counter()
+            sameData = sameData and dpLogStream.readLog(pathFile) == json.loads(json.dumps(resultData))
+            timeDic["read"+str(compress)] = time.perf_counter()-startTime
+        resultDic = {
+                        "nodes" : nodeCount,
+                        "validators" : len(resultData),
+                        "legacyTextTime" : legacyTextTime,
+                        "textTime" : textTime,
+                        "sameText" : legacyText == text,
+                        "legacyTime" : legacyTime,
+                        "legacySize" : os.path.getsize(legacyPath),
+                        "streamTime" : timeDic[False],
+                        "streamSize" : sizeDic[False],
+                        "gzipTime" : timeDic[True],
+                        "gzipSize" : sizeDic[True],
+                        "readTime" : timeDic["readFalse"],
+                        "gzipReadTime" : timeDic["readTrue"],
+                        "sameData" : sameData
+                    }
+    finally:
+        shutil.rmtree(tempDir, ignore_errors=True)
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("log stream benchmark with %i validators of %i checked nodes:" % (resultDic["validators"], resultDic["nodes"]))
+    print("    legacy log text:   %.4f s" % resultDic["legacyTextTime"])
+    print("    joined log text:   %.4f s, same text: %s" % (resultDic["textTime"], resultDic["sameText"]))
+    print("    legacy json dump:  %.4f s, %i bytes" % (resultDic["legacyTime"], resultDic["legacySize"]))
+    print("    JSON Lines stream: %.4f s, %i bytes" % (resultDic["streamTime"], resultDic["streamSize"]))
+    print("    gzip stream:       %.4f s, %i bytes" % (resultDic["gzipTime"], resultDic["gzipSize"]))
+    print("    read back:         %.4f s, gzip %.4f s, same data: %s" % (resultDic["readTime"], resultDic["gzipReadTime"], resultDic["sameData"]))
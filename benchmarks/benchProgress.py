@@ -0,0 +1,101 @@
+# importing libraries:
+import benchScene
+import io
+import contextlib
+from maya import cmds
+from dpAutoRigSystem.Modules.Library import dpProgress
+from dpAutoRigSystem.Validator import dpValidatorRunner
+
+ITEM_COUNT = 100000
+VALIDATOR_MODULE_LIST = ["dpAutoRigSystem.Validator.CheckIn.dpDuplicatedName", "dpAutoRigSystem.Validator.CheckIn.dpFreezeTransform",
+                        "dpAutoRigSystem.Validator.CheckIn.dpNamespaceCleaner", "dpAutoRigSystem.Validator.CheckOut.dpDisplayLayers",
+                        "dpAutoRigSystem.Validator.CheckOut.dpHideDataGrp", "dpAutoRigSystem.Validator.CheckOut.dpUnknownNodesCleaner"]
+CANCEL_AFTER = 2
+
+
+# the progress window edit of each iteration before the progress helper, kept to compare the calls:
+def legacyLoop(itemList):
+    """ Update the progress window with a formatted status for each item like the long loops did.
+    """
+    progressAmount = 0
+    maxProcess = len(itemList)
+    cmds.progressWindow(title="dpValidator", progress=progressAmount, status="Validator: 0%", isInterruptable=False)
+    for item in itemList:
+        progressAmount += 1
+        cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=("Validator: "+repr(progressAmount)+" "+item))
+    cmds.progressWindow(endProgress=True)
+    return progressAmount
+
+
+def progressLoop(itemList, ui=True):
+    """ Update the throttled progress helper for each item, creating the status only when it's shown.
+        Return the number of shown updates.
+    """
+    progress = dpProgress.Progress("dpValidator", len(itemList), "Validator: 0%", interruptable=True, ui=ui)
+    progress.start()
+    for progressAmount, item in enumerate(itemList, 1):
+        if progress.isCancelled():
+            break
+        progress.update(progressAmount, status=lambda: "Validator: "+repr(progressAmount)+" "+item)
+    progress.end()
+    return progress.updateCount
+
+
+def getProgressCalls():
+    """ Return the number of progressWindow calls since the last reset.
+    """
+    return cmds.getCallCountDic().get("progressWindow", 0)
+
+
+def run(itemCount=ITEM_COUNT, repeat=3):
+    """ Benchmark a long loop updating the progress window on each iteration and with the throttled progress helper,
+        the helper without interface and the runner stopping after a cancel.
+        Return a dictionary with the results.
+    """
+    itemList = ["Node_"+str(n)+"_Jnt" for n in range(itemCount)]
+    cmds.setBatchMode(False)
+    try:
+        legacyTime, legacyCalls, legacyCount = benchScene.timeIt(lambda: legacyLoop(itemList), repeat)
+        legacyWindowCalls = getProgressCalls()
+        progressTime, progressCalls, progressCount = benchScene.timeIt(lambda: progressLoop(itemList), repeat)
+        progressWindowCalls = getProgressCalls()
+        # run the validators cancelling the progress window after some of them:
+        benchScene.createRiggedScene(100)
+        fakeUI = benchScene.FakeUI()
+        validatorInstList = [fakeUI.initValidatorModule(moduleName) for moduleName in VALIDATOR_MODULE_LIST]
+        cmds.setProgressCancel(CANCEL_AFTER)
+        # the cancel query is throttled, so it's asked for each validator here:
+        progress = dpProgress.Progress("dpValidator", len(validatorInstList), interruptable=True, updateInterval=0)
+        progress.start()
+        resultData, stopStatus, stoppedIndex = dpValidatorRunner.runValidators(validatorInstList, True, progress=progress)
+        progress.end()
+    finally:
+        cmds.setProgressCancel(None)
+        cmds.setBatchMode(True)
+    # without interface the progress is printed once by log interval:
+    logStream = io.StringIO()
+    with contextlib.redirect_stdout(logStream):
+        headlessTime = benchScene.timeIt(lambda: progressLoop(itemList), repeat)[0]
+    resultDic = {
+                    "items" : itemCount,
+                    "legacyTime" : legacyTime,
+                    "legacyWindowCalls" : legacyWindowCalls,
+                    "progressTime" : progressTime,
+                    "progressWindowCalls" : progressWindowCalls,
+                    "shownUpdates" : progressCount,
+                    "headlessTime" : headlessTime,
+                    "headlessLogLines" : len(logStream.getvalue().splitlines()) // repeat,
+                    "validators" : len(validatorInstList),
+                    "cancelledAfter" : len(resultData),
+                    "stopStatus" : stopStatus
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("progress benchmark with %i items:" % resultDic["items"])
+    print("    edit by item:  %.4f s, %i progressWindow calls" % (resultDic["legacyTime"], resultDic["legacyWindowCalls"]))
+    print("    throttled:     %.4f s, %i progressWindow calls, %i shown updates" % (resultDic["progressTime"], resultDic["progressWindowCalls"], resultDic["shownUpdates"]))
+    print("    headless:      %.4f s, %i log lines" % (resultDic["headlessTime"], resultDic["headlessLogLines"]))
+    print("    runner cancel: %i of %i validators ran, stop status %r" % (resultDic["cancelledAfter"], resultDic["validators"], resultDic["stopStatus"]))
@@ -0,0 +1,160 @@
+# importing libraries:
+import benchScene
+import types
+from maya import cmds
+from dpAutoRigSystem.Modules.Library import dpUtils
+from dpAutoRigSystem.Validator.CheckOut import dpProxyCreator
+
+MESH_COUNT = 4
+GRID_SIZE_LIST = [20, 50]
+JOINT_COUNT = 8
+SHARED_GRID_SIZE = 6
+
+
+# the createProxy face loop before reading all the weights at once, kept to compare the results:
+def legacyCreateProxy(self, source, grp, *args):
+    """ Creates a proxy setup from the given source transform and put it into the given grp group.
+    """
+    try:
+        inputDeformerList = cmds.findDeformers(source)
+    except:
+        return
+    skinClusterNode = None
+    if inputDeformerList:
+        for deformerNode in inputDeformerList:
+            if cmds.objectType(deformerNode) == "skinCluster":
+                skinClusterNode = deformerNode
+                break
+    if skinClusterNode:
+        self.skinClusterList.append(skinClusterNode)
+        weightedInfluenceList = cmds.skinCluster(skinClusterNode, query=True, weightedInfluence=True)
+        if weightedInfluenceList:
+            # get data and store it into a dic
+            indexJointDic = {}
+            sourceFaceList = cmds.ls(source+".f[*]", flatten=True)
+            for i, idx in enumerate(sourceFaceList):
+                percList = cmds.skinPercent(skinClusterNode, source+".f["+str(i)+"]", ignoreBelow=0.1, transform=None, query=True)
+                indexJointDic[i] = percList[0]
+                if not len(percList) == 1:
+                    jointValueList = []
+                    for item in percList:
+                        jointValueList.append(cmds.skinPercent(skinClusterNode, source+".f["+str(i)+"]", ignoreBelow=0.1, transform=item, query=True))
+                    indexJointDic[i] = percList[jointValueList.index(max(jointValueList))]
+            for jnt in weightedInfluenceList:
+                nodeFaceList = []
+                skinnedFaceList = []
+                # data analisis
+                for j in list(indexJointDic.keys()):
+                    if indexJointDic[j] == jnt:
+                        skinnedFaceList.append(j)
+                if skinnedFaceList:
+                    # filter lists
+                    faceList = [w.replace(source+".f[", "") for w in sourceFaceList]
+                    faceList = [int(w.replace("]", "")) for w in faceList]
+                    if faceList:
+                        for v in reversed(skinnedFaceList):
+                            faceList.pop(v)
+                    if faceList:
+                        for n in faceList:
+                            nodeFaceList.append(source+".f["+str(n)+"]")
+                    # create proxy geometry
+                    dup = cmds.duplicate(source, name=source+"_"+jnt+"_Pxy")[0]
+                    for dupItem in cmds.listRelatives(dup, children=True, allDescendents=True):
+                        if "Orig" in dupItem:
+                            cmds.delete(dupItem)
+                    if nodeFaceList:
+                        faceDupList = [w.replace(source, dup) for w in nodeFaceList]
+                        cmds.delete(faceDupList)
+                    self.dpUIinst.ctrls.setLockHide([dup], ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz'], l=False)
+                    cmds.xform(dup, pivots=cmds.xform(jnt, worldSpace=True, rotatePivot=True, query=True))
+                    cmds.parent(dup, jnt)
+                    cmds.scriptEditorInfo(suppressWarnings=True)
+                    cmds.makeIdentity(dup, apply=True, translate=True, rotate=True, scale=True)
+                    cmds.scriptEditorInfo(suppressWarnings=False)
+                    self.checkReverseNormal(dup, jnt)
+                    cmds.connectAttr(jnt+".worldMatrix", dup+".offsetParentMatrix", force=True)
+                    cmds.parent(dup, grp)
+                    dpUtils.setAttrValues([dup], ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz'], [0, 0, 0, 0, 0, 0, 1, 1, 1])
+                    self.dpUIinst.ctrls.setLockHide([dup], ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz'])
+                    drawOverrideList = cmds.listConnections(dup+".drawOverride", source=True, destination=False, plugs=True)
+                    if drawOverrideList:
+                        # remove from display layer
+                        cmds.disconnectAttr(drawOverrideList[0], dup+".drawOverride")
+                    cmds.setAttr(dup+".overrideEnabled", 1)
+                    cmds.setAttr(dup+".overrideDisplayType", 2) #reference
+                    self.reconnectVisibility(source, dup)
+        cmds.addAttr(source, longName=dpProxyCreator.PROXIED, attributeType="bool", defaultValue=1)
+    sourceParent = cmds.listRelatives(source, parent=True, type="transform")
+    if sourceParent:
+        if sourceParent[0] == grp:
+            cmds.delete(source)
+
+
+def createProxyScene(gridSize, meshCount=MESH_COUNT, jointCount=JOINT_COUNT):
+    """ Create a new fake scene with skinned grid meshes in the render group and an empty proxy group.
+        The last skinCluster also deforms a smaller mesh, to check the weights are read by shape and not from the first geometry.
+        Returns the mesh list.
+    """
+    cmds.newScene()
+    jointList = benchScene.createJointList(jointCount)
+    renderGrp = cmds.createNode("transform", name="Render_Grp")
+    cmds.createNode("transform", name="Proxy_Grp")
+    meshList = []
+    for n in range(meshCount):
+        meshList.append(benchScene.createGridMesh("Body_"+str(n)+"_Geo", gridSize, gridSize, renderGrp))
+        skinClusterNode = cmds.skinCluster(jointList[n % jointCount:]+jointList[:n % jointCount], meshList[-1], name="Body_"+str(n)+"_SC")[0]
+    meshList.append(benchScene.createGridMesh("Shared_Geo", SHARED_GRID_SIZE, SHARED_GRID_SIZE, renderGrp))
+    cmds.skinCluster(skinClusterNode, edit=True, geometry=meshList[-1])
+    # the validator gives the transform short names:
+    return [mesh[mesh.rfind("|")+1:] for mesh in meshList]
+
+
+def getProxyData():
+    """ Return the name, parent and mesh data of each proxy mesh.
+    """
+    proxyDataList = []
+    for proxy in cmds.ls("*_Pxy", long=True):
+        shapeNode = cmds.getShapeNode(proxy)
+        proxyDataList.append((proxy, shapeNode.vertexCountList, shapeNode.vertexList, shapeNode.pointList))
+    return sorted(proxyDataList)
+
+
+def run(gridSize, repeat=1):
+    """ Benchmark the proxy creation with the face by face skinPercent queries and with the weights read at once.
+        Return a dictionary with the results.
+    """
+    fakeUI = benchScene.FakeUI()
+    meshList = []
+    def setup():
+        meshList[:] = createProxyScene(gridSize)
+    def createProxies(proxyInst):
+        proxyInst.skinClusterList = []
+        for mesh in meshList:
+            proxyInst.createProxy(mesh, "Proxy_Grp")
+    legacyInst = fakeUI.initValidatorModule(dpProxyCreator.__name__)
+    legacyInst.createProxy = types.MethodType(legacyCreateProxy, legacyInst)
+    legacyTime, legacyCalls, legacyResult = benchScene.timeIt(lambda: createProxies(legacyInst), repeat, setup)
+    legacyProxyData = getProxyData()
+    newInst = fakeUI.initValidatorModule(dpProxyCreator.__name__)
+    newTime, newCalls, newResult = benchScene.timeIt(lambda: createProxies(newInst), repeat, setup)
+    newProxyData = getProxyData()
+    resultDic = {
+                    "meshes" : MESH_COUNT,
+                    "faces" : gridSize*gridSize,
+                    "legacyTime" : legacyTime,
+                    "legacyCalls" : legacyCalls,
+                    "newTime" : newTime,
+                    "newCalls" : newCalls,
+                    "proxies" : len(newProxyData),
+                    "sameProxies" : legacyProxyData == newProxyData
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    for gridSize in GRID_SIZE_LIST:
+        resultDic = run(gridSize)
+        print("proxy creator benchmark with %i meshes of %i faces:" % (resultDic["meshes"], resultDic["faces"]))
+        print("    face by face: %.4f s, %i cmds calls" % (resultDic["legacyTime"], resultDic["legacyCalls"]))
+        print("    all weights:  %.4f s, %i cmds calls" % (resultDic["newTime"], resultDic["newCalls"]))
+        print("    %i proxies, same proxy meshes: %s" % (resultDic["proxies"], resultDic["sameProxies"]))
@@ -0,0 +1,128 @@
+# importing libraries:
+import benchScene
+import types
+from maya import cmds
+from dpAutoRigSystem.Validator.CheckOut import dpResetPose
+
+VALIDATOR_MODULE = "dpAutoRigSystem.Validator.CheckOut.dpResetPose"
+CONTROL_COUNT = 600
+# keyable custom attributes with their default values, like the dpAutoRig controls have:
+CUSTOM_ATTR_DIC = {"autoRotate" : 0.0, "stretchable" : 1.0, "footRoll" : 0.0, "follow" : 1.0}
+# the log keys changing on each run:
+IGNORE_KEY_LIST = ["time", "user", "logText"]
+
+
+# the getSetupAttrList and getAttrDefaultValueData before the API attribute reads, kept to compare the results:
+def legacyGetSetupAttrList(self, item, ignoreAttrList=dpResetPose.TO_IGNORE, *args):
+    """ Returns the desired attribute list to work with set or reset default values.
+    """
+    cleanAttrList = []
+    attrList = cmds.listAttr(item, channelBox=True)
+    if not attrList:
+        attrList = []
+    if attrList:
+        for attrName in attrList:
+            if not cmds.attributeQuery(attrName, node=item, attributeType=True) == "bool":
+                cleanAttrList.append(attrName)
+    allAttrList = cmds.listAttr(item)
+    animAttrList = cmds.listAnimatable(item)
+    if allAttrList and animAttrList:
+        orderedAttrs = [attr for attr in allAttrList for animAttr in animAttrList if animAttr.endswith(attr) and not attr in cleanAttrList]
+        cleanAttrList.extend(orderedAttrs)
+    if ignoreAttrList:
+        for ignoreAttr in ignoreAttrList:
+            if ignoreAttr in cleanAttrList:
+                cleanAttrList.remove(ignoreAttr)
+    return cleanAttrList
+
+
+def legacyGetAttrDefaultValueData(self, item, *args):
+    """ Returns a dictionary with a list of default and current values for each attribute of the given node.
+    """
+    attrData = {}
+    attrList = legacyGetSetupAttrList(self, item)
+    if attrList:
+        for attr in attrList:
+            attrType = cmds.attributeQuery(attr, node=item, attributeType=True)
+            currentValue = cmds.getAttr(item+"."+attr)
+            if attr in self.nonDynZeroAttrList:
+                attrData[attr] = [0.0, currentValue, attrType]
+            elif attr in self.nonDynOneAttrList:
+                attrData[attr] = [1.0, currentValue, attrType]
+            else:
+                attrData[attr] = [cmds.addAttr(item+"."+attr, query=True, defaultValue=True), currentValue, attrType]
+    return attrData
+
+
+def createControlScene(controlCount=CONTROL_COUNT):
+    """ Create a new fake scene with dpControls having keyable custom attributes, a channel box attribute and some edited values.
+        Each 7th control has a moved translate and each 11th control has a custom attribute out of its default value.
+    """
+    cmds.newScene()
+    for n in range(controlCount):
+        ctrl = cmds.createNode("transform", name="Control_"+str(n)+"_Ctrl")
+        cmds.addAttr(ctrl, longName="dpControl", attributeType="bool")
+        cmds.setAttr(ctrl+".dpControl", 1)
+        for attr, defaultValue in CUSTOM_ATTR_DIC.items():
+            # the last custom attribute changes its default value by control:
+            if attr == "follow":
+                defaultValue = float(n % 2)
+            cmds.addAttr(ctrl, longName=attr, attributeType="double", defaultValue=defaultValue, keyable=True)
+        cmds.addAttr(ctrl, longName="extraVis", attributeType="bool", defaultValue=1)
+        cmds.setAttr(ctrl+".extraVis", channelBox=True)
+        cmds.addAttr(ctrl, longName="mode", attributeType="long", defaultValue=0)
+        cmds.setAttr(ctrl+".mode", channelBox=True)
+        if n % 7 == 0:
+            cmds.setAttr(ctrl+".translateX", 1.5)
+        if n % 11 == 0:
+            cmds.setAttr(ctrl+".footRoll", 10.0)
+
+
+def getComparableData(dataLogDic):
+    """ Return the validation result without the keys changing on each run.
+    """
+    return dict((key, value) for key, value in dataLogDic.items() if not key in IGNORE_KEY_LIST)
+
+
+def run(controlCount=CONTROL_COUNT, repeat=3):
+    """ Benchmark the reset pose verify with the legacy attribute reads and with one API pass by node.
+        Only the cmds calls are counted, the API reads aren't.
+        Return a dictionary with the results.
+    """
+    createControlScene(controlCount)
+    fakeUI = benchScene.FakeUI()
+    validatorInst = fakeUI.initValidatorModule(VALIDATOR_MODULE)
+    newTime, newCalls, newData = benchScene.timeIt(validatorInst.runValidator, repeat)
+    newCallDic = cmds.getCallCountDic()
+    legacyInst = fakeUI.initValidatorModule(VALIDATOR_MODULE)
+    legacyInst.getAttrDefaultValueData = types.MethodType(legacyGetAttrDefaultValueData, legacyInst)
+    legacyTime, legacyCalls, legacyData = benchScene.timeIt(legacyInst.runValidator, repeat)
+    legacyCallDic = cmds.getCallCountDic()
+    # compare the attribute data of each control:
+    diffCount = 0
+    for ctrl in fakeUI.ctrls.getControlList():
+        if legacyGetAttrDefaultValueData(legacyInst, ctrl) != validatorInst.getAttrDefaultValueData(ctrl):
+            diffCount += 1
+    resultDic = {
+                    "controls" : controlCount,
+                    "legacyTime" : legacyTime,
+                    "legacyCalls" : legacyCalls,
+                    "legacyCallDic" : legacyCallDic,
+                    "newTime" : newTime,
+                    "newCalls" : newCalls,
+                    "newCallDic" : newCallDic,
+                    "sameResult" : getComparableData(legacyData) == getComparableData(newData),
+                    "diffControls" : diffCount,
+                    "foundIssues" : newData["foundIssueList"].count(True)
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("reset pose benchmark with %i controls:" % resultDic["controls"])
+    print("    legacy reads:    %.4f s, %i cmds calls" % (resultDic["legacyTime"], resultDic["legacyCalls"]))
+    print("    API pass:        %.4f s, %i cmds calls" % (resultDic["newTime"], resultDic["newCalls"]))
+    for name, callDic in [("legacy", resultDic["legacyCallDic"]), ("API", resultDic["newCallDic"])]:
+        print("    %-7s calls: %s" % (name, ", ".join("%s %i" % (command, count) for command, count in sorted(callDic.items(), key=lambda item: -item[1]))))
+    print("    same results: %s, %i different controls, %i controls with issues" % (resultDic["sameResult"], resultDic["diffControls"], resultDic["foundIssues"]))
@@ -0,0 +1,202 @@
+# importing libraries:
+import os
+import sys
+import json
+import time
+import importlib
+
+# use the in-memory fake Maya to run outside of Maya:
+BENCHMARKS_PATH = os.path.dirname(os.path.abspath(__file__))
+FAKE_MAYA_PATH = os.path.join(BENCHMARKS_PATH, "fakeMaya")
+REPO_PATH = os.path.dirname(BENCHMARKS_PATH)
+for path in [FAKE_MAYA_PATH, REPO_PATH]:
+    if not path in sys.path:
+        sys.path.insert(0, path)
+# the UI finds its package from the PYTHONPATH like inside of Maya:
+if not REPO_PATH in os.environ.get("PYTHONPATH", "").split(os.pathsep):
+    os.environ["PYTHONPATH"] = os.pathsep.join([REPO_PATH]+[path for path in os.environ.get("PYTHONPATH", "").split(os.pathsep) if path])
+
+from maya import cmds
+from dpAutoRigSystem import dpAutoRig
+
+# guide modules used to populate the synthetic scenes:
+MODULE_LIST = ["dpLimb", "dpFinger", "dpSpine", "dpChain", "dpFkLine", "dpFoot", "dpHead", "dpEye"]
+JOINT_PER_GUIDE = 3
+
+
+class FakeUI(object):
+    """ Minimal stand-in of the DP_AutoRig_UI instance with the data used by the guides, controls and validators.
+    """
+    def __init__(self, langName="English", presetName="Default", *args):
+        self.dpARVersion = dpAutoRig.DPAR_VERSION_PY3
+        self.dpData = dpAutoRig.DPDATA
+        self.dpLog = dpAutoRig.DPLOG
+        self.dpSkin = dpAutoRig.DPSKIN
+        self.degreeOption = 0
+        self.guide = None
+        self.allUIs = {}
+        self.infoList = []
+        dpARPath = os.path.join(REPO_PATH, "dpAutoRigSystem")
+        with open(os.path.join(dpARPath, "Languages", langName+".json")) as langFile:
+            self.lang = json.load(langFile)
+        with open(os.path.join(dpARPath, "Controls", "Presets", presetName+".json")) as presetFile:
+            self.ctrlPreset = json.load(presetFile)
+        self.controlInstanceList = []
+        for controlDir in [dpAutoRig.CONTROLS, dpAutoRig.COMBINED]:
+            for fileName in sorted(os.listdir(os.path.join(dpARPath, controlDir))):
+                if fileName.startswith("dp") and fileName.endswith(".py") and fileName != "dpBaseControlClass.py":
+                    self.controlInstanceList.append(self.initExtraModule(fileName[:-3], controlDir.replace("/", ".")))
+        from dpAutoRigSystem.Modules.Library import dpControls
+        self.ctrls = dpControls.ControlClass(self)
+    
+    
+    def initExtraModule(self, guideModule, guideDir=None, *args):
+        """ Import the module and return its class instance like the DP_AutoRig_UI does.
+        """
+        guide = importlib.import_module("dpAutoRigSystem."+guideDir.replace("/", ".")+"."+guideModule)
+        return getattr(guide, guide.CLASS_NAME)(self)
+    
+    
+    def startGuideModules(self, guideDir, action, layout, checkModuleList=None, path=None, *args):
+        """ Return the not found modules to check or the existing module list like the DP_AutoRig_UI does, without UI.
+        """
+        guideModuleList = sorted(fileName[:-3] for fileName in os.listdir(os.path.join(REPO_PATH, "dpAutoRigSystem", guideDir)) if fileName.startswith("dp") and fileName.endswith(".py"))
+        if action == "check":
+            return [checkModule for checkModule in checkModuleList or [] if not checkModule in guideModuleList]
+        return guideModuleList
+    
+    
+    def initValidatorModule(self, guideModule, *args):
+        """ Import the validator and return its class instance without UI.
+        """
+        guide = importlib.import_module(guideModule)
+        return getattr(guide, guide.CLASS_NAME)(self, ui=False, verbose=False)
+    
+    
+    def info(self, *args):
+        """ Store the info instead of opening a window.
+        """
+        self.infoList.append(args)
+
+
+def createGuide(moduleName, instance, fatherNode=None):
+    """ Create a guide base with its joint guides like the dpBaseClass does.
+        Return the guide base and its joint guide list.
+    """
+    namespace = moduleName+"__"+str(instance)
+    cmds.namespace(add=namespace)
+    guideBase = cmds.createNode("transform", name=namespace+":Guide_Base", parent=fatherNode)
+    for attr in ["guideBase", "mirrorEnable", "displayAnnotation"]:
+        cmds.addAttr(guideBase, longName=attr, attributeType="bool")
+    cmds.setAttr(guideBase+".guideBase", 1)
+    for attr in ["moduleNamespace", "customName", "mirrorAxis", "mirrorName", "hookNode"]:
+        cmds.addAttr(guideBase, longName=attr, dataType="string")
+    cmds.setAttr(guideBase+".moduleNamespace", namespace, type="string")
+    cmds.setAttr(guideBase+".customName", "", type="string")
+    cmds.setAttr(guideBase+".mirrorAxis", "off", type="string")
+    cmds.setAttr(guideBase+".mirrorName", "L --> R", type="string")
+    cmds.setAttr(guideBase+".hookNode", "_Grp", type="string")
+    jointGuideList = []
+    lastNode = guideBase
+    for j in range(JOINT_PER_GUIDE):
+        jointGuide = cmds.createNode("transform", name=namespace+":Guide_JointLoc"+str(j+1), parent=lastNode)
+        cmds.addAttr(jointGuide, longName="nJoint", attributeType="long")
+        cmds.setAttr(jointGuide+".nJoint", j+1)
+        jointGuideList.append(jointGuide)
+        lastNode = jointGuide
+    return guideBase, jointGuideList
+
+
+def createGuideHierarchy(guideCount=500, extraTransformCount=0, clear=True):
+    """ Create a new fake scene with the given number of guide modules parented in chains.
+        Each 4th module is parented directly to its father guide base and the others to a joint guide.
+        Return the created guide base list.
+    """
+    if clear:
+        cmds.newScene()
+    guideBaseList = []
+    jointGuideList = []
+    for g in range(guideCount):
+        moduleName = MODULE_LIST[g % len(MODULE_LIST)]
+        fatherNode = None
+        if guideBaseList:
+            # chain modules by groups of 25 to have deep hierarchies:
+            if g % 25:
+                if g % 4 == 0:
+                    fatherNode = guideBaseList[-1]
+                else:
+                    fatherNode = jointGuideList[-1][-1]
+        guideBase, jointList = createGuide(moduleName, g+1, fatherNode)
+        guideBaseList.append(guideBase)
+        jointGuideList.append(jointList)
+    for e in range(extraTransformCount):
+        cmds.createNode("transform", name="extra_"+str(e)+"_Grp")
+    return guideBaseList
+
+
+def createRiggedScene(nodeCount=1000, clear=True):
+    """ Create a new fake scene with rigged like transforms, half of them with originedFrom attribute and a quarter as dpControls.
+        Each 10th node also gets a mesh.
+        Return the created transform list.
+    """
+    if clear:
+        cmds.newScene()
+    allGrp = cmds.createNode("transform", name="All_Grp")
+    cmds.addAttr(allGrp, longName="masterGrp", attributeType="bool")
+    cmds.setAttr(allGrp+".masterGrp", 1)
+    transformList = []
+    for n in range(nodeCount):
+        transform = cmds.createNode("transform", name="Node_"+str(n)+"_Jnt", parent=allGrp)
+        if n % 2 == 0:
+            cmds.addAttr(transform, longName="originedFrom", dataType="string")
+            cmds.setAttr(transform+".originedFrom", "dpLimb__"+str(n)+":Guide_JointLoc1;dpLimb__"+str(n)+":Guide_JointEnd", type="string")
+        if n % 4 == 0:
+            cmds.addAttr(transform, longName="dpControl", attributeType="bool")
+            cmds.setAttr(transform+".dpControl", 1)
+            cmds.addAttr(transform, longName="controlID", dataType="string")
+            cmds.setAttr(transform+".controlID", "id_007_FkLine", type="string")
+        if n % 10 == 0:
+            cmds.polyCube(name="Geo_"+str(n)+"_Geo")
+        transformList.append(transform)
+    return transformList
+
+
+def createGridMesh(name, rows=2, columns=2, parent=None):
+    """ Create a fake mesh transform with a grid of quad faces and its points in the XZ plane.
+        Returns the transform long name.
+    """
+    transform = cmds.createNode("transform", name=name, parent=parent)
+    shapeNode = cmds.getNode(cmds.createNode("mesh", name=name+"Shape", parent=transform))
+    shapeNode.pointList = [[float(c), 0.0, float(r)] for r in range(rows+1) for c in range(columns+1)]
+    for r in range(rows):
+        for c in range(columns):
+            shapeNode.vertexCountList.append(4)
+            shapeNode.vertexList.extend([r*(columns+1)+c, r*(columns+1)+c+1, (r+1)*(columns+1)+c+1, (r+1)*(columns+1)+c])
+    return cmds.longName(cmds.getNode(transform))
+
+
+def createJointList(jointCount=10, prefix="Skin"):
+    """ Create a chain of joints to be used as skinning influences.
+        Returns the joint list.
+    """
+    cmds.select(clear=True)
+    jointList = [cmds.joint(name=prefix+"_"+str(j)+"_Jnt") for j in range(jointCount)]
+    cmds.select(clear=True)
+    return jointList
+
+
+def timeIt(func, repeat=3, setup=None, *args, **kwargs):
+    """ Run the function and return the best elapsed time in seconds, the number of fake cmds calls and its last result.
+        The setup function runs before each repetition without being timed.
+    """
+    bestTime = None
+    for r in range(repeat):
+        if setup:
+            setup()
+        cmds.resetCallCount()
+        startTime = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsedTime = time.perf_counter()-startTime
+        if bestTime is None or elapsedTime < bestTime:
+            bestTime = elapsedTime
+    return bestTime, cmds.getCallCount(), result
@@ -0,0 +1,94 @@
+# importing libraries:
+import benchScene
+import os
+import shutil
+import tempfile
+from maya import cmds
+from dpAutoRigSystem.Deforms import dpSkinning
+
+MESH_COUNT = 200
+GRID_SIZE = 20
+JOINT_COUNT = 40
+SCENE_NAME = "dpAsset_Rig.ma"
+SHARED_GRID_SIZE = 3
+
+
+def createSkinnedScene(meshCount=MESH_COUNT, gridSize=GRID_SIZE, jointCount=JOINT_COUNT):
+    """ Create a new fake scene with skinned grid meshes in a render group.
+        The last skinCluster also deforms a smaller mesh, to check the weights are read by shape and not from the first geometry.
+    """
+    cmds.newScene()
+    jointList = benchScene.createJointList(jointCount)
+    renderGrp = cmds.createNode("transform", name="Render_Grp")
+    for n in range(meshCount):
+        renderMesh = benchScene.createGridMesh("Body_"+str(n)+"_Geo", gridSize, gridSize, renderGrp)
+        skinClusterNode = cmds.skinCluster(jointList[n % jointCount:]+jointList[:n % jointCount], renderMesh, name="Body_"+str(n)+"_SC")[0]
+    sharedMesh = benchScene.createGridMesh("Shared_Geo", SHARED_GRID_SIZE, SHARED_GRID_SIZE, renderGrp)
+    cmds.skinCluster(skinClusterNode, edit=True, geometry=sharedMesh)
+
+
+def updateModel():
+    """ Simulate a model update: the skinning is lost, the meshes are in a renamed group,
+        one mesh was removed and another one has a new topology.
+    """
+    cmds.delete(cmds.ls(type="skinCluster"))
+    cmds.rename("Render_Grp", "Model_Grp")
+    cmds.delete("Body_0_Geo")
+    cmds.delete("Body_1_Geo")
+    benchScene.createGridMesh("Body_1_Geo", 3, 3, "Model_Grp")
+
+
+def getSkinData():
+    """ Return the influences and weights of each skinned mesh by its short name.
+    """
+    skinDataDic = {}
+    for skinClusterNode in cmds.ls(type="skinCluster"):
+        node = cmds.getNode(skinClusterNode)
+        influenceNameList = sorted(influenceNode.name for influenceNode in node.influenceList)
+        for shapeNode, weightList in zip(node.geometryList, node.geometryWeightList):
+            skinDataDic[shapeNode.parent.name] = (influenceNameList, sorted((sorted((node.influenceList[i].name, round(value, 12)) for i, value in vertexWeightDic.items())) for vertexWeightDic in weightList))
+    return skinDataDic
+
+
+def run(meshCount=MESH_COUNT, repeat=3):
+    """ Benchmark the skin weights export to a NumPy file and the import after a model update.
+        Return a dictionary with the results.
+    """
+    tempDir = tempfile.mkdtemp()
+    try:
+        skinInst = dpSkinning.Skinning(benchScene.FakeUI())
+        createSkinnedScene(meshCount)
+        cmds.file(rename=os.path.join(tempDir, SCENE_NAME).replace("\\", "/"))
+        sourceSkinData = getSkinData()
+        denseSize = sum(len(weightList)*len(influenceList)*8 for influenceList, weightList in sourceSkinData.values())
+        exportTime, exportCalls, path = benchScene.timeIt(lambda: skinInst.exportSkinWeights(), repeat)
+        updateModel()
+        importTime, importCalls, reportDic = benchScene.timeIt(lambda: skinInst.importSkinWeights(), repeat)
+        importedSkinData = getSkinData()
+        resultDic = {
+                        "meshes" : meshCount,
+                        "vertices" : (GRID_SIZE+1)**2,
+                        "influences" : JOINT_COUNT,
+                        "exportTime" : exportTime,
+                        "exportCalls" : exportCalls,
+                        "fileSize" : os.path.getsize(path),
+                        "denseSize" : denseSize,
+                        "importTime" : importTime,
+                        "importCalls" : importCalls,
+                        "imported" : len(reportDic["imported"]),
+                        "unmatched" : len(reportDic["unmatched"]),
+                        "changedVertices" : len(reportDic["changedVertices"]),
+                        "missingInfluences" : len(reportDic["missingInfluences"]),
+                        "sameSkin" : all(importedSkinData[name] == sourceSkinData[name] for name in importedSkinData) and len(importedSkinData) == len(sourceSkinData)-2
+                    }
+    finally:
+        shutil.rmtree(tempDir, ignore_errors=True)
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("skin weights benchmark with %i meshes of %i vertices and %i influences:" % (resultDic["meshes"], resultDic["vertices"], resultDic["influences"]))
+    print("    export: %.4f s, %i cmds calls, %i bytes, %i bytes as dense weights" % (resultDic["exportTime"], resultDic["exportCalls"], resultDic["fileSize"], resultDic["denseSize"]))
+    print("    import: %.4f s, %i cmds calls" % (resultDic["importTime"], resultDic["importCalls"]))
+    print("    report: %i imported, %i unmatched, %i changed vertex count, %i missing influences, same skinning: %s" % (resultDic["imported"], resultDic["unmatched"], resultDic["changedVertices"], resultDic["missingInfluences"], resultDic["sameSkin"]))
@@ -0,0 +1,114 @@
+# importing libraries:
+import benchScene
+from maya import cmds
+from dpAutoRigSystem.Deforms import dpSkinning
+from dpAutoRigSystem.Modules.Library import dpUtils
+
+MESH_COUNT_LIST = [500, 2000]
+JOINT_COUNT = 20
+# joint sets used by the meshes, like the props skinned to different parts of a crowd rig:
+GROUP_COUNT = 4
+SKINNED_COUNT = 5
+
+
+def legacyValidateGeoList(self, geoList, mode=None, *args):
+    """ The geometry validation before the set based checks, kept to compare the results.
+    """
+    if geoList:
+        for i, item in enumerate(geoList):
+            if item in geoList[:i]:
+                self.dpUIinst.info('i038_canceled', 'e003_moreThanOneGeo', item, 'center', 205, 270)
+                return False
+            elif not cmds.objExists(item):
+                self.dpUIinst.info('i038_canceled', 'i061_notExists', item, 'center', 205, 270)
+                return False
+            elif not mode:
+                try:
+                    inputDeformerList = cmds.findDeformers(item)
+                    if inputDeformerList:
+                        for deformerNode in inputDeformerList:
+                            if cmds.objectType(deformerNode) == "skinCluster":
+                                self.dpUIinst.info('i038_canceled', 'i285_alreadySkinned', item, 'center', 205, 270)
+                                return False
+                except:
+                    pass
+    return True
+
+
+def legacySkinJobs(skinInst, jobList):
+    """ Validate and skin each geometry one by one like the skinFromUI did.
+    """
+    if legacyValidateGeoList(skinInst, [job[0] for job in jobList]):
+        for geomSkin, jointSkinList in jobList:
+            baseName = dpUtils.extractSuffix(geomSkin)
+            skinClusterName = baseName+"_SC"
+            if "|" in skinClusterName:
+                skinClusterName = skinClusterName[skinClusterName.rfind("|")+1:]
+            cmds.skinCluster(jointSkinList, geomSkin, toSelectedBones=True, dropoffRate=4.0, maximumInfluences=3, skinMethod=0, normalizeWeights=1, removeUnusedInfluence=False, name=skinClusterName)
+
+
+def createPropScene(meshCount, jointCount=JOINT_COUNT):
+    """ Create a new fake scene with not skinned prop meshes and a joint chain.
+        Returns the skin job list with a geometry and its joints, using the joint sets by turns.
+    """
+    cmds.newScene()
+    jointList = benchScene.createJointList(jointCount)
+    propGrp = cmds.createNode("transform", name="Prop_Grp")
+    jobList = []
+    for n in range(meshCount):
+        g = n % GROUP_COUNT
+        jobList.append([benchScene.createGridMesh("Prop_"+str(n)+"_Geo", 2, 2, propGrp), jointList[g*jointCount//GROUP_COUNT:(g+1)*jointCount//GROUP_COUNT]])
+    return jobList
+
+
+def getSkinClusterList():
+    """ Return the name, geometry and influences of each skinCluster.
+    """
+    return sorted((skinClusterNode, cmds.skinCluster(skinClusterNode, query=True, geometry=True)[0], cmds.skinCluster(skinClusterNode, query=True, influence=True)) for skinClusterNode in cmds.ls(type="skinCluster"))
+
+
+def run(meshCount, repeat=3):
+    """ Benchmark the validation and skinning of many prop meshes one by one and with the batch skinning jobs.
+        Return a dictionary with the results.
+    """
+    fakeUI = benchScene.FakeUI()
+    skinInst = dpSkinning.Skinning(fakeUI)
+    jobList = []
+    def setup():
+        jobList[:] = createPropScene(meshCount)
+    legacyTime, legacyCalls, legacyResult = benchScene.timeIt(lambda: legacySkinJobs(skinInst, jobList), repeat, setup)
+    legacyCallDic = cmds.getCallCountDic()
+    legacySkinClusterList = getSkinClusterList()
+    batchTime, batchCalls, reportDic = benchScene.timeIt(lambda: skinInst.runSkinJobs(jobList), repeat, setup)
+    batchCallDic = cmds.getCallCountDic()
+    batchSkinClusterList = getSkinClusterList()
+    # some geometries already skinned and a repeated one: one by one it cancels all, the batch skips them
+    setup()
+    for geomSkin, jointSkinList in jobList[:SKINNED_COUNT]:
+        cmds.skinCluster(jointSkinList, geomSkin, name="Old_SC")
+    invalidReportDic = skinInst.runSkinJobs(jobList+jobList[-1:])
+    resultDic = {
+                    "meshes" : meshCount,
+                    "legacyTime" : legacyTime,
+                    "legacyCalls" : legacyCalls,
+                    "legacyDeformerQueries" : legacyCallDic.get("findDeformers", 0),
+                    "batchTime" : batchTime,
+                    "batchCalls" : batchCalls,
+                    "batchDeformerQueries" : batchCallDic.get("listHistory", 0),
+                    "groups" : reportDic["groups"],
+                    "slowestTime" : max(reportDic["geometryTime"].values()),
+                    "sameSkinClusters" : legacySkinClusterList == batchSkinClusterList,
+                    "invalidSkinned" : len(invalidReportDic["skinned"]),
+                    "invalidFailed" : len(invalidReportDic["failed"])
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    for meshCount in MESH_COUNT_LIST:
+        resultDic = run(meshCount)
+        print("batch skinning benchmark with %i meshes:" % resultDic["meshes"])
+        print("    one by one: %.4f s, %i cmds calls, %i deformer queries" % (resultDic["legacyTime"], resultDic["legacyCalls"], resultDic["legacyDeformerQueries"]))
+        print("    batch jobs: %.4f s, %i cmds calls, %i deformer queries, %i influence groups, slowest mesh %.4f s" % (resultDic["batchTime"], resultDic["batchCalls"], resultDic["batchDeformerQueries"], resultDic["groups"], resultDic["slowestTime"]))
+        print("    same skinClusters: %s" % resultDic["sameSkinClusters"])
+        print("    with %i skinned and 1 repeated meshes: %i skinned, %i skipped" % (SKINNED_COUNT, resultDic["invalidSkinned"], resultDic["invalidFailed"]))
@@ -0,0 +1,137 @@
+# importing libraries:
+import benchScene
+import os
+import time
+import shutil
+import tempfile
+from importlib import reload
+from maya import cmds
+from dpAutoRigSystem import dpAutoRig
+from dpAutoRigSystem.Modules.Library import dpUtils
+from dpAutoRigSystem.Modules.Library import dpManifest
+
+# folders read by the UI at startup:
+GUIDE_DIR_LIST = [dpAutoRig.MODULES, dpAutoRig.SCRIPTS, dpAutoRig.CONTROLS, dpAutoRig.COMBINED, dpAutoRig.EXTRAS, dpAutoRig.CHECKIN, dpAutoRig.CHECKOUT]
+INSTANCE_DIR_LIST = [dpAutoRig.CONTROLS, dpAutoRig.COMBINED, dpAutoRig.CHECKIN, dpAutoRig.CHECKOUT]
+REPOPULATE_GUIDE_COUNT = 60
+
+
+# the startGuideModules discovery before the manifest, kept to compare the results:
+def legacyDiscovery():
+    """ Import and reload all modules of the UI folders like the createGuideButton did,
+        reloading again the controls and validators when creating their instances.
+        Return the number of reloaded modules.
+    """
+    path = os.path.dirname(dpAutoRig.__file__)
+    reloadCount = 0
+    for guideDir in GUIDE_DIR_LIST:
+        for guideModule in sorted(dpUtils.findAllModules(path, guideDir)):
+            moduleName = "dpAutoRigSystem."+guideDir.replace("/", ".")+"."+guideModule
+            for n in range(2 if guideDir in INSTANCE_DIR_LIST else 1):
+                reload(__import__(moduleName, {}, {}, [guideModule]))
+                reloadCount += 1
+    return reloadCount
+
+
+def manifestDiscovery():
+    """ Read the manifest entries of all UI folders and import only the controls and validators.
+        Return the number of manifest entries.
+    """
+    path = os.path.dirname(dpAutoRig.__file__)
+    entryCount = 0
+    for guideDir in GUIDE_DIR_LIST:
+        entryList = dpManifest.moduleManifest.getEntryList(path, guideDir, sorted(dpUtils.findAllModules(path, guideDir)))
+        entryCount += len(entryList)
+        if guideDir in INSTANCE_DIR_LIST:
+            for entryDic in entryList:
+                dpManifest.importModule("dpAutoRigSystem."+guideDir.replace("/", ".")+"."+entryDic["module"])
+    return entryCount
+
+
+def repopulateImports(guideCount=REPOPULATE_GUIDE_COUNT, legacy=False):
+    """ Import the guide modules of the given number of scene guides like the populateCreatedGuideModules does.
+        The legacy mode reloads each module like it did before the development mode switch.
+        Return the number of reloaded modules.
+    """
+    startReloadCount = dpManifest.reloadCount
+    for n in range(guideCount):
+        moduleName = "dpAutoRigSystem."+dpAutoRig.MODULES+"."+benchScene.MODULE_LIST[n % len(benchScene.MODULE_LIST)]
+        if legacy:
+            reload(__import__(moduleName, {}, {}, [moduleName]))
+        else:
+            dpManifest.importModule(moduleName)
+    return guideCount if legacy else dpManifest.reloadCount-startReloadCount
+
+
+def openUI():
+    """ Create the dpAutoRig UI in the fake Maya running with interface and return its startup time.
+    """
+    cmds.newScene()
+    cmds.setBatchMode(False)
+    try:
+        return dpAutoRig.DP_AutoRig_UI().startupTime
+    finally:
+        cmds.setBatchMode(True)
+
+
+def run(repeat=3):
+    """ Benchmark the module discovery and the UI startup with a cold and a warm manifest,
+        and the guide module imports of the repopulate in legacy, development and production modes.
+        Return a dictionary with the results.
+    """
+    # avoid the network access of the update check and terms:
+    cmds.optionVar(intValue=("dpAutoRigAutoCheckUpdate", 0))
+    cmds.optionVar(intValue=("dpAutoRigAgreeTermsCond", 0))
+    tempDir = tempfile.mkdtemp()
+    manifestPath = os.path.join(tempDir, dpManifest.MANIFEST_FILE)
+    def resetManifest(keepFile=True):
+        if not keepFile and os.path.exists(manifestPath):
+            os.remove(manifestPath)
+        dpManifest.moduleManifest = dpManifest.ModuleManifest(manifestPath)
+    try:
+        legacyTime, legacyCalls, legacyReloads = benchScene.timeIt(legacyDiscovery, repeat)
+        # clear the stored modification times to reload the modules one more time like a new session:
+        coldTime, coldCalls, entryCount = benchScene.timeIt(manifestDiscovery, repeat, lambda: [resetManifest(False), dpManifest.__dict__.update(IMPORT_GENERATION=time.time())])
+        warmTime, warmCalls, entryCount = benchScene.timeIt(manifestDiscovery, repeat, resetManifest)
+        resetManifest(False)
+        dpManifest.IMPORT_GENERATION = time.time()
+        uiColdTime = openUI()
+        uiWarmTime = min(openUI() for r in range(repeat))
+        legacyPopulateTime, legacyPopulateCalls, legacyPopulateReloads = benchScene.timeIt(lambda: repopulateImports(legacy=True), repeat)
+        dpManifest.setDevMode(True)
+        devPopulateTime, devPopulateCalls, devPopulateReloads = benchScene.timeIt(repopulateImports, repeat)
+        dpManifest.setDevMode(False)
+        populateTime, populateCalls, populateReloads = benchScene.timeIt(repopulateImports, repeat)
+    finally:
+        shutil.rmtree(tempDir, ignore_errors=True)
+    resultDic = {
+                    "modules" : entryCount,
+                    "legacyTime" : legacyTime,
+                    "legacyReloads" : legacyReloads,
+                    "coldTime" : coldTime,
+                    "warmTime" : warmTime,
+                    "uiColdTime" : uiColdTime,
+                    "uiWarmTime" : uiWarmTime,
+                    "populateGuides" : REPOPULATE_GUIDE_COUNT,
+                    "legacyPopulateTime" : legacyPopulateTime,
+                    "legacyPopulateReloads" : legacyPopulateReloads,
+                    "devPopulateTime" : devPopulateTime,
+                    "devPopulateReloads" : devPopulateReloads,
+                    "populateTime" : populateTime,
+                    "populateReloads" : populateReloads
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("UI startup benchmark with %i modules:" % resultDic["modules"])
+    print("    legacy discovery:        %.4f s, %i module reloads" % (resultDic["legacyTime"], resultDic["legacyReloads"]))
+    print("    manifest discovery cold: %.4f s" % resultDic["coldTime"])
+    print("    manifest discovery warm: %.4f s" % resultDic["warmTime"])
+    print("    UI startup cold:         %.4f s" % resultDic["uiColdTime"])
+    print("    UI startup warm:         %.4f s" % resultDic["uiWarmTime"])
+    print("repopulate imports with %i guides:" % resultDic["populateGuides"])
+    print("    legacy:      %.4f s, %i module reloads" % (resultDic["legacyPopulateTime"], resultDic["legacyPopulateReloads"]))
+    print("    development: %.4f s, %i module reloads" % (resultDic["devPopulateTime"], resultDic["devPopulateReloads"]))
+    print("    production:  %.4f s, %i module reloads" % (resultDic["populateTime"], resultDic["populateReloads"]))
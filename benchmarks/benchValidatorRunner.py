@@ -0,0 +1,102 @@
+# importing libraries:
+import benchScene
+import benchInvertedNormals
+import os
+from maya import cmds
+from dpAutoRigSystem import dpAutoRig
+from dpAutoRigSystem.Validator import dpValidatorRunner
+
+NODE_COUNT = 5000
+MESH_COUNT = 8
+MESH_FACE_COUNT = 40000
+VALIDATOR_DIR_LIST = [dpAutoRig.CHECKIN, dpAutoRig.CHECKOUT]
+# the log keys changing on each run:
+IGNORE_KEY_LIST = ["time", "user", "logText"]
+
+
+# the runSelectedValidators loop before the validator runner, kept to compare the results:
+def legacyRunValidators(validatorInstList, verifyMode):
+    """ Run each active validator in order, each one reading the scene by itself.
+    """
+    validationResultData = {}
+    for validatorInst in validatorInstList:
+        if validatorInst.active:
+            validatorInst.verbose = False
+            validationResultData[validatorInst.guideModuleName] = validatorInst.runValidator(verifyMode)
+            validatorInst.verbose = True
+    return validationResultData
+
+
+def createValidationScene(nodeCount=NODE_COUNT, meshCount=MESH_COUNT, meshFaceCount=MESH_FACE_COUNT):
+    """ Create a new fake scene with rigged nodes, guides with duplicated names and big meshes, the first one with inverted normals.
+    """
+    benchScene.createRiggedScene(nodeCount)
+    benchScene.createGuideHierarchy(nodeCount // 10, extraTransformCount=nodeCount // 10, clear=False)
+    for n in range(nodeCount // 10):
+        cmds.createNode("transform", name="extra_"+str(n)+"_Grp", parent="All_Grp")
+    side = int(meshFaceCount**0.5)
+    for m in range(meshCount):
+        benchInvertedNormals.createMesh("Body_"+str(m)+"_Geo", *benchInvertedNormals.getGridFaces(side, side, set([side*side // 2]) if m == 0 else None))
+
+
+def getValidatorInstList(fakeUI):
+    """ Return the validator instances of the CheckIn and CheckOut folders that run in the fake scene.
+    """
+    validatorInstList = []
+    for validatorDir in VALIDATOR_DIR_LIST:
+        validatorPath = os.path.join(benchScene.REPO_PATH, "dpAutoRigSystem", validatorDir)
+        for fileName in sorted(os.listdir(validatorPath)):
+            if fileName.startswith("dp") and fileName.endswith(".py"):
+                try:
+                    validatorInst = fakeUI.initValidatorModule("dpAutoRigSystem."+validatorDir.replace("/", ".")+"."+fileName[:-3])
+                    validatorInst.runValidator(True)
+                except Exception:
+                    continue
+                validatorInstList.append(validatorInst)
+    return validatorInstList
+
+
+def getComparableData(validationResultData):
+    """ Return the validation results without the keys changing on each run.
+    """
+    return dict((name, dict((key, value) for key, value in dataLogDic.items() if not key in IGNORE_KEY_LIST)) for name, dataLogDic in validationResultData.items())
+
+
+def run(nodeCount=NODE_COUNT, repeat=3):
+    """ Benchmark the verify mode of all validators with the legacy loop and the runner with one and more worker threads.
+        Return a dictionary with the results.
+    """
+    createValidationScene(nodeCount)
+    fakeUI = benchScene.FakeUI()
+    validatorInstList = getValidatorInstList(fakeUI)
+    cmds.progressWindow(title="dpValidator", progress=0)
+    legacyTime, legacyCalls, legacyData = benchScene.timeIt(lambda: legacyRunValidators(validatorInstList, True), repeat)
+    serialTime, serialCalls, serialData = benchScene.timeIt(lambda: dpValidatorRunner.runValidators(validatorInstList, True, maxWorkers=1)[0], repeat)
+    threadWorkers = max(dpValidatorRunner.MAX_WORKERS, 4)
+    threadTime, threadCalls, threadData = benchScene.timeIt(lambda: dpValidatorRunner.runValidators(validatorInstList, True, maxWorkers=threadWorkers)[0], repeat)
+    cmds.progressWindow(endProgress=True)
+    resultDic = {
+                    "nodes" : cmds.getNodeCount(),
+                    "validators" : len(validatorInstList),
+                    "readOnly" : len([validatorInst for validatorInst in validatorInstList if validatorInst.readOnly]),
+                    "cpuCount" : os.cpu_count(),
+                    "legacyTime" : legacyTime,
+                    "legacyCalls" : legacyCalls,
+                    "serialTime" : serialTime,
+                    "serialCalls" : serialCalls,
+                    "threadWorkers" : threadWorkers,
+                    "threadTime" : threadTime,
+                    "threadCalls" : threadCalls,
+                    "sameResult" : getComparableData(legacyData) == getComparableData(serialData) == getComparableData(threadData),
+                    "foundIssues" : sorted(name for name, dataLogDic in legacyData.items() if True in dataLogDic["foundIssueList"])
+                }
+    return resultDic
+
+
+if __name__ == "__main__":
+    resultDic = run()
+    print("validator runner benchmark with %i nodes, %i validators, %i read-only, %i cpus:" % (resultDic["nodes"], resultDic["validators"], resultDic["readOnly"], resultDic["cpuCount"]))
+    print("    legacy loop:          %.4f s, %i cmds calls" % (resultDic["legacyTime"], resultDic["legacyCalls"]))
+    print("    runner 1 worker:      %.4f s, %i cmds calls" % (resultDic["serialTime"], resultDic["serialCalls"]))
+    print("    runner %i workers:     %.4f s, %i cmds calls" % (resultDic["threadWorkers"], resultDic["threadTime"], resultDic["threadCalls"]))
+    print("    same results: %s, found issues in %s" % (resultDic["sameResult"], ", ".join(resultDic["foundIssues"])))
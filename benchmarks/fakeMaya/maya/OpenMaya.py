@@ -0,0 +1,26 @@
+# importing libraries:
+FAKE_OPENMAYA_VERSION = 1.1
+
+
+class FakeObject(object):
+    """ Placeholder for the OpenMaya classes and constants, accepting any argument.
+    """
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return FakeObject()
+
+    def __call__(self, *args, **kwargs):
+        return FakeObject()
+
+    def isDone(self, *args):
+        return True
+
+
+def __getattr__(name):
+    """ Return a placeholder for any OpenMaya class or constant.
+    """
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return FakeObject()
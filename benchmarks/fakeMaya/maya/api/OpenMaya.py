@@ -0,0 +1,303 @@
+# importing libraries:
+from .. import cmds
+
+FAKE_OPENMAYA_VERSION = 1.6
+
+
+class FakeObject(object):
+    """ Placeholder for the OpenMaya classes and constants, accepting any argument.
+    """
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return FakeObject()
+
+    def __call__(self, *args, **kwargs):
+        return FakeObject()
+
+    def isDone(self, *args):
+        return True
+
+
+class MFn(object):
+    """ Function set types used to iterate the fake scene nodes.
+    """
+    kMesh = "mesh"
+    kTransform = "transform"
+    kJoint = "joint"
+    kNurbsCurve = "nurbsCurve"
+    kMeshVertComponent = "vtx"
+    kNumericAttribute = "numeric"
+    kUnitAttribute = "unit"
+    kEnumAttribute = "enum"
+
+
+class MFnNumericData(object):
+    """ Numeric types of the fake numeric attributes, named like the Maya attribute types.
+    """
+    kBoolean = "bool"
+    kByte = "byte"
+    kShort = "short"
+    kLong = "long"
+    kInt = "long"
+    kFloat = "float"
+    kDouble = "double"
+
+
+class MIntArray(list):
+    """ Python list used as the Maya API integer array.
+    """
+
+
+class MDoubleArray(list):
+    """ Python list used as the Maya API double array.
+    """
+
+
+class MDagPath(object):
+    """ Path to a fake dag node.
+    """
+    def __init__(self, node=None, *args):
+        self.dagNode = node
+
+    def node(self):
+        return self.dagNode
+
+    def fullPathName(self):
+        return cmds.longName(self.dagNode)
+
+    def partialPathName(self):
+        return cmds.getName(self.dagNode)
+
+
+class MDistance(object):
+    """ Distance value in the fake scene, always in centimeters.
+    """
+    def __init__(self, value=0.0, *args):
+        self.value = value
+
+    @staticmethod
+    def uiUnit():
+        return "cm"
+
+    def asUnits(self, unit):
+        return self.value
+
+
+class MAngle(MDistance):
+    """ Angle value in the fake scene, always in degrees.
+    """
+    @staticmethod
+    def uiUnit():
+        return "deg"
+
+
+class MFnAttribute(object):
+    """ Attribute of a fake node, with the function sets found from its Maya attribute type.
+    """
+    def __init__(self, attrObj=None, *args):
+        if isinstance(attrObj, MFnAttribute):
+            attrObj = attrObj.attrObj
+        self.attrObj = attrObj
+        self.node, self.attr = attrObj
+
+    def getTypeName(self):
+        if self.attr in self.node.attrTypeDic:
+            return self.node.attrTypeDic[self.attr]
+        return cmds.STATIC_ATTR_TYPE_DIC.get(self.attr, "double")
+
+    def hasFn(self, fnType):
+        typeName = self.getTypeName()
+        if typeName in ["doubleLinear", "doubleAngle"]:
+            return fnType == MFn.kUnitAttribute
+        if typeName == "enum":
+            return fnType == MFn.kEnumAttribute
+        return fnType == MFn.kNumericAttribute and typeName in ["bool", "byte", "short", "long", "float", "double"]
+
+    @property
+    def name(self):
+        return self.attr
+
+    @property
+    def default(self):
+        if self.attr in self.node.attrDefaultDic:
+            return self.node.attrDefaultDic[self.attr]
+        return cmds.TRANSFORM_ATTR_DIC.get(self.attr, 0.0)
+
+
+class MFnNumericAttribute(MFnAttribute):
+    def numericType(self):
+        return self.getTypeName()
+
+
+class MFnEnumAttribute(MFnAttribute):
+    pass
+
+
+class MFnUnitAttribute(MFnAttribute):
+    kDistance = "doubleLinear"
+    kAngle = "doubleAngle"
+
+    def unitType(self):
+        return self.getTypeName()
+
+    @property
+    def default(self):
+        return MDistance(MFnAttribute.default.fget(self))
+
+
+class MPlug(object):
+    """ Plug of a fake node attribute reading its stored value.
+    """
+    def __init__(self, node=None, attr=None, *args):
+        self.node = node
+        self.attr = attr
+
+    def attribute(self):
+        return MFnAttribute((self.node, self.attr))
+
+    def asBool(self):
+        return bool(self.node.attrDic[self.attr])
+
+    def asInt(self):
+        return int(self.node.attrDic[self.attr])
+
+    def asShort(self):
+        return int(self.node.attrDic[self.attr])
+
+    def asDouble(self):
+        return float(self.node.attrDic[self.attr])
+
+    def asMDistance(self):
+        return MDistance(self.node.attrDic[self.attr])
+
+    def asMAngle(self):
+        return MAngle(self.node.attrDic[self.attr])
+
+
+class MFnDependencyNode(object):
+    """ Find the plugs of a fake node.
+    """
+    def __init__(self, node=None, *args):
+        self.node = node
+
+    def name(self):
+        return self.node.name
+
+    def typeName(self):
+        return self.node.nodeType
+
+    def hasAttribute(self, attr):
+        return cmds.SHORT_ATTR_DIC.get(attr, attr) in self.node.attrDic
+
+    def findPlug(self, attr, wantNetworkedPlug=False):
+        attr = cmds.SHORT_ATTR_DIC.get(attr, attr)
+        if not attr in self.node.attrDic:
+            raise RuntimeError("(kInvalidParameter): Cannot find the plug "+attr)
+        return MPlug(self.node, attr)
+
+
+class MSelectionList(object):
+    """ List of fake nodes added by name.
+    """
+    def __init__(self, *args):
+        self.nodeList = []
+
+    def add(self, name):
+        node = cmds.getNode(name)
+        if not node:
+            raise RuntimeError("(kInvalidParameter): Object does not exist")
+        self.nodeList.append(node)
+        return self
+
+    def length(self):
+        return len(self.nodeList)
+
+    def getDependNode(self, index):
+        return self.nodeList[index]
+
+    def getDagPath(self, index):
+        return MDagPath(self.nodeList[index])
+
+
+class MFnSingleIndexedComponent(object):
+    """ Vertex component of a fake mesh, only the complete data is stored.
+    """
+    def __init__(self, component=None, *args):
+        self.elementCount = 0
+
+    def create(self, componentType):
+        return self
+
+    def setCompleteData(self, elementCount):
+        self.elementCount = elementCount
+
+
+class MItDependencyNodes(object):
+    """ Iterate the fake scene nodes of the given type.
+    """
+    def __init__(self, fnType=None, *args):
+        self.nodeList = [node for node in cmds.allNodes() if fnType is None or cmds.isType(node, fnType)]
+        self.index = 0
+
+    def isDone(self):
+        return self.index >= len(self.nodeList)
+
+    def next(self):
+        self.index += 1
+
+    def thisNode(self):
+        return self.nodeList[self.index]
+
+
+class MFnDagNode(object):
+    """ Read the name and the parent of a fake dag node.
+    """
+    def __init__(self, node=None, *args):
+        if isinstance(node, MDagPath):
+            node = node.node()
+        self.node = node
+
+    def name(self):
+        return self.node.name
+
+    def fullPathName(self):
+        return cmds.longName(self.node)
+
+    def partialPathName(self):
+        return cmds.getName(self.node)
+
+    @property
+    def isIntermediateObject(self):
+        return bool(self.node.attrDic.get("intermediateObject"))
+
+    def parentCount(self):
+        return 1 if self.node.parent else 0
+
+    def parent(self, index=0):
+        return self.node.parent
+
+
+class MFnMesh(MFnDagNode):
+    """ Read the face vertices stored in a fake mesh node.
+    """
+    def numPolygons(self):
+        return len(self.node.vertexCountList)
+
+    @property
+    def numVertices(self):
+        return cmds.getVertexCount(self.node)
+
+    def getVertices(self):
+        """ Return the vertex count of each face and the vertex list of all faces, like the Maya API 2.0 does.
+        """
+        return list(self.node.vertexCountList), list(self.node.vertexList)
+
+
+def __getattr__(name):
+    """ Return a placeholder for any other OpenMaya class or constant.
+    """
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return FakeObject()
@@ -0,0 +1,72 @@
+# importing libraries:
+from .OpenMaya import FakeObject, MDagPath, MDoubleArray
+
+FAKE_OPENMAYAANIM_VERSION = 1.1
+
+
+class MFnSkinCluster(object):
+    """ Read and write the weights stored in a fake skinCluster node.
+        The weights are flat by vertex and influence, like the Maya API 2.0 returns them.
+        A skinCluster can deform many geometries, so the weights are read and written for the given shape path.
+    """
+    def __init__(self, node=None, *args):
+        self.node = node
+
+    def name(self):
+        return self.node.name
+
+    def influenceObjects(self):
+        return [MDagPath(influenceNode) for influenceNode in self.node.influenceList]
+
+    def indexForOutputShape(self, shape):
+        """ Return the index of the given shape node in the deformed geometries, it raises RuntimeError if the skinCluster doesn't deform it.
+        """
+        if not shape in self.node.geometryList:
+            raise RuntimeError("(kInvalidParameter): Object is not an output shape of this deformer")
+        return self.node.geometryList.index(shape)
+
+    def getPathAtIndex(self, index):
+        return MDagPath(self.node.geometryList[index])
+
+    def getWeightList(self, shape):
+        """ Return the weights by vertex of the given shape path.
+        """
+        return self.node.geometryWeightList[self.indexForOutputShape(shape.node())]
+
+    def getWeights(self, shape, components, *args):
+        """ Return the weights of all vertices and all influences of the given shape path and the influence count.
+        """
+        influenceCount = len(self.node.influenceList)
+        weightList = MDoubleArray()
+        for vertexWeightDic in self.getWeightList(shape):
+            vertexWeightList = [0.0]*influenceCount
+            for i, value in vertexWeightDic.items():
+                vertexWeightList[i] = value
+            weightList.extend(vertexWeightList)
+        return weightList, influenceCount
+
+    def setWeights(self, shape, components, influences, values, normalize=True, returnOldWeights=False):
+        """ Set the weights of all vertices of the given shape path for the given influence indices, the other influences keep their weights.
+        """
+        influenceCount = len(influences)
+        for v, vertexWeightDic in enumerate(self.getWeightList(shape)):
+            for i, influenceIndex in enumerate(influences):
+                value = values[v*influenceCount+i]
+                if value:
+                    vertexWeightDic[influenceIndex] = value
+                else:
+                    vertexWeightDic.pop(influenceIndex, None)
+            if normalize:
+                total = sum(vertexWeightDic.values())
+                if total:
+                    for influenceIndex in vertexWeightDic:
+                        vertexWeightDic[influenceIndex] /= total
+        return None
+
+
+def __getattr__(name):
+    """ Return a placeholder for any other OpenMayaAnim class or constant.
+    """
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return FakeObject()
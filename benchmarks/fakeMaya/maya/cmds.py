@@ -0,0 +1,1212 @@
+# importing libraries:
+import math
+import pickle
+import fnmatch
+
+FAKE_CMDS_VERSION = 2.3
+
+# derived node types to answer type queries like Maya does:
+TYPE_INHERITANCE = {
+                    "transform" : ["transform", "dagNode"],
+                    "joint" : ["joint", "transform", "dagNode"],
+                    "mesh" : ["mesh", "shape", "dagNode"],
+                    "nurbsCurve" : ["nurbsCurve", "shape", "dagNode"],
+                    "locator" : ["locator", "shape", "dagNode"],
+                    "annotationShape" : ["annotationShape", "shape", "dagNode"],
+                    }
+
+# default attributes created with the nodes:
+TRANSFORM_ATTR_DIC = {
+                    "translateX" : 0.0, "translateY" : 0.0, "translateZ" : 0.0,
+                    "rotateX" : 0.0, "rotateY" : 0.0, "rotateZ" : 0.0,
+                    "scaleX" : 1.0, "scaleY" : 1.0, "scaleZ" : 1.0,
+                    "visibility" : True, "rotateOrder" : 0, "template" : False,
+                    "overrideEnabled" : False, "overrideColor" : 0, "overrideRGBColors" : False, "overrideDisplayType" : 0,
+                    }
+SHAPE_ATTR_DIC = {
+                    "visibility" : True, "template" : False, "intermediateObject" : False,
+                    "overrideEnabled" : False, "overrideColor" : 0, "overrideRGBColors" : False, "overrideDisplayType" : 0,
+                    "lineWidth" : -1.0, "text" : "",
+                    }
+# short names of the default attributes:
+SHORT_ATTR_DIC = {
+                    "tx" : "translateX", "ty" : "translateY", "tz" : "translateZ",
+                    "rx" : "rotateX", "ry" : "rotateY", "rz" : "rotateZ",
+                    "sx" : "scaleX", "sy" : "scaleY", "sz" : "scaleZ",
+                    "v" : "visibility",
+                    }
+# attribute types of the default attributes, the others are double:
+STATIC_ATTR_TYPE_DIC = {
+                    "translateX" : "doubleLinear", "translateY" : "doubleLinear", "translateZ" : "doubleLinear",
+                    "rotateX" : "doubleAngle", "rotateY" : "doubleAngle", "rotateZ" : "doubleAngle",
+                    "visibility" : "bool", "rotateOrder" : "enum", "template" : "bool",
+                    "overrideEnabled" : "bool", "overrideColor" : "byte", "overrideRGBColors" : "bool",
+                    "intermediateObject" : "bool", "text" : "string",
+                    }
+# keyable default attributes of the transforms:
+TRANSFORM_KEYABLE_LIST = ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ", "scaleX", "scaleY", "scaleZ", "visibility"]
+COMPOUND_ATTR_DIC = {
+                    "translate" : ["translateX", "translateY", "translateZ"],
+                    "rotate" : ["rotateX", "rotateY", "rotateZ"],
+                    "scale" : ["scaleX", "scaleY", "scaleZ"],
+                    }
+MAYA_VERSION = "2024"
+
+# UI commands storing their controls, with the default values returned by queries:
+UI_COMMAND_LIST = ["window", "menu", "menuItem", "radioMenuItemCollection", "columnLayout", "rowLayout", "rowColumnLayout", "frameLayout",
+                    "formLayout", "paneLayout", "scrollLayout", "tabLayout", "gridLayout", "button", "iconTextButton", "image", "text", "separator",
+                    "checkBox", "radioCollection", "radioButton", "radioButtonGrp", "textField", "textFieldGrp", "textFieldButtonGrp",
+                    "textScrollList", "optionMenu", "optionMenuGrp", "floatSliderGrp", "intSliderGrp", "floatField", "intField", "dockControl",
+                    "workspaceControl", "checkBoxGrp", "floatFieldGrp", "colorSliderGrp", "iconTextCheckBox", "iconTextRadioButton"]
+UI_QUERY_DEFAULT_DIC = {
+                        "value" : False,
+                        "text" : "",
+                        "select" : 1,
+                        "radioButton" : False,
+                        "childArray" : [],
+                        "itemListLong" : [],
+                        "selectItem" : [],
+                        "allItems" : [],
+                        "width" : 100,
+                        "height" : 100,
+                        }
+# commands without fake implementation that also run without interface, the other ones are UI commands:
+BATCH_COMMAND_LIST = ["controller", "scriptJob", "scriptEditorInfo"]
+
+# in-memory scene, the nodes are stored in lists by short name because the dag nodes can have the same name with different parents:
+nodeDic = {}
+connectionList = []
+namespaceList = []
+selectionList = []
+callCountDic = {}
+# in-memory user interface and preferences:
+uiDic = {}
+optionVarDic = {}
+# running mode and the simulated progress window cancel:
+fakeStateDic = {"batch" : True, "cancelAfter" : None, "progressEdits" : 0, "sceneName" : ""}
+
+
+class FakeNode(object):
+    """ In-memory node with its type, dag parent node, children nodes and attributes.
+    """
+    def __init__(self, name, nodeType, parent=None, *args):
+        self.name = name
+        self.nodeType = nodeType
+        self.parent = parent
+        self.childList = []
+        self.attrDic = {}
+        self.attrTypeDic = {}
+        self.attrDefaultDic = {}
+        self.lockedAttrList = []
+        self.keyableAttrList = []
+        self.channelBoxAttrList = []
+        self.pointList = []
+        self.vertexCountList = []
+        self.vertexList = []
+        # deformers of a shape and the skinning data of a skinCluster:
+        self.deformerList = []
+        self.geometryList = []
+        self.influenceList = []
+        self.geometryWeightList = []
+        if isType(self, "transform"):
+            self.attrDic.update(TRANSFORM_ATTR_DIC)
+            self.keyableAttrList.extend(TRANSFORM_KEYABLE_LIST)
+        elif isType(self, "shape"):
+            self.attrDic.update(SHAPE_ATTR_DIC)
+
+    @property
+    def geometry(self):
+        """ First geometry deformed by a skinCluster.
+        """
+        return self.geometryList[0] if self.geometryList else None
+
+    @property
+    def weightList(self):
+        """ Weights of the first geometry deformed by a skinCluster, one dictionary of influence index and weight by vertex.
+        """
+        return self.geometryWeightList[0] if self.geometryWeightList else []
+
+    @weightList.setter
+    def weightList(self, weightList):
+        if self.geometryWeightList:
+            self.geometryWeightList[0] = weightList
+        else:
+            self.geometryWeightList.append(weightList)
+
+
+def countCall(func):
+    """ Decorator to count how many times each fake command was called.
+    """
+    def runCount(*args, **kwargs):
+        callCountDic[func.__name__] = callCountDic.get(func.__name__, 0)+1
+        return func(*args, **kwargs)
+    runCount.__name__ = func.__name__
+    runCount.__doc__ = func.__doc__
+    runCount.original = func
+    return runCount
+
+
+def __getattr__(name):
+    """ Return a counted command that does nothing for all commands without fake implementation, like the UI ones.
+        The UI ones raise an error in batch mode.
+    """
+    if name.startswith("__"):
+        raise AttributeError(name)
+    def runUnknown(*args, **kwargs):
+        callCountDic[name] = callCountDic.get(name, 0)+1
+        if fakeStateDic["batch"] and not name in BATCH_COMMAND_LIST:
+            raise RuntimeError(name+": UI command not available in batch mode.")
+        return None
+    runUnknown.__name__ = name
+    return runUnknown
+
+
+def resetCallCount():
+    """ Clear the command counter.
+    """
+    callCountDic.clear()
+
+
+def getCallCount():
+    """ Return the total number of fake command calls since the last reset.
+    """
+    return sum(callCountDic.values())
+
+
+def getCallCountDic():
+    """ Return a copy of the command counter dictionary.
+    """
+    return dict(callCountDic)
+
+
+def allNodes():
+    """ Return a list with all nodes in the scene.
+    """
+    return [node for nodeList in nodeDic.values() for node in nodeList]
+
+
+def newScene():
+    """ Clear the in-memory scene.
+    """
+    nodeDic.clear()
+    del connectionList[:]
+    del namespaceList[:]
+    del selectionList[:]
+    fakeStateDic["sceneName"] = ""
+
+
+def getNodeCount():
+    """ Return the number of nodes in the scene.
+    """
+    return sum(len(nodeList) for nodeList in nodeDic.values())
+
+
+def isType(node, nodeType):
+    """ Return True if the node is of the given type or derived from it.
+    """
+    return nodeType in TYPE_INHERITANCE.get(node.nodeType, [node.nodeType])
+
+
+def longName(node):
+    """ Return the full dag path of the given node.
+    """
+    pathList = []
+    while node:
+        pathList.append(node.name)
+        node = node.parent
+    return "|"+"|".join(reversed(pathList))
+
+
+def getName(node):
+    """ Return the short name of the node or its shortest unique partial path if the short name isn't unique, like Maya does.
+    """
+    nodeList = nodeDic[node.name]
+    if len(nodeList) == 1:
+        return node.name
+    longNameList = [longName(other) for other in nodeList]
+    path = node.name
+    current = node.parent
+    while current:
+        path = current.name+"|"+path
+        if sum(1 for otherLongName in longNameList if otherLongName.endswith("|"+path)) == 1:
+            return path
+        current = current.parent
+    return "|"+path
+
+
+def flatten(itemList):
+    """ Return a flat list of names from the given arguments.
+    """
+    resultList = []
+    for item in itemList:
+        if isinstance(item, (list, tuple)):
+            resultList.extend(flatten(item))
+        elif item is not None:
+            resultList.append(item)
+    return resultList
+
+
+def getNode(name):
+    """ Return the node from a short name, a partial path or a full path name.
+    """
+    if name is None:
+        return None
+    if isinstance(name, FakeNode):
+        return name
+    name = name.split(".")[0]
+    nodeList = nodeDic.get(name[name.rfind("|")+1:])
+    if not nodeList:
+        return None
+    if len(nodeList) == 1 or not "|" in name:
+        return nodeList[0]
+    for node in nodeList:
+        nodeLongName = longName(node)
+        if nodeLongName == name or (not name.startswith("|") and nodeLongName.endswith("|"+name)):
+            return node
+    return None
+
+
+def uniqueName(name):
+    """ Return a name that doesn't exist in the scene yet, adding a number at the end.
+    """
+    if not name in nodeDic:
+        return name
+    baseName = name.rstrip("0123456789")
+    n = 1
+    while baseName+str(n) in nodeDic:
+        n += 1
+    return baseName+str(n)
+
+
+def splitPlug(plug):
+    """ Return the node and attribute from a plug string.
+    """
+    attr = plug[plug.find(".")+1:]
+    return getNode(plug), SHORT_ATTR_DIC.get(attr, attr)
+
+
+def getComponentIndexList(component, count):
+    """ Return the indices of the given component string like "mesh.f[2]", "mesh.f[2:5]" or "mesh.f[*]".
+    """
+    indexText = component[component.rfind("[")+1:component.rfind("]")]
+    if indexText == "*":
+        return list(range(count))
+    if ":" in indexText:
+        start, end = indexText.split(":")
+        return list(range(int(start), int(end)+1))
+    return [int(indexText)]
+
+
+def getFaceOffsetList(shapeNode):
+    """ Return the first face vertex position of each face in the vertex list and the vertex list size at the end.
+        It's stored in the node until the faces change.
+    """
+    offsetList = shapeNode.__dict__.get("faceOffsetList")
+    if not offsetList or len(offsetList) != len(shapeNode.vertexCountList)+1:
+        offsetList = [0]
+        for vertexCount in shapeNode.vertexCountList:
+            offsetList.append(offsetList[-1]+vertexCount)
+        shapeNode.faceOffsetList = offsetList
+    return offsetList
+
+
+def getComponentVertexList(componentList):
+    """ Return the shape node and the vertices of the given face components, without repeating them.
+    """
+    shapeNode, vertexList, vertexSet = None, [], set()
+    for component in flatten(componentList):
+        shapeNode = getShapeNode(component[:component.find(".")])
+        offsetList = getFaceOffsetList(shapeNode)
+        for f in getComponentIndexList(component, len(shapeNode.vertexCountList)):
+            for vertex in shapeNode.vertexList[offsetList[f]:offsetList[f+1]]:
+                if not vertex in vertexSet:
+                    vertexList.append(vertex)
+                    vertexSet.add(vertex)
+    return shapeNode, vertexList
+
+
+def deleteFaces(shapeNode, faceSet):
+    """ Delete the given faces of the fake mesh and the vertices not used anymore, renumbering the others like Maya does.
+    """
+    offsetList = getFaceOffsetList(shapeNode)
+    vertexCountList, vertexList = [], []
+    for f, vertexCount in enumerate(shapeNode.vertexCountList):
+        if not f in faceSet:
+            vertexCountList.append(vertexCount)
+            vertexList.extend(shapeNode.vertexList[offsetList[f]:offsetList[f+1]])
+    usedList = sorted(set(vertexList))
+    indexDic = dict((vertex, i) for i, vertex in enumerate(usedList))
+    shapeNode.vertexCountList = vertexCountList
+    shapeNode.vertexList = [indexDic[vertex] for vertex in vertexList]
+    shapeNode.pointList = [shapeNode.pointList[vertex] for vertex in usedList if vertex < len(shapeNode.pointList)]
+
+
+@countCall
+def createNode(nodeType, name=None, parent=None, skipSelect=True, **kwargs):
+    """ Create a node and return its name.
+        The name is unique in the scene for world nodes and unique between the siblings for child nodes.
+    """
+    parentNode = getNode(parent)
+    name = name or nodeType+"1"
+    if not parentNode or name in [child.name for child in parentNode.childList]:
+        name = uniqueName(name)
+    node = FakeNode(name, nodeType, parentNode)
+    nodeDic.setdefault(name, []).append(node)
+    if parentNode:
+        parentNode.childList.append(node)
+    return getName(node)
+
+
+@countCall
+def group(*args, empty=True, name=None, parent=None, **kwargs):
+    """ Create an empty transform and return its name.
+    """
+    grp = createNode("transform", name=name or "group1", parent=parent)
+    for item in flatten(args):
+        cmds_parent(item, grp)
+    return grp
+
+
+@countCall
+def spaceLocator(name=None, **kwargs):
+    """ Create a transform with a locator shape.
+    """
+    transform = createNode("transform", name=name or "locator1")
+    createNode("locator", name=transform+"Shape", parent=transform)
+    return [transform]
+
+
+@countCall
+def joint(*args, name=None, **kwargs):
+    """ Create a joint under the selected joint.
+    """
+    parentNode = selectionList[0] if selectionList else None
+    jnt = createNode("joint", name=name or "joint1", parent=parentNode)
+    selectionList[:] = [getNode(jnt)]
+    return jnt
+
+
+@countCall
+def curve(name=None, point=None, degree=1, knot=None, periodic=False, **kwargs):
+    """ Create a transform with a nurbsCurve shape storing the points.
+    """
+    transform = createNode("transform", name=name or "curve1")
+    createNode("nurbsCurve", name=transform+"Shape", parent=transform)
+    shapeNode = getNode(transform).childList[-1]
+    shapeNode.pointList = [tuple(p) for p in (point or [])]
+    shapeNode.attrDic["degree"] = degree
+    return transform
+
+
+@countCall
+def polyCube(name=None, **kwargs):
+    """ Create a transform with a mesh shape.
+    """
+    transform = createNode("transform", name=name or "pCube1")
+    createNode("mesh", name=transform+"Shape", parent=transform)
+    return [transform, "polyCube1"]
+
+
+@countCall
+def duplicate(nodeName, name=None, **kwargs):
+    """ Duplicate the given node with its attributes and children.
+        The children keep their names like Maya does, so they have the same names of the original children.
+    """
+    node = getNode(flatten([nodeName])[0])
+    return [getName(copyNode(node, name or node.name, node.parent))]
+
+
+def copyNode(node, name, parentNode):
+    """ Copy the node with its attributes and children.
+        Return the new node.
+    """
+    newNode = getNode(createNode(node.nodeType, name=name, parent=parentNode))
+    newNode.attrDic.update(node.attrDic)
+    newNode.attrTypeDic.update(node.attrTypeDic)
+    newNode.pointList = list(node.pointList)
+    newNode.vertexCountList = list(node.vertexCountList)
+    newNode.vertexList = list(node.vertexList)
+    for child in list(node.childList):
+        copyNode(child, child.name, newNode)
+    return newNode
+
+
+@countCall
+def objExists(name):
+    """ Return True if the node or the node attribute exists.
+    """
+    if not isinstance(name, str):
+        return False
+    node = getNode(name)
+    if not node:
+        return False
+    if "." in name:
+        attr = name[name.find(".")+1:]
+        return attr in node.attrDic or attr in COMPOUND_ATTR_DIC
+    return True
+
+
+@countCall
+def addAttr(*nodeNames, longName=None, attributeType=None, dataType=None, defaultValue=None, **kwargs):
+    """ Add an attribute to the given nodes.
+        Query or edit the default value of the given plug.
+    """
+    if "ln" in kwargs:
+        longName = kwargs["ln"]
+    if kwargs.get("query") or kwargs.get("edit"):
+        node, attr = splitPlug(flatten(nodeNames)[0])
+        if kwargs.get("edit"):
+            if defaultValue is not None:
+                node.attrDefaultDic[attr] = defaultValue
+            return None
+        if defaultValue:
+            if attr in node.attrDefaultDic:
+                return node.attrDefaultDic[attr]
+            return TRANSFORM_ATTR_DIC.get(attr, 0.0)
+        return None
+    for nodeName in flatten(nodeNames) or selectionList:
+        node = getNode(nodeName)
+        if longName in node.attrDic:
+            raise RuntimeError("Found more than one attribute with the name "+longName)
+        node.attrTypeDic[longName] = attributeType or dataType
+        value = defaultValue
+        if value is None and dataType is None:
+            value = 0
+        node.attrDic[longName] = value
+        node.attrDefaultDic[longName] = value
+        if kwargs.get("keyable") or kwargs.get("k"):
+            node.keyableAttrList.append(longName)
+
+
+@countCall
+def setAttr(plug, *values, **kwargs):
+    """ Set the attribute value.
+    """
+    node, attr = splitPlug(plug)
+    if not node or not (attr in node.attrDic or attr in COMPOUND_ATTR_DIC):
+        raise RuntimeError("No object matches name: "+plug)
+    if "lock" in kwargs:
+        if kwargs["lock"] and not attr in node.lockedAttrList:
+            node.lockedAttrList.append(attr)
+        elif not kwargs["lock"] and attr in node.lockedAttrList:
+            node.lockedAttrList.remove(attr)
+    for flag, flagAttrList in [("keyable", node.keyableAttrList), ("channelBox", node.channelBoxAttrList)]:
+        if flag in kwargs:
+            if kwargs[flag] and not attr in flagAttrList:
+                flagAttrList.append(attr)
+            elif not kwargs[flag] and attr in flagAttrList:
+                flagAttrList.remove(attr)
+    if values:
+        if attr in COMPOUND_ATTR_DIC:
+            for childAttr, value in zip(COMPOUND_ATTR_DIC[attr], values):
+                node.attrDic[childAttr] = value
+        else:
+            node.attrDic[attr] = values[0] if len(values) == 1 else tuple(values)
+
+
+@countCall
+def getAttr(plug, **kwargs):
+    """ Return the attribute value.
+    """
+    node, attr = splitPlug(plug)
+    if not node or not (attr in node.attrDic or attr in COMPOUND_ATTR_DIC):
+        raise ValueError("No object matches name: "+plug)
+    if kwargs.get("type"):
+        return node.attrTypeDic.get(attr, "double")
+    if kwargs.get("lock"):
+        return attr in node.lockedAttrList
+    if attr in COMPOUND_ATTR_DIC:
+        return [tuple(node.attrDic[childAttr] for childAttr in COMPOUND_ATTR_DIC[attr])]
+    return node.attrDic[attr]
+
+
+@countCall
+def listAttr(nodeName, userDefined=False, **kwargs):
+    """ Return the attribute list of the given node.
+    """
+    node = getNode(flatten([nodeName])[0])
+    if node:
+        if userDefined:
+            attrList = [attr for attr in node.attrDic if attr in node.attrTypeDic]
+        else:
+            attrList = list(node.attrDic)
+        if kwargs.get("locked"):
+            attrList = [attr for attr in attrList if attr in node.lockedAttrList]
+        if kwargs.get("keyable"):
+            attrList = [attr for attr in attrList if attr in node.keyableAttrList]
+        if kwargs.get("channelBox"):
+            attrList = [attr for attr in attrList if attr in node.channelBoxAttrList]
+        if attrList:
+            return attrList
+
+
+@countCall
+def attributeQuery(attr, node=None, exists=False, attributeType=False, **kwargs):
+    """ Return True if the attribute exists in the node or the attribute type.
+    """
+    nodeItem = getNode(node)
+    if exists:
+        return bool(nodeItem) and attr in nodeItem.attrDic
+    if attributeType:
+        if not nodeItem or not attr in nodeItem.attrDic:
+            raise RuntimeError("No attribute named "+attr)
+        if attr in nodeItem.attrTypeDic:
+            return nodeItem.attrTypeDic[attr]
+        return STATIC_ATTR_TYPE_DIC.get(attr, "double")
+    return None
+
+
+@countCall
+def listAnimatable(nodeName, **kwargs):
+    """ Return the keyable plugs of the given node with its full path.
+    """
+    node = getNode(flatten([nodeName])[0])
+    if node and node.keyableAttrList:
+        return [longName(node)+"."+attr for attr in node.keyableAttrList]
+
+
+@countCall
+def deleteAttr(plug, **kwargs):
+    """ Remove the attribute from the node.
+    """
+    node, attr = splitPlug(plug)
+    node.attrDic.pop(attr, None)
+    node.attrTypeDic.pop(attr, None)
+
+
+def cmds_parent(childName, parentName=None, world=False):
+    """ Reparent the child node without counting the call.
+    """
+    child = getNode(childName)
+    if child.parent:
+        child.parent.childList.remove(child)
+    newParent = None if world else getNode(parentName)
+    child.parent = newParent
+    if newParent:
+        newParent.childList.append(child)
+    return getName(child)
+
+
+@countCall
+def parent(*args, world=False, shape=False, **kwargs):
+    """ Reparent the child nodes to the last given node or to the world.
+    """
+    itemList = flatten(args)
+    if world:
+        return [cmds_parent(item, world=True) for item in itemList]
+    return [cmds_parent(item, itemList[-1]) for item in itemList[:-1]]
+
+
+@countCall
+def listRelatives(nodeName=None, parent=False, children=False, allDescendents=False, type=None, fullPath=False, shapes=False, **kwargs):
+    """ Return the relatives of the given node like Maya does.
+        The allDescendents list is in the reverse depth-first order.
+    """
+    resultList = []
+    for item in flatten([nodeName]):
+        node = getNode(item)
+        if not node:
+            continue
+        if parent:
+            if node.parent:
+                resultList.append(node.parent)
+        elif allDescendents:
+            descendentList = []
+            stackList = list(reversed(node.childList))
+            while stackList:
+                child = stackList.pop()
+                descendentList.append(child)
+                stackList.extend(reversed(child.childList))
+            resultList.extend(reversed(descendentList))
+        else:
+            resultList.extend(node.childList)
+    if shapes:
+        type = type or "shape"
+    if type:
+        typeList = type if isinstance(type, (list, tuple)) else [type]
+        resultList = [item for item in resultList if any(isType(item, t) for t in typeList)]
+    if resultList:
+        if fullPath:
+            return [longName(item) for item in resultList]
+        return [getName(item) for item in resultList]
+    return None
+
+
+@countCall
+def ls(*patterns, selection=False, type=None, long=False, objectsOnly=False, recursive=False, transforms=False, assemblies=False, dag=False, **kwargs):
+    """ List the scene nodes filtering by name pattern, type and attribute patterns like "*.attrName".
+    """
+    if "sl" in kwargs:
+        selection = kwargs["sl"]
+    if transforms:
+        type = "transform"
+    patternList = flatten(patterns)
+    if patternList and all(".f[" in pattern for pattern in patternList):
+        # face components by the given node name:
+        componentList = []
+        for pattern in patternList:
+            nodeName = pattern[:pattern.find(".f[")]
+            faceList = getComponentIndexList(pattern, len(getShapeNode(nodeName).vertexCountList))
+            if kwargs.get("flatten") or kwargs.get("fl"):
+                componentList.extend(nodeName+".f["+str(f)+"]" for f in faceList)
+            elif faceList:
+                componentList.append(nodeName+".f["+str(faceList[0])+":"+str(faceList[-1])+"]")
+        return componentList
+    if selection:
+        nodeList = list(selectionList)
+    elif assemblies:
+        nodeList = [node for node in allNodes() if not node.parent and isType(node, "dagNode")]
+    elif patterns and not any(c in pattern for pattern in patternList for c in "*?["):
+        # only exact names, the scene nodes aren't listed:
+        nodeList = []
+    else:
+        nodeList = allNodes()
+    if patterns:
+        foundList, foundSet = [], set()
+        for pattern in patternList:
+            attr = None
+            if "." in pattern:
+                pattern, attr = pattern.split(".", 1)
+            if not any(c in pattern for c in "*?["):
+                # exact name:
+                node = getNode(pattern)
+                if node and not id(node) in foundSet and (not attr or attr in node.attrDic):
+                    foundList.append(node)
+                    foundSet.add(id(node))
+                continue
+            if "|" in pattern:
+                pattern = pattern[pattern.rfind("|")+1:]
+            for node in nodeList:
+                nodeName = node.name
+                if recursive and ":" in nodeName:
+                    nodeName = nodeName[nodeName.rfind(":")+1:]
+                if not id(node) in foundSet and (not attr or attr in node.attrDic):
+                    if fnmatch.fnmatchcase(nodeName, pattern):
+                        foundList.append(node)
+                        foundSet.add(id(node))
+        nodeList = foundList
+    if type:
+        typeList = type if isinstance(type, (list, tuple)) else [type]
+        nodeList = [node for node in nodeList if any(isType(node, t) for t in typeList)]
+    if dag:
+        nodeList = [node for node in nodeList if isType(node, "dagNode")]
+    if long:
+        return [longName(node) for node in nodeList]
+    return [getName(node) for node in nodeList]
+
+
+@countCall
+def select(*args, clear=False, add=False, **kwargs):
+    """ Change the current selection.
+    """
+    itemList = [getNode(item) for item in flatten(args) if getNode(item)]
+    if clear or not add:
+        del selectionList[:]
+    selectionList.extend(itemList)
+
+
+@countCall
+def rename(oldName, newName, **kwargs):
+    """ Rename the node and return its new name.
+    """
+    node = getNode(oldName)
+    newName = uniqueName(newName)
+    connectedList = [[getNode(plug) is node for plug in connection] for connection in connectionList]
+    nodeDic[node.name].remove(node)
+    if not nodeDic[node.name]:
+        del nodeDic[node.name]
+    node.name = newName
+    nodeDic[newName] = [node]
+    for c, connection in enumerate(connectionList):
+        connectionList[c] = tuple(newName+plug[plug.find("."):] if connected else plug for plug, connected in zip(connection, connectedList[c]))
+    return newName
+
+
+@countCall
+def delete(*nodeNames, **kwargs):
+    """ Delete the given nodes and their children, or the given face components.
+    """
+    faceDic, itemList = {}, []
+    for item in flatten(nodeNames):
+        if isinstance(item, str) and ".f[" in item:
+            shapeNode = getShapeNode(item[:item.find(".f[")])
+            faceDic.setdefault(id(shapeNode), [shapeNode, set()])[1].update(getComponentIndexList(item, len(shapeNode.vertexCountList)))
+        else:
+            itemList.append(item)
+    for shapeNode, faceSet in faceDic.values():
+        deleteFaces(shapeNode, faceSet)
+    for item in itemList:
+        node = getNode(item)
+        if node:
+            for child in list(node.childList):
+                delete(child)
+            if node.parent:
+                node.parent.childList.remove(node)
+            for shapeNode in node.geometryList:
+                if node in shapeNode.deformerList:
+                    shapeNode.deformerList.remove(node)
+            connectionList[:] = [connection for connection in connectionList if not node in [getNode(plug) for plug in connection]]
+            if node in selectionList:
+                selectionList.remove(node)
+            nodeDic[node.name].remove(node)
+            if not nodeDic[node.name]:
+                del nodeDic[node.name]
+
+
+@countCall
+def objectType(nodeName, isType=None, **kwargs):
+    """ Return the node type.
+    """
+    node = getNode(nodeName)
+    if isType:
+        return node.nodeType == isType
+    return node.nodeType
+
+
+@countCall
+def nodeType(nodeName, **kwargs):
+    """ Return the node type.
+    """
+    return getNode(nodeName).nodeType
+
+
+@countCall
+def connectAttr(sourcePlug, destinationPlug, force=False, **kwargs):
+    """ Connect the source plug to the destination plug.
+    """
+    for plug in [sourcePlug, destinationPlug]:
+        if not getNode(plug):
+            raise RuntimeError("No object matches name: "+plug)
+    for connection in list(connectionList):
+        if connection[1] == destinationPlug:
+            if not force:
+                raise RuntimeError(destinationPlug+" already has an incoming connection.")
+            connectionList.remove(connection)
+    connectionList.append((sourcePlug, destinationPlug))
+
+
+@countCall
+def disconnectAttr(sourcePlug, destinationPlug, **kwargs):
+    """ Remove the connection between the given plugs.
+    """
+    if (sourcePlug, destinationPlug) in connectionList:
+        connectionList.remove((sourcePlug, destinationPlug))
+
+
+@countCall
+def isConnected(sourcePlug, destinationPlug, **kwargs):
+    """ Return True if the plugs are connected.
+    """
+    return (sourcePlug, destinationPlug) in connectionList
+
+
+@countCall
+def listConnections(item, source=True, destination=True, plugs=False, connections=False, type=None, **kwargs):
+    """ Return the connected nodes or plugs of the given node or plug.
+    """
+    node = getNode(item)
+    resultList = []
+    for sourcePlug, destinationPlug in connectionList:
+        for thisPlug, otherPlug, useIt in [(sourcePlug, destinationPlug, destination), (destinationPlug, sourcePlug, source)]:
+            if useIt and getNode(thisPlug) is node and ("." not in item or thisPlug == item):
+                otherNode = getNode(otherPlug)
+                if type and not isType(otherNode, type):
+                    continue
+                if connections:
+                    resultList.append(thisPlug)
+                resultList.append(otherPlug if plugs else getName(otherNode))
+    if resultList:
+        return resultList
+    return None
+
+
+@countCall
+def namespace(add=None, exists=None, setNamespace=None, removeNamespace=None, **kwargs):
+    """ Add, remove or check the existence of namespaces.
+    """
+    if exists is not None:
+        return exists.strip(":") in namespaceList
+    if add:
+        if not add in namespaceList:
+            namespaceList.append(add)
+        return add
+    if removeNamespace:
+        if removeNamespace.strip(":") in namespaceList:
+            namespaceList.remove(removeNamespace.strip(":"))
+    return None
+
+
+@countCall
+def namespaceInfo(*args, listOnlyNamespaces=False, **kwargs):
+    """ Return the existing namespaces with the UI and shared ones that Maya always has.
+    """
+    if listOnlyNamespaces or kwargs.get("lon"):
+        return ["UI", "shared"]+namespaceList
+    if args and (kwargs.get("listNamespace") or kwargs.get("ls")):
+        return [getName(node) for node in allNodes() if node.name.startswith(args[0].strip(":")+":")]
+    return None
+
+
+def multMatrix(a, b):
+    """ Return the 3x3 matrix product a*b.
+    """
+    return [[sum(a[r][k]*b[k][c] for k in range(3)) for c in range(3)] for r in range(3)]
+
+
+def getTransformMatrix(node, translate=True, rotate=True, scale=True):
+    """ Return the row vector 3x3 matrix and the translation of the node with the xyz rotate order.
+    """
+    matrix = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    if scale:
+        matrix = [[node.attrDic["scaleX"], 0, 0], [0, node.attrDic["scaleY"], 0], [0, 0, node.attrDic["scaleZ"]]]
+    if rotate:
+        x, y, z = [math.radians(node.attrDic[attr]) for attr in ["rotateX", "rotateY", "rotateZ"]]
+        rotateXMatrix = [[1, 0, 0], [0, math.cos(x), math.sin(x)], [0, -math.sin(x), math.cos(x)]]
+        rotateYMatrix = [[math.cos(y), 0, -math.sin(y)], [0, 1, 0], [math.sin(y), 0, math.cos(y)]]
+        rotateZMatrix = [[math.cos(z), math.sin(z), 0], [-math.sin(z), math.cos(z), 0], [0, 0, 1]]
+        matrix = multMatrix(multMatrix(multMatrix(matrix, rotateXMatrix), rotateYMatrix), rotateZMatrix)
+    translation = [0, 0, 0]
+    if translate:
+        translation = [node.attrDic["translateX"], node.attrDic["translateY"], node.attrDic["translateZ"]]
+    return matrix, translation
+
+
+@countCall
+def makeIdentity(*args, apply=False, translate=False, rotate=False, scale=False, **kwargs):
+    """ Freeze the transformations setting them to the default values.
+        When applying, the curve shape points get the frozen transformation.
+    """
+    if not (translate or rotate or scale):
+        translate = rotate = scale = True
+    attrPrefixList = [prefix for prefix, use in [("translate", translate), ("rotate", rotate), ("scale", scale)] if use]
+    for item in flatten(args):
+        node = getNode(item)
+        if apply:
+            matrix, translation = getTransformMatrix(node, translate, rotate, scale)
+            for child in node.childList:
+                if child.nodeType == "nurbsCurve":
+                    child.pointList = [tuple(sum(point[k]*matrix[k][c] for k in range(3))+translation[c] for c in range(3)) for point in child.pointList]
+        for attr, value in TRANSFORM_ATTR_DIC.items():
+            if attr.startswith(tuple(attrPrefixList)) and attr != "rotateOrder":
+                node.attrDic[attr] = value
+
+
+@countCall
+def rotate(x, y, z, *args, **kwargs):
+    """ Set the rotation of the given nodes.
+    """
+    for item in flatten(args) or selectionList:
+        node = getNode(item)
+        node.attrDic.update({"rotateX" : x, "rotateY" : y, "rotateZ" : z})
+
+
+@countCall
+def move(x, y, z, *args, **kwargs):
+    """ Set the translation of the given nodes.
+    """
+    for item in flatten(args) or selectionList:
+        node = getNode(item)
+        node.attrDic.update({"translateX" : x, "translateY" : y, "translateZ" : z})
+
+
+@countCall
+def xform(*args, query=False, **kwargs):
+    """ Return the stored translation when querying.
+    """
+    if query:
+        node = getNode(flatten(args)[0])
+        return [node.attrDic["translateX"], node.attrDic["translateY"], node.attrDic["translateZ"]]
+    return None
+
+
+@countCall
+def file(*args, query=False, sceneName=False, modified=False, **kwargs):
+    """ Open, save and rename the in-memory scene, the scene file stores it with pickle.
+        Return the scene name, empty if it wasn't saved, and a not modified scene.
+    """
+    if kwargs.get("new"):
+        newScene()
+        return ""
+    if query and sceneName:
+        return fakeStateDic["sceneName"]
+    if query and modified:
+        return False
+    if kwargs.get("rename"):
+        fakeStateDic["sceneName"] = kwargs["rename"]
+        return kwargs["rename"]
+    if kwargs.get("save"):
+        with open(fakeStateDic["sceneName"], "wb") as sceneFile:
+            pickle.dump((nodeDic, connectionList, namespaceList), sceneFile)
+        return fakeStateDic["sceneName"]
+    if kwargs.get("open"):
+        with open(args[0], "rb") as sceneFile:
+            sceneData = pickle.load(sceneFile)
+        newScene()
+        nodeDic.update(sceneData[0])
+        connectionList.extend(sceneData[1])
+        namespaceList.extend(sceneData[2])
+        fakeStateDic["sceneName"] = args[0]
+        return args[0]
+    return None
+
+
+@countCall
+def about(version=False, **kwargs):
+    """ Return the fake Maya version.
+    """
+    if version:
+        return MAYA_VERSION
+    if kwargs.get("batch"):
+        return fakeStateDic["batch"]
+    return None
+
+
+@countCall
+def progressWindow(*args, **kwargs):
+    """ Return if the progress was cancelled when asking it, after the given number of edits to simulate the user cancel.
+    """
+    if kwargs.get("query"):
+        cancelAfter = fakeStateDic["cancelAfter"]
+        return cancelAfter is not None and fakeStateDic["progressEdits"] >= cancelAfter
+    if kwargs.get("edit"):
+        fakeStateDic["progressEdits"] += 1
+    elif not kwargs.get("endProgress"):
+        fakeStateDic["progressEdits"] = 0
+    return None
+
+
+def setBatchMode(value=True):
+    """ Set if the fake Maya answers it's running without interface.
+    """
+    fakeStateDic["batch"] = bool(value)
+
+
+def setProgressCancel(cancelAfter=None):
+    """ Make the progress window cancelled after the given number of edits, or never if None.
+    """
+    fakeStateDic["cancelAfter"] = cancelAfter
+
+
+@countCall
+def optionVar(*args, query=None, exists=None, remove=None, **kwargs):
+    """ Store the option variables in memory.
+    """
+    if exists:
+        return exists in optionVarDic
+    if query:
+        return optionVarDic.get(query)
+    if remove:
+        optionVarDic.pop(remove, None)
+    for flag in ["stringValue", "intValue", "floatValue", "sv", "iv", "fv"]:
+        if flag in kwargs:
+            optionVarDic[kwargs[flag][0]] = kwargs[flag][1]
+    return None
+
+
+def createUICommand(uiType):
+    """ Return a counted UI command that stores the created controls and their flags.
+        Queries return the stored flag value or a default one.
+    """
+    def runUI(*args, query=False, edit=False, exists=False, **kwargs):
+        callCountDic[uiType] = callCountDic.get(uiType, 0)+1
+        name = args[0] if args and isinstance(args[0], str) else None
+        if exists:
+            return name in uiDic
+        if query:
+            flagDic = uiDic.get(name, {})
+            for flag, value in kwargs.items():
+                if value is True:
+                    return flagDic.get(flag, UI_QUERY_DEFAULT_DIC.get(flag))
+            return None
+        if edit:
+            if name in uiDic:
+                uiDic[name].update(kwargs)
+            return None
+        if not name or name in uiDic:
+            name = uiType+str(len(uiDic)+1)
+        uiDic[name] = dict(kwargs, uiType=uiType)
+        return name
+    runUI.__name__ = uiType
+    return runUI
+
+
+@countCall
+def deleteUI(*args, **kwargs):
+    """ Remove the given UI controls.
+    """
+    for name in flatten(args):
+        uiDic.pop(name, None)
+
+
+for uiType in UI_COMMAND_LIST:
+    globals()[uiType] = createUICommand(uiType)
+
+
+@countCall
+def polyNormalPerVertex(*args, query=False, **kwargs):
+    """ Fake meshes don't have locked normals.
+    """
+    if query:
+        return [False]
+    return None
+
+
+def getShapeNode(name):
+    """ Return the first not intermediate shape node of the given transform or the given shape node.
+    """
+    node = getNode(name)
+    if node and isType(node, "transform"):
+        for child in node.childList:
+            if isType(child, "shape") and not child.attrDic.get("intermediateObject"):
+                return child
+        return None
+    return node
+
+
+def getVertexCount(shapeNode):
+    """ Return the number of vertices of the fake mesh.
+    """
+    if shapeNode.vertexList:
+        return max(shapeNode.vertexList)+1
+    return len(shapeNode.pointList)
+
+
+def getInitialWeightList(vertexCount, influenceCount):
+    """ Return the weights of a new skinCluster, each vertex shared by two consecutive influences.
+        Each weight is a dictionary of the influence index and its value.
+    """
+    if influenceCount == 1:
+        return [{0 : 1.0} for v in range(vertexCount)]
+    return [{v % influenceCount : 0.75, (v+1) % influenceCount : 0.25} for v in range(vertexCount)]
+
+
+@countCall
+def skinCluster(*args, edit=False, query=False, name=None, multi=False, skinMethod=0, influence=False, geometry=False, addInfluence=None, removeInfluence=None, weight=0.0, **kwargs):
+    """ Create, edit and query fake skinCluster nodes.
+        The given joints are the influences and the other items the geometries, like Maya does.
+        In edit mode, the geometry flag adds the given geometries to the skinCluster with their own weights.
+    """
+    if query:
+        node = getNode(flatten(args)[0])
+        if node and not isType(node, "skinCluster"):
+            node = ([deformer for deformer in reversed((getShapeNode(node) or node).deformerList) if isType(deformer, "skinCluster")] or [None])[0]
+        if kwargs.get("weightedInfluence") or kwargs.get("wi"):
+            return [getName(influenceNode) for i, influenceNode in enumerate(node.influenceList) if any(vertexWeightDic.get(i) for weightList in node.geometryWeightList for vertexWeightDic in weightList)]
+        if influence or kwargs.get("inf"):
+            return [getName(influenceNode) for influenceNode in node.influenceList]
+        if geometry or kwargs.get("g"):
+            return [getName(shapeNode) for shapeNode in node.geometryList]
+        if skinMethod or kwargs.get("sm"):
+            return node.attrDic.get("skinningMethod", 0)
+        return None
+    itemList = flatten(args)
+    if edit:
+        shapeNode = getShapeNode(itemList[0])
+        node = getNode(itemList[0])
+        if not isType(node, "skinCluster"):
+            node = [deformer for deformer in shapeNode.deformerList if isType(deformer, "skinCluster")][-1]
+        if addInfluence:
+            for influenceName in flatten([addInfluence]):
+                influenceNode = getNode(influenceName)
+                if not influenceNode in node.influenceList:
+                    node.influenceList.append(influenceNode)
+        if geometry:
+            for item in flatten([geometry]):
+                geometryNode = getShapeNode(item)
+                if not geometryNode in node.geometryList:
+                    node.geometryList.append(geometryNode)
+                    node.geometryWeightList.append(getInitialWeightList(getVertexCount(geometryNode), len(node.influenceList)))
+                    geometryNode.deformerList.append(node)
+        if removeInfluence:
+            for influenceName in flatten([removeInfluence]):
+                influenceNode = getNode(influenceName)
+                if influenceNode in node.influenceList:
+                    i = node.influenceList.index(influenceNode)
+                    node.influenceList.pop(i)
+                    node.geometryWeightList = [[dict((j if j < i else j-1, value) for j, value in vertexWeightDic.items() if j != i) for vertexWeightDic in weightList] for weightList in node.geometryWeightList]
+        return None
+    influenceList = [getNode(item) for item in itemList if isType(getNode(item), "joint")]
+    geometryList = [getShapeNode(item) for item in itemList if not isType(getNode(item), "joint")]
+    shapeNode = geometryList[0]
+    if not multi and any(isType(deformer, "skinCluster") for deformer in shapeNode.deformerList):
+        raise RuntimeError("Skin on "+getName(shapeNode)+" was already connected to a skinCluster.")
+    node = getNode(createNode("skinCluster", name=name or "skinCluster1"))
+    node.attrDic["skinningMethod"] = skinMethod
+    node.geometryList = [shapeNode]
+    node.influenceList = influenceList
+    node.geometryWeightList = [getInitialWeightList(getVertexCount(shapeNode), len(influenceList))]
+    shapeNode.deformerList.append(node)
+    return [getName(node)]
+
+
+@countCall
+def listHistory(*args, **kwargs):
+    """ Return the deformers of the given geometries, the last one first, followed by their influences.
+    """
+    resultList, foundSet = [], set()
+    for item in flatten(args):
+        shapeNode = getShapeNode(item)
+        if not shapeNode:
+            continue
+        for deformer in reversed(shapeNode.deformerList):
+            for node in [deformer]+deformer.influenceList:
+                if not id(node) in foundSet:
+                    resultList.append(node)
+                    foundSet.add(id(node))
+    return [getName(node) for node in resultList] or None
+
+
+@countCall
+def findDeformers(*args, **kwargs):
+    """ Return the deformers of the given geometry, the last one first.
+    """
+    shapeNode = getShapeNode(flatten(args)[0])
+    if shapeNode and shapeNode.deformerList:
+        return [getName(deformer) for deformer in reversed(shapeNode.deformerList)]
+    return None
+
+
+@countCall
+def copySkinWeights(*args, sourceSkin=None, destinationSkin=None, **kwargs):
+    """ Copy the weights between two skinClusters associating the influences by name.
+        The surface association uses the vertex at the same relative index of the source mesh instead of the closest point.
+    """
+    sourceNode = getNode(sourceSkin)
+    destinationNode = getNode(destinationSkin)
+    indexDic = dict((s, destinationNode.influenceList.index(influenceNode)) for s, influenceNode in enumerate(sourceNode.influenceList) if influenceNode in destinationNode.influenceList)
+    sourceCount = len(sourceNode.weightList)
+    destinationCount = len(destinationNode.weightList)
+    weightList = []
+    for d in range(destinationCount):
+        sourceWeightDic = sourceNode.weightList[d*sourceCount // destinationCount] if sourceCount else {}
+        vertexWeightDic = dict((indexDic[s], value) for s, value in sourceWeightDic.items() if s in indexDic)
+        total = sum(vertexWeightDic.values())
+        if total:
+            vertexWeightDic = dict((i, value/total) for i, value in vertexWeightDic.items())
+        weightList.append(vertexWeightDic)
+    destinationNode.weightList = weightList
+
+
+@countCall
+def polyUVSet(*args, query=False, **kwargs):
+    """ Fake meshes only have the default uv set.
+    """
+    if query:
+        return ["map1"]
+    return None
+
+
+@countCall
+def skinPercent(skinClusterName, *components, ignoreBelow=0.0, transform=None, query=False, **kwargs):
+    """ Query the weights of the given components, with many vertices it returns the average weight like Maya does.
+        Without a transform, it returns the influences with an average weight above the ignoreBelow value.
+    """
+    if not query:
+        return None
+    node = getNode(skinClusterName)
+    shapeNode, vertexList = getComponentVertexList(components)
+    weightList = node.geometryWeightList[node.geometryList.index(shapeNode)]
+    averageList = [sum(weightList[v].get(i, 0.0) for v in vertexList)/len(vertexList) for i in range(len(node.influenceList))]
+    if transform is None:
+        return [getName(influenceNode) for i, influenceNode in enumerate(node.influenceList) if averageList[i] > ignoreBelow]
+    return averageList[node.influenceList.index(getNode(transform))]
@@ -0,0 +1,100 @@
+# importing libraries:
+import re
+import math
+from . import cmds
+
+FAKE_MEL_VERSION = 1.3
+
+# evaluated mel commands:
+evalList = []
+
+# quoted strings, statement separators and words:
+MEL_TOKEN_RE = re.compile(r'("(?:[^"\\]|\\.)*")|(;|[^\s;"]+)')
+MEL_ESCAPE_RE = re.compile(r'\\(.)')
+ESCAPE_DIC = {"n" : "\n", "t" : "\t"}
+
+# mel commands run in the fake scene, the others are only stored:
+MEL_COMMAND_LIST = ["addAttr", "setAttr"]
+MEL_FLAG_DIC = {
+                "longName" : "longName",
+                "ln" : "longName",
+                "attributeType" : "attributeType",
+                "at" : "attributeType",
+                "dataType" : "dataType",
+                "dt" : "dataType",
+                "defaultValue" : "defaultValue",
+                "dv" : "defaultValue",
+                "keyable" : "keyable",
+                "k" : "keyable",
+                "channelBox" : "channelBox",
+                "cb" : "channelBox",
+                "lock" : "lock",
+                "l" : "lock",
+                "type" : "type",
+                }
+
+
+def getValue(token):
+    """ Return the mel token as a number if possible.
+        Raises RuntimeError for inf and nan like the mel parser does.
+    """
+    for valueType in [int, float]:
+        try:
+            value = valueType(token)
+        except ValueError:
+            continue
+        if valueType == float and not math.isfinite(value):
+            raise RuntimeError("Error while parsing arguments: "+token)
+        return value
+    return token
+
+
+def splitStatements(command):
+    """ Return a list of token lists for each mel statement.
+    """
+    statementList = [[]]
+    for quoted, token in MEL_TOKEN_RE.findall(command):
+        if token == ";":
+            statementList.append([])
+        elif token:
+            statementList[-1].append(token)
+        else:
+            statementList[-1].append(MEL_ESCAPE_RE.sub(lambda match: ESCAPE_DIC.get(match.group(1), match.group(1)), quoted[1:-1]))
+    return [statement for statement in statementList if statement]
+
+
+def runStatement(tokenList):
+    """ Run the addAttr and setAttr statements with the fake cmds without counting them.
+        Return False if the command isn't supported.
+    """
+    if not tokenList[0] in MEL_COMMAND_LIST:
+        return False
+    flagDic = {}
+    argList = []
+    t = 1
+    while t < len(tokenList):
+        token = tokenList[t]
+        if token.startswith("-") and token[1:] in MEL_FLAG_DIC:
+            flagDic[MEL_FLAG_DIC[token[1:]]] = getValue(tokenList[t+1])
+            t += 2
+        else:
+            argList.append(token)
+            t += 1
+    if tokenList[0] == "setAttr":
+        if flagDic.get("type") == "string":
+            valueList = argList[1:]
+        else:
+            valueList = [getValue(arg) for arg in argList[1:]]
+        cmds.setAttr.original(argList[0], *valueList, **flagDic)
+    else:
+        cmds.addAttr.original(*argList, **flagDic)
+    return True
+
+
+def eval(command, *args):
+    """ Store the mel command and run the supported statements in the fake scene.
+    """
+    cmds.callCountDic["mel.eval"] = cmds.callCountDic.get("mel.eval", 0)+1
+    evalList.append(command)
+    for tokenList in splitStatements(command):
+        runStatement(tokenList)
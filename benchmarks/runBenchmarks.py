@@ -0,0 +1,162 @@
+# importing libraries:
+import benchScene
+import benchHook
+import benchAttr
+import os
+import json
+import time
+import argparse
+import platform
+import subprocess
+from maya import cmds
+from dpAutoRigSystem import dpAutoRig
+from dpAutoRigSystem.Modules.Library import dpUtils
+
+# Run all benchmarks outside of Maya using the in-memory fake Maya and write a json report:
+#   python benchmarks/runBenchmarks.py --sizes 100 1000 --repeat 3 --output benchmarks/report.json
+
+DEFAULT_SIZE_LIST = [100, 1000]
+DEFAULT_REPEAT = 3
+CONTROL_TYPE_LIST = ["Circle", "Square", "Cube", "Locator", "Triangle", "Ellipse", "Ball", "Diamond"]
+VALIDATOR_DIR_LIST = [dpAutoRig.CHECKIN, dpAutoRig.CHECKOUT]
+
+
+def getCommit():
+    """ Return the current git commit hash or None if it isn't a git repository.
+    """
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=benchScene.REPO_PATH, stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+
+def measure(benchName, size, func, repeat, setup=None):
+    """ Time the given function and return a result dictionary.
+        Errors are stored in the result to keep running the other benchmarks.
+    """
+    resultDic = {"benchmark" : benchName, "size" : size}
+    try:
+        nodeCountList = []
+        def runSetup():
+            if setup:
+                setup()
+            nodeCountList.append(cmds.getNodeCount())
+        bestTime, callCount, result = benchScene.timeIt(func, repeat, runSetup)
+        resultDic.update({"time" : bestTime, "calls" : callCount, "callCountDic" : cmds.getCallCountDic(), "nodesCreated" : cmds.getNodeCount()-nodeCountList[-1]})
+    except Exception as e:
+        resultDic["error"] = repr(e)
+    return resultDic
+
+
+def runGuideCreation(size, repeat):
+    """ Create the given number of guide modules.
+    """
+    return [measure("guideCreation", size, lambda: benchScene.createGuideHierarchy(size), repeat, cmds.newScene)]
+
+
+def runHook(size, repeat):
+    """ Mount the hook dictionary with the legacy and the current function.
+    """
+    benchScene.createGuideHierarchy(size)
+    return [measure("hook", size, dpUtils.hook, repeat), measure("hookLegacy", size, benchHook.legacyHook, repeat)]
+
+
+def runOriginedFrom(size, repeat):
+    """ Read the originedFrom dictionary of a rigged like scene.
+    """
+    benchScene.createRiggedScene(size)
+    return [measure("getOriginedFromDic", size, dpUtils.getOriginedFromDic, repeat)]
+
+
+def runControlCreation(size, repeat, fakeUI):
+    """ Create the given number of controls with simple and combined control types.
+    """
+    def createControls():
+        for n in range(size):
+            ctrlType = CONTROL_TYPE_LIST[n % len(CONTROL_TYPE_LIST)]
+            fakeUI.ctrls.cvControl(ctrlType, ctrlType+"_"+str(n)+"_Ctrl", r=1+n%3, d=1+2*(n%2))
+    return [measure("controlCreation", size, createControls, repeat, cmds.newScene)]
+
+
+def runControlInfo(size, repeat):
+    """ Add the control information attributes with the legacy calls and the batched schema.
+    """
+    nodeList = []
+    def setup():
+        nodeList[:] = benchAttr.createNodeList(size)
+    return [measure("controlInfo", size, lambda: [benchAttr.schemaControlInfo(node) for node in nodeList], repeat, setup), measure("controlInfoLegacy", size, lambda: [benchAttr.legacyControlInfo(node) for node in nodeList], repeat, setup)]
+
+
+def runValidators(size, repeat, fakeUI):
+    """ Run all validators in verify mode in a scene with guides and rigged nodes.
+    """
+    def setupScene():
+        benchScene.createRiggedScene(size)
+        benchScene.createGuideHierarchy(size, clear=False)
+    resultList = []
+    setupScene()
+    for validatorDir in VALIDATOR_DIR_LIST:
+        validatorPath = os.path.join(benchScene.REPO_PATH, "dpAutoRigSystem", validatorDir)
+        for fileName in sorted(os.listdir(validatorPath)):
+            if fileName.startswith("dp") and fileName.endswith(".py"):
+                moduleName = "dpAutoRigSystem."+validatorDir.replace("/", ".")+"."+fileName[:-3]
+                try:
+                    validatorInst = fakeUI.initValidatorModule(moduleName)
+                except Exception as e:
+                    resultList.append({"benchmark" : "validator:"+fileName[:-3], "size" : size, "error" : repr(e)})
+                    continue
+                resultList.append(measure("validator:"+fileName[:-3], size, validatorInst.runValidator, repeat))
+    return resultList
+
+
+def run(sizeList=DEFAULT_SIZE_LIST, repeat=DEFAULT_REPEAT, benchList=None):
+    """ Run the benchmarks for each scene size.
+        Return the report dictionary.
+    """
+    fakeUI = benchScene.FakeUI()
+    benchDic = {
+                "guideCreation" : lambda size: runGuideCreation(size, repeat),
+                "hook" : lambda size: runHook(size, repeat),
+                "getOriginedFromDic" : lambda size: runOriginedFrom(size, repeat),
+                "controlCreation" : lambda size: runControlCreation(size, repeat, fakeUI),
+                "controlInfo" : lambda size: runControlInfo(size, repeat),
+                "validators" : lambda size: runValidators(size, repeat, fakeUI),
+                }
+    reportDic = {
+                "dpARVersion" : dpAutoRig.DPAR_VERSION_PY3,
+                "fakeCmdsVersion" : cmds.FAKE_CMDS_VERSION,
+                "python" : platform.python_version(),
+                "date" : time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+                "commit" : getCommit(),
+                "repeat" : repeat,
+                "sizes" : list(sizeList),
+                "results" : []
+                }
+    for benchName in benchList or list(benchDic):
+        for size in sizeList:
+            reportDic["results"].extend(benchDic[benchName](size))
+    return reportDic
+
+
+def printReport(reportDic):
+    """ Print a short table with the report results.
+    """
+    for resultDic in reportDic["results"]:
+        if "error" in resultDic:
+            print("%-40s %8i   error: %s" % (resultDic["benchmark"], resultDic["size"], resultDic["error"]))
+        else:
+            print("%-40s %8i %10.4f s %10i calls %8i nodes" % (resultDic["benchmark"], resultDic["size"], resultDic["time"], resultDic["calls"], resultDic["nodesCreated"]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="dpAutoRigSystem benchmarks using the in-memory fake Maya.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZE_LIST, help="scene sizes to run")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="repetitions, the best time is stored")
+    parser.add_argument("--bench", nargs="+", default=None, help="benchmark names to run, all by default")
+    parser.add_argument("--output", default=os.path.join(benchScene.BENCHMARKS_PATH, "report.json"), help="json report path")
+    args = parser.parse_args()
+    reportDic = run(args.sizes, args.repeat, args.bench)
+    printReport(reportDic)
+    with open(args.output, "w") as outFile:
+        json.dump(reportDic, outFile, indent=4)
+    print("\nReport file", args.output)
@@ -1,5 +1,4 @@
 # importing libraries:
-from maya import cmds
 from maya import mel
 from .. import dpBaseControlClass
 
@@ -9,7 +8,7 @@ TITLE = "m113_arrow"
 DESCRIPTION = "m099_cvControlDesc"
 ICON = "/Icons/dp_arrow.png"
 
-DP_ARROW_VERSION = 1.3
+DP_ARROW_VERSION = 1.4
 
 
 class Arrow(dpBaseControlClass.ControlStartClass):
@@ -39,14 +38,11 @@ class Arrow(dpBaseControlClass.ControlStartClass):
             mel.eval('error \"'+ self.dpUIinst.lang['e001_GuideNotChecked'] +' - '+ (", ").join(checkResultList) +'\";')
     
     
-    def generateCombineCurves(self, useUI, cvID, cvName, cvSize, cvDegree, cvDirection, *args):
-        """ Combine controls in order to return it.
+    def getCombineShapeList(self, *args):
+        """ Return the shapes to combine as (controlModule, sizeFactor, transformList).
+            Each transform dictionary is frozen in order and the translation is relative to the control size.
         """
-        # load module instance
-        arrowFlatInstance = self.dpUIinst.initExtraModule('dpArrowFlat', self.controlsGuideDir)
-        # creating curve shapes:
-        curve1 = arrowFlatInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        curve2 = arrowFlatInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        cmds.setAttr(curve2+".rotateY", 90)
-        mainCurve = self.combineCurves([curve1, curve2])
-        return mainCurve
\ No newline at end of file
+        return [
+                ("dpArrowFlat", 1, []),
+                ("dpArrowFlat", 1, [{"rotate" : (0, 90, 0)}])
+                ]
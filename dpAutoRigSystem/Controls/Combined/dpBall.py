@@ -1,5 +1,4 @@
 # importing libraries:
-from maya import cmds
 from maya import mel
 from .. import dpBaseControlClass
 
@@ -9,7 +8,7 @@ TITLE = "m116_ball"
 DESCRIPTION = "m099_cvControlDesc"
 ICON = "/Icons/dp_ball.png"
 
-DP_BALL_VERSION = 1.3
+DP_BALL_VERSION = 1.4
 
 
 class Ball(dpBaseControlClass.ControlStartClass):
@@ -39,16 +38,12 @@ class Ball(dpBaseControlClass.ControlStartClass):
             mel.eval('error \"'+ self.dpUIinst.lang['e001_GuideNotChecked'] +' - '+ (", ").join(checkResultList) +'\";')
     
     
-    def generateCombineCurves(self, useUI, cvID, cvName, cvSize, cvDegree, cvDirection, *args):
-        """ Combine controls in order to return it.
+    def getCombineShapeList(self, *args):
+        """ Return the shapes to combine as (controlModule, sizeFactor, transformList).
+            Each transform dictionary is frozen in order and the translation is relative to the control size.
         """
-        # load module instance
-        circleInstance = self.dpUIinst.initExtraModule('dpCircle', self.controlsGuideDir)
-        # creating curve shapes:
-        curve1 = circleInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        curve2 = circleInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        curve3 = circleInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        cmds.setAttr(curve2+".rotateY", -90)
-        cmds.setAttr(curve3+".rotateX", 90)
-        mainCurve = self.combineCurves([curve1, curve2, curve3])
-        return mainCurve
\ No newline at end of file
+        return [
+                ("dpCircle", 1, []),
+                ("dpCircle", 1, [{"rotate" : (0, -90, 0)}]),
+                ("dpCircle", 1, [{"rotate" : (90, 0, 0)}])
+                ]
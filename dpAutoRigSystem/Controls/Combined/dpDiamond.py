@@ -1,5 +1,4 @@
 # importing libraries:
-from maya import cmds
 from maya import mel
 from .. import dpBaseControlClass
 
@@ -9,7 +8,7 @@ TITLE = "m105_diamond"
 DESCRIPTION = "m099_cvControlDesc"
 ICON = "/Icons/dp_diamond.png"
 
-DP_DIAMOND_VERSION = 1.5
+DP_DIAMOND_VERSION = 1.6
 
 
 class Diamond(dpBaseControlClass.ControlStartClass):
@@ -39,18 +38,12 @@ class Diamond(dpBaseControlClass.ControlStartClass):
             mel.eval('error \"'+ self.dpUIinst.lang['e001_GuideNotChecked'] +' - '+ (", ").join(checkResultList) +'\";')
     
     
-    def generateCombineCurves(self, useUI, cvID, cvName, cvSize, cvDegree, cvDirection, *args):
-        """ Combine controls in order to return it.
+    def getCombineShapeList(self, *args):
+        """ Return the shapes to combine as (controlModule, sizeFactor, transformList).
+            Each transform dictionary is frozen in order and the translation is relative to the control size.
         """
-        # load module instance
-        squareInstance = self.dpUIinst.initExtraModule('dpSquare', self.controlsGuideDir)
-        # creating curve shapes:
-        curve1 = squareInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        cmds.setAttr(curve1+".rotateZ", 45)
-        cmds.makeIdentity(curve1, apply=True)
-        curve2 = cmds.duplicate(curve1)[0]
-        cmds.setAttr(curve2+".rotateX", 90)
-        curve3 = cmds.duplicate(curve1)[0]
-        cmds.setAttr(curve3+".rotateY", 90)
-        mainCurve = self.combineCurves([curve1, curve2, curve3])
-        return mainCurve
\ No newline at end of file
+        return [
+                ("dpSquare", 1, [{"rotate" : (0, 0, 45)}]),
+                ("dpSquare", 1, [{"rotate" : (0, 0, 45)}, {"rotate" : (90, 0, 0)}]),
+                ("dpSquare", 1, [{"rotate" : (0, 0, 45)}, {"rotate" : (0, 90, 0)}])
+                ]
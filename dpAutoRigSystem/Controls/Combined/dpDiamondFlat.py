@@ -1,5 +1,4 @@
 # importing libraries:
-from maya import cmds
 from maya import mel
 from .. import dpBaseControlClass
 
@@ -9,7 +8,7 @@ TITLE = "m177_diamondFlat"
 DESCRIPTION = "m099_cvControlDesc"
 ICON = "/Icons/dp_diamondFlat.png"
 
-DP_DIAMONDFLAT_VERSION = 1.5
+DP_DIAMONDFLAT_VERSION = 1.6
 
 
 class DiamondFlat(dpBaseControlClass.ControlStartClass):
@@ -39,13 +38,10 @@ class DiamondFlat(dpBaseControlClass.ControlStartClass):
             mel.eval('error \"'+ self.dpUIinst.lang['e001_GuideNotChecked'] +' - '+ (", ").join(checkResultList) +'\";')
     
     
-    def generateCombineCurves(self, useUI, cvID, cvName, cvSize, cvDegree, cvDirection, *args):
-        """ Combine controls in order to return it.
+    def getCombineShapeList(self, *args):
+        """ Return the shapes to combine as (controlModule, sizeFactor, transformList).
+            Each transform dictionary is frozen in order and the translation is relative to the control size.
         """
-        # load module instance
-        squareInstance = self.dpUIinst.initExtraModule('dpSquare', self.controlsGuideDir)
-        # creating curve shapes:
-        curve1 = squareInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        cmds.setAttr(curve1+".rotateZ", 45)
-        mainCurve = self.combineCurves([curve1])
-        return mainCurve
\ No newline at end of file
+        return [
+                ("dpSquare", 1, [{"rotate" : (0, 0, 45)}])
+                ]
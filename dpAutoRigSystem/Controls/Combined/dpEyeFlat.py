@@ -1,5 +1,4 @@
 # importing libraries:
-from maya import cmds
 from maya import mel
 from .. import dpBaseControlClass
 
@@ -9,7 +8,7 @@ TITLE = "m211_eyeFlat"
 DESCRIPTION = "m099_cvControlDesc"
 ICON = "/Icons/dp_eyeFlat.png"
 
-DP_EYEFLAT_VERSION = 1.1
+DP_EYEFLAT_VERSION = 1.2
 
 
 class EyeFlat(dpBaseControlClass.ControlStartClass):
@@ -39,17 +38,11 @@ class EyeFlat(dpBaseControlClass.ControlStartClass):
             mel.eval('error \"'+ self.dpUIinst.lang['e001_GuideNotChecked'] +' - '+ (", ").join(checkResultList) +'\";')
     
     
-    def generateCombineCurves(self, useUI, cvID, cvName, cvSize, cvDegree, cvDirection, *args):
-        """ Combine controls in order to return it.
+    def getCombineShapeList(self, *args):
+        """ Return the shapes to combine as (controlModule, sizeFactor, transformList).
+            Each transform dictionary is frozen in order and the translation is relative to the control size.
         """
-        # load module instance
-        lenFlatInstance = self.dpUIinst.initExtraModule('dpLens', self.controlsGuideDir)
-        circleFlatInstance = self.dpUIinst.initExtraModule('dpCircle', self.controlsGuideDir)
-        # creating curve shapes:
-        curve1 = lenFlatInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        curve2 = circleFlatInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        cmds.setAttr(curve1+".rotateZ", 90)
-        cmds.setAttr(curve2+".scaleX", 0.38)
-        cmds.setAttr(curve2+".scaleY", 0.38)
-        mainCurve = self.combineCurves([curve1, curve2])
-        return mainCurve
\ No newline at end of file
+        return [
+                ("dpLens", 1, [{"rotate" : (0, 0, 90)}]),
+                ("dpCircle", 1, [{"scale" : (0.38, 0.38, 1)}])
+                ]
@@ -1,5 +1,4 @@
 # importing libraries:
-from maya import cmds
 from maya import mel
 from .. import dpBaseControlClass
 
@@ -9,7 +8,7 @@ TITLE = "m103_hexagram"
 DESCRIPTION = "m099_cvControlDesc"
 ICON = "/Icons/dp_hexagram.png"
 
-DP_HEXAGRAM_VERSION = 1.3
+DP_HEXAGRAM_VERSION = 1.4
 
 
 class Hexagram(dpBaseControlClass.ControlStartClass):
@@ -39,14 +38,11 @@ class Hexagram(dpBaseControlClass.ControlStartClass):
             mel.eval('error \"'+ self.dpUIinst.lang['e001_GuideNotChecked'] +' - '+ (", ").join(checkResultList) +'\";')
     
     
-    def generateCombineCurves(self, useUI, cvID, cvName, cvSize, cvDegree, cvDirection, *args):
-        """ Combine controls in order to return it.
+    def getCombineShapeList(self, *args):
+        """ Return the shapes to combine as (controlModule, sizeFactor, transformList).
+            Each transform dictionary is frozen in order and the translation is relative to the control size.
         """
-        # load module instance
-        triangleInstance = self.dpUIinst.initExtraModule('dpTriangle', self.controlsGuideDir)
-        # creating curve shapes:
-        curve1 = triangleInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        curve2 = triangleInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        cmds.setAttr(curve2+".rotateZ", 180)
-        mainCurve = self.combineCurves([curve1, curve2])
-        return mainCurve
\ No newline at end of file
+        return [
+                ("dpTriangle", 1, []),
+                ("dpTriangle", 1, [{"rotate" : (0, 0, 180)}])
+                ]
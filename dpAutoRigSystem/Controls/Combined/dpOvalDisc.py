@@ -1,5 +1,4 @@
 # importing libraries:
-from maya import cmds
 from maya import mel
 from .. import dpBaseControlClass
 
@@ -9,7 +8,7 @@ TITLE = "m123_ovalDisc"
 DESCRIPTION = "m099_cvControlDesc"
 ICON = "/Icons/dp_ovalDisc.png"
 
-DP_OVALDISC_VERSION = 1.3
+DP_OVALDISC_VERSION = 1.4
 
 
 class OvalDisc(dpBaseControlClass.ControlStartClass):
@@ -39,14 +38,11 @@ class OvalDisc(dpBaseControlClass.ControlStartClass):
             mel.eval('error \"'+ self.dpUIinst.lang['e001_GuideNotChecked'] +' - '+ (", ").join(checkResultList) +'\";')
     
     
-    def generateCombineCurves(self, useUI, cvID, cvName, cvSize, cvDegree, cvDirection, *args):
-        """ Combine controls in order to return it.
+    def getCombineShapeList(self, *args):
+        """ Return the shapes to combine as (controlModule, sizeFactor, transformList).
+            Each transform dictionary is frozen in order and the translation is relative to the control size.
         """
-        # load module instance
-        ellipseInstance = self.dpUIinst.initExtraModule('dpEllipse', self.controlsGuideDir)
-        # creating curve shapes:
-        curve1 = ellipseInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        curve2 = ellipseInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        cmds.setAttr(curve2+".rotateZ", 90)
-        mainCurve = self.combineCurves([curve1, curve2])
-        return mainCurve
\ No newline at end of file
+        return [
+                ("dpEllipse", 1, []),
+                ("dpEllipse", 1, [{"rotate" : (0, 0, 90)}])
+                ]
@@ -1,5 +1,4 @@
 # importing libraries:
-from maya import cmds
 from maya import mel
 from .. import dpBaseControlClass
 
@@ -9,7 +8,7 @@ TITLE = "m101_smile"
 DESCRIPTION = "m099_cvControlDesc"
 ICON = "/Icons/dp_smile.png"
 
-DP_SMILE_VERSION = 1.3
+DP_SMILE_VERSION = 1.4
 
 
 class Smile(dpBaseControlClass.ControlStartClass):
@@ -39,20 +38,13 @@ class Smile(dpBaseControlClass.ControlStartClass):
             mel.eval('error \"'+ self.dpUIinst.lang['e001_GuideNotChecked'] +' - '+ (", ").join(checkResultList) +'\";')
     
     
-    def generateCombineCurves(self, useUI, cvID, cvName, cvSize, cvDegree, cvDirection, *args):
-        """ Combine controls in order to return it.
+    def getCombineShapeList(self, *args):
+        """ Return the shapes to combine as (controlModule, sizeFactor, transformList).
+            Each transform dictionary is frozen in order and the translation is relative to the control size.
         """
-        # load module instance
-        circleInstance = self.dpUIinst.initExtraModule('dpCircle', self.controlsGuideDir)
-        mouthInstance = self.dpUIinst.initExtraModule('dpCurvedCircleUp', self.controlsGuideDir)
-        # creating curve shapes:
-        curve1 = circleInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        curve2 = circleInstance.cvMain(False, cvID, cvName, cvSize*0.3, cvDegree)
-        curve3 = circleInstance.cvMain(False, cvID, cvName, cvSize*0.3, cvDegree)
-        curve4 = mouthInstance.cvMain(False, cvID, cvName, cvSize, cvDegree)
-        cmds.setAttr(curve2+".translateX", 0.4*cvSize)
-        cmds.setAttr(curve2+".translateY", 0.3*cvSize)
-        cmds.setAttr(curve3+".translateX", -0.4*cvSize)
-        cmds.setAttr(curve3+".translateY", 0.3*cvSize)
-        mainCurve = self.combineCurves([curve1, curve2, curve3, curve4])
-        return mainCurve
\ No newline at end of file
+        return [
+                ("dpCircle", 1, []),
+                ("dpCircle", 0.3, [{"translate" : (0.4, 0.3, 0)}]),
+                ("dpCircle", 0.3, [{"translate" : (-0.4, 0.3, 0)}]),
+                ("dpCurvedCircleUp", 1, [])
+                ]
@@ -4,8 +4,60 @@ from maya import mel
 from ..Modules.Library import dpControls
 from ..Modules.Library import dpUtils
 from ..Extras import dpCustomAttr
+import math
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
-DP_CONTROLSTARTCLASS_VERSION = 2.2
+DP_CONTROLSTARTCLASS_VERSION = 2.4
+
+# rotation used to orient each control direction from the default +Y:
+DIRECTION_ROTATION_DIC = {
+                            "-X" : (90, -90, 0),
+                            "+X" : (-90, -90, 0),
+                            "-Y" : (0, 0, 180),
+                            "+Y" : (0, 0, 0),
+                            "-Z" : (-90, 0, 0),
+                            "+Z" : (90, 0, 0)
+                        }
+
+# unit size curve templates already oriented, stored by (className, degree, direction, rotation):
+CURVE_TEMPLATE_CACHE = {}
+
+
+def clearCurveTemplateCache(*args):
+    """ Remove all stored curve templates.
+    """
+    CURVE_TEMPLATE_CACHE.clear()
+
+
+def getRotationMatrix(rotation, *args):
+    """ Return the 3x3 rotation matrix for the given XYZ rotation in degrees.
+        It uses the Maya row vector convention with the default xyz rotate order.
+    """
+    cx, cy, cz = [math.cos(math.radians(v)) for v in rotation]
+    sx, sy, sz = [math.sin(math.radians(v)) for v in rotation]
+    return [
+            [cy*cz, cy*sz, -sy],
+            [sx*sy*cz-cx*sz, sx*sy*sz+cx*cz, sx*cy],
+            [cx*sy*cz+sx*sz, cx*sy*sz-sx*cz, cx*cy]
+            ]
+
+
+def transformPointList(pointList, rotation=(0, 0, 0), scale=(1, 1, 1), translation=(0, 0, 0), *args):
+    """ Return the point list scaled, rotated and translated like a frozen Maya transform.
+        It uses NumPy when it's available.
+    """
+    matrix = getRotationMatrix(rotation)
+    matrix = [[scale[r]*v for v in matrix[r]] for r in range(3)]
+    if numpy is not None:
+        resultArray = numpy.dot(numpy.array(pointList, dtype=float), numpy.array(matrix))+numpy.array(translation, dtype=float)
+        return [tuple(point) for point in resultArray.tolist()]
+    resultList = []
+    for x, y, z in pointList:
+        resultList.append(tuple(x*matrix[0][c]+y*matrix[1][c]+z*matrix[2][c]+translation[c] for c in range(3)))
+    return resultList
 
 
 class ControlStartClass(object):
@@ -60,35 +112,26 @@ class ControlStartClass(object):
     def addControlInfo(self, cvNode, className=True, size=True, degree=True, direction=True, rot=True, dpGuide=False, *args):
         """ Add some information in the curve transform node of the control.
         """
-        cmds.addAttr(cvNode, longName="dpControl", attributeType='bool')
-        cmds.setAttr(cvNode+".dpControl", 1)
+        attrSchemaList = [("dpControl", "bool", 1)]
         if dpGuide:
-            cmds.addAttr(cvNode, longName="dpGuide", attributeType='bool')
-            cmds.setAttr(cvNode+".dpGuide", 1)
-        cmds.addAttr(cvNode, longName="version", dataType='string')
-        cmds.setAttr(cvNode+".version", self.dpUIinst.dpARVersion, type="string")
+            attrSchemaList.append(("dpGuide", "bool", 1))
+        attrSchemaList.append(("version", "string", self.dpUIinst.dpARVersion))
         if self.cvID:
-            cmds.addAttr(cvNode, longName="controlID", dataType='string')
-            cmds.setAttr(cvNode+".controlID", self.cvID, type="string")
+            attrSchemaList.append(("controlID", "string", self.cvID))
         if className:
-            cmds.addAttr(cvNode, longName="className", dataType='string')
-            cmds.setAttr(cvNode+".className", self.guideModuleName, type="string")
+            attrSchemaList.append(("className", "string", self.guideModuleName))
         if size:
-            cmds.addAttr(cvNode, longName="size", attributeType='float')
-            cmds.setAttr(cvNode+".size", self.cvSize)
+            attrSchemaList.append(("size", "float", self.cvSize))
         if degree:
-            cmds.addAttr(cvNode, longName="degree", attributeType='short')
-            cmds.setAttr(cvNode+".degree", self.cvDegree)
+            attrSchemaList.append(("degree", "short", self.cvDegree))
         if direction:
-            cmds.addAttr(cvNode, longName="direction", dataType='string')
-            cmds.setAttr(cvNode+".direction", self.cvDirection, type="string")
+            attrSchemaList.append(("direction", "string", self.cvDirection))
         if rot:
-            cmds.addAttr(cvNode, longName="cvRotX", attributeType='double')
-            cmds.addAttr(cvNode, longName="cvRotY", attributeType='double')
-            cmds.addAttr(cvNode, longName="cvRotZ", attributeType='double')
-            cmds.setAttr(cvNode+".cvRotX", self.cvRot[0])
-            cmds.setAttr(cvNode+".cvRotY", self.cvRot[1])
-            cmds.setAttr(cvNode+".cvRotZ", self.cvRot[2])
+            attrSchemaList.append(("cvRotX", "double", self.cvRot[0]))
+            attrSchemaList.append(("cvRotY", "double", self.cvRot[1]))
+            attrSchemaList.append(("cvRotZ", "double", self.cvRot[2]))
+        # add and set all attributes in one call:
+        dpUtils.addAttrSchema(cvNode, attrSchemaList)
     
     
     def createCurve(self, cvName, cvDegree, cvPointList, cvKnot, cvPeriodic, dpGuide, *args):
@@ -102,39 +145,62 @@ class ControlStartClass(object):
         return cvCurve
     
     
-    def combineCurves(self, curveList, *args):
-        """ Combine all guiven curve to just one main curve and return it.
+    def getShapeTemplateList(self, cvDegree, combine=False, *args):
+        """ Return a list of unit size templates for this control as (degree, pointList, knotList, periodic) without direction.
+            Combined controls read the templates of their shape modules and transform them as described by getCombineShapeList.
         """
-        mainCurve = curveList[0]
-        cmds.makeIdentity(mainCurve, translate=True, rotate=True, scale=True, apply=True)
-        for item in curveList[1:]:
-            cmds.makeIdentity(item, translate=True, rotate=True, scale=True, apply=True)
-            self.ctrls.transferShape(True, False, item, [mainCurve])
-        cmds.setAttr(mainCurve+".className", self.guideModuleName, type="string")
-        return mainCurve
-        
+        if combine:
+            templateList = []
+            for shapeModule, sizeFactor, transformList in self.getCombineShapeList():
+                shapeInstance = self.dpUIinst.initExtraModule(shapeModule, self.controlsGuideDir)
+                for degree, pointList, knotList, periodic in shapeInstance.getShapeTemplateList(cvDegree):
+                    pointList = transformPointList(pointList, scale=(sizeFactor, sizeFactor, sizeFactor))
+                    for transformDic in transformList:
+                        pointList = transformPointList(pointList, transformDic.get("rotate", (0, 0, 0)), transformDic.get("scale", (1, 1, 1)), transformDic.get("translate", (0, 0, 0)))
+                    templateList.append((degree, pointList, knotList, periodic))
+            return templateList
+        # getting unit size curve info based on choose degree:
+        currentSize = self.cvSize
+        self.cvSize = 1.0
+        if cvDegree == 1: #linear
+            self.getLinearPoints()
+        else: #cubic
+            self.getCubicPoints()
+        self.cvSize = currentSize
+        return [(cvDegree, self.cvPointList, self.cvKnotList, self.cvPeriodic)]
     
-    def setControlDirection(self, cvNode, cvDirection, *args):
-        """ Rotate the node given to have the correct direction orientation.
+    
+    def getCurveTemplateList(self, cvDegree, cvDirection, cvRot, combine=False, *args):
+        """ Return the unit size templates oriented by the direction and then by the given rotation.
+            They are computed once and stored in the template cache for the next controls with the same parameters.
         """
-        if cvDirection == "-X":
-            cmds.setAttr(cvNode+".rotateX", 90)
-            cmds.setAttr(cvNode+".rotateY", -90)
-        elif cvDirection == "+X":
-            cmds.setAttr(cvNode+".rotateX", -90)
-            cmds.setAttr(cvNode+".rotateY", -90)
-        elif cvDirection == "-Y":
-            cmds.setAttr(cvNode+".rotateZ", 180)
-        elif cvDirection == "-Z":
-            cmds.setAttr(cvNode+".rotateX", -90)
-        elif cvDirection == "+Z":
-            cmds.setAttr(cvNode+".rotateX", 90)
-        else:
-            pass #default +Y, just pass
-        cmds.makeIdentity(cvNode, rotate=True, apply=True)
-        # rotate and freezeTransformation from given cvRot vector:
-        cmds.rotate(self.cvRot[0], self.cvRot[1], self.cvRot[2], self.cvCurve)
-        cmds.makeIdentity(self.cvCurve, rotate=True, apply=True)
+        cacheKey = (self.guideModuleName, cvDegree, cvDirection, tuple(cvRot))
+        if not cacheKey in CURVE_TEMPLATE_CACHE:
+            templateList = []
+            for degree, pointList, knotList, periodic in self.getShapeTemplateList(cvDegree, combine):
+                pointList = transformPointList(pointList, DIRECTION_ROTATION_DIC.get(cvDirection, (0, 0, 0)))
+                pointList = transformPointList(pointList, cvRot)
+                templateList.append((degree, pointList, list(knotList), periodic))
+            CURVE_TEMPLATE_CACHE[cacheKey] = templateList
+        return CURVE_TEMPLATE_CACHE[cacheKey]
+    
+    
+    def createTemplateCurve(self, templateList, dpGuide, *args):
+        """ Create and return the control curve with the given templates scaled by the control size.
+            The first template is the main curve and the other ones are added as shapes of it.
+        """
+        cvCurve = None
+        for degree, pointList, knotList, periodic in templateList:
+            pointList = [(x*self.cvSize, y*self.cvSize, z*self.cvSize) for x, y, z in pointList]
+            if not cvCurve:
+                cvCurve = self.createCurve(self.cvName, degree, pointList, knotList, periodic, dpGuide)
+            else:
+                tempCurve = cmds.curve(point=pointList, degree=degree, knot=knotList, periodic=periodic)
+                cmds.parent(cmds.listRelatives(tempCurve, shapes=True, fullPath=True), cvCurve, relative=True, shape=True)
+                cmds.delete(tempCurve)
+        if len(templateList) > 1:
+            self.ctrls.renameShape([cvCurve])
+        return cvCurve
     
     
     def doControlAction(self, destinationList, *args):
@@ -176,18 +242,9 @@ class ControlStartClass(object):
         if useUI:
             self.getControlUIValues(self.cvName)
         
-        # combine or create curve using the parameters:
-        if combine:
-            self.cvCurve = self.generateCombineCurves(useUI, self.cvID, self.cvName, self.cvSize, self.cvDegree, self.cvDirection)
-        else:
-            # getting curve info to be created based on choose degree:
-            if self.cvDegree == 1: #linear
-                self.getLinearPoints()
-            else: #cubic
-                self.getCubicPoints()
-            self.cvCurve = self.createCurve(self.cvName, self.cvDegree, self.cvPointList, self.cvKnotList, self.cvPeriodic, dpGuide)
-        # set control direction for the control curve:
-        self.setControlDirection(self.cvCurve, self.cvDirection)
+        # create the curve from the oriented templates, combined controls get one shape by template:
+        templateList = self.getCurveTemplateList(self.cvDegree, self.cvDirection, self.cvRot, combine)
+        self.cvCurve = self.createTemplateCurve(templateList, dpGuide)
         
         # working about action to do, like new control, add shape or replace shapes:
         self.doControlAction(destinationList)
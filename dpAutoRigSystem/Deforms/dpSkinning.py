@@ -1,9 +1,24 @@
 # importing libraries:
 from maya import cmds
 from maya import mel
+from maya.api import OpenMaya
+from maya.api import OpenMayaAnim
 from ..Modules.Library import dpUtils
+from ..Modules.Library import dpProgress
+import os
+import time
+import array
+import hashlib
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
-DP_SKINNING_VERSION = 1.0
+# global variables to this module:
+SKIN_WEIGHTS_EXTENSION = ".npz"
+SKIN_WEIGHTS_FORMAT = 1
+
+DP_SKINNING_VERSION = 1.7
 
 
 class Skinning(object):
@@ -14,29 +29,98 @@ class Skinning(object):
         self.dpUIinst = dpUIinst
         
 
+    def getInvalidGeoDic(self, geoList, mode=None, *args):
+        """ Find the geometries that can't be skinned: repeated in the list, not existing or already skinned when creating a new skinCluster.
+            The repeated items are found with a set and the skinned ones with one history query for the whole list.
+            Returns a dictionary with the invalid geometries and the language key of their issue.
+        """
+        invalidDic, itemSet = {}, set()
+        for item in geoList or []:
+            if item in itemSet:
+                invalidDic[item] = 'e003_moreThanOneGeo'
+            elif not cmds.objExists(item):
+                invalidDic[item] = 'i061_notExists'
+            itemSet.add(item)
+        if not mode:
+            skinnedSet = set(self.getSkinnedItemList([item for item in itemSet if not item in invalidDic]))
+            if skinnedSet:
+                for item in geoList:
+                    if not item in invalidDic and cmds.ls(item, long=True)[0] in skinnedSet:
+                        invalidDic[item] = 'i285_alreadySkinned'
+        return invalidDic
+
+
     def validateGeoList(self, geoList, mode=None, *args):
         """ Check if the geometry list from UI is good to be skinned, because we can get issue if the display long name is not used.
         """
         if geoList:
-            for i, item in enumerate(geoList):
-                if item in geoList[:i]:
-                    self.dpUIinst.info('i038_canceled', 'e003_moreThanOneGeo', item, 'center', 205, 270)
-                    return False
-                elif not cmds.objExists(item):
-                    self.dpUIinst.info('i038_canceled', 'i061_notExists', item, 'center', 205, 270)
+            invalidDic = self.getInvalidGeoDic(geoList, mode)
+            for item in geoList:
+                if item in invalidDic:
+                    self.dpUIinst.info('i038_canceled', invalidDic[item], item, 'center', 205, 270)
                     return False
-                elif not mode:
-                    try:
-                        inputDeformerList = cmds.findDeformers(item)
-                        if inputDeformerList:
-                            for deformerNode in inputDeformerList:
-                                if cmds.objectType(deformerNode) == "skinCluster":
-                                    self.dpUIinst.info('i038_canceled', 'i285_alreadySkinned', item, 'center', 205, 270)
-                                    return False
-                    except:
-                        pass
         return True
-    
+
+
+    def skinGeometry(self, geomSkin, jointSkinList, mode=None, *args):
+        """ Create a new skinCluster for the geometry, or add or remove the influences of its skinCluster by the mode.
+        """
+        if (mode == "Add"):
+            cmds.skinCluster(geomSkin, edit=True, addInfluence=jointSkinList, toSelectedBones=True, lockWeights=True, weight=0.0)
+        elif (mode == "Remove"):
+            cmds.skinCluster(geomSkin, edit=True, removeInfluence=jointSkinList, toSelectedBones=True)
+        else: # None = create a new skinCluster node
+            baseName = dpUtils.extractSuffix(geomSkin)
+            skinClusterName = baseName+"_SC"
+            if "|" in skinClusterName:
+                skinClusterName = skinClusterName[skinClusterName.rfind("|")+1:]
+            cmds.skinCluster(jointSkinList, geomSkin, toSelectedBones=True, dropoffRate=4.0, maximumInfluences=3, skinMethod=0, normalizeWeights=1, removeUnusedInfluence=False, name=skinClusterName)
+
+
+    def runSkinJobs(self, jobList, mode=None, validate=True, ui=False, *args):
+        """ Skin many geometries in a batch without reading the UI, useful for crowd or prop rigs.
+            Each job is a list with a geometry and its joint list, the mode adds or removes the influences instead of creating the skinClusters.
+            The geometries are validated together and skipped if invalid, and the jobs with the same influence set are grouped
+            to check their joints once by group. The not existing joints are ignored.
+            Cancelling the progress window stops it between the geometries, keeping the ones already skinned.
+            Returns a report dictionary with the skinned geometries, the failed ones and their issue, the not found joints,
+            the number of influence groups, the time of each geometry and the total time.
+        """
+        startTime = time.time()
+        reportDic = {"skinned" : [], "failed" : {}, "missingJoints" : [], "groups" : 0, "geometryTime" : {}, "time" : 0.0}
+        if validate:
+            for item, langKey in self.getInvalidGeoDic([job[0] for job in jobList], mode).items():
+                reportDic["failed"][item] = self.dpUIinst.lang[langKey]
+        # group the geometries by influence set:
+        groupDic = {}
+        for geomSkin, jointSkinList in jobList:
+            if not geomSkin in reportDic["failed"]:
+                groupDic.setdefault(frozenset(jointSkinList), [list(jointSkinList), []])[1].append(geomSkin)
+        reportDic["groups"] = len(groupDic)
+        progress = dpProgress.Progress(self.dpUIinst.lang['i028_skinButton'], sum(len(groupList[1]) for groupList in groupDic.values()), 'Skinning: 0%', interruptable=True, ui=ui)
+        progress.start()
+        for jointSkinList, groupGeoList in groupDic.values():
+            existingJointList = [item for item in jointSkinList if cmds.objExists(item)]
+            reportDic["missingJoints"].extend(item for item in jointSkinList if not item in existingJointList and not item in reportDic["missingJoints"])
+            for geomSkin in groupGeoList:
+                if progress.isCancelled():
+                    break
+                # Update progress window
+                progress.update(status=lambda: 'Skinning: '+geomSkin)
+                geoStartTime = time.time()
+                try:
+                    if not existingJointList:
+                        raise RuntimeError(self.dpUIinst.lang['i069_notSkinJoint'])
+                    self.skinGeometry(geomSkin, existingJointList, mode)
+                except Exception as e:
+                    reportDic["failed"][geomSkin] = str(e)
+                    continue
+                reportDic["geometryTime"][geomSkin] = time.time()-geoStartTime
+                reportDic["skinned"].append(geomSkin)
+        progress.end()
+        reportDic["time"] = time.time()-startTime
+        return reportDic
+
 
     def skinFromUI(self, mode=None, *args):
         """ Skin the geometries using the joints, reading from UI the selected items of the textScrollLists or getting all items if nothing selected.
@@ -73,21 +157,13 @@ class Skinning(object):
         # check if we have repeated listed geometries in case of the user choose to not display long names:
         if self.validateGeoList(geomSkinList, mode):
             if jointSkinList and geomSkinList:
-                for geomSkin in geomSkinList:
-                    if (mode == "Add"):
-                        cmds.skinCluster(geomSkin, edit=True, addInfluence=jointSkinList, toSelectedBones=True, lockWeights=True, weight=0.0)
-                    elif (mode == "Remove"):
-                        cmds.skinCluster(geomSkin, edit=True, removeInfluence=jointSkinList, toSelectedBones=True)
-                    else: # None = create a new skinCluster node
-                        baseName = dpUtils.extractSuffix(geomSkin)
-                        skinClusterName = baseName+"_SC"
-                        if "|" in skinClusterName:
-                            skinClusterName = skinClusterName[skinClusterName.rfind("|")+1:]
-                        cmds.skinCluster(jointSkinList, geomSkin, toSelectedBones=True, dropoffRate=4.0, maximumInfluences=3, skinMethod=0, normalizeWeights=1, removeUnusedInfluence=False, name=skinClusterName)
-                print(self.dpUIinst.lang['i077_skinned'] + ', '.join(geomSkinList))
+                reportDic = self.runSkinJobs([[geomSkin, jointSkinList] for geomSkin in geomSkinList], mode, False, True)
+                for geomSkin in reportDic["failed"]:
+                    cmds.warning(geomSkin+": "+reportDic["failed"][geomSkin])
+                print(self.dpUIinst.lang['i077_skinned'] + ', '.join(reportDic["skinned"]))
                 if logWin:
-                    self.dpUIinst.info('i028_skinButton', 'i077_skinned', '\n'.join(geomSkinList), 'center', 205, 270)
-                cmds.select(geomSkinList)
+                    self.dpUIinst.info('i028_skinButton', 'i077_skinned', '\n'.join(reportDic["skinned"]), 'center', 205, 270)
+                cmds.select(reportDic["skinned"] or geomSkinList)
         else:
             print(self.dpUIinst.lang['i029_skinNothing'])
             if logWin:
@@ -112,36 +188,105 @@ class Skinning(object):
         return result
 
 
+    def getSkinnedItemList(self, itemList, *args):
+        """ Return the long names of the given items deformed by a skinCluster.
+            It reads the history of all items in one query and the geometry of each found skinCluster,
+            instead of a full history query by item.
+        """
+        skinnedList = []
+        if itemList:
+            skinClusterList = cmds.ls(cmds.listHistory(itemList, pruneDagObjects=True, interestLevel=True) or [], type="skinCluster")
+            geometryList = []
+            for skinClusterNode in skinClusterList:
+                geometryList.extend(cmds.skinCluster(skinClusterNode, query=True, geometry=True) or [])
+            if geometryList:
+                for shapeNode in cmds.ls(geometryList, long=True):
+                    # the skinned shape and its transform:
+                    skinnedList.extend([shapeNode, shapeNode[:shapeNode.rfind("|")]])
+        return skinnedList
+
+
+    def getSameNamePairList(self, itemList, *args):
+        """ Find the items with the same short name using a dictionary instead of comparing each item with all others.
+            Each item is paired with the last item of its name, like the copy skin same name always did.
+            Returns the pair list in the item order and the list of geometries without a same name item.
+        """
+        shortNameDic = {}
+        for item in itemList:
+            shortNameDic.setdefault(item[item.rfind("|")+1:], []).append(item)
+        pairList, singleList = [], []
+        for item in itemList:
+            sameNameList = shortNameDic[item[item.rfind("|")+1:]]
+            if len(sameNameList) == 1:
+                singleList.append(item)
+            elif not item == sameNameList[-1]:
+                pairList.append([item, sameNameList[-1]])
+        # only the single geometries are reported, not the groups:
+        shapeList = cmds.listRelatives(singleList, shapes=True, fullPath=True, noIntermediate=True) if singleList else None
+        geometrySet = set(shapeNode[:shapeNode.rfind("|")] for shapeNode in shapeList or [])
+        return pairList, [item for item in singleList if item in geometrySet]
+
+
     def serializeCopySkin(self, sourceList, destinationList, oneSource=True, byUVs=False, *args):
         """ Serialize the copy skinning for one source or many items with the same name.
+            The same name items are matched once by their short names and the skinned ones are found in one history query.
+            The item without skinning of each pair receives the skinning of the other one.
+            Cancelling the progress window stops it between the meshes, keeping the skinning already copied.
+            Returns a report dictionary with the copied pairs, the ones copied by vertex index, the same name pairs without skinning,
+            the geometries without a same name item and the elapsed time.
         """
-        ranList = []
-        maxProcess = len(destinationList)
-        progressAmount = 0
-        cmds.progressWindow(title=self.dpUIinst.lang['i287_copy']+" Skinning", progress=progressAmount, status='Skinning: 0%', isInterruptable=False)
-        for sourceItem in sourceList:
+        startTime = time.time()
+        reportDic = {"copied" : [], "byIndex" : [], "notSkinned" : [], "unmatched" : [], "time" : 0.0}
+        hashDic = {}
+        if oneSource:
+            pairList = [[sourceList[0], item] for item in destinationList]
+        else:
+            sourceSet = set(sourceList)
+            itemList = cmds.ls(sourceList+[item for item in destinationList if not item in sourceSet], long=True)
+            pairList, reportDic["unmatched"] = self.getSameNamePairList(itemList)
+            skinnedSet = set(self.getSkinnedItemList([item for pair in pairList for item in pair]))
+        progress = dpProgress.Progress(self.dpUIinst.lang['i287_copy']+" Skinning", len(pairList), 'Skinning: 0%', interruptable=True)
+        progress.start()
+        for progressAmount, (sourceItem, destinationItem) in enumerate(pairList, 1):
+            if progress.isCancelled():
+                break
             # Update progress window
-            progressAmount += 1
-            cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=('Skinning: '+repr(progressAmount)))
-            if oneSource:
-                for item in destinationList:
-                    self.runCopySkin(sourceItem, item, byUVs)
-                cmds.progressWindow(endProgress=True)
-                return
-            else:
-                if not sourceItem in ranList:
-                    for item in reversed(destinationList): #to avoid find the same item in the same given list
-                        if not sourceItem == item:
-                            if sourceItem[sourceItem.rfind("|")+1:] == item[item.rfind("|")+1:]:
-                                if self.checkExistingSkinClusterNode(sourceItem)[0]:
-                                    self.runCopySkin(sourceItem, item, byUVs)
-                                elif self.checkExistingSkinClusterNode(item)[0]:
-                                    self.runCopySkin(item, sourceItem, byUVs)
-                                # To avoid repeat the same item in the same given list
-                                ranList.append(item)
-                                break
-                    ranList.append(sourceItem)
-        cmds.progressWindow(endProgress=True)
+            progress.update(progressAmount, status=lambda: 'Skinning: '+repr(progressAmount))
+            if not oneSource:
+                if sourceItem in skinnedSet:
+                    skinnedSet.add(destinationItem)
+                elif destinationItem in skinnedSet:
+                    sourceItem, destinationItem = destinationItem, sourceItem
+                    skinnedSet.add(destinationItem)
+                else:
+                    reportDic["notSkinned"].append([sourceItem, destinationItem])
+                    continue
+            if self.runCopySkin(sourceItem, destinationItem, byUVs, hashDic):
+                reportDic["byIndex"].append([sourceItem, destinationItem])
+            reportDic["copied"].append([sourceItem, destinationItem])
+        progress.end()
+        reportDic["time"] = time.time()-startTime
+        return reportDic
+
+
+    def logCopySkinReport(self, reportDic, ui=False, *args):
+        """ Print the copy skin report summary and show the matched and unmatched items in the info window if using UI.
+        """
+        summaryText = self.dpUIinst.lang['i292_copiedPairs']+": "+str(len(reportDic["copied"]))+"\n"
+        summaryText += self.dpUIinst.lang['i293_notSkinnedPairs']+": "+str(len(reportDic["notSkinned"]))+"\n"
+        summaryText += self.dpUIinst.lang['i294_unmatchedGeo']+": "+str(len(reportDic["unmatched"]))+"\n"
+        summaryText += "%.2f s" % reportDic["time"]
+        print(summaryText)
+        if ui:
+            textList = [summaryText]
+            for key, langKey in [("copied", 'i292_copiedPairs'), ("notSkinned", 'i293_notSkinnedPairs')]:
+                if reportDic[key]:
+                    textList.append("\n"+self.dpUIinst.lang[langKey]+":")
+                    textList.extend(sourceItem+" -> "+destinationItem for sourceItem, destinationItem in reportDic[key])
+            if reportDic["unmatched"]:
+                textList.append("\n"+self.dpUIinst.lang['i294_unmatchedGeo']+":")
+                textList.extend(reportDic["unmatched"])
+            self.dpUIinst.info('i287_copy', 'i083_copiedSkin', "\n".join(textList), 'left', 450, 400)
 
 
     def getDeformerOrder(self, defList, *args):
@@ -156,14 +301,56 @@ class Skinning(object):
         return 0
 
 
-    def runCopySkin(self, sourceItem, destinationItem, byUVs=False, *args):
+    def getTopologyHash(self, item, hashDic=None, *args):
+        """ Return a hash of the vertex count and the face vertices of the given mesh, to find the same topology without comparing the meshes.
+            The hash and the hashed shape path are stored in the given dictionary to be reused when the same mesh is compared again.
+            Returns None if it isn't a mesh.
+        """
+        if hashDic is not None and item in hashDic:
+            return hashDic[item][0]
+        topologyHash = None
+        shapePath = self.getShapePath(item)
+        if shapePath:
+            fnMesh = OpenMaya.MFnMesh(shapePath)
+            vertexCountList, vertexList = fnMesh.getVertices()
+            topologyHash = hashlib.sha1(array.array("i", [fnMesh.numVertices, len(vertexCountList)]+list(vertexCountList)+list(vertexList)).tobytes()).hexdigest()
+        if hashDic is not None:
+            hashDic[item] = (topologyHash, shapePath)
+        return topologyHash
+
+
+    def copySkinWeightsByIndex(self, sourceSkinClusterNode, destinationSkinClusterNode, sourcePath, destinationPath, *args):
+        """ Copy the weights between skinClusters of meshes with the same topology, vertex by vertex, with one getWeights and one setWeights call.
+            The given source and destination shape paths are the hashed ones, because a skinCluster can deform many meshes.
+            The influences are remapped by name, so their order in the skinClusters doesn't matter.
+        """
+        fnSourceSkinCluster = self.getSkinClusterFn(sourceSkinClusterNode)
+        fnDestinationSkinCluster = self.getSkinClusterFn(destinationSkinClusterNode)
+        sourcePath = self.getOutputShapePath(fnSourceSkinCluster, sourcePath)
+        destinationPath = self.getOutputShapePath(fnDestinationSkinCluster, destinationPath)
+        vertexCount = OpenMaya.MFnMesh(sourcePath).numVertices
+        weightList = fnSourceSkinCluster.getWeights(sourcePath, self.getVertexComponent(vertexCount))[0]
+        influenceIndexDic = dict((influencePath.partialPathName(), i) for i, influencePath in enumerate(fnDestinationSkinCluster.influenceObjects()))
+        influenceList = [influenceIndexDic[influencePath.partialPathName()] for influencePath in fnSourceSkinCluster.influenceObjects()]
+        fnDestinationSkinCluster.setWeights(destinationPath, self.getVertexComponent(vertexCount), OpenMaya.MIntArray(influenceList), weightList, False)
+
+
+    def runCopySkin(self, sourceItem, destinationItem, byUVs=False, hashDic=None, *args):
         """ Copy the skin from sourceItem to destinationItem.
             It will get skinInfList and skinMethod by source.
+            Meshes with the same topology have the weights copied by vertex index, the others use the surface association of copySkinWeights.
+            Returns True if the weights were copied by vertex index.
         """
         i = 0
         defOrderIdx = None
+        sameTopology = False
+        if hashDic is None:
+            hashDic = {}
         sourceDefList = self.checkExistingSkinClusterNode(sourceItem)[2]
         if sourceDefList:
+            # same vertex count and face vertices, the vertex index is the correspondence
+            sourceHash = self.getTopologyHash(sourceItem, hashDic)
+            sameTopology = bool(sourceHash) and sourceHash == self.getTopologyHash(destinationItem, hashDic)
             # get correct naming
             skinClusterName = dpUtils.extractSuffix(destinationItem)
             if "|" in skinClusterName:
@@ -181,7 +368,9 @@ class Skinning(object):
                 elif cmds.about(version=True) >= "2024": #accepting multiple skinClusters
                     newSkinClusterNode = cmds.skinCluster(skinInfList, destinationItem, multi=True, name=skinClusterName+"_"+str(i)+"_SC", toSelectedBones=True, maximumInfluences=3, skinMethod=skinMethodToUse)[0]
                 # copy skin weights from source to destination
-                if byUVs:
+                if sameTopology:
+                    self.copySkinWeightsByIndex(sourceDef, newSkinClusterNode, hashDic[sourceItem][1], hashDic[destinationItem][1])
+                elif byUVs:
                     sourceUVMap = cmds.polyUVSet(sourceItem, query=True, allUVSets=True)[0]
                     destinationUVMap = cmds.polyUVSet(destinationItem, query=True, allUVSets=True)[0]
                     cmds.copySkinWeights(sourceSkin=sourceDef, destinationSkin=newSkinClusterNode, noMirror=True, surfaceAssociation="closestPoint", influenceAssociation=["label", "oneToOne", "closestJoint"], uvSpace=[sourceUVMap, destinationUVMap])
@@ -193,6 +382,7 @@ class Skinning(object):
                 i += 1
         # log result
         mel.eval("print \""+self.dpUIinst.lang['i083_copiedSkin']+" "+sourceItem+" "+destinationItem+"\"; ")
+        return sameTopology
 
 
     def copySkinFromOneSource(self, objList=None, ui=False, byUVs=False, *args):
@@ -223,6 +413,7 @@ class Skinning(object):
 
     def copySkinSameName(self, objList=None, ui=False, byUVs=False, *args):
         """ Copy the skinning between meshes with the same name, selected or not or using the given list.
+            Returns the copy report dictionary.
         """
         if not objList:
             objList = cmds.ls(selection=True, long=True, type="transform")
@@ -231,7 +422,241 @@ class Skinning(object):
         if objList:
             if ui:
                 byUVs = self.getByUVsFromUI()
-            self.serializeCopySkin(objList, objList, False, byUVs)
+            reportDic = self.serializeCopySkin(objList, objList, False, byUVs)
+            self.logCopySkinReport(reportDic, ui)
+            return reportDic
+
+
+    def getSkinWeightsPath(self, *args):
+        """ Return the default skin weights file in the dpSkin directory of dpData, next to the current scene.
+            Returns None if the scene wasn't saved.
+        """
+        currentPath = cmds.file(query=True, sceneName=True)
+        if not currentPath:
+            print(self.dpUIinst.lang['i201_saveScene'])
+            return None
+        sceneName = currentPath[currentPath.rfind("/")+1:]
+        if "." in sceneName:
+            sceneName = sceneName[:sceneName.rfind(".")]
+        return currentPath[:currentPath.rfind("/")+1]+self.dpUIinst.dpData+"/"+self.dpUIinst.dpSkin+"/"+self.dpUIinst.dpSkin+"_"+sceneName+SKIN_WEIGHTS_EXTENSION
+
+
+    def getSkinClusterFn(self, skinClusterNode, *args):
+        """ Return the MFnSkinCluster of the given skinCluster node.
+        """
+        selList = OpenMaya.MSelectionList()
+        selList.add(skinClusterNode)
+        return OpenMayaAnim.MFnSkinCluster(selList.getDependNode(0))
+
+
+    def getShapePath(self, item, *args):
+        """ Return the MDagPath of the not intermediate mesh shape of the given item, or None if it isn't a mesh.
+        """
+        shapeList = cmds.listRelatives(item, shapes=True, fullPath=True, noIntermediate=True, type="mesh")
+        if shapeList:
+            return OpenMaya.MSelectionList().add(shapeList[0]).getDagPath(0)
+
+
+    def getOutputShapePath(self, fnSkinCluster, shapePath, *args):
+        """ Return the path of the given shape as an output geometry of the skinCluster, because one skinCluster can deform many meshes.
+            Raises RuntimeError if the skinCluster doesn't deform this shape.
+        """
+        try:
+            return fnSkinCluster.getPathAtIndex(fnSkinCluster.indexForOutputShape(shapePath.node()))
+        except RuntimeError:
+            raise RuntimeError(fnSkinCluster.name()+" doesn't deform "+shapePath.fullPathName())
+
+
+    def getVertexComponent(self, vertexCount, *args):
+        """ Return a component with all the vertices of a mesh to read or write all the weights in one call.
+        """
+        fnComponent = OpenMaya.MFnSingleIndexedComponent()
+        vertexComponent = fnComponent.create(OpenMaya.MFn.kMeshVertComponent)
+        fnComponent.setCompleteData(vertexCount)
+        return vertexComponent
+
+
+    def getSkinWeightsData(self, skinClusterNode, shapePath, *args):
+        """ Read the weights of the given skinCluster for the given shape path with one getWeights call.
+            Returns a dictionary with the influence names, the skinning method, the vertex count
+            and the not zero weights as a CSR sparse matrix by vertex: data, indices and indptr arrays.
+        """
+        fnSkinCluster = self.getSkinClusterFn(skinClusterNode)
+        shapePath = self.getOutputShapePath(fnSkinCluster, shapePath)
+        vertexCount = OpenMaya.MFnMesh(shapePath).numVertices
+        weightList, influenceCount = fnSkinCluster.getWeights(shapePath, self.getVertexComponent(vertexCount))
+        weightArray = numpy.array(weightList, dtype=numpy.float64).reshape(vertexCount, influenceCount)
+        vertexArray, influenceArray = numpy.nonzero(weightArray)
+        return {
+                "influences" : numpy.array([influencePath.partialPathName() for influencePath in fnSkinCluster.influenceObjects()]),
+                "skinMethod" : numpy.array(cmds.skinCluster(skinClusterNode, query=True, skinMethod=True)),
+                "vertexCount" : numpy.array(vertexCount),
+                "data" : weightArray[vertexArray, influenceArray],
+                "indices" : influenceArray.astype(numpy.int32),
+                "indptr" : numpy.concatenate(([0], numpy.cumsum(numpy.bincount(vertexArray, minlength=vertexCount)))).astype(numpy.int64)
+            }
+
+
+    def setSkinWeightsData(self, skinClusterNode, dataDic, shapePath, *args):
+        """ Write the weights of a CSR sparse matrix to the given skinCluster for the given shape path with one setWeights call.
+            The influences are matched by name, so their order in the skinCluster doesn't matter.
+        """
+        fnSkinCluster = self.getSkinClusterFn(skinClusterNode)
+        shapePath = self.getOutputShapePath(fnSkinCluster, shapePath)
+        vertexCount = int(dataDic["vertexCount"])
+        influenceIndexDic = dict((influencePath.partialPathName(), i) for i, influencePath in enumerate(fnSkinCluster.influenceObjects()))
+        influenceList = [influenceIndexDic[influence] for influence in dataDic["influences"]]
+        weightArray = numpy.zeros((vertexCount, len(influenceList)), dtype=numpy.float64)
+        weightArray[numpy.repeat(numpy.arange(vertexCount), numpy.diff(dataDic["indptr"])), dataDic["indices"]] = dataDic["data"]
+        fnSkinCluster.setWeights(shapePath, self.getVertexComponent(vertexCount), OpenMaya.MIntArray(influenceList), OpenMaya.MDoubleArray(weightArray.ravel().tolist()), False)
+
+
+    def exportSkinWeights(self, objList=None, path=None, ui=False, *args):
+        """ Export the skin weights of the given or selected meshes, or of all skinned meshes, to a NumPy .npz file.
+            Each skinCluster is stored as its influence names and a CSR sparse weight matrix, read with one getWeights call.
+            Without a given path, it uses the dpSkin directory of dpData next to the current scene.
+            Returns the exported file path.
+        """
+        if numpy is None:
+            mel.eval("warning \""+self.dpUIinst.lang['e022_numpyNotFound']+"\";")
+            return
+        if not path:
+            path = self.getSkinWeightsPath()
+            if not path:
+                return
+        if not objList:
+            objList = cmds.ls(selection=True, long=True, type="transform")
+            if not objList:
+                objList = cmds.ls(selection=False, long=True, type="transform")
+        skinnedSet = set(self.getSkinnedItemList(objList))
+        itemList = [item for item in cmds.ls(objList, long=True) if item in skinnedSet]
+        if not itemList:
+            mel.eval("warning \""+self.dpUIinst.lang['e007_notSkinFound']+"\";")
+            return
+        arrayDic = {"format" : numpy.array(SKIN_WEIGHTS_FORMAT)}
+        meshList = []
+        progress = dpProgress.Progress(self.dpUIinst.lang['i164_export']+" "+self.dpUIinst.lang['i295_skinWeights'], len(itemList), 'Skinning: 0%', ui=ui)
+        progress.start()
+        for progressAmount, item in enumerate(itemList, 1):
+            # Update progress window
+            progress.update(progressAmount, status=lambda: 'Skinning: '+repr(progressAmount))
+            shapePath = self.getShapePath(item)
+            # the multiple skinClusters are stored in the deformation order:
+            for skinClusterNode in reversed(self.checkExistingSkinClusterNode(item)[2]):
+                for key, value in self.getSkinWeightsData(skinClusterNode, shapePath).items():
+                    arrayDic[key+"_"+str(len(meshList))] = value
+                meshList.append(item)
+        progress.end()
+        arrayDic["meshes"] = numpy.array(meshList)
+        if not os.path.exists(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as skinFile:
+            numpy.savez_compressed(skinFile, **arrayDic)
+        print(self.dpUIinst.lang['i164_export']+" "+self.dpUIinst.lang['i295_skinWeights']+": "+path)
+        return path
+
+
+    def importSkinWeights(self, objList=None, path=None, ui=False, *args):
+        """ Import the skin weights from a NumPy .npz file exported by exportSkinWeights.
+            The meshes are found by their long names or by their short names if they were moved in the hierarchy,
+            and the new skinClusters receive the weights with one setWeights call by skinCluster.
+            The meshes with a different vertex count or missing influences are skipped and reported.
+            Without a given path, it uses the dpSkin directory of dpData next to the current scene.
+            Cancelling the progress window stops it between the meshes, keeping the skinning already imported.
+            Returns a report dictionary with the imported, unmatched, changed vertex count and missing influence meshes and the elapsed time.
+        """
+        if numpy is None:
+            mel.eval("warning \""+self.dpUIinst.lang['e022_numpyNotFound']+"\";")
+            return
+        if not path:
+            path = self.getSkinWeightsPath()
+            if not path:
+                return
+        if not os.path.exists(path):
+            print(self.dpUIinst.lang['e004_objNotExist']+path)
+            return
+        startTime = time.time()
+        reportDic = {"imported" : [], "unmatched" : [], "changedVertices" : [], "missingInfluences" : [], "time" : 0.0}
+        with numpy.load(path) as skinFile:
+            # group the stored skinClusters by mesh:
+            meshDic = {}
+            for i, mesh in enumerate(skinFile["meshes"].tolist()):
+                meshDic.setdefault(mesh, []).append(i)
+            # find the scene meshes by long name or unique short name:
+            sceneList = cmds.ls(selection=False, long=True, type="transform")
+            sceneSet = set(sceneList)
+            shortNameDic = {}
+            for item in sceneList:
+                shortNameDic.setdefault(item[item.rfind("|")+1:], []).append(item)
+            if objList:
+                objSet = set(cmds.ls(objList, long=True))
+            pairList = []
+            for mesh in meshDic:
+                item = mesh if mesh in sceneSet else None
+                if not item:
+                    sameNameList = shortNameDic.get(mesh[mesh.rfind("|")+1:], [])
+                    if len(sameNameList) == 1:
+                        item = sameNameList[0]
+                if not item:
+                    reportDic["unmatched"].append(mesh)
+                elif not objList or item in objSet:
+                    pairList.append([mesh, item])
+            # check the influences in one query:
+            influenceSet = set()
+            for i in range(len(skinFile["meshes"])):
+                influenceSet.update(skinFile["influences_"+str(i)].tolist())
+            influenceSet = set(cmds.ls(list(influenceSet)))
+            progress = dpProgress.Progress(self.dpUIinst.lang['i196_import']+" "+self.dpUIinst.lang['i295_skinWeights'], len(pairList), 'Skinning: 0%', interruptable=True, ui=ui)
+            progress.start()
+            for progressAmount, (mesh, item) in enumerate(pairList, 1):
+                if progress.isCancelled():
+                    break
+                # Update progress window
+                progress.update(progressAmount, status=lambda: 'Skinning: '+repr(progressAmount))
+                dataDicList = [dict((key, skinFile[key+"_"+str(i)]) for key in ["influences", "skinMethod", "vertexCount", "data", "indices", "indptr"]) for i in meshDic[mesh]]
+                shapePath = self.getShapePath(item)
+                if not shapePath or not OpenMaya.MFnMesh(shapePath).numVertices == int(dataDicList[0]["vertexCount"]):
+                    reportDic["changedVertices"].append(item)
+                    continue
+                if not all(influence in influenceSet for dataDic in dataDicList for influence in dataDic["influences"].tolist()):
+                    reportDic["missingInfluences"].append(item)
+                    continue
+                # get correct naming
+                skinClusterName = dpUtils.extractSuffix(item)
+                if "|" in skinClusterName:
+                    skinClusterName = skinClusterName[skinClusterName.rfind("|")+1:]
+                # clean-up current skinCluster
+                defOrderIdx = None
+                destDefList = self.checkExistingSkinClusterNode(item, True)
+                if destDefList[0] and destDefList[2]:
+                    defOrderIdx = self.getDeformerOrder(destDefList)
+                for i, dataDic in enumerate(dataDicList):
+                    if i == 0:
+                        newSkinClusterNode = cmds.skinCluster(dataDic["influences"].tolist(), item, name=skinClusterName+"_"+str(i)+"_SC", toSelectedBones=True, skinMethod=int(dataDic["skinMethod"]), removeUnusedInfluence=False)[0]
+                    elif cmds.about(version=True) >= "2024": #accepting multiple skinClusters
+                        newSkinClusterNode = cmds.skinCluster(dataDic["influences"].tolist(), item, multi=True, name=skinClusterName+"_"+str(i)+"_SC", toSelectedBones=True, skinMethod=int(dataDic["skinMethod"]), removeUnusedInfluence=False)[0]
+                    else:
+                        break
+                    self.setSkinWeightsData(newSkinClusterNode, dataDic, shapePath)
+                    # deformer order
+                    if defOrderIdx:
+                        cmds.reorderDeformers(destDefList[1][defOrderIdx-1], newSkinClusterNode, item)
+                reportDic["imported"].append(item)
+            progress.end()
+        reportDic["time"] = time.time()-startTime
+        summaryText = self.dpUIinst.lang['i196_import']+" "+self.dpUIinst.lang['i295_skinWeights']+": "+str(len(reportDic["imported"]))+"\n"
+        for key, langKey in [("unmatched", 'i294_unmatchedGeo'), ("changedVertices", 'i296_changedVertices'), ("missingInfluences", 'i297_missingInfluences')]:
+            summaryText += self.dpUIinst.lang[langKey]+": "+str(len(reportDic[key]))+"\n"
+        summaryText += "%.2f s" % reportDic["time"]
+        print(summaryText)
+        if ui:
+            textList = [summaryText]
+            for key, langKey in [("unmatched", 'i294_unmatchedGeo'), ("changedVertices", 'i296_changedVertices'), ("missingInfluences", 'i297_missingInfluences')]:
+                if reportDic[key]:
+                    textList.append("\n"+self.dpUIinst.lang[langKey]+":")
+                    textList.extend(reportDic[key])
+            self.dpUIinst.info('i196_import', 'i295_skinWeights', "\n".join(textList), 'left', 450, 400)
+        return reportDic
 
 
     def getByUVsFromUI(self, *args):
@@ -150,14 +150,12 @@ class CustomAttr(object):
                 elif attrIndex == 0: #dpID
                     if not cmds.objExists(item+"."+ATTR_DPID):
                         id = dpUtils.generateID(item)
-                        cmds.addAttr(item, longName=ATTR_DPID, dataType="string")
-                        cmds.setAttr(item+"."+ATTR_DPID, id, type="string", lock=True)
+                        dpUtils.addAttrSchema(item, [(ATTR_DPID, "string", id, {"lock" : True})])
                 else:
                     attr = ATTR_LIST[attrIndex]
                 if attr:
                     if not cmds.objExists(item+"."+attr):
-                        cmds.addAttr(item, longName=attr, attributeType="bool", defaultValue=1, keyable=False)
-                        cmds.setAttr(item+"."+attr, edit=True, channelBox=False)
+                        dpUtils.addAttrSchema(item, [(attr, "bool", None, {"defaultValue" : 1, "keyable" : False, "channelBox" : False})])
 
 
     def removeAttrUI(self, *args):
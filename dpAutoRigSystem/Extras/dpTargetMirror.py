@@ -2,6 +2,7 @@
 from maya import cmds
 from maya import mel
 from functools import partial
+from ..Modules.Library import dpProgress
 
 # global variables to this module:
 CLASS_NAME = "TargetMirror"
@@ -9,7 +10,7 @@ TITLE = "m055_tgtMirror"
 DESCRIPTION = "m056_tgtMirrorDesc"
 ICON = "/Icons/dp_targetMirror.png"
 
-DP_TARGETMIRROR_VERSION = 2.6
+DP_TARGETMIRROR_VERSION = 2.7
 
 
 class TargetMirror(object):
@@ -176,24 +177,22 @@ class TargetMirror(object):
             targetList = cmds.textScrollList(self.targetScrollList, query=True, allItems=True)
             if targetList:
                 # progress window
-                progressAmount = 0
-                cmds.progressWindow(title=self.dpUIinst.lang["m055_tgtMirror"], progress=progressAmount, status='Doing: 0%', isInterruptable=True)
+                progress = dpProgress.Progress(self.dpUIinst.lang["m055_tgtMirror"], len(targetList), 'Doing: 0%', interruptable=True)
+                progress.start()
                 cancelled = False
-                nbTarget = len(targetList)
                 # get mirror information from UI
                 selectedMirror = cmds.radioCollection(self.mirrorAxisRC, query=True, select=True)
                 axis = cmds.radioButton(selectedMirror, query=True, annotation=True)
                 clearUndo = cmds.checkBox(self.cleanUndoCB, query=True, value=True)
                 # clear selection
                 cmds.select(clear=True)
-                for item in targetList:
-                    # update progress window
-                    progressAmount += 1
+                for progressAmount, item in enumerate(targetList, 1):
                     # check if the dialog has been cancelled
-                    if cmds.progressWindow(query=True, isCancelled=True):
+                    if progress.isCancelled():
                         cancelled = True
                         break
-                    cmds.progressWindow(edit=True, maxValue=nbTarget, progress=progressAmount, status=('Doing: ' + repr(progressAmount) + ' target'))
+                    # update progress window
+                    progress.update(progressAmount, status=lambda: 'Doing: ' + repr(progressAmount) + ' target')
                     if not item == origNode:
                         # start copying
                         if self.dpCheckGeometry(item):
@@ -234,5 +233,5 @@ class TargetMirror(object):
                             # clear undo
                             if clearUndo:
                                 mel.eval("flushUndo;")
-                cmds.progressWindow(endProgress=True)
+                progress.end()
             cmds.select(clear=True)
\ No newline at end of file
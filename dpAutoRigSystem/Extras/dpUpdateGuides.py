@@ -8,7 +8,7 @@ TITLE = "m186_updateGuides"
 DESCRIPTION = "m187_updateGuidesDesc"
 ICON = "/Icons/dp_updateGuides.png"
 
-DP_UPDATEGUIDES_VERSION = 1.4
+DP_UPDATEGUIDES_VERSION = 1.5
 
 
 class UpdateGuides(object):
@@ -514,7 +514,7 @@ class UpdateGuides(object):
                     cmds.namespace(moveNamespace=(self.dpUIinst.modulesToBeRiggedList[self.updateData[guide]['idx']].guideNamespace, ':'), force=True)
                     cmds.namespace(removeNamespace=self.dpUIinst.modulesToBeRiggedList[self.updateData[guide]['idx']].guideNamespace, force=True)
 
-        self.dpUIinst.jobReloadUI()
+        self.dpUIinst.jobRefreshUI()
 
 
     def doUpdate(self, *args):
@@ -0,0 +1,33 @@
+# importing libraries:
+import os
+import re
+
+# Constants shared by the dpAutoRig UI and the tools running without interface, like the batch validation from mayapy.
+# This module doesn't build UI or use Maya commands, so it can be imported before Maya standalone starts.
+
+DP_CONSTANTS_VERSION = 1.0
+
+DPAR_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).replace("\\", "/")
+DPAR_FILE = "dpAutoRig.py"
+DPAR_VERSION_RE = re.compile(r"^DPAR_VERSION_PY3[ \t]*=[ \t]*[\"']([^\"'\n]*)[\"']", re.MULTILINE)
+ENGLISH = "English"
+LANGUAGES = "Languages"
+VALIDATOR = "Validator"
+CHECKIN = "Validator/CheckIn"
+CHECKOUT = "Validator/CheckOut"
+VALIDATOR_PRESETS = "Validator/Presets"
+DPDATA = "dpData"
+DPLOG = "dpLog"
+
+
+def getDPARVersion(path=DPAR_PATH):
+    """ Return the dpAutoRigSystem version read from the dpAutoRig.py file without importing it, because its import opens the loading window.
+        The version stays in the dpAutoRig.py header to be found by the update checker.
+        Returns None if it isn't found.
+    """
+    try:
+        with open(os.path.join(path, DPAR_FILE), "r", encoding="utf-8", errors="replace") as dparFile:
+            found = DPAR_VERSION_RE.search(dparFile.read(4096))
+    except IOError:
+        return None
+    return found.group(1) if found else None
@@ -2,6 +2,8 @@
 from maya import cmds
 from maya import mel
 from . import dpUtils
+from . import dpSceneIndex
+from . import dpProgress
 from ...Validator.CheckOut import dpResetPose
 from functools import partial
 import os
@@ -255,16 +257,12 @@ class ControlClass(object):
         return [ribbonNurbsPlane, ribbonNurbsPlaneShape, jointGrpList, jointList]
     
     
-    def getControlNodeById(self, ctrlType, *args):
+    def getControlNodeById(self, ctrlType, sceneIndex=None, *args):
         """ Find and return node list with ctrlType in its attribute.
         """
-        ctrlList = []
-        allTransformList = cmds.ls(selection=False, type="transform")
-        for item in allTransformList:
-            if cmds.objExists(item+".controlID"):
-                if cmds.getAttr(item+".controlID") == ctrlType:
-                    ctrlList.append(item)
-        return ctrlList
+        if not sceneIndex:
+            sceneIndex = dpSceneIndex.SceneIndex()
+        return sceneIndex.getNodeList("controlID", ctrlType)
     
     
     def getControlModuleById(self, ctrlType, *args):
@@ -717,12 +715,9 @@ class ControlClass(object):
         """ Creates a json file as a Control Preset and returns it.
         """
         resultString = None
-        ctrlList, ctrlIDList = [], []
-        allTransformList = cmds.ls(selection=False, type='transform')
-        for item in allTransformList:
-            if cmds.objExists(item+"."+DPCONTROL):
-                if cmds.getAttr(item+"."+DPCONTROL) == 1:
-                    ctrlList.append(item)
+        ctrlIDList = []
+        sceneIndex = dpSceneIndex.SceneIndex()
+        ctrlList = sceneIndex.getNodeList(DPCONTROL, 1)
         if ctrlList:
             resultDialog = cmds.promptDialog(
                                             title=self.dpUIinst.lang['i129_createPreset'],
@@ -748,8 +743,8 @@ class ControlClass(object):
                     ctrlIDList.append("_updated")
                     # get all existing controls info
                     for ctrlNode in ctrlList:
-                        ctrl_ID = cmds.getAttr(ctrlNode+".controlID")
-                        if ctrl_ID.startswith("id_"):
+                        ctrl_ID = sceneIndex.getValue(ctrlNode, "controlID")
+                        if ctrl_ID and ctrl_ID.startswith("id_"):
                             if not ctrl_ID in ctrlIDList:
                                 ctrlIDList.append(ctrl_ID)
                                 ctrl_Type = cmds.getAttr(ctrlNode+".className")
@@ -832,8 +827,7 @@ class ControlClass(object):
         """ Add and set attributes to this control curve be used as a guide.
         """
         # create an attribute to be used as guide by module:
-        cmds.addAttr(ctrlName, longName="nJoint", attributeType='long')
-        cmds.setAttr(ctrlName+".nJoint", 1)
+        dpUtils.addAttrSchema(ctrlName, [("nJoint", "long", 1)])
         # colorize curveShapes:
         self.colorShape([ctrlName], 'blue')
         # shapeSize setup:
@@ -849,10 +843,7 @@ class ControlClass(object):
         if not ctrlName.endswith("_JointEnd"):
             if not ctrlName.endswith("_RadiusCtrl"):
                 if not cmds.objExists(ctrlName+".pinGuide"):
-                    cmds.addAttr(ctrlName, longName="pinGuide", attributeType="bool")
-                    cmds.setAttr(ctrlName+".pinGuide", channelBox=True)
-                    cmds.addAttr(ctrlName, longName="pinGuideConstraint", attributeType="message")
-                    cmds.addAttr(ctrlName, longName="lockedList", dataType="string")
+                    dpUtils.addAttrSchema(ctrlName, [("pinGuide", "bool", None, {"channelBox" : True}), ("pinGuideConstraint", "message", None), ("lockedList", "string", None)])
                 cmds.scriptJob(attributeChange=[str(ctrlName+".pinGuide"), lambda nodeName=ctrlName: self.jobPinGuide(nodeName)], killWithScene=True, compressUndo=True)
                 self.jobPinGuide(ctrlName) # just forcing pinGuide setup run before wait for the job be trigger by the attribute
     
@@ -1061,17 +1052,14 @@ class ControlClass(object):
             return list(cmds.getAttr(nodeName+".calibrationList").split(";"))
 
     
-    def getControlList(self, *args):
+    def getControlList(self, sceneIndex=None, *args):
         """ List all dpControl transforms that has active .dpControl attribute.
             Returns a list of them.
         """
-        nodeList = []
-        allList = cmds.ls(selection=False, type="transform")
-        if allList:
-            for item in allList:
-                if cmds.objExists(item+"."+DPCONTROL) and cmds.getAttr(item+"."+DPCONTROL):
-                    nodeList.append(item)
-        return nodeList
+        if not sceneIndex:
+            sceneIndex = dpSceneIndex.SceneIndex()
+        valueDic = sceneIndex.getValueDic(DPCONTROL)
+        return [item for item in valueDic if valueDic[item]]
 
 
     def exportShape(self, nodeList=None, path=None, publish=False, dpSnapshotGrp="dpSnapshot_Grp", keepSnapshot=False, overrideExisting=True, ui=True, *args):
@@ -1101,22 +1089,18 @@ class ControlClass(object):
                     if pathList:
                         path = pathList[0] 
             if path:
-                if ui:
-                    # Starting progress window
-                    progressAmount = 0
-                    cmds.progressWindow(title=self.dpUIinst.lang['i164_export'], progress=progressAmount, status=self.doingName+': 0%', isInterruptable=False)
-                    maxProcess = len(nodeList)
+                # Starting progress window
+                progress = dpProgress.Progress(self.dpUIinst.lang['i164_export'], len(nodeList), self.doingName+': 0%', ui=ui)
+                progress.start()
                 # make sure we save the file as mayaAscii
                 if not path.endswith(".ma"):
                     path = path.replace(".*", ".ma")
                 cmds.undoInfo(openChunk=True)
                 if not cmds.objExists(dpSnapshotGrp):
                     cmds.group(name=dpSnapshotGrp, empty=True)
-                for item in nodeList:
-                    if ui:
-                        # Update progress window
-                        progressAmount += 1
-                        cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.doingName+': ' + repr(progressAmount) + ' Shape'))
+                for progressAmount, item in enumerate(nodeList, 1):
+                    # Update progress window
+                    progress.update(progressAmount, status=lambda: self.doingName+': ' + repr(progressAmount) + ' Shape')
                     snapshotName = item+SNAPSHOT_SUFFIX
                     if cmds.objExists(snapshotName):
                         if overrideExisting:
@@ -1154,17 +1138,17 @@ class ControlClass(object):
                         cmds.delete(dpSnapshotGrp)
                     print('Exported shapes to: {0}'.format(path))
                 cmds.undoInfo(closeChunk=True)
+                # Close progress window
+                progress.end()
         else:
             print(self.dpUIinst.lang['i202_noControls'])
-        if ui:
-            # Close progress window
-            cmds.progressWindow(endProgress=True)
 
 
     def importShape(self, nodeList=None, path=None, recharge=False, ui=True, *args):
         """ Import control shapes from an external loaded Maya file.
             If not get an user defined parameter for a node list, it will import all shapes.
             If the recharge parameter is True, it will use the default path as current location inside dpShapeIO directory.
+            Cancelling the progress window stops it between the shapes and keeps the ones already imported.
         """
         importShapeNamespace = "dpImportShape"
         if not nodeList:
@@ -1194,28 +1178,25 @@ class ControlClass(object):
                     refNode = cmds.file(path, referenceNode=True, query=True)
                     refNodeList = cmds.referenceQuery(refNode, nodes=True)
                     if refNodeList:
-                        if ui:
-                            # Starting progress window
-                            progressAmount = 0
-                            cmds.progressWindow(title=self.dpUIinst.lang['i196_import'], progress=progressAmount, status=self.doingName+': 0%', isInterruptable=False)
-                            maxProcess = len(refNodeList)
-                        for sourceRefNode in refNodeList:
-                            if ui:
-                                # Update progress window
-                                progressAmount += 1
-                                cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.doingName+': ' + repr(progressAmount) + ' Shape'))
+                        # Starting progress window
+                        progress = dpProgress.Progress(self.dpUIinst.lang['i196_import'], len(refNodeList), self.doingName+': 0%', interruptable=True, ui=ui)
+                        progress.start()
+                        for progressAmount, sourceRefNode in enumerate(refNodeList, 1):
+                            if progress.isCancelled():
+                                break
+                            # Update progress window
+                            progress.update(progressAmount, status=lambda: self.doingName+': ' + repr(progressAmount) + ' Shape')
                             if cmds.objectType(sourceRefNode) == "transform":
                                 destinationNode = sourceRefNode[sourceRefNode.rfind(":")+1:-len(SNAPSHOT_SUFFIX)] #removed namespace before ":"" and the suffix _Snapshot_Crv (-13)
                                 if cmds.objExists(destinationNode):
                                     self.transferShape(deleteSource=False, clearDestinationShapes=True, sourceItem=sourceRefNode, destinationList=[destinationNode], keepColor=False)
+                        # Close progress window
+                        progress.end()
                     # remove referenced file:
                     cmds.file(path, removeReference=True)
                     print("Imported shapes: {0}".format(path))
         else:
             print(self.dpUIinst.lang['i202_noControls'])
-        if ui:
-            # Close progress window
-            cmds.progressWindow(endProgress=True)
 
 
     def createCorrectiveJointCtrl(self, jcrName, correctiveNet, type='id_092_Correctives', radius=1, degree=3, *args):
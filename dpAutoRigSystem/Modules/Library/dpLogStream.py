@@ -0,0 +1,510 @@
+# importing libraries:
+from maya import cmds
+import os
+import gzip
+import re
+import json
+import time
+import uuid
+import datetime
+
+# global variables to this module:
+LOG_PREFIX = "dpLog_"
+LOG_EXTENSION = ".jsonl"
+GZIP_EXTENSION = ".gz"
+COMPRESS_OPTVAR = "dpAutoRigCompressLog"
+# list items written in each record:
+CHUNK_SIZE = 1000
+# daily archives and index of each scene:
+ARCHIVE_PREFIX = "dpLogArchive_"
+INDEX_PREFIX = "dpLogIndex_"
+INDEX_VERSION = 1
+RETENTION_OPTVAR = "dpAutoRigLogRetentionDays"
+DEFAULT_RETENTION_DAYS = 30
+LOG_TIME_FORMAT = "%Y-%m-%d_%H-%M-%S"
+# loose log files written by each run, like dpLog_<scene>_<date>_<time>.json:
+LOOSE_LOG_PATTERN = re.compile(r"^"+LOG_PREFIX+r"(.+)_(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2}-\d{2})\.(json|jsonl|jsonl\.gz)$")
+# daily archives of each scene, like dpLogArchive_<scene>_<date>.jsonl.gz:
+ARCHIVE_PATTERN = re.compile(r"^"+ARCHIVE_PREFIX+r"(.+)_(\d{4}-\d{2}-\d{2})\.jsonl(\.gz)?$")
+
+DP_LOGSTREAM_VERSION = 1.3
+
+
+def getCompressMode():
+    """ Return True if the log files must be gzip compressed by the user optionVar.
+    """
+    try:
+        if cmds.optionVar(exists=COMPRESS_OPTVAR):
+            return bool(cmds.optionVar(query=COMPRESS_OPTVAR))
+    except:
+        pass
+    return False
+
+
+def setCompressMode(value):
+    """ Store the gzip compression of the log files in the user optionVar and return it.
+    """
+    try:
+        cmds.optionVar(intValue=(COMPRESS_OPTVAR, int(bool(value))))
+    except:
+        pass
+    return bool(value)
+
+
+def getRetentionDays():
+    """ Return the number of days to keep the log archives from the user optionVar.
+        Zero keeps all archives.
+    """
+    try:
+        if cmds.optionVar(exists=RETENTION_OPTVAR):
+            return int(cmds.optionVar(query=RETENTION_OPTVAR))
+    except:
+        pass
+    return DEFAULT_RETENTION_DAYS
+
+
+def setRetentionDays(days):
+    """ Store the number of days to keep the log archives in the user optionVar and return it.
+    """
+    days = max(0, int(days))
+    try:
+        cmds.optionVar(intValue=(RETENTION_OPTVAR, days))
+    except:
+        pass
+    return days
+
+
+def getLogPath(name=None, path=None, subFolder=None, compress=None):
+    """ Return a new timestamped log file path in the given sub folder of the scene folder, creating the folder if needed.
+        Returns None if there isn't a path and the scene isn't saved.
+    """
+    currentTime = time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime())
+    if not path:
+        path = cmds.file(query=True, sceneName=True)
+    if not path:
+        return None
+    dpFolder = path[:path.rfind("/")]
+    if subFolder:
+        dpFolder = dpFolder+"/"+subFolder
+    if not os.path.exists(dpFolder):
+        os.makedirs(dpFolder)
+    if not name:
+        name = path[path.rfind("/")+1:path.rfind(".")]
+    if compress is None:
+        compress = getCompressMode()
+    return dpFolder+"/"+LOG_PREFIX+name+"_"+currentTime+LOG_EXTENSION+(GZIP_EXTENSION if compress else "")
+
+
+def openLogFile(pathFile, mode="r"):
+    """ Open the log file as text, using gzip if it has the compressed file extension.
+    """
+    if pathFile.endswith(GZIP_EXTENSION):
+        return gzip.open(pathFile, mode+"t", compresslevel=6, encoding="utf-8")
+    return open(pathFile, mode, encoding="utf-8")
+
+
+class LogWriter(object):
+    """ Append the log data to a JSON Lines file, one record per line, as the results are produced.
+        A dictionary is written as one record with its values and records with chunks of the items of its not empty lists,
+        so big lists don't need to be dumped at once and the file can be read back by readLog even if it was interrupted.
+        Records:
+            {"path" : [keys], "dic" : {key : value}} = update the dictionary in the path with the values
+            {"path" : [keys], "items" : [values]} = extend the list in the path with the values
+    """
+    def __init__(self, pathFile, logId=None, *args):
+        """ Initialize the class.
+            The records get the given log id to be found in an archive with many logs.
+        """
+        # defining variables:
+        self.pathFile = pathFile
+        self.logId = logId
+        self.logFile = None
+
+
+    def __enter__(self):
+        self.open()
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def open(self, *args):
+        """ Open the log file to append records.
+            It starts a new line if the file doesn't end with one, so an interrupted record doesn't join the next one.
+        """
+        if not self.logFile:
+            lineEnded = self.isLineEnded()
+            self.logFile = openLogFile(self.pathFile, "a")
+            if not lineEnded:
+                self.logFile.write("\n")
+
+
+    def isLineEnded(self, *args):
+        """ Return True if the log file doesn't exist, is empty or ends with a new line.
+            The compressed files aren't read back to check it, the empty line is skipped by readArchive.
+        """
+        if not os.path.exists(self.pathFile) or not os.path.getsize(self.pathFile):
+            return True
+        if self.pathFile.endswith(GZIP_EXTENSION):
+            return False
+        with open(self.pathFile, "rb") as logFile:
+            logFile.seek(-1, os.SEEK_END)
+            return logFile.read(1) == b"\n"
+
+
+    def close(self, *args):
+        """ Close the log file.
+        """
+        if self.logFile:
+            self.logFile.close()
+            self.logFile = None
+
+
+    def writeRecord(self, record, *args):
+        """ Append one record as a line.
+        """
+        self.open()
+        if self.logId:
+            record["log"] = self.logId
+        self.logFile.write(json.dumps(record, separators=(",", ":"))+"\n")
+
+
+    def writeDic(self, dic, keyList=None, chunkSize=CHUNK_SIZE, *args):
+        """ Append the given dictionary in the key path, with the list items in records of the given chunk size.
+        """
+        keyList = keyList or []
+        valueDic = {}
+        itemDic = {}
+        for key, value in dic.items():
+            if isinstance(value, dict):
+                self.writeDic(value, keyList+[key], chunkSize)
+            elif isinstance(value, (list, tuple)) and value:
+                itemDic[key] = value
+            else:
+                valueDic[key] = value
+        self.writeRecord({"path" : keyList, "dic" : valueDic})
+        for key, itemList in itemDic.items():
+            itemPath = keyList+[key]
+            for i in range(0, len(itemList), chunkSize):
+                self.writeRecord({"path" : itemPath, "items" : list(itemList[i:i+chunkSize])})
+
+
+def readLog(pathFile, logId=None):
+    """ Read the JSON Lines log file and return the dictionary as it was written.
+        If a log id is given, only the records of this log are read from the archive.
+        It also reads the older json log files.
+    """
+    if pathFile.endswith(".json"):
+        with open(pathFile, "r") as logFile:
+            return json.load(logFile)
+    return readArchive(pathFile, logId).get(logId, {})
+
+
+def readArchive(pathFile, logId=None):
+    """ Read the JSON Lines log file and return a dictionary with the log id as key and the log dictionary as value.
+        The records without log id are stored in the None key.
+        If a log id is given, the records of the other logs are skipped.
+    """
+    archiveDic = {}
+    with openLogFile(pathFile) as logFile:
+        for line in logFile:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # skip the record of an interrupted write and keep reading the next logs:
+                continue
+            if logId and record.get("log") != logId:
+                continue
+            dic = archiveDic.setdefault(record.get("log"), {})
+            if "items" in record:
+                for key in record["path"][:-1]:
+                    dic = dic.setdefault(key, {})
+                dic.setdefault(record["path"][-1], []).extend(record["items"])
+            else:
+                for key in record["path"]:
+                    dic = dic.setdefault(key, {})
+                dic.update(record["dic"])
+    return archiveDic
+
+
+def exportLogDic(dic, name=None, path=None, subFolder=None, compress=None):
+    """ Save the given dictionary as a new JSON Lines log file in the scene folder.
+        Returns the log file path or False if the scene isn't saved.
+    """
+    pathFile = getLogPath(name, path, subFolder, compress)
+    if not pathFile:
+        return False
+    print("\nLog file", pathFile)
+    with LogWriter(pathFile) as logWriter:
+        logWriter.writeDic(dic)
+    return pathFile
+
+
+def getLogSummary(dic):
+    """ Return the validator names and the validators with issues of the given log dictionary.
+        It reads a validator data log or a dictionary of validator data logs by name.
+    """
+    validatorList = []
+    issueList = []
+    for validatorDic in [dic]+[value for value in dic.values() if isinstance(value, dict)]:
+        if "validator" in validatorDic:
+            validatorList.append(validatorDic["validator"])
+            if True in validatorDic.get("foundIssueList", []):
+                issueList.append(validatorDic["validator"])
+    return validatorList, issueList
+
+
+def getLogStore(subFolder=None, path=None):
+    """ Return the log store of the given sub folder of the scene folder.
+        Returns None if there isn't a path and the scene isn't saved.
+    """
+    if not path:
+        path = cmds.file(query=True, sceneName=True)
+    if not path:
+        return None
+    logFolder = path[:path.rfind("/")]
+    if subFolder:
+        logFolder = logFolder+"/"+subFolder
+    return LogStore(logFolder, path[path.rfind("/")+1:path.rfind(".")])
+
+
+class LogStore(object):
+    """ Store the logs of one scene in append-only daily archives, like dpLogArchive_<scene>_<date>.jsonl.gz,
+        instead of one file for each run, to keep the log folder small.
+        An index file lists each log with its archive, time, validators and validators with issues,
+        so the logs are found without reading the archives.
+        The loose log files of the scene are rolled into the archives and the old archives are removed by the retention days.
+    """
+    def __init__(self, logFolder, sceneName, *args):
+        """ Initialize the class.
+        """
+        # defining variables:
+        self.logFolder = logFolder
+        self.sceneName = sceneName
+        self.indexPath = logFolder+"/"+INDEX_PREFIX+sceneName+".json"
+        self.indexDic = None
+
+
+    def loadIndex(self, *args):
+        """ Read the index file or rebuild it from the archives if it doesn't exist or can't be read.
+        """
+        self.indexDic = None
+        if os.path.exists(self.indexPath):
+            try:
+                with open(self.indexPath, "r") as indexFile:
+                    indexDic = json.load(indexFile)
+                if indexDic.get("version") == INDEX_VERSION:
+                    self.indexDic = indexDic
+            except:
+                pass
+        if self.indexDic is None:
+            self.rebuildIndex()
+        return self.indexDic
+
+
+    def getIndex(self, *args):
+        """ Return the index dictionary, loading it once.
+        """
+        if self.indexDic is None:
+            self.loadIndex()
+        return self.indexDic
+
+
+    def saveIndex(self, *args):
+        """ Write the index file replacing the old one at once.
+        """
+        if not os.path.exists(self.logFolder):
+            os.makedirs(self.logFolder)
+        tempPath = self.indexPath+"."+uuid.uuid4().hex[:8]+".tmp"
+        with open(tempPath, "w") as indexFile:
+            json.dump(self.indexDic, indexFile)
+        os.replace(tempPath, self.indexPath)
+
+
+    def rebuildIndex(self, *args):
+        """ Create the index reading all archives of the scene.
+        """
+        self.indexDic = {"version" : INDEX_VERSION, "maintenance" : None, "logs" : []}
+        if os.path.exists(self.logFolder):
+            for fileName in sorted(os.listdir(self.logFolder)):
+                match = ARCHIVE_PATTERN.match(fileName)
+                if match and match.group(1) == self.sceneName:
+                    for logId, logDic in readArchive(self.logFolder+"/"+fileName).items():
+                        if logId:
+                            self.addIndexEntry(logId, fileName, logDic)
+            self.indexDic["logs"].sort(key=lambda entry: entry["time"])
+        return self.indexDic
+
+
+    def addIndexEntry(self, logId, fileName, dic, *args):
+        """ Add the log summary to the index.
+        """
+        validatorList, issueList = getLogSummary(dic)
+        self.getIndex()["logs"].append({"id" : logId, "file" : fileName, "time" : logId[:19], "validators" : validatorList, "issues" : issueList})
+
+
+    def getArchivePath(self, date, compress=None, *args):
+        """ Return the archive path of the given date, like 2024-12-31.
+        """
+        if compress is None:
+            compress = getCompressMode()
+        return self.logFolder+"/"+ARCHIVE_PREFIX+self.sceneName+"_"+date+LOG_EXTENSION+(GZIP_EXTENSION if compress else "")
+
+
+    def startLog(self, logTime=None, compress=None, *args):
+        """ Return a new log writer appending to the archive of the log day.
+            The log id starts with the log time to sort the logs.
+            It must be added to the index with indexLog after writing.
+        """
+        if not os.path.exists(self.logFolder):
+            os.makedirs(self.logFolder)
+        logId = self.getNewLogId(logTime)
+        return LogWriter(self.getArchivePath(logId[:10], compress), logId)
+
+
+    def getNewLogId(self, logTime=None, *args):
+        """ Return a new unique log id starting with the given log time or the current time.
+        """
+        return (logTime or time.strftime(LOG_TIME_FORMAT, time.localtime()))+"_"+uuid.uuid4().hex[:8]
+
+
+    def indexLog(self, logWriter, dic, *args):
+        """ Add the log of the given writer to the index with the summary of the given dictionary.
+        """
+        self.addIndexEntry(logWriter.logId, os.path.basename(logWriter.pathFile), dic)
+        self.saveIndex()
+
+
+    def exportLogDic(self, dic, logTime=None, compress=None, *args):
+        """ Append the given dictionary as a new log in the archive of the day and add it to the index.
+            Returns the log id.
+        """
+        with self.startLog(logTime, compress) as logWriter:
+            logWriter.writeDic(dic)
+        self.indexLog(logWriter, dic)
+        print("\nLog file", logWriter.pathFile)
+        return logWriter.logId
+
+
+    def findLogs(self, validator=None, date=None, issues=False, *args):
+        """ Return the index entries of the logs with the given validator, of the given date or date range, and with issues if asked.
+            The date can be a day like 2024-12-31 or a list with the first and the last days.
+        """
+        entryList = []
+        for entry in self.getIndex()["logs"]:
+            if validator and not validator in entry["validators"]:
+                continue
+            if date:
+                if isinstance(date, (list, tuple)):
+                    if not date[0] <= entry["time"][:10] <= date[1]:
+                        continue
+                elif entry["time"][:10] != date:
+                    continue
+            if issues and not (entry["issues"] if not validator else validator in entry["issues"]):
+                continue
+            entryList.append(entry)
+        return entryList
+
+
+    def readLog(self, entry, *args):
+        """ Return the log dictionary of the given index entry or log id.
+        """
+        if not isinstance(entry, dict):
+            entry = next((logEntry for logEntry in self.getIndex()["logs"] if logEntry["id"] == entry), None)
+            if not entry:
+                return {}
+        return readLog(self.logFolder+"/"+entry["file"], entry["id"])
+
+
+    def compact(self, *args):
+        """ Roll the loose log files of this scene into the daily archives and remove them.
+            Returns the number of rolled files.
+        """
+        rolledCount = 0
+        if os.path.exists(self.logFolder):
+            # the sorted files are grouped by day, so each archive is opened once:
+            logWriter = None
+            rolledList = []
+            try:
+                for fileName in sorted(os.listdir(self.logFolder)):
+                    match = LOOSE_LOG_PATTERN.match(fileName)
+                    if match and match.group(1) == self.sceneName:
+                        pathFile = self.logFolder+"/"+fileName
+                        try:
+                            dic = readLog(pathFile)
+                        except:
+                            # keep the file that can't be read:
+                            continue
+                        archivePath = self.getArchivePath(match.group(2))
+                        if not logWriter or logWriter.pathFile != archivePath:
+                            if logWriter:
+                                logWriter.close()
+                                self.removeRolledFiles(rolledList)
+                            logWriter = LogWriter(archivePath)
+                        logWriter.logId = self.getNewLogId(match.group(2)+"_"+match.group(3))
+                        logWriter.writeDic(dic)
+                        self.addIndexEntry(logWriter.logId, os.path.basename(archivePath), dic)
+                        rolledList.append(pathFile)
+                        rolledCount += 1
+            finally:
+                if logWriter:
+                    logWriter.close()
+                    self.removeRolledFiles(rolledList)
+            if rolledCount:
+                self.getIndex()["logs"].sort(key=lambda entry: entry["time"])
+                self.saveIndex()
+        return rolledCount
+
+
+    def removeRolledFiles(self, rolledList, *args):
+        """ Remove the loose log files already written and closed in their archive and clear the given list.
+        """
+        for pathFile in rolledList:
+            os.remove(pathFile)
+        del rolledList[:]
+
+
+    def applyRetention(self, days=None, today=None, *args):
+        """ Remove the archives older than the given number of days, or the retention days of the user optionVar, and their index entries.
+            Zero days keeps all archives.
+            Returns the number of removed archives.
+        """
+        if days is None:
+            days = getRetentionDays()
+        if not days:
+            return 0
+        today = today or datetime.date.today()
+        firstDate = (today-datetime.timedelta(days=days)).isoformat()
+        removedCount = 0
+        if os.path.exists(self.logFolder):
+            for fileName in os.listdir(self.logFolder):
+                # the scene name is matched as a whole to keep the archives of other scenes with the same prefix:
+                match = ARCHIVE_PATTERN.match(fileName)
+                if match and match.group(1) == self.sceneName and match.group(2) < firstDate:
+                    os.remove(self.logFolder+"/"+fileName)
+                    removedCount += 1
+        indexDic = self.getIndex()
+        logCount = len(indexDic["logs"])
+        indexDic["logs"] = [entry for entry in indexDic["logs"] if entry["time"][:10] >= firstDate]
+        if removedCount or logCount != len(indexDic["logs"]):
+            self.saveIndex()
+        return removedCount
+
+
+    def runMaintenance(self, force=False, *args):
+        """ Compact the loose log files and apply the retention once a day, or now if forced.
+            Returns the number of rolled files and removed archives.
+        """
+        today = datetime.date.today().isoformat()
+        indexDic = self.getIndex()
+        if not force and indexDic.get("maintenance") == today:
+            return 0, 0
+        rolledCount = self.compact()
+        removedCount = self.applyRetention()
+        indexDic["maintenance"] = today
+        self.saveIndex()
+        return rolledCount, removedCount
@@ -0,0 +1,210 @@
+# importing libraries:
+from maya import cmds
+from importlib import reload
+import os
+import re
+import ast
+import sys
+import json
+import time
+import importlib
+
+DP_MANIFEST_VERSION = 1.1
+
+MANIFEST_FILE = "dpAutoRigManifest.json"
+MANIFEST_KEY_LIST = ["CLASS_NAME", "TITLE", "DESCRIPTION", "ICON"]
+VERSION_RE = re.compile(r"^DP_[A-Z0-9_]+_VERSION$")
+HEADER_RE = re.compile(r"^([A-Z][A-Z0-9_]*)[ \t]*=[ \t]*([\"'][^\"'\n]*[\"']|[0-9.]+)[ \t]*(?:#.*)?$", re.MULTILINE)
+MTIME_ATTR = "_dpManifestMtime"
+DEV_MODE_ENV = "DPAR_DEV_MODE"
+DEV_MODE_OPTVAR = "dpAutoRigDevMode"
+
+# changes when this module is reloaded with the dpAutoRig package, so all modules are reloaded once to get the new base classes:
+IMPORT_GENERATION = time.time()
+
+
+def readModuleHeader(filePath):
+    """ Read the module global constants without importing or parsing the whole module.
+        Return a dictionary with CLASS_NAME, TITLE, DESCRIPTION, ICON and version values found.
+    """
+    with open(filePath, "r", encoding="utf-8", errors="replace") as moduleFile:
+        text = moduleFile.read()
+    headerDic = {}
+    for name, value in HEADER_RE.findall(text):
+        if name in MANIFEST_KEY_LIST or VERSION_RE.match(name):
+            try:
+                value = ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                continue
+            headerDic["version" if VERSION_RE.match(name) else name] = value
+    return headerDic
+
+
+def getFileMtime(filePath):
+    """ Return the modification time of the file or None if it doesn't exist.
+    """
+    try:
+        return os.path.getmtime(filePath)
+    except OSError:
+        return None
+
+
+def getDevMode():
+    """ Return True if the development mode is active by the DPAR_DEV_MODE environment variable or the user optionVar.
+    """
+    if os.environ.get(DEV_MODE_ENV, "0") not in ["", "0"]:
+        return True
+    try:
+        if cmds.optionVar(exists=DEV_MODE_OPTVAR):
+            return bool(cmds.optionVar(query=DEV_MODE_OPTVAR))
+    except:
+        pass
+    return False
+
+
+def setDevMode(value):
+    """ Store the development mode in the user optionVar.
+        In development mode the modules are always reloaded, in production mode they're reloaded only if their file changed.
+    """
+    global devMode
+    devMode = bool(value)
+    try:
+        cmds.optionVar(intValue=(DEV_MODE_OPTVAR, int(devMode)))
+    except:
+        pass
+    return devMode
+
+
+def importModule(moduleName, filePath=None):
+    """ Import the module and reload it only if its file changed since the last import or if the package was reloaded.
+        The module is always reloaded in development mode.
+        Return the imported module.
+    """
+    global reloadCount
+    module = sys.modules.get(moduleName)
+    if module is None:
+        module = importlib.import_module(moduleName)
+    else:
+        if not filePath:
+            filePath = getattr(module, "__file__", None)
+        if devMode or not filePath or getattr(module, MTIME_ATTR, None) != (getFileMtime(filePath), IMPORT_GENERATION):
+            module = reload(module)
+            reloadCount += 1
+    if not filePath:
+        filePath = getattr(module, "__file__", None)
+    if filePath:
+        setattr(module, MTIME_ATTR, (getFileMtime(filePath), IMPORT_GENERATION))
+    return module
+
+
+class ModuleManifest(object):
+    """ Persistent manifest of the module headers found in each folder.
+        The UI reads the module name, class name, title, description, icon and version from it without importing the modules.
+        Each entry is read again only if the file modification time changed.
+    """
+    def __init__(self, manifestPath=None, *args):
+        """ Initialize the class.
+        """
+        # defining variables:
+        self.manifestPath = manifestPath
+        self.manifestDic = None
+        self.changed = False
+        self.lastTime = 0.0
+
+
+    def getManifestPath(self, *args):
+        """ Return the manifest file path in the Maya user preferences folder.
+        """
+        if not self.manifestPath:
+            try:
+                self.manifestPath = os.path.join(cmds.internalVar(userPrefDir=True), MANIFEST_FILE)
+            except:
+                self.manifestPath = None
+        return self.manifestPath
+
+
+    def load(self, *args):
+        """ Read the manifest file if it exists and has the same manifest version.
+        """
+        self.manifestDic = {"version" : DP_MANIFEST_VERSION, "folders" : {}}
+        manifestPath = self.getManifestPath()
+        if manifestPath and os.path.exists(manifestPath):
+            try:
+                with open(manifestPath, "r") as manifestFile:
+                    loadedDic = json.load(manifestFile)
+                if loadedDic.get("version") == DP_MANIFEST_VERSION:
+                    self.manifestDic = loadedDic
+            except:
+                pass
+        self.changed = False
+
+
+    def save(self, *args):
+        """ Write the manifest file if any entry changed.
+            The manifest stays in memory if the preferences folder isn't writable.
+        """
+        manifestPath = self.getManifestPath()
+        if self.changed and manifestPath:
+            try:
+                with open(manifestPath, "w") as manifestFile:
+                    json.dump(self.manifestDic, manifestFile, indent=4)
+                self.changed = False
+            except:
+                pass
+
+
+    def getEntryList(self, path, guideDir, moduleList, *args):
+        """ Return the manifest entries of the given modules in the folder.
+            Each entry is a dictionary with module, CLASS_NAME, TITLE, DESCRIPTION, ICON, version and mtime keys.
+            Unreadable modules are skipped like the failed imports were.
+        """
+        startTime = time.perf_counter()
+        if self.manifestDic is None:
+            self.load()
+        folderPath = os.path.abspath(os.path.join(path, guideDir))
+        folderDic = self.manifestDic["folders"].setdefault(folderPath, {})
+        entryList = []
+        for moduleName in moduleList:
+            filePath = os.path.join(folderPath, moduleName+".py")
+            mtime = getFileMtime(filePath)
+            entryDic = folderDic.get(moduleName)
+            if not entryDic or entryDic.get("mtime") != mtime:
+                try:
+                    entryDic = readModuleHeader(filePath)
+                except Exception as e:
+                    print("dpManifest: "+moduleName+" : "+str(e))
+                    folderDic.pop(moduleName, None)
+                    self.changed = True
+                    continue
+                entryDic["module"] = moduleName
+                entryDic["mtime"] = mtime
+                folderDic[moduleName] = entryDic
+                self.changed = True
+            entryList.append(entryDic)
+        # remove deleted modules:
+        for moduleName in list(folderDic):
+            if not moduleName in moduleList:
+                del folderDic[moduleName]
+                self.changed = True
+        self.save()
+        self.lastTime = time.perf_counter()-startTime
+        return entryList
+
+
+    def getFolderDic(self, path, guideDir, *args):
+        """ Return the stored entries dictionary of the folder.
+        """
+        if self.manifestDic is None:
+            self.load()
+        return self.manifestDic["folders"].get(os.path.abspath(os.path.join(path, guideDir)), {})
+
+
+# keep the same manifest when this module is reloaded:
+try:
+    moduleManifest
+except NameError:
+    moduleManifest = ModuleManifest()
+
+# number of reloaded modules, used to log the repopulate cost:
+reloadCount = 0
+devMode = getDevMode()
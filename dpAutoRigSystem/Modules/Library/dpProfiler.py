@@ -0,0 +1,381 @@
+# importing libraries:
+from maya import cmds
+from . import dpUtils
+import os
+import sys
+import time
+import atexit
+import getpass
+
+DP_PROFILER_VERSION = 1.2
+
+# set this environment variable to 1 to trace the cmds calls in batch runs, the report is printed when the session ends:
+DPAR_TRACE_CMDS_ENV = "DPAR_TRACE_CMDS"
+PACKAGE_NAME = "dpAutoRigSystem"
+
+
+class CmdsCounter(object):
+    """ Wrap the maya.cmds functions to count how many times they are called.
+        All modules share the same cmds module, so the wrappers work for the whole package while installed.
+    """
+    def __init__(self, *args):
+        """ Initialize the class.
+        """
+        # defining variables:
+        self.originalDic = {}
+        self.callCountDic = {}
+
+
+    def wrap(self, name, func, *args):
+        """ Return a function that counts the call before running the original cmds function.
+        """
+        def runCount(*args, **kwargs):
+            self.callCountDic[name] = self.callCountDic.get(name, 0)+1
+            return func(*args, **kwargs)
+        runCount.__name__ = name
+        runCount.__doc__ = func.__doc__
+        return runCount
+
+
+    def install(self, *args):
+        """ Replace the cmds functions by the counting wrappers.
+        """
+        if not self.originalDic:
+            for name in dir(cmds):
+                if not name.startswith("_"):
+                    func = getattr(cmds, name)
+                    if callable(func):
+                        self.originalDic[name] = func
+                        setattr(cmds, name, self.wrap(name, func))
+
+
+    def uninstall(self, *args):
+        """ Restore the original cmds functions.
+        """
+        for name in self.originalDic:
+            setattr(cmds, name, self.originalDic[name])
+        self.originalDic = {}
+
+
+    def getOriginal(self, name, *args):
+        """ Return the original cmds function to run it without counting.
+        """
+        return self.originalDic.get(name, getattr(cmds, name))
+
+
+    def getCallCount(self, *args):
+        """ Return the total number of counted calls.
+        """
+        return sum(self.callCountDic.values())
+
+
+class CmdsTracer(CmdsCounter):
+    """ Wrap the maya.cmds functions to store the call count, cumulative time and call sites of each command.
+        The call site is the first dpAutoRigSystem module and function found in the stack.
+    """
+    def __init__(self, *args):
+        """ Initialize the class.
+        """
+        CmdsCounter.__init__(self)
+        # defining variables:
+        self.callTimeDic = {}
+        self.callSiteDic = {}
+        self.startTime = None
+        self.totalTime = 0.0
+
+
+    def getCallSite(self, *args):
+        """ Return the module.function name of the first package frame that isn't in this module.
+        """
+        frame = sys._getframe(2)
+        while frame:
+            moduleName = frame.f_globals.get("__name__", "")
+            if moduleName.startswith(PACKAGE_NAME) and moduleName != __name__:
+                return moduleName[moduleName.rfind(".")+1:]+"."+frame.f_code.co_name
+            frame = frame.f_back
+        return "external"
+
+
+    def wrap(self, name, func, *args):
+        """ Return a function that stores the call count, time and call site before returning the original cmds result.
+        """
+        def runTrace(*args, **kwargs):
+            startTime = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsedTime = time.perf_counter()-startTime
+                self.callCountDic[name] = self.callCountDic.get(name, 0)+1
+                self.callTimeDic[name] = self.callTimeDic.get(name, 0.0)+elapsedTime
+                siteDic = self.callSiteDic.setdefault(name, {})
+                site = self.getCallSite()
+                if site in siteDic:
+                    siteDic[site][0] += 1
+                    siteDic[site][1] += elapsedTime
+                else:
+                    siteDic[site] = [1, elapsedTime]
+        runTrace.__name__ = name
+        runTrace.__doc__ = func.__doc__
+        return runTrace
+
+
+    def start(self, *args):
+        """ Clear the stored data and install the tracing wrappers.
+        """
+        self.uninstall()
+        self.callCountDic = {}
+        self.callTimeDic = {}
+        self.callSiteDic = {}
+        self.totalTime = 0.0
+        self.install()
+        self.startTime = time.perf_counter()
+
+
+    def stop(self, *args):
+        """ Restore the original cmds functions keeping the stored data.
+        """
+        if self.isTracing():
+            self.totalTime = time.perf_counter()-self.startTime
+            self.uninstall()
+            self.startTime = None
+
+
+    def isTracing(self, *args):
+        """ Return True if the tracing wrappers are installed.
+        """
+        return bool(self.originalDic)
+
+
+    def getReport(self, limit=None, *args):
+        """ Return a dictionary with the traced commands sorted by cumulative time.
+            Each command has its call sites also sorted by cumulative time.
+        """
+        totalTime = self.totalTime
+        if self.isTracing():
+            totalTime = time.perf_counter()-self.startTime
+        commandList = []
+        for name in sorted(self.callTimeDic, key=lambda item: self.callTimeDic[item], reverse=True)[:limit]:
+            siteList = []
+            for site, siteData in sorted(self.callSiteDic[name].items(), key=lambda item: item[1][1], reverse=True):
+                siteList.append({"site" : site, "calls" : siteData[0], "time" : round(siteData[1], 6)})
+            commandList.append({"command" : name, "calls" : self.callCountDic[name], "time" : round(self.callTimeDic[name], 6), "siteList" : siteList})
+        return {
+                "user" : getpass.getuser(),
+                "time" : str(time.asctime(time.localtime(time.time()))),
+                "tracedTime" : round(totalTime, 6),
+                "totalCalls" : self.getCallCount(),
+                "cmdsTime" : round(sum(self.callTimeDic.values()), 6),
+                "commandList" : commandList
+                }
+
+
+    def printReport(self, limit=30, siteLimit=5, *args):
+        """ Print the most expensive commands and their main call sites.
+        """
+        reportDic = self.getReport(limit)
+        print("\n-------------\ndpProfiler: cmds trace")
+        print("%.3f s traced, %.3f s in %i cmds calls" % (reportDic["tracedTime"], reportDic["cmdsTime"], reportDic["totalCalls"]))
+        for commandDic in reportDic["commandList"]:
+            print("    %8.3f s %8i calls  %s" % (commandDic["time"], commandDic["calls"], commandDic["command"]))
+            for siteDic in commandDic["siteList"][:siteLimit]:
+                print("        %8.3f s %8i calls  %s" % (siteDic["time"], siteDic["calls"], siteDic["site"]))
+
+
+    def exportReport(self, subFolder=None, *args):
+        """ Print the report and save it as a json file in the given sub folder of the scene path.
+            Return the saved file path or False if the scene isn't saved.
+        """
+        if self.callCountDic:
+            self.printReport()
+            scenePath = self.getOriginal("file")(query=True, sceneName=True)
+            if scenePath:
+                sceneName = scenePath[scenePath.rfind("/")+1:scenePath.rfind(".")]
+                return dpUtils.exportLogDicToJson(self.getReport(), name=sceneName+"_cmdsTrace", path=scenePath, subFolder=subFolder)
+        return False
+
+
+class BuildProfiler(object):
+    """ Record wall time, number of cmds calls and created nodes for each phase of a rig build.
+        The node counts list the whole scene, so they are taken out of the timed windows.
+        It does nothing if it isn't enabled, so it can stay in the code.
+    """
+    def __init__(self, dpUIinst, enabled=False, *args):
+        """ Initialize the class.
+        """
+        # defining variables:
+        self.dpUIinst = dpUIinst
+        self.enabled = enabled
+        self.counter = CmdsCounter()
+        self.name = None
+        self.phaseList = []
+        self.currentPhase = None
+        self.startTime = None
+        self.totalTime = 0.0
+        self.startNodeCount = 0
+        self.totalNodes = 0
+        self.nodeCountTime = 0.0
+
+
+    def getNodeCount(self, *args):
+        """ Return the number of nodes in the scene without counting this call.
+            Its time is stored to be removed from the total time.
+        """
+        startTime = time.perf_counter()
+        nodeCount = len(self.counter.getOriginal("ls")() or [])
+        self.nodeCountTime += time.perf_counter()-startTime
+        return nodeCount
+
+
+    def start(self, name="rigAll", *args):
+        """ Start to count the cmds calls and clear the recorded phases.
+        """
+        if self.enabled:
+            self.counter.uninstall()
+            self.counter.callCountDic = {}
+            self.name = name
+            self.phaseList = []
+            self.currentPhase = None
+            self.startNodeCount = self.getNodeCount()
+            self.nodeCountTime = 0.0
+            self.counter.install()
+            self.startTime = time.perf_counter()
+
+
+    def startPhase(self, phaseName, moduleName=None, *args):
+        """ Start to record a new phase closing the current one if it exists.
+        """
+        if self.enabled and self.startTime is not None:
+            self.endPhase()
+            startNodeCount = self.getNodeCount()
+            self.currentPhase = {
+                                    "phase" : phaseName,
+                                    "module" : moduleName,
+                                    "startCallCountDic" : dict(self.counter.callCountDic),
+                                    "startNodeCount" : startNodeCount,
+                                    "startTime" : time.perf_counter()
+                                }
+
+
+    def endPhase(self, *args):
+        """ Store the wall time, cmds calls and created nodes of the current phase.
+        """
+        if self.enabled and self.currentPhase:
+            phaseTime = time.perf_counter()-self.currentPhase["startTime"]
+            startCallCountDic = self.currentPhase["startCallCountDic"]
+            phaseCallCountDic = {}
+            for name, count in self.counter.callCountDic.items():
+                if count > startCallCountDic.get(name, 0):
+                    phaseCallCountDic[name] = count-startCallCountDic.get(name, 0)
+            self.phaseList.append({
+                                    "phase" : self.currentPhase["phase"],
+                                    "module" : self.currentPhase["module"],
+                                    "time" : round(phaseTime, 6),
+                                    "calls" : sum(phaseCallCountDic.values()),
+                                    "nodes" : self.getNodeCount()-self.currentPhase["startNodeCount"],
+                                    "callCountDic" : dict(sorted(phaseCallCountDic.items(), key=lambda item: item[1], reverse=True))
+                                })
+            self.currentPhase = None
+
+
+    def stop(self, *args):
+        """ Close the current phase, restore the cmds functions and store the totals.
+        """
+        if self.enabled and self.startTime is not None:
+            self.endPhase()
+            self.totalTime = time.perf_counter()-self.startTime-self.nodeCountTime
+            self.counter.uninstall()
+            self.totalNodes = self.getNodeCount()-self.startNodeCount
+            self.startTime = None
+
+
+    def getReport(self, *args):
+        """ Return a dictionary with the recorded phases sorted by the build order and the totals.
+        """
+        return {
+                "user" : getpass.getuser(),
+                "time" : str(time.asctime(time.localtime(time.time()))),
+                "name" : self.name,
+                "totalTime" : round(self.totalTime, 6),
+                "totalCalls" : self.counter.getCallCount(),
+                "totalNodes" : self.totalNodes,
+                "phaseList" : self.phaseList
+                }
+
+
+    def printReport(self, *args):
+        """ Print the recorded phases sorted by wall time.
+        """
+        reportDic = self.getReport()
+        print("\n-------------\ndpProfiler: "+str(reportDic["name"]))
+        print("%.3f s, %i cmds calls, %i nodes" % (reportDic["totalTime"], reportDic["totalCalls"], reportDic["totalNodes"]))
+        for phaseDic in sorted(reportDic["phaseList"], key=lambda item: item["time"], reverse=True):
+            phaseName = phaseDic["phase"]
+            if phaseDic["module"]:
+                phaseName += " "+phaseDic["module"]
+            print("    %8.3f s %8i calls %6i nodes  %s" % (phaseDic["time"], phaseDic["calls"], phaseDic["nodes"], phaseName))
+
+
+    def exportReport(self, *args):
+        """ Print the report and save it as a json file in the dpLog folder, next to the validator logs.
+            Return the saved file path or False if the scene isn't saved.
+        """
+        if self.enabled and self.phaseList:
+            self.printReport()
+            scenePath = cmds.file(query=True, sceneName=True)
+            if scenePath:
+                sceneName = scenePath[scenePath.rfind("/")+1:scenePath.rfind(".")]
+                return dpUtils.exportLogDicToJson(self.getReport(), name=sceneName+"_"+str(self.name)+"Profile", subFolder=self.dpUIinst.dpData+"/"+self.dpUIinst.dpLog)
+        return False
+
+
+# keep the same tracer when this module is reloaded, because its wrappers can be installed:
+try:
+    cmdsTracer
+except NameError:
+    cmdsTracer = CmdsTracer()
+
+
+def startTracing(*args):
+    """ Start to trace all cmds calls of the package.
+    """
+    cmdsTracer.start()
+    print("dpProfiler: cmds tracing started.")
+
+
+def stopTracing(subFolder=None, *args):
+    """ Stop to trace the cmds calls, print the report and save it if the scene is saved.
+        Return the saved file path or False.
+    """
+    cmdsTracer.stop()
+    print("dpProfiler: cmds tracing stopped.")
+    return cmdsTracer.exportReport(subFolder)
+
+
+def isTracing(*args):
+    """ Return True if the cmds calls are being traced.
+    """
+    return cmdsTracer.isTracing()
+
+
+def toggleTracing(subFolder=None, *args):
+    """ Start or stop the cmds tracing.
+        Return the new tracing state.
+    """
+    if isTracing():
+        stopTracing(subFolder)
+    else:
+        startTracing()
+    return isTracing()
+
+
+def printTracingReportAtExit(*args):
+    """ Stop the tracing and print the report when the batch session ends.
+    """
+    if isTracing():
+        cmdsTracer.stop()
+        cmdsTracer.printReport()
+
+
+if os.environ.get(DPAR_TRACE_CMDS_ENV, "0") not in ["", "0"] and not isTracing():
+    startTracing()
+    atexit.register(printTracingReportAtExit)
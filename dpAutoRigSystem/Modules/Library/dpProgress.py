@@ -0,0 +1,132 @@
+# importing libraries:
+from maya import cmds
+import time
+
+# global variables to this module:
+UPDATE_INTERVAL = 0.1
+LOG_INTERVAL = 5.0
+
+DP_PROGRESS_VERSION = 1.0
+
+
+def isBatchMode():
+    """ Return True if Maya is running without interface, like in mayapy.
+    """
+    try:
+        return bool(cmds.about(batch=True))
+    except:
+        return True
+
+
+class Progress(object):
+    """ Progress window shared by the long loops.
+        The window is updated at most once by update interval, so the loops don't spend time drawing each iteration,
+        and the status text is only created when it'll be shown.
+        Without interface, or with ui=False, it doesn't use the window and prints the progress once by log interval.
+        If it's interruptable, isCancelled returns True after the user cancels it and the loop can stop at a safe point.
+    """
+    def __init__(self, title="dpAutoRigSystem", maxValue=100, status="", interruptable=False, ui=True, log=False, updateInterval=UPDATE_INTERVAL, logInterval=LOG_INTERVAL, *args):
+        """ Initialize the class.
+        """
+        # defining variables:
+        self.title = title
+        self.maxValue = max(1, maxValue)
+        self.status = status
+        self.interruptable = interruptable
+        self.ui = ui and not isBatchMode()
+        self.log = log or (ui and not self.ui)
+        self.updateInterval = updateInterval
+        self.logInterval = logInterval
+        self.progress = 0
+        self.lastUpdateTime = None
+        self.lastLogTime = None
+        self.lastCancelTime = None
+        self.cancelled = False
+        self.running = False
+        self.updateCount = 0
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, *args):
+        self.end()
+
+
+    def start(self, *args):
+        """ Open the progress window or start the progress log.
+        """
+        self.progress = 0
+        self.cancelled = False
+        self.lastCancelTime = None
+        self.running = True
+        self.lastUpdateTime = time.perf_counter()
+        self.lastLogTime = self.lastUpdateTime
+        if self.ui:
+            cmds.progressWindow(title=self.title, maxValue=self.maxValue, progress=0, status=self.getStatusText(self.status), isInterruptable=self.interruptable)
+        elif self.log:
+            print(self.title+": "+self.getStatusText(self.status))
+
+
+    def getStatusText(self, status, *args):
+        """ Return the status text from the given text or function.
+        """
+        if callable(status):
+            status = status()
+        return str(status)
+
+
+    def update(self, progress=None, maxValue=None, status=None, force=False, *args):
+        """ Set the progress value, or step it by one, and show it if the update interval has passed or it's forced.
+            The status can be a function to create the text only when it's shown.
+            Returns True if the progress was shown.
+        """
+        if progress is None:
+            progress = self.progress+1
+        self.progress = progress
+        if maxValue:
+            self.maxValue = maxValue
+        if status is not None:
+            self.status = status
+        if not self.running:
+            return False
+        currentTime = time.perf_counter()
+        if self.ui:
+            if force or progress >= self.maxValue or currentTime-self.lastUpdateTime >= self.updateInterval:
+                self.lastUpdateTime = currentTime
+                self.updateCount += 1
+                cmds.progressWindow(edit=True, maxValue=self.maxValue, progress=progress, status=self.getStatusText(self.status))
+                return True
+        elif self.log:
+            if force or currentTime-self.lastLogTime >= self.logInterval:
+                self.lastLogTime = currentTime
+                self.updateCount += 1
+                print(self.title+": "+str(progress)+"/"+str(self.maxValue)+" "+self.getStatusText(self.status))
+                return True
+        return False
+
+
+    def isCancelled(self, *args):
+        """ Return True if the user cancelled the progress window.
+            It must be called only where the loop can stop without leaving the scene in a broken state.
+        """
+        if self.ui and self.interruptable and self.running and not self.cancelled:
+            # the query is also throttled, a cancel click isn't lost between the queries:
+            currentTime = time.perf_counter()
+            if self.lastCancelTime is None or currentTime-self.lastCancelTime >= self.updateInterval:
+                self.lastCancelTime = currentTime
+                self.cancelled = bool(cmds.progressWindow(query=True, isCancelled=True))
+        return self.cancelled
+
+
+    def end(self, *args):
+        """ Close the progress window.
+        """
+        if self.running:
+            self.running = False
+            if self.ui:
+                cmds.progressWindow(endProgress=True)
+            elif self.log:
+                print(self.title+": "+str(self.progress)+"/"+str(self.maxValue))
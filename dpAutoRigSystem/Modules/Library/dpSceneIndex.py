@@ -0,0 +1,153 @@
+# importing libraries:
+from maya import cmds
+import time
+
+DP_SCENEINDEX_VERSION = 1.0
+
+# dp marker attributes indexed by default:
+GUIDE_BASE_ATTR = "guideBase"
+DPCONTROL_ATTR = "dpControl"
+CONTROLID_ATTR = "controlID"
+ORIGINEDFROM_ATTR = "originedFrom"
+MASTER_ATTR = "masterGrp"
+HOOK_ATTR_LIST = ["staticHook", "scalableHook", "ctrlHook", "hookNode"]
+MARKER_ATTR_LIST = [GUIDE_BASE_ATTR, DPCONTROL_ATTR, CONTROLID_ATTR, ORIGINEDFROM_ATTR, MASTER_ATTR] + HOOK_ATTR_LIST
+
+
+class SceneIndex(object):
+    """ Scene lookup tables for the dp marker attributes.
+        It lists the scene transforms once and queries each marker attribute by name pattern,
+        so the callers don't need to run objExists and getAttr for every transform in the scene.
+        The tables are kept until invalidate() is called, then they'll be rebuilt on the next query.
+    """
+    def __init__(self, attrList=None, verbose=False, *args):
+        """ Initialize the class.
+        """
+        # defining variables:
+        self.attrList = list(attrList or MARKER_ATTR_LIST)
+        self.verbose = verbose
+        self.invalidate()
+
+
+    def invalidate(self, *args):
+        """ Clear all stored lookup tables.
+            They will be rebuilt in the next query.
+        """
+        self.built = False
+        self.transformList = []
+        self.transformSet = set()
+        self.attrValueDic = {}
+        self.buildTime = 0.0
+
+
+    def build(self, *args):
+        """ List all transforms and read the marker attributes in one pass.
+            Return this instance to allow chained calls.
+        """
+        startTime = time.perf_counter()
+        self.invalidate()
+        self.transformList = cmds.ls(selection=False, type="transform") or []
+        self.transformSet = set(self.transformList)
+        for attr in self.attrList:
+            self.indexAttr(attr)
+        self.built = True
+        self.buildTime = time.perf_counter()-startTime
+        if self.verbose:
+            self.printReport()
+        return self
+
+
+    def indexAttr(self, attr, *args):
+        """ Store a dictionary with the transforms that have the given attribute and its values.
+            It's also used to index attributes on demand, like dpAR_type or module counters.
+        """
+        valueDic = {}
+        attrNodeList = cmds.ls("*."+attr, recursive=True, objectsOnly=True, type="transform")
+        if attrNodeList:
+            attrNodeSet = set(attrNodeList)
+            # keep the scene transform order:
+            for node in self.transformList:
+                if node in attrNodeSet:
+                    try:
+                        valueDic[node] = cmds.getAttr(node+"."+attr)
+                    except:
+                        pass
+        self.attrValueDic[attr] = valueDic
+        if not attr in self.attrList:
+            self.attrList.append(attr)
+        return valueDic
+
+
+    def checkBuilt(self, *args):
+        """ Build the lookup tables if they were invalidated.
+        """
+        if not self.built:
+            self.build()
+
+
+    def getTransformList(self, *args):
+        """ Return the indexed transform list.
+        """
+        self.checkBuilt()
+        return self.transformList
+
+
+    def getValueDic(self, attr, *args):
+        """ Return a dictionary with the node as key and the attribute value as value for the given attribute.
+        """
+        self.checkBuilt()
+        if not attr in self.attrValueDic:
+            self.indexAttr(attr)
+        return self.attrValueDic[attr]
+
+
+    def hasAttr(self, node, attr, *args):
+        """ Return True if the node has the given attribute.
+            It runs a live query for nodes that aren't indexed, like non unique short names.
+        """
+        valueDic = self.getValueDic(attr)
+        if node in self.transformSet:
+            return node in valueDic
+        return cmds.objExists(node+"."+attr)
+
+
+    def getValue(self, node, attr, default=None, *args):
+        """ Return the indexed attribute value of the node or the default value if it doesn't have the attribute.
+            It runs a live query for nodes that aren't indexed, like non unique short names.
+        """
+        valueDic = self.getValueDic(attr)
+        if node in self.transformSet:
+            return valueDic.get(node, default)
+        if cmds.objExists(node+"."+attr):
+            return cmds.getAttr(node+"."+attr)
+        return default
+
+
+    def getNodeList(self, attr, value=None, *args):
+        """ Return the list of transforms that have the given attribute.
+            If a value is given, return only the nodes with this attribute value.
+        """
+        valueDic = self.getValueDic(attr)
+        if value is None:
+            return list(valueDic)
+        return [node for node, nodeValue in valueDic.items() if nodeValue == value]
+
+
+    def getReport(self, *args):
+        """ Return a dictionary with the build time and the number of entries by attribute.
+        """
+        return {
+                "built" : self.built,
+                "buildTime" : round(self.buildTime, 6),
+                "transforms" : len(self.transformList),
+                "entries" : dict((attr, len(self.attrValueDic.get(attr, {}))) for attr in self.attrList)
+                }
+
+
+    def printReport(self, *args):
+        """ Print the build time and the number of indexed entries.
+        """
+        reportDic = self.getReport()
+        print("dpSceneIndex: %i transforms indexed in %.4f seconds" % (reportDic["transforms"], reportDic["buildTime"]))
+        for attr in reportDic["entries"]:
+            print("    "+attr+": "+str(reportDic["entries"][attr]))
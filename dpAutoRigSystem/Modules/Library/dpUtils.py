@@ -1,6 +1,9 @@
 # importing libraries:
 from maya import cmds
+from maya import mel
 from maya import OpenMaya as om
+from . import dpSceneIndex
+from . import dpManifest
 import os
 import sys
 import re
@@ -13,9 +16,8 @@ import time
 import getpass
 import datetime
 from io import TextIOWrapper
-from importlib import reload
 
-DP_UTILS_VERSION = 2.8
+DP_UTILS_VERSION = 3.1
 
 
 # UTILS functions:
@@ -105,15 +107,14 @@ def findAllModules(path, dir):
 def findAllModuleNames(path, dir):
     """ Find all modules names for this directory.
         Return a list with the valid modules and valid modules names.
+        The class names come from the module manifest, so the modules aren't imported.
     """
-    validModules = findAllModules(path, dir)
+    validModules = []
     validModuleNames = []
-    #guideFolder = (path+"/"+dir).partition("/Modules/")[2]
-    guideFolder = findEnv("PYTHONPATH", "dpAutoRigSystem")+".Modules"
-    for m in validModules:
-        mod = __import__(guideFolder+"."+m, {}, {}, [m])
-        reload(mod)
-        validModuleNames.append(mod.CLASS_NAME)
+    for entryDic in dpManifest.moduleManifest.getEntryList(path, dir, findAllModules(path, dir)):
+        if "CLASS_NAME" in entryDic:
+            validModules.append(entryDic["module"])
+            validModuleNames.append(entryDic["CLASS_NAME"])
     return(validModules, validModuleNames)
 
 
@@ -167,22 +168,18 @@ def findLastNumber(nameList, basename):
     return finalValue
 
 
-def findModuleLastNumber(className, typeName):
+def findModuleLastNumber(className, typeName, sceneIndex=None):
     """ Find the last used number of this type of module.
         Return its highest number.
     """
     # work with rigged modules in the scene:
-    numberList = []
     guideTypeCount = 0
-    # list all transforms and find the existing value in them names:
-    transformList = cmds.ls(selection=False, transforms=True)
-    for transform in transformList:
-        if cmds.objExists(transform+"."+typeName):
-            if cmds.getAttr(transform+"."+typeName) == className:
-                numberList.append(className)
-        # try check if there is a masterGrp and get its counter:
-        if cmds.objExists(transform+".masterGrp") and cmds.getAttr(transform+".masterGrp") == 1:
-            guideTypeCount = cmds.getAttr(transform+'.dp'+className+'Count')
+    if not sceneIndex:
+        sceneIndex = dpSceneIndex.SceneIndex()
+    numberList = sceneIndex.getNodeList(typeName, className)
+    # try check if there is a masterGrp and get its counter:
+    for masterNode in sceneIndex.getNodeList("masterGrp", 1):
+        guideTypeCount = cmds.getAttr(masterNode+'.dp'+className+'Count')
     if(guideTypeCount > len(numberList)):
         return guideTypeCount
     else:
@@ -284,23 +281,21 @@ def originedFrom(objName="", attrString=""):
         cmds.setAttr(objName+".originedFrom", attrString, type='string')
 
 
-def getOriginedFromDic():
+def getOriginedFromDic(sceneIndex=None):
     """ List all transforms in the scene, verify if there is an originedFrom string attribute and store it value in a dictionary.
         Return a dictionary with originedFrom string as keys and transform nodes as values of these keys.
     """
     originedFromDic = {}
-    allTransformList = cmds.ls(selection=False, type="transform")
-    if allTransformList:
-        for transform in allTransformList:
-            if cmds.objExists(transform+".originedFrom"):
-                tempOriginedFrom = cmds.getAttr(transform+".originedFrom")
-                if tempOriginedFrom:
-                    if not ";" in tempOriginedFrom:
-                        originedFromDic[tempOriginedFrom] = transform
-                    else:
-                        tempOriginedFromList = tempOriginedFrom.split(";")
-                        for orignedFromString in tempOriginedFromList:
-                            originedFromDic[orignedFromString] = transform
+    if not sceneIndex:
+        sceneIndex = dpSceneIndex.SceneIndex()
+    for transform, tempOriginedFrom in sceneIndex.getValueDic("originedFrom").items():
+        if tempOriginedFrom:
+            if not ";" in tempOriginedFrom:
+                originedFromDic[tempOriginedFrom] = transform
+            else:
+                tempOriginedFromList = tempOriginedFrom.split(";")
+                for orignedFromString in tempOriginedFromList:
+                    originedFromDic[orignedFromString] = transform
     return originedFromDic
 
 
@@ -312,88 +307,104 @@ def addHook(objName="", hookType="staticHook"):
         cmds.setAttr(objName+"."+hookType, 1)
 
 
-def hook():
+def getGuideInfo(item):
+    """ Read the module info stored in the given guide base.
+        Return a dictionary with the module namespace, name, instance, customName, mirrorAxis and mirrorName list.
+    """
+    tempMirrorName = cmds.getAttr(item+".mirrorName")
+    return {
+            "moduleNamespace" : item[:item.find(":")],
+            "moduleName"      : item[:item.find("__")],
+            "instance"        : item[item.rfind("__")+2:item.find(":")],
+            "customName"      : cmds.getAttr(item+".customName"),
+            "mirrorAxis"      : cmds.getAttr(item+".mirrorAxis"),
+            "mirrorName"      : [tempMirrorName[0]+"_" , tempMirrorName[len(tempMirrorName)-1:]+"_"]
+            }
+
+
+def getGuideFatherJoint(guideParent):
+    """ Find the last child of the given guide base that has nJoint equal 1 in the same namespace.
+        Return the found node or None.
+    """
+    fatherJoint = None
+    guideParentChildrenList = cmds.listRelatives(guideParent, children=True, type='transform')
+    if guideParentChildrenList:
+        for guideParentChild in guideParentChildrenList:
+            if cmds.objExists(guideParentChild+'.nJoint'):
+                if cmds.getAttr(guideParentChild+'.nJoint') == 1:
+                    if guideParent[:guideParent.rfind(":")] in guideParentChild:
+                        fatherJoint = guideParentChild
+    return fatherJoint
+
+
+def hook(sceneIndex=None):
     """ Mount a dictionary with guide modules hierarchies.
+        It walks the guide hierarchy once from the root guides, using the full path of the guide bases to find fathers and children.
+        The children lists keep the listRelatives allDescendents order.
         Return a dictionary with the father and children lists inside of each guide like:
         {guide{'guideModuleNamespace':"...", 'guideModuleName':"...", 'guideCustomName':"...", 'guideMirrorAxis':"...", 'guideMirrorName':"...", 'fatherGuide':"...", 'fatherNode':"...", 'fatherModule':"...", 'fatherCustomName':"...", 'fatherMirrorAxis':"...", 'fatherMirrorName':"...", 'fatherGuideLoc':"...", 'childrenList':[...]}}
     """
     hookDic = {}
-    allList = cmds.ls(type='transform')
-    for item in allList:
-        if cmds.objExists(item+".guideBase") and cmds.getAttr(item+".guideBase") == 1:
-            # module info:
-            guideModuleNamespace = item[:item.find(":")]
-            guideModuleName      = item[:item.find("__")]
-            guideInstance        = item[item.rfind("__")+2:item.find(":")]
-            guideCustomName      = cmds.getAttr(item+".customName")
-            guideMirrorAxis      = cmds.getAttr(item+".mirrorAxis")
-            tempAMirrorName      = cmds.getAttr(item+".mirrorName")
-            guideMirrorName      = [tempAMirrorName[0]+"_" , tempAMirrorName[len(tempAMirrorName)-1:]+"_"]
-            
-            # get children:
-            guideChildrenList = []
-            childrenList = cmds.listRelatives(item, allDescendents=True, type='transform')
-            if childrenList:
-                for child in childrenList:
-                    if cmds.objExists(child+".guideBase"):
-                        if cmds.getAttr(child+".guideBase"):
-                            if cmds.getAttr(child+".guideBase") == 1:
-                                guideChildrenList.append(child)
-                    if cmds.objExists(child+".hookNode"):
-                        hookNode = cmds.getAttr(child+".hookNode")
-            
-            # get father:
-            guideParentList = []
-            fatherNodeList = []
-            parentNode = ""
-            parentList = cmds.listRelatives(item, parent=True, type='transform')
-            if parentList:
-                nextLoop = True
-                while nextLoop:
-                    if cmds.objExists(parentList[0]+".guideBase") and cmds.getAttr(parentList[0]+".guideBase") == 1:
-                        guideParentList.append(parentList[0])
-                        nextLoop = False
-                    else:
-                        if not fatherNodeList:
-                            fatherNodeList.append(parentList[0])
-                        parentList = cmds.listRelatives(parentList[0], parent=True, type='transform')
-                        if parentList:
-                            nextLoop = True
-                        else:
-                            nextLoop = False
-                if guideParentList:
-                    # father info:
-                    guideParent      = guideParentList[0]
-                    fatherModule     = guideParent[:guideParent.find("__")]
-                    fatherInstance   = guideParent[guideParent.rfind("__")+2:guideParent.find(":")]
-                    fatherCustomName = cmds.getAttr(guideParent+".customName")
-                    fatherMirrorAxis = cmds.getAttr(guideParent+".mirrorAxis")
-                    tempBMirrorName  = cmds.getAttr(guideParent+".mirrorName")
-                    fatherMirrorName = [tempBMirrorName[0]+"_" , tempBMirrorName[len(tempBMirrorName)-1:]+"_"]
-                    if fatherNodeList:
-                        fatherGuideLoc = fatherNodeList[0][fatherNodeList[0].find("Guide_")+6:]
-                    else:
-                        guideParentChildrenList = cmds.listRelatives(guideParent, children=True, type='transform')
-                        if guideParentChildrenList:
-                            for guideParentChild in guideParentChildrenList:
-                                if cmds.objExists(guideParentChild+'.nJoint'):
-                                    if cmds.getAttr(guideParentChild+'.nJoint') == 1:
-                                        if guideParent[:guideParent.rfind(":")] in guideParentChild:
-                                            fatherNodeList = [guideParentChild]
-                                            fatherGuideLoc = guideParentChild[guideParentChild.find("Guide_")+6:]
-                
-                # parentNode info:
-                parentNode = cmds.listRelatives(item, parent=True, type='transform')[0]
-            
-            # mounting dictionary:
-            if guideParentList and guideChildrenList:
-                hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":guideParent, "fatherNode":fatherNodeList[0], "fatherModule":fatherModule, "fatherInstance":fatherInstance, "fatherCustomName":fatherCustomName, "fatherMirrorAxis":fatherMirrorAxis, "fatherMirrorName":fatherMirrorName, "fatherGuideLoc":fatherGuideLoc, "parentNode":parentNode, "childrenList":guideChildrenList}
-            elif guideParentList:
-                hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":guideParent, "fatherNode":fatherNodeList[0], "fatherModule":fatherModule, "fatherInstance":fatherInstance, "fatherCustomName":fatherCustomName, "fatherMirrorAxis":fatherMirrorAxis, "fatherMirrorName":fatherMirrorName, "fatherGuideLoc":fatherGuideLoc, "parentNode":parentNode, "childrenList":[]}
-            elif guideChildrenList:
-                hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":"", "fatherNode":"", "fatherModule":"", "fatherInstance":"", "fatherCustomName":"", "fatherMirrorAxis":"", "fatherMirrorName":"", "fatherGuideLoc":"", "parentNode":parentNode, "childrenList":guideChildrenList}
+    if not sceneIndex:
+        sceneIndex = dpSceneIndex.SceneIndex()
+    guideList = sceneIndex.getNodeList("guideBase", 1)
+    if not guideList:
+        return hookDic
+    # read guide info and paths once:
+    guideInfoDic, guideLongDic, parentNodeDic, parentLongDic = {}, {}, {}, {}
+    for item in guideList:
+        guideInfoDic[item] = getGuideInfo(item)
+        guideLongDic[item] = cmds.ls(item, long=True)[0]
+        parentList = cmds.listRelatives(item, parent=True, type='transform')
+        if parentList:
+            parentNodeDic[item] = parentList[0]
+            parentLongDic[item] = guideLongDic[item][:guideLongDic[item].rfind("|")]
+        else:
+            parentNodeDic[item] = ""
+            parentLongDic[item] = ""
+    
+    # find the root guides, without a father guide in their full path:
+    longGuideDic = dict((guideLongDic[item], item) for item in guideList)
+    rootList = []
+    for item in guideList:
+        pathList = guideLongDic[item].split("|")
+        if not any("|".join(pathList[:p]) in longGuideDic for p in range(2, len(pathList))):
+            rootList.append(item)
+    
+    # walk each root guide in the scene depth-first order, it's the reversed listRelatives allDescendents order:
+    fatherGuideDic, childrenDic, fatherJointDic = {}, {}, {}
+    for rootGuide in rootList:
+        descendentList = cmds.listRelatives(rootGuide, allDescendents=True, type='transform', fullPath=True) or []
+        guideStackList = []
+        for item in [rootGuide]+[longGuideDic[node] for node in reversed(descendentList) if node in longGuideDic]:
+            itemLong = guideLongDic[item]
+            while guideStackList and not itemLong.startswith(guideLongDic[guideStackList[-1]]+"|"):
+                guideStackList.pop()
+            fatherGuideDic[item] = guideStackList[-1] if guideStackList else ""
+            # add this guide as descendant of all its father guides:
+            for ancestorGuide in guideStackList:
+                childrenDic.setdefault(ancestorGuide, []).append(item)
+            childrenDic.setdefault(item, [])
+            guideStackList.append(item)
+    
+    # mounting dictionary:
+    for item in guideList:
+        guideInfo = guideInfoDic[item]
+        hookDic[item] = {"guideModuleNamespace":guideInfo["moduleNamespace"], "guideModuleName":guideInfo["moduleName"], "guideInstance":guideInfo["instance"], "guideCustomName":guideInfo["customName"], "guideMirrorAxis":guideInfo["mirrorAxis"], "guideMirrorName":guideInfo["mirrorName"], "fatherGuide":"", "fatherNode":"", "fatherModule":"", "fatherInstance":"", "fatherCustomName":"", "fatherMirrorAxis":"", "fatherMirrorName":"", "fatherGuideLoc":"", "parentNode":parentNodeDic[item], "childrenList":list(reversed(childrenDic[item]))}
+        guideParent = fatherGuideDic[item]
+        if guideParent:
+            # father info:
+            fatherInfo = guideInfoDic[guideParent]
+            if parentLongDic[item] == guideLongDic[guideParent]:
+                # directly parented to the father guide base, so use its last joint guide with nJoint 1:
+                if not guideParent in fatherJointDic:
+                    fatherJointDic[guideParent] = getGuideFatherJoint(guideParent)
+                fatherNode = fatherJointDic[guideParent]
             else:
-                hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":"", "fatherNode":"", "fatherModule":"", "fatherInstance":"", "fatherCustomName":"", "fatherMirrorAxis":"", "fatherMirrorName":"", "fatherGuideLoc":"", "parentNode":parentNode, "childrenList":[]}
+                fatherNode = parentNodeDic[item]
+            hookDic[item].update({"fatherGuide":guideParent, "fatherModule":fatherInfo["moduleName"], "fatherInstance":fatherInfo["instance"], "fatherCustomName":fatherInfo["customName"], "fatherMirrorAxis":fatherInfo["mirrorAxis"], "fatherMirrorName":fatherInfo["mirrorName"]})
+            if fatherNode:
+                hookDic[item].update({"fatherNode":fatherNode, "fatherGuideLoc":fatherNode[fatherNode.find("Guide_")+6:]})
     return hookDic
 
 
@@ -1115,6 +1126,116 @@ def setAttrValues(itemList, attrList, valueList):
                 cmds.setAttr(item+"."+attr, value)
 
 
+# attribute types added with dataType flag, all other types use the attributeType flag:
+DATA_TYPE_LIST = ["string", "stringArray", "matrix", "doubleArray", "Int32Array", "vectorArray"]
+
+def getMelString(value):
+    """ Return the given value as a quoted mel string.
+    """
+    return '"'+str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')+'"'
+
+
+def getMelValue(value):
+    """ Return the given number or boolean as a mel value.
+        Raises ValueError for inf and nan, because mel can't parse them.
+    """
+    if isinstance(value, (bool, int)):
+        return str(int(value))
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError("Mel can't parse the number: "+repr(value))
+    return repr(value)
+
+
+def isMelSchema(attrSchema):
+    """ Return True if the numbers of the given attribute schema can be written in mel, it means they aren't inf or nan.
+    """
+    valueList = [attrSchema[2]]
+    if len(attrSchema) > 3:
+        valueList.append(attrSchema[3].get("defaultValue"))
+    return all(not isinstance(value, float) or math.isfinite(value) for value in valueList)
+
+
+def getAttrSchemaMel(nodeName, attrSchemaList):
+    """ Return the mel command to add and set all attributes of the given schema in the node.
+        The schema is a list of (longName, attrType, value) or (longName, attrType, value, flagDic) items.
+        The value isn't set if it's None and the flagDic accepts defaultValue, keyable, channelBox and lock keys.
+    """
+    melNode = getMelString(nodeName)
+    melList = []
+    for attrSchema in attrSchemaList:
+        attr, attrType, value = attrSchema[:3]
+        flagDic = attrSchema[3] if len(attrSchema) > 3 else {}
+        melPlug = getMelString(nodeName+"."+attr)
+        addAttrMel = "addAttr -longName "+getMelString(attr)
+        if attrType in DATA_TYPE_LIST:
+            addAttrMel += " -dataType "+getMelString(attrType)
+        else:
+            addAttrMel += " -attributeType "+getMelString(attrType)
+        if "defaultValue" in flagDic:
+            addAttrMel += " -defaultValue "+getMelValue(flagDic["defaultValue"])
+        if "keyable" in flagDic:
+            addAttrMel += " -keyable "+getMelValue(bool(flagDic["keyable"]))
+        melList.append(addAttrMel+" "+melNode+";")
+        setAttrMel = "setAttr"
+        if flagDic.get("lock"):
+            setAttrMel += " -lock 1"
+        if value is not None:
+            if attrType == "string":
+                melList.append(setAttrMel+" -type \"string\" "+melPlug+" "+getMelString(value)+";")
+            else:
+                melList.append(setAttrMel+" "+melPlug+" "+getMelValue(value)+";")
+        elif flagDic.get("lock"):
+            melList.append(setAttrMel+" "+melPlug+";")
+        if "channelBox" in flagDic:
+            melList.append("setAttr -channelBox "+getMelValue(bool(flagDic["channelBox"]))+" "+melPlug+";")
+    return " ".join(melList)
+
+
+def addAttrSchemaItem(nodeName, attrSchema):
+    """ Add and set one attribute of the schema in the node with cmds.
+        It's used for the inf and nan numbers that can't be written in mel.
+    """
+    attr, attrType, value = attrSchema[:3]
+    flagDic = attrSchema[3] if len(attrSchema) > 3 else {}
+    addAttrDic = {"longName" : attr}
+    if attrType in DATA_TYPE_LIST:
+        addAttrDic["dataType"] = attrType
+    else:
+        addAttrDic["attributeType"] = attrType
+    for flag in ["defaultValue", "keyable"]:
+        if flag in flagDic:
+            addAttrDic[flag] = flagDic[flag]
+    cmds.addAttr(nodeName, **addAttrDic)
+    if value is not None:
+        if attrType == "string":
+            cmds.setAttr(nodeName+"."+attr, value, type="string")
+        else:
+            cmds.setAttr(nodeName+"."+attr, value)
+    if flagDic.get("lock"):
+        cmds.setAttr(nodeName+"."+attr, lock=True)
+    if "channelBox" in flagDic:
+        cmds.setAttr(nodeName+"."+attr, channelBox=bool(flagDic["channelBox"]))
+
+
+def addAttrSchema(nodeName, attrSchemaList):
+    """ Add and set all attributes of the given schema in the node running only one mel command.
+        It replaces the addAttr and setAttr calls for each attribute by a single Maya round trip in the same undo chunk.
+        The attributes with inf or nan numbers are added by cmds in the schema order, so one of them doesn't break the whole mel command.
+    """
+    melSchemaList = []
+    for attrSchema in attrSchemaList or []:
+        if isMelSchema(attrSchema):
+            melSchemaList.append(attrSchema)
+        else:
+            if melSchemaList:
+                mel.eval(getAttrSchemaMel(nodeName, melSchemaList))
+                melSchemaList = []
+            addAttrSchemaItem(nodeName, attrSchema)
+    if melSchemaList:
+        mel.eval(getAttrSchemaMel(nodeName, melSchemaList))
+
+
 def reapplyDeformers(item, defList):
     """ Reapply the given deformer list to the destination given item except the tweak node.
     """
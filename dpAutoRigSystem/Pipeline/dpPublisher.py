@@ -2,12 +2,13 @@
 from maya import cmds
 from maya import mel
 from ..Modules.Library import dpUtils
+from ..Validator import dpValidatorRunner
 from . import dpPipeliner
 from . import dpPackager
 from functools import partial
 import os
 
-DP_PUBLISHER_VERSION = 1.7
+DP_PUBLISHER_VERSION = 1.9
 
 
 class Publisher(object):
@@ -202,12 +203,16 @@ class Publisher(object):
 
     def runCheckedValidators(self, verifyMode=True, stopIfFoundBlock=True, publishLog=None, *args):
         """ Run the verify of fix of checked validators.
+            Returns the message to stop the publishing if a validator found a blocking issue or the user cancelled the validation, or False to go on.
         """
-        toCheckValidatorList = self.dpUIinst.checkInInstanceList
+        # copy the list to not extend the checkIn instances with the checkOut and addOns ones for the next run:
+        toCheckValidatorList = list(self.dpUIinst.checkInInstanceList)
         toCheckValidatorList.extend(self.dpUIinst.checkOutInstanceList)
         toCheckValidatorList.extend(self.dpUIinst.checkAddOnsInstanceList)
         if toCheckValidatorList:
             validationResultDataList = self.dpUIinst.runSelectedValidators(toCheckValidatorList, verifyMode, True, stopIfFoundBlock, publishLog)
+            if validationResultDataList[1] == dpValidatorRunner.CANCELLED:
+                return self.dpUIinst.lang['i038_canceled']
             if validationResultDataList[1]: #found issue
                 stoppedMessage = self.dpUIinst.lang['v020_publishStopped']+" "+toCheckValidatorList[validationResultDataList[2]].guideModuleName                    
                 return stoppedMessage
@@ -1,6 +1,7 @@
 # importing libraries:
 from maya import cmds
 from .. import dpBaseValidatorClass
+from .. import dpValidationContext
 
 # global variables to this module:
 CLASS_NAME = "DuplicatedName"
@@ -8,7 +9,7 @@ TITLE = "v024_duplicatedName"
 DESCRIPTION = "v025_duplicatedNameDesc"
 ICON = "/Icons/dp_duplicatedName.png"
 
-DP_DUPLICATEDNAME_VERSION = 1.2
+DP_DUPLICATEDNAME_VERSION = 1.4
 
 
 class DuplicatedName(dpBaseValidatorClass.ValidatorStartClass):
@@ -19,9 +20,43 @@ class DuplicatedName(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
+        self.snapshotTypeList = [dpValidationContext.ALL_NODES]
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def fetchSceneData(self, context, objList=None, *args):
+        """ Return the long names of the given objects or all scene nodes.
+        """
+        if objList:
+            return cmds.ls(objList, long=True)
+        return context.getNodeList(dpValidationContext.ALL_NODES)
+
+
+    def analyzeSceneData(self, toCheckList, *args):
+        """ Group the long names by short name and keep the upper node of each group, listing the others with a new name using the group index.
+            Returns if there are nodes to check and the duplicated list of depth, long name and new name, ordered to rename them.
+        """
+        duplicatedList = []
+        if toCheckList:
+            shortNameDic = {}
+            for longName in toCheckList:
+                shortNameDic.setdefault(longName[longName.rfind("|")+1:], []).append(longName)
+            usedNameSet = set(shortNameDic)
+            for shortName, longNameList in shortNameDic.items():
+                if len(longNameList) > 1:
+                    longNameList = sorted(longNameList, key=lambda longName: (longName.count("|"), longName), reverse=True)
+                    n = 0
+                    for longName in longNameList[:-1]:
+                        while shortName+str(n) in usedNameSet:
+                            n += 1
+                        usedNameSet.add(shortName+str(n))
+                        duplicatedList.append((longName.count("|"), longName, shortName+str(n)))
+            # ordenate from children to grandfather (inverted hierarchy) to rename without changing the long names to rename next:
+            duplicatedList.sort(reverse=True)
+        return bool(toCheckList), duplicatedList
+
+
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -33,71 +68,32 @@ class DuplicatedName(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
         
         # ---
         # --- validator code --- beginning
-        if objList:
-            toCheckList = objList
-        else:
-            toCheckList = cmds.ls(selection=False, long=False)
-        if toCheckList:
+        foundNodes, duplicatedList = self.getAnalysisData(objList)
+        if foundNodes:
             progressAmount = 0
-            maxProcess = len(toCheckList)
-            foundDuplicated = False
-            for node in toCheckList:
-                if "|" in node:
-                    foundDuplicated = True
-                    break
-            if foundDuplicated:
-                # analisys the elements in the allObjectList in order to put it with ordenation from children to grandfather (inverted hierarchy)
-                sizeList = []
-                orderedObjList = []
-                for i, element in enumerate(toCheckList):
-                    # find the number of ocorrences of "|" in the string (element)
-                    number = element.count("|")
-                    # add to a list another list with number and element
-                    sizeList.append([number, element])
-                # sort (put in alphabetic order to A-Z) and reverse (invert the order to Z-A)
-                sizeList.sort()
-                sizeList.reverse()
-                # add the elements to the final orderedObjList
-                for n, value in enumerate(sizeList):
-                    orderedObjList.append(sizeList[n][1])
-                # prepare a list with nodeNames to iteration
-                shortNameList = []
-                for longName in orderedObjList:
-                    # verify if there are childrens in order to get the shortNames
-                    if "|" in longName:
-                        shortNameList.append(longName[longName.rfind("|")+1:])
-                    else:
-                        shortNameList.append(longName)
-                # compare each obj in the list with the others, deleting it from the original list in order to avoid compare itself
-                n = 0
-                for i, obj in enumerate(shortNameList):
-                    if self.verbose:
-                        # Update progress window
-                        progressAmount += 1
-                        cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
-                    # use another list without the first element to compare it the item repeats
-                    anotherList = shortNameList[i+1:]
-                    for item in anotherList:
-                        if cmds.objExists(orderedObjList[i]):
-                            if obj == item:
-                                # found issue here
-                                self.checkedObjList.append(orderedObjList[i])
-                                self.foundIssueList.append(True)
-                                if self.verifyMode:
-                                    self.resultOkList.append(False)
-                                else: #fix
-                                    try:
-                                        cmds.rename(orderedObjList[i], obj+str(n))
-                                        n += 1
-                                        self.resultOkList.append(True)
-                                        self.messageList.append(self.dpUIinst.lang['v004_fixed']+": "+orderedObjList[i])
-                                    except:
-                                        self.resultOkList.append(False)
-                                        self.messageList.append(self.dpUIinst.lang['v005_cantFix']+": "+orderedObjList[i])
+            maxProcess = len(duplicatedList)
+            for depth, longName, newName in duplicatedList:
+                if self.verbose:
+                    # Update progress window
+                    progressAmount += 1
+                    self.updateProgress(progressAmount, maxProcess)
+                # found issue here
+                self.checkedObjList.append(longName)
+                self.foundIssueList.append(True)
+                if self.verifyMode:
+                    self.resultOkList.append(False)
+                else: #fix
+                    try:
+                        cmds.rename(longName, newName)
+                        self.resultOkList.append(True)
+                        self.messageList.append(self.dpUIinst.lang['v004_fixed']+": "+longName)
+                    except:
+                        self.resultOkList.append(False)
+                        self.messageList.append(self.dpUIinst.lang['v005_cantFix']+": "+longName)
         else:
             self.notFoundNodes()
         # --- validator code --- end
@@ -8,7 +8,7 @@ TITLE = 'v015_freezeTransform'
 DESCRIPTION = 'v016_freezeTranformDesc'
 ICON = '/Icons/dp_freezeTransform.png'
 
-DP_FREEZETRANSFORM_VERSION = 1.5
+DP_FREEZETRANSFORM_VERSION = 1.6
 
 
 class FreezeTransform(dpBaseValidatorClass.ValidatorStartClass):
@@ -19,9 +19,10 @@ class FreezeTransform(dpBaseValidatorClass.ValidatorStartClass):
         kwargs['DESCRIPTION'] = DESCRIPTION
         kwargs['ICON'] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
 
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         ''' Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -33,7 +34,7 @@ class FreezeTransform(dpBaseValidatorClass.ValidatorStartClass):
         '''
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
 
         # ---
         # --- validator code --- beginning
@@ -44,6 +45,13 @@ class FreezeTransform(dpBaseValidatorClass.ValidatorStartClass):
                     return False
             return True
 
+        def checkFrozenContext(obj):
+            # read the translate, rotate and scale compound values once from the validation context
+            for attr, compValue in [('translate', 0), ('rotate', 0), ('scale', 1)]:
+                if any(value != compValue for value in self.context.getAttr(obj, attr)[0]):
+                    return False
+            return True
+
         def unlockAttributes(obj, attrList):
             for attr in attrList:
                 if self.animCurvesList:
@@ -63,12 +71,12 @@ class FreezeTransform(dpBaseValidatorClass.ValidatorStartClass):
         if objList:
             allObjectList = list(filter(lambda obj: cmds.objectType(obj) == 'transform', objList))
         if len(allObjectList) == 0:
-            allObjectList = cmds.ls(selection=False, type='transform', long=True)
+            allObjectList = self.context.getNodeList('transform')
         # analisys transformations
         if len(allObjectList) > 0:
             progressAmount = 0
             maxProcess = len(allObjectList)
-            self.animCurvesList = cmds.ls(type='animCurve')
+            self.animCurvesList = self.context.getNodeList('animCurve', long=False)
             zeroAttrList = ['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ']
             oneAttrList = ['scaleX', 'scaleY', 'scaleZ']
             camerasList = ['|persp', '|top', '|side', '|front', '|bottom', '|back', '|left']
@@ -77,14 +85,10 @@ class FreezeTransform(dpBaseValidatorClass.ValidatorStartClass):
                 if self.verbose:
                     # Update progress window
                     progressAmount += 1
-                    cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
+                    self.updateProgress(progressAmount, maxProcess)
                 if cmds.objExists(obj):
-                    # run for translates and rotates
-                    frozenTR = checkFrozenObject(obj, zeroAttrList, 0)
-                    # run for scales
-                    frozenS = checkFrozenObject(obj, oneAttrList, 1)
                     self.checkedObjList.append(obj)
-                    if frozenTR and frozenS:
+                    if checkFrozenContext(obj):
                         self.foundIssueList.append(False)
                         self.resultOkList.append(True)
                     else:
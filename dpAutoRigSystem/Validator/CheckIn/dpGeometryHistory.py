@@ -8,7 +8,7 @@ TITLE = "v071_geometryHistory"
 DESCRIPTION = "v072_geometryHistoryDesc"
 ICON = "/Icons/dp_geometryHistory.png"
 
-DP_GEOMETRYHISTORY_VERSION = 1.2
+DP_GEOMETRYHISTORY_VERSION = 1.3
 
 
 class GeometryHistory(dpBaseValidatorClass.ValidatorStartClass):
@@ -19,9 +19,10 @@ class GeometryHistory(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -33,7 +34,7 @@ class GeometryHistory(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
 
         # ---
         # --- validator code --- beginning
@@ -41,11 +42,11 @@ class GeometryHistory(dpBaseValidatorClass.ValidatorStartClass):
         if objList:
             geoToCleanList = objList
         else:
-            shapeList = cmds.ls(selection=False, type='mesh')
+            shapeList = self.context.getNodeList("mesh")
             geoList = []
             if shapeList:
                 # Get only transform nodes
-                transformList = list(set(cmds.listRelatives(shapeList, type="transform", parent=True, fullPath=True)))
+                transformList = self.context.getParentList(shapeList)
                 if transformList:
                     for transform in transformList:
                         # Filter which geometry has deformer history and groupLevels to pass through sets and shader
@@ -68,7 +69,7 @@ class GeometryHistory(dpBaseValidatorClass.ValidatorStartClass):
                     if self.verbose:
                     # Update progress window
                         progressAmount += 1
-                        cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
+                        self.updateProgress(progressAmount, maxProcess)
                     self.checkedObjList.append(geo)
                     self.foundIssueList.append(True)
                     if self.verifyMode:
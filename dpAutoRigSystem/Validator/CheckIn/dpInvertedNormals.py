@@ -1,7 +1,11 @@
 # importing libraries:
 from maya import cmds
-from maya import OpenMaya
+from maya.api import OpenMaya
 from .. import dpBaseValidatorClass
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # global variables to this module:
 CLASS_NAME = "InvertedNormals"
@@ -9,7 +13,38 @@ TITLE = "v086_invertedNormals"
 DESCRIPTION = "v087_invertedNormalsDesc"
 ICON = "/Icons/dp_invertedNormals.png"
 
-DP_INVERTEDNORMALS_VERSION = 1.0
+DP_INVERTEDNORMALS_VERSION = 1.4
+
+
+def hasInvertedNormals(vertexCountList, vertexList):
+    """ Find if the same directed edge is used by two different faces, meaning adjacent faces with opposite normals.
+        The face vertices are read as half-edges from each vertex to the next one of the face, sorted by edge and face with NumPy if available.
+        Returns True if found inverted normals.
+    """
+    if not len(vertexList):
+        return False
+    if numpy is not None:
+        countArray = numpy.asarray(vertexCountList, dtype=numpy.int64)
+        startArray = numpy.asarray(vertexList, dtype=numpy.int64)
+        faceArray = numpy.repeat(numpy.arange(len(countArray)), countArray)
+        # the next face vertex is the first one of the face for the last face vertex:
+        firstArray = numpy.repeat(numpy.cumsum(countArray)-countArray, countArray)
+        nextArray = numpy.arange(1, len(startArray)+1)
+        nextArray = numpy.where(nextArray == firstArray+countArray[faceArray], firstArray, nextArray)
+        edgeArray = startArray*(startArray.max()+1)+startArray[nextArray]
+        orderArray = numpy.lexsort((faceArray, edgeArray))
+        edgeArray = edgeArray[orderArray]
+        faceArray = faceArray[orderArray]
+        return bool(numpy.any((edgeArray[1:] == edgeArray[:-1]) & (faceArray[1:] != faceArray[:-1])))
+    edgeFaceDic = {}
+    first = 0
+    for f, count in enumerate(vertexCountList):
+        for i in range(count):
+            edge = (vertexList[first+i], vertexList[first+(i+1)%count])
+            if edgeFaceDic.setdefault(edge, f) != f:
+                return True
+        first += count
+    return False
 
 
 class InvertedNormals(dpBaseValidatorClass.ValidatorStartClass):
@@ -20,9 +55,57 @@ class InvertedNormals(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
+        self.snapshotTypeList = ["mesh"]
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def fetchSceneData(self, context, objList=None, *args):
+        """ Read the face vertices of the given meshes or all scene meshes with the API.
+            The intermediate shapes, like the Orig ones, aren't rendered, so they're skipped.
+            Returns a list of shape full path, transform name, vertex count list and vertex list for each mesh to check.
+        """
+        meshDataList = []
+        objMeshList = objList or context.getNodeList("mesh")
+        if objMeshList:
+            progressAmount = 0
+            maxProcess = len(objMeshList)
+            # use the short names to find the meshes to check:
+            meshNameList = set(obj[obj.rfind("|")+1:] for obj in objMeshList)
+            geomIter = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kMesh)
+            while not geomIter.isDone():
+                # get mesh data
+                shapeNode = geomIter.thisNode()
+                fnShapeNode = OpenMaya.MFnDagNode(shapeNode)
+                shapeName = fnShapeNode.name()
+                fnObjNode = OpenMaya.MFnDagNode(fnShapeNode.parent(0))
+                if self.verbose:
+                    # Update progress window
+                    progressAmount += 1
+                    self.updateProgress(progressAmount, maxProcess, shapeName)
+                # verify if objName or shapeName is in objMeshList
+                if not fnShapeNode.isIntermediateObject and (fnObjNode.name() in meshNameList or shapeName in meshNameList):
+                    # get all face vertices at once
+                    vertexCountList, vertexList = OpenMaya.MFnMesh(shapeNode).getVertices()
+                    # the unique partial path finds the transform to fix when other ones have the same name:
+                    meshDataList.append((fnShapeNode.fullPathName(), fnObjNode.partialPathName(), vertexCountList, vertexList))
+                # go to next geometry
+                geomIter.next()
+        return meshDataList
+
+
+    def analyzeSceneData(self, meshDataList, *args):
+        """ Return the list of transforms with inverted normals.
+        """
+        # check each changed mesh in parallel, the NumPy sorting releases the GIL, and store the results by unique shape path:
+        foundList = self.getIncrementalResultList([(shapePath, (vertexCountList, vertexList)) for shapePath, objName, vertexCountList, vertexList in meshDataList], lambda meshData: hasInvertedNormals(*meshData))
+        invertedObjList = []
+        for (shapePath, objName, vertexCountList, vertexList), found in zip(meshDataList, foundList):
+            if found and not objName in invertedObjList:
+                invertedObjList.append(objName)
+        return invertedObjList
+
+
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -34,74 +117,13 @@ class InvertedNormals(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
         
         # ---
         # --- validator code --- beginning
-        invertedObjList = []
-        if objList:
-            objMeshList = objList
-        else:
-            objMeshList = cmds.ls(selection=False, type='mesh')
-        if objMeshList:
-            progressAmount = 0
-            maxProcess = len(objMeshList)
-            geomIter = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kMesh)
-            while not geomIter.isDone():
-                nextGeom = False
-                useThisObj = False
-                # get mesh data
-                shapeNode = geomIter.thisNode()
-                fnShapeNode = OpenMaya.MFnDagNode(shapeNode)
-                shapeName = fnShapeNode.name()
-                parentNode = fnShapeNode.parent(0)
-                fnParentNode = OpenMaya.MFnDagNode(parentNode)
-                objName = fnParentNode.name()
-                # Update progress window
-                progressAmount += 1
-                cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)+' '+shapeName))
-                # verify if objName or shapeName is in objMeshList
-                for obj in objMeshList:
-                    if objName in obj or shapeName in obj:
-                        useThisObj = True
-                        break
-                if useThisObj:
-                    # get faces
-                    faceIter   = OpenMaya.MItMeshPolygon(shapeNode)
-                    conFacesIt = OpenMaya.MItMeshPolygon(shapeNode)
-                    # run in faces listing vertices
-                    while not faceIter.isDone() and not nextGeom:
-                        # list vertices from this face
-                        vtxIntArray = OpenMaya.MIntArray()
-                        faceIter.getVertices(vtxIntArray)
-                        vtxIntArray.append(vtxIntArray[0])
-                        # get connected faces of this face
-                        conFacesIntArray = OpenMaya.MIntArray()
-                        faceIter.getConnectedFaces(conFacesIntArray)
-                        # run in adjacent faces to list them vertices
-                        for f in conFacesIntArray:
-                            # say this is the face index to use for next iterations
-                            lastIndexPtr = OpenMaya.MScriptUtil().asIntPtr()
-                            conFacesIt.setIndex(f, lastIndexPtr)
-                            # get vertices from this adjacent face
-                            conVtxIntArray = OpenMaya.MIntArray()
-                            conFacesIt.getVertices(conVtxIntArray)
-                            conVtxIntArray.append(conVtxIntArray[0])
-                            # compare vertex in order to find double consecutive vertices
-                            for i in range(0, len(vtxIntArray)-1):
-                                iPair = str(vtxIntArray[i])+","+str(vtxIntArray[i+1])
-                                for c in range(0, len(conVtxIntArray)-1):
-                                    cPair = str(conVtxIntArray[c])+","+str(conVtxIntArray[c+1])
-                                    if iPair == cPair:
-                                        # found inverted normals
-                                        invertedObjList.append(objName)
-                                        nextGeom = True
-                        faceIter.next()
-                # go to next geometry
-                geomIter.next()
+        invertedObjList = self.getAnalysisData(objList)
         # verify if there are inverted normals
         if invertedObjList:
-            invertedObjList = list(set(invertedObjList))
             for mesh in invertedObjList:
                 self.checkedObjList.append(mesh)
                 self.foundIssueList.append(True)
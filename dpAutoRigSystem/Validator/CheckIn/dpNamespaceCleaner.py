@@ -19,9 +19,10 @@ class NamespaceCleaner(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
 
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -33,7 +34,7 @@ class NamespaceCleaner(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
 
         # ---
         # --- validator code --- beginning
@@ -75,7 +76,7 @@ class NamespaceCleaner(dpBaseValidatorClass.ValidatorStartClass):
                 if self.verbose:
                     # Update progress window
                     progressAmount += 1
-                    cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
+                    self.updateProgress(progressAmount, maxProcess)
                 self.checkedObjList.append(namespace)
                 self.foundIssueList.append(True)
             if self.verifyMode:
@@ -19,9 +19,10 @@ class ColorSetCleaner(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -33,14 +34,14 @@ class ColorSetCleaner(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
         
         # ---
         # --- validator code --- beginning
         if objList:
             toCheckList = objList
         else:
-            toCheckList = cmds.ls(selection=False, type='createColorSet')
+            toCheckList = self.context.getNodeList("createColorSet", long=False)
         if toCheckList:
             progressAmount = 0
             maxProcess = len(toCheckList)
@@ -48,7 +49,7 @@ class ColorSetCleaner(dpBaseValidatorClass.ValidatorStartClass):
                 if self.verbose:
                     # Update progress window
                     progressAmount += 1
-                    cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
+                    self.updateProgress(progressAmount, maxProcess)
                 # conditional to check here
                 self.checkedObjList.append(item)
                 self.foundIssueList.append(True)
@@ -19,9 +19,10 @@ class ControllerTag(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -33,14 +34,14 @@ class ControllerTag(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
         
         # ---
         # --- validator code --- beginning
         if objList:
             toCheckList = objList
         else:
-            toCheckList = self.dpUIinst.ctrls.getControlList()
+            toCheckList = self.dpUIinst.ctrls.getControlList(self.context.sceneIndex)
         if toCheckList:
             progressAmount = 0
             maxProcess = len(toCheckList)
@@ -49,7 +50,7 @@ class ControllerTag(dpBaseValidatorClass.ValidatorStartClass):
                 if self.verbose:
                     # Update progress window
                     progressAmount += 1
-                    cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
+                    self.updateProgress(progressAmount, maxProcess)
                 # conditional to check here
                 if not cmds.controller(item, query=True, isController=True):
                     # found issue here
@@ -24,6 +24,7 @@ class ControlsHierarchy(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
 
     def checkNurbs(self, transform):
         try:
@@ -178,7 +179,7 @@ class ControlsHierarchy(dpBaseValidatorClass.ValidatorStartClass):
         length = len(self.currentFileName)
         return self.currentFileName[length-5:-3] == "_v"
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It"s in verify mode by default.
             If verifyMode parameter is False, it"ll run in fix mode.
@@ -190,7 +191,7 @@ class ControlsHierarchy(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
         
         # ---
         # --- validator code --- beginning
@@ -20,9 +20,10 @@ class DisplayLayers(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -34,7 +35,7 @@ class DisplayLayers(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
         
         # ---
         # --- validator code --- beginning
@@ -43,7 +44,7 @@ class DisplayLayers(dpBaseValidatorClass.ValidatorStartClass):
         else:
             # List all controls
             ctrlsGeometryList = None
-            self.allCtrlsList = self.dpUIinst.ctrls.getControlList()
+            self.allCtrlsList = self.dpUIinst.ctrls.getControlList(self.context.sceneIndex)
             if self.allCtrlsList:
                 allGeoList = self.getGeometryTranform()
                 ctrlsGeometryList = self.allCtrlsList
@@ -52,7 +53,7 @@ class DisplayLayers(dpBaseValidatorClass.ValidatorStartClass):
         if ctrlsGeometryList:
             self.geoLayerName = "Geo_Lyr"
             self.ctrlLayerName = "Ctrl_Lyr"
-            allLayersList = cmds.ls(type="displayLayer")
+            allLayersList = self.context.getNodeList("displayLayer", long=False)
             self.extraLayerToDelete = []
             for layer in allLayersList:
                 if layer != self.geoLayerName and layer != self.ctrlLayerName and layer != "defaultLayer":
@@ -78,7 +79,7 @@ class DisplayLayers(dpBaseValidatorClass.ValidatorStartClass):
                             if self.verbose:
                                 # Update progress window
                                 progressAmount += 1
-                                cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
+                                self.updateProgress(progressAmount, maxProcess)
                             missingGeoList = list(set(allGeoList) - set(itemsInGeoLayerList))
                             remainingGeoList = list(set(itemsInGeoLayerList) - set(allGeoList))
                             missingCtrlList = list(set(self.allCtrlsList) - set(itemsInCtrlLayerList))
@@ -20,9 +20,10 @@ class HideDataGrp(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -34,7 +35,7 @@ class HideDataGrp(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
         
         # ---
         # --- validator code --- beginning
@@ -49,7 +50,7 @@ class HideDataGrp(dpBaseValidatorClass.ValidatorStartClass):
         if dataGrp:
             if self.verbose:
                 # Update progress window
-                cmds.progressWindow(edit=True, maxValue=1, progress=1, status=(self.dpUIinst.lang[self.title]+': '+repr(1)))
+                self.updateProgress(1, 1)
             self.checkedObjList.append(dataGrp)
             visibilityStatus = cmds.getAttr(dataGrp+".visibility")
             if visibilityStatus:
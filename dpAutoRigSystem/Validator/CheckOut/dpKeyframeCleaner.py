@@ -1,6 +1,7 @@
 # importing libraries:
 from maya import cmds
 from .. import dpBaseValidatorClass
+from .. import dpValidationContext
 
 # global variables to this module:
 CLASS_NAME = "KeyframeCleaner"
@@ -8,7 +9,7 @@ TITLE = "v040_keyframeCleaner"
 DESCRIPTION = "v041_keyframeCleanerDesc"
 ICON = "/Icons/dp_keyframeCleaner.png"
 
-DP_KEYFRAMECLEANER_VERSION = 1.1
+DP_KEYFRAMECLEANER_VERSION = 1.2
 
 
 class KeyframeCleaner(dpBaseValidatorClass.ValidatorStartClass):
@@ -19,9 +20,10 @@ class KeyframeCleaner(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -33,17 +35,18 @@ class KeyframeCleaner(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
 
         # ---
         # --- validator code --- beginning
         if objList:
             toCheckList = objList
         else:
-            toCheckList = cmds.ls(selection=False)
+            toCheckList = self.context.getNodeList(dpValidationContext.ALL_NODES, long=False)
         if toCheckList:
+            toCheckSet = set(toCheckList)
             # get animation node list
-            animCurveList = cmds.ls(type="animCurve")
+            animCurveList = self.context.getNodeList("animCurve", long=False)
             if animCurveList:
                 animatedList = []
                 for animCrv in animCurveList:
@@ -57,8 +60,8 @@ class KeyframeCleaner(dpBaseValidatorClass.ValidatorStartClass):
                         if self.verbose:
                             # Update progress window
                             progressAmount += 1
-                            cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
-                        if item in toCheckList:
+                            self.updateProgress(progressAmount, maxProcess)
+                        if item in toCheckSet:
                             if cmds.objExists(item):
                                 crvList = cmds.listConnections(item, source=True, destination=False, type="animCurve") #blendWeighted/pairBlend
                                 if crvList:
@@ -20,9 +20,10 @@ class OutlinerCleaner(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -34,19 +35,19 @@ class OutlinerCleaner(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
         
         # ---
         # --- validator code --- beginning
         hiddenList = ["dpAR_Temp_Grp", "dpAR_GuideMirror_Grp"]
         if not objList:
-            objList = cmds.ls(selection=False, type="transform")
+            objList = self.context.getNodeList("transform", long=False)
         if objList:
             for i, item in enumerate(objList):
                 if cmds.objExists(item):
                     if self.verbose:
                         # Update progress window
-                        cmds.progressWindow(edit=True, maxValue=len(objList), progress=i, status=(self.dpUIinst.lang[self.title]+': '+repr(i)))
+                        self.updateProgress(i, len(objList))
                     for hidden in hiddenList:
                         self.checkedObjList.append(item)
                         if hidden in item:
@@ -1,7 +1,13 @@
 # importing libraries:
 from maya import cmds
+from maya.api import OpenMaya
+from maya.api import OpenMayaAnim
 from .. import dpBaseValidatorClass
 from ...Modules.Library import dpUtils
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # global variables to this module:
 CLASS_NAME = "ProxyCreator"
@@ -12,7 +18,7 @@ ICON = "/Icons/dp_proxyCreator.png"
 PROXIED = "dpProxied"
 NO_PROXY = "dpDoNotProxyIt"
 
-DP_PROXYCREATOR_VERSION = 1.2
+DP_PROXYCREATOR_VERSION = 1.4
 
 
 class ProxyCreator(dpBaseValidatorClass.ValidatorStartClass):
@@ -23,9 +29,10 @@ class ProxyCreator(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -37,7 +44,7 @@ class ProxyCreator(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
 
         # ---
         # --- validator code --- beginning
@@ -77,7 +84,7 @@ class ProxyCreator(dpBaseValidatorClass.ValidatorStartClass):
                         maxProcess = len(toProxyList)
                         if self.verbose:
                             # Update progress window
-                            cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
+                            self.updateProgress(progressAmount, maxProcess)
                         self.checkedObjList.append(proxyGrp)
                         self.foundIssueList.append(True)
                         if self.verifyMode:
@@ -87,7 +94,7 @@ class ProxyCreator(dpBaseValidatorClass.ValidatorStartClass):
                                 for sourceTransform in toProxyList:
                                     # Update progress window
                                     progressAmount += 1
-                                    cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)+' '+sourceTransform))
+                                    self.updateProgress(progressAmount, maxProcess, sourceTransform)
                                     self.createProxy(sourceTransform, proxyGrp)
                                 self.proxyIntegration(proxyGrp)
                                 self.resultOkList.append(True)
@@ -131,41 +138,24 @@ class ProxyCreator(dpBaseValidatorClass.ValidatorStartClass):
             self.skinClusterList.append(skinClusterNode)
             weightedInfluenceList = cmds.skinCluster(skinClusterNode, query=True, weightedInfluence=True)
             if weightedInfluenceList:
-                # get data and store it into a dic
-                indexJointDic = {}
-                sourceFaceList = cmds.ls(source+".f[*]", flatten=True)
-                for i, idx in enumerate(sourceFaceList):
-                    percList = cmds.skinPercent(skinClusterNode, source+".f["+str(i)+"]", ignoreBelow=0.1, transform=None, query=True)
-                    indexJointDic[i] = percList[0]
-                    if not len(percList) == 1:
-                        jointValueList = []
-                        for item in percList:
-                            jointValueList.append(cmds.skinPercent(skinClusterNode, source+".f["+str(i)+"]", ignoreBelow=0.1, transform=item, query=True))
-                        indexJointDic[i] = percList[jointValueList.index(max(jointValueList))]
+                # get the faces of each joint
+                jointFaceDic, faceCount = self.getJointFaceDic(skinClusterNode, source)
                 for jnt in weightedInfluenceList:
-                    nodeFaceList = []
-                    skinnedFaceList = []
-                    # data analisis
-                    for j in list(indexJointDic.keys()):
-                        if indexJointDic[j] == jnt:
-                            skinnedFaceList.append(j)
+                    skinnedFaceList = jointFaceDic.get(jnt)
                     if skinnedFaceList:
-                        # filter lists
-                        faceList = [w.replace(source+".f[", "") for w in sourceFaceList]
-                        faceList = [int(w.replace("]", "")) for w in faceList]
-                        if faceList:
-                            for v in reversed(skinnedFaceList):
-                                faceList.pop(v)
-                        if faceList:
-                            for n in faceList:
-                                nodeFaceList.append(source+".f["+str(n)+"]")
                         # create proxy geometry
                         dup = cmds.duplicate(source, name=source+"_"+jnt+"_Pxy")[0]
                         for dupItem in cmds.listRelatives(dup, children=True, allDescendents=True):
                             if "Orig" in dupItem:
                                 cmds.delete(dupItem)
-                        if nodeFaceList:
-                            faceDupList = [w.replace(source, dup) for w in nodeFaceList]
+                        # delete the faces of the other joints as ranges between the joint faces
+                        faceDupList = []
+                        startFace = 0
+                        for face in skinnedFaceList+[faceCount]:
+                            if face > startFace:
+                                faceDupList.append(dup+".f["+str(startFace)+":"+str(face-1)+"]")
+                            startFace = face+1
+                        if faceDupList:
                             cmds.delete(faceDupList)
                         self.dpUIinst.ctrls.setLockHide([dup], ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz'], l=False)
                         cmds.xform(dup, pivots=cmds.xform(jnt, worldSpace=True, rotatePivot=True, query=True))
@@ -192,6 +182,49 @@ class ProxyCreator(dpBaseValidatorClass.ValidatorStartClass):
                 cmds.delete(source)
 
 
+    def getJointFaceDic(self, skinClusterNode, source, *args):
+        """ Find the influence with the biggest average weight of the face vertices for each face of the given skinned source mesh.
+            The source shape is found in the skinCluster output geometries, because one skinCluster can deform many meshes.
+            All the weights are read with one getWeights call and averaged by face with NumPy if available.
+            Returns a dictionary with the sorted face list of each influence and the face count.
+        """
+        selList = OpenMaya.MSelectionList()
+        selList.add(skinClusterNode)
+        selList.add(cmds.listRelatives(source, shapes=True, fullPath=True, noIntermediate=True, type="mesh")[0])
+        fnSkinCluster = OpenMayaAnim.MFnSkinCluster(selList.getDependNode(0))
+        shapePath = fnSkinCluster.getPathAtIndex(fnSkinCluster.indexForOutputShape(selList.getDagPath(1).node()))
+        fnMesh = OpenMaya.MFnMesh(shapePath)
+        vertexCountList, vertexList = fnMesh.getVertices()
+        vertexCount = fnMesh.numVertices
+        fnComponent = OpenMaya.MFnSingleIndexedComponent()
+        vertexComponent = fnComponent.create(OpenMaya.MFn.kMeshVertComponent)
+        fnComponent.setCompleteData(vertexCount)
+        weightList, influenceCount = fnSkinCluster.getWeights(shapePath, vertexComponent)
+        influenceList = [influencePath.partialPathName() for influencePath in fnSkinCluster.influenceObjects()]
+        faceCount = len(vertexCountList)
+        if not faceCount:
+            return {}, 0
+        if numpy is not None:
+            weightArray = numpy.array(weightList, dtype=numpy.float64).reshape(vertexCount, influenceCount)
+            countArray = numpy.array(vertexCountList, dtype=numpy.int64)
+            faceWeightArray = numpy.add.reduceat(weightArray[numpy.array(vertexList, dtype=numpy.int64)], numpy.cumsum(countArray)-countArray, axis=0)/countArray[:, None]
+            # the first biggest influence wins a tie, like the first in the influence list did:
+            faceInfluenceArray = numpy.argmax(faceWeightArray, axis=1)
+            orderArray = numpy.argsort(faceInfluenceArray, kind="stable")
+            splitList = numpy.split(orderArray, numpy.cumsum(numpy.bincount(faceInfluenceArray, minlength=influenceCount))[:-1])
+            return dict((influenceList[i], faceArray.tolist()) for i, faceArray in enumerate(splitList) if len(faceArray)), faceCount
+        jointFaceDic = {}
+        v = 0
+        for f, faceVertexCount in enumerate(vertexCountList):
+            faceWeightList = [0.0]*influenceCount
+            for vertex in vertexList[v:v+faceVertexCount]:
+                for i in range(influenceCount):
+                    faceWeightList[i] += weightList[vertex*influenceCount+i]
+            v += faceVertexCount
+            jointFaceDic.setdefault(influenceList[faceWeightList.index(max(faceWeightList))], []).append(f)
+        return jointFaceDic, faceCount
+
+
     def proxyIntegration(self, grp, *args):
         """ Add attributes, connect to deformer envelopes if possible to disable them and 
         """
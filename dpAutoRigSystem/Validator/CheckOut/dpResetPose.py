@@ -1,5 +1,6 @@
 # importing libraries:
 from maya import cmds
+from maya.api import OpenMaya
 from .. import dpBaseValidatorClass
 
 # global variables to this module:
@@ -23,8 +24,17 @@ ATTR_TYPE = {
                 "doubleAngle" : 2,
                 "doubleLinear" : 2
             }
+# Maya attribute type of the API numeric types:
+NUMERIC_TYPE = {
+                    OpenMaya.MFnNumericData.kBoolean : "bool",
+                    OpenMaya.MFnNumericData.kByte : "byte",
+                    OpenMaya.MFnNumericData.kShort : "short",
+                    OpenMaya.MFnNumericData.kInt : "long",
+                    OpenMaya.MFnNumericData.kFloat : "float",
+                    OpenMaya.MFnNumericData.kDouble : "double"
+                }
 
-DP_RESETPOSE_VERSION = 1.3
+DP_RESETPOSE_VERSION = 1.5
 
 
 class ResetPose(dpBaseValidatorClass.ValidatorStartClass):
@@ -35,11 +45,12 @@ class ResetPose(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
         self.nonDynZeroAttrList = ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ"]
         self.nonDynOneAttrList = ["scaleX", "scaleY", "scaleZ", "visibility"]
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -51,14 +62,14 @@ class ResetPose(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
 
         # ---
         # --- validator code --- beginning
         if objList:
             toCheckList = objList
         else:
-            toCheckList = self.dpUIinst.ctrls.getControlList()
+            toCheckList = self.dpUIinst.ctrls.getControlList(self.context.sceneIndex)
         if toCheckList:
             progressAmount = 0
             maxProcess = len(toCheckList)
@@ -66,7 +77,7 @@ class ResetPose(dpBaseValidatorClass.ValidatorStartClass):
                 if self.verbose:
                     # Update progress window
                     progressAmount += 1
-                    cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
+                    self.updateProgress(progressAmount, maxProcess)
                 # conditional to check here
                 if cmds.objExists(item+".dpControl"):
                     self.checkedObjList.append(item)
@@ -127,21 +138,65 @@ class ResetPose(dpBaseValidatorClass.ValidatorStartClass):
         return self.dataLogDic
 
 
-    def getSetupAttrList(self, item, ignoreAttrList=TO_IGNORE, *args):
+    def getAttrInfoDic(self, item, attrList, *args):
+        """ Returns a dictionary with the default value, the current value and the attribute type of each given attribute of the node.
+            The numeric, unit and enum attributes are read in one API pass by node, with the values in the UI units like getAttr.
+            The other attributes are read with the Maya commands.
+        """
+        attrInfoDic = {}
+        fnNode = OpenMaya.MFnDependencyNode(OpenMaya.MSelectionList().add(item).getDependNode(0))
+        for attr in attrList:
+            plug = fnNode.findPlug(attr, False)
+            attrObj = plug.attribute()
+            attrInfo = None
+            if attrObj.hasFn(OpenMaya.MFn.kNumericAttribute):
+                fnAttr = OpenMaya.MFnNumericAttribute(attrObj)
+                attrType = NUMERIC_TYPE.get(fnAttr.numericType())
+                if attrType == "bool":
+                    attrInfo = [fnAttr.default, plug.asBool(), attrType]
+                elif attrType:
+                    attrInfo = [fnAttr.default, plug.asInt() if ATTR_TYPE[attrType] == 1 else plug.asDouble(), attrType]
+            elif attrObj.hasFn(OpenMaya.MFn.kUnitAttribute):
+                fnAttr = OpenMaya.MFnUnitAttribute(attrObj)
+                if fnAttr.unitType() == OpenMaya.MFnUnitAttribute.kDistance:
+                    uiUnit = OpenMaya.MDistance.uiUnit()
+                    attrInfo = [fnAttr.default.asUnits(uiUnit), plug.asMDistance().asUnits(uiUnit), "doubleLinear"]
+                elif fnAttr.unitType() == OpenMaya.MFnUnitAttribute.kAngle:
+                    uiUnit = OpenMaya.MAngle.uiUnit()
+                    attrInfo = [fnAttr.default.asUnits(uiUnit), plug.asMAngle().asUnits(uiUnit), "doubleAngle"]
+            elif attrObj.hasFn(OpenMaya.MFn.kEnumAttribute):
+                attrInfo = [OpenMaya.MFnEnumAttribute(attrObj).default, plug.asShort(), "enum"]
+            if not attrInfo:
+                attrInfo = [cmds.addAttr(item+"."+attr, query=True, defaultValue=True), cmds.getAttr(item+"."+attr), cmds.attributeQuery(attr, node=item, attributeType=True)]
+            # translate, rotate and scale:
+            if attr in self.nonDynZeroAttrList:
+                attrInfo[0] = 0.0
+            elif attr in self.nonDynOneAttrList:
+                attrInfo[0] = 1.0
+            attrInfoDic[attr] = attrInfo
+        return attrInfoDic
+
+
+    def getSetupAttrList(self, item, ignoreAttrList=TO_IGNORE, attrInfoDic=None, *args):
         """ Returns the desired attribute list to work with set or reset default values.
+            The attribute info read to find the channel box booleans is stored in the given dictionary to not read it again.
         """
+        if attrInfoDic is None:
+            attrInfoDic = {}
         cleanAttrList = []
         attrList = cmds.listAttr(item, channelBox=True)
-        if not attrList:
-            attrList = []
         if attrList:
+            attrInfoDic.update(self.getAttrInfoDic(item, [attrName for attrName in attrList if not attrName in attrInfoDic]))
             for attrName in attrList:
-                if not cmds.attributeQuery(attrName, node=item, attributeType=True) == "bool":
+                if not attrInfoDic[attrName][2] == "bool":
                     cleanAttrList.append(attrName)
         allAttrList = cmds.listAttr(item)
         animAttrList = cmds.listAnimatable(item)
         if allAttrList and animAttrList:
-            orderedAttrs = [attr for attr in allAttrList for animAttr in animAttrList if animAttr.endswith(attr) and not attr in cleanAttrList]
+            # the animatable plugs are like "|node.attr", so match the attribute names in a set:
+            animAttrSet = set(animAttr[animAttr.rfind(".")+1:] for animAttr in animAttrList)
+            cleanAttrSet = set(cleanAttrList)
+            orderedAttrs = [attr for attr in allAttrList if attr in animAttrSet and not attr in cleanAttrSet]
             cleanAttrList.extend(orderedAttrs)
         if ignoreAttrList:
             for ignoreAttr in ignoreAttrList:
@@ -157,17 +212,12 @@ class ResetPose(dpBaseValidatorClass.ValidatorStartClass):
             index 2 = attribute type
         """
         attrData = {}
-        attrList = self.getSetupAttrList(item)
+        attrInfoDic = {}
+        attrList = self.getSetupAttrList(item, attrInfoDic=attrInfoDic)
         if attrList:
+            attrInfoDic.update(self.getAttrInfoDic(item, [attr for attr in attrList if not attr in attrInfoDic]))
             for attr in attrList:
-                attrType = cmds.attributeQuery(attr, node=item, attributeType=True)
-                currentValue = cmds.getAttr(item+"."+attr)
-                if attr in self.nonDynZeroAttrList: #translate and rotate
-                    attrData[attr] = [0.0, currentValue, attrType]
-                elif attr in self.nonDynOneAttrList: #scale
-                    attrData[attr] = [1.0, currentValue, attrType]
-                else: #custom and visibility
-                    attrData[attr] = [cmds.addAttr(item+"."+attr, query=True, defaultValue=True), currentValue, attrType]
+                attrData[attr] = attrInfoDic[attr]
         return attrData
 
 
@@ -11,7 +11,7 @@ ICON = "/Icons/dp_targetCleaner.png"
 
 DPKEEPITATTR = "dpKeepIt"
 
-DP_TARGETCLEANER_VERSION = 1.7
+DP_TARGETCLEANER_VERSION = 1.8
 
 
 class TargetCleaner(dpBaseValidatorClass.ValidatorStartClass):
@@ -22,9 +22,10 @@ class TargetCleaner(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -36,7 +37,7 @@ class TargetCleaner(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
         
         # ---
         # --- validator code --- beginning
@@ -44,9 +45,9 @@ class TargetCleaner(dpBaseValidatorClass.ValidatorStartClass):
             toCheckList = objList
         else:
             toCheckList = None
-            meshList = cmds.ls(selection=False, type='mesh')
+            meshList = self.context.getNodeList("mesh")
             if meshList:
-                toCheckList = list(set(cmds.listRelatives(meshList, type="transform", parent=True, fullPath=False)))
+                toCheckList = cmds.ls(self.context.getParentList(meshList), long=False)
         if toCheckList:
             progressAmount = 0
             maxProcess = len(toCheckList)
@@ -82,7 +83,7 @@ class TargetCleaner(dpBaseValidatorClass.ValidatorStartClass):
                 if self.verbose:
                     # Update progress window
                     progressAmount += 1
-                    cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
+                    self.updateProgress(progressAmount, maxProcess)
                 if cmds.objExists(item):
                     self.checkedObjList.append(item)
                     if not item in exceptionList:
@@ -20,9 +20,10 @@ class UnusedNodeCleaner(dpBaseValidatorClass.ValidatorStartClass):
         kwargs["DESCRIPTION"] = DESCRIPTION
         kwargs["ICON"] = ICON
         dpBaseValidatorClass.ValidatorStartClass.__init__(self, *args, **kwargs)
+        self.readOnly = True
     
 
-    def runValidator(self, verifyMode=True, objList=None, *args):
+    def runValidator(self, verifyMode=True, objList=None, context=None, *args):
         """ Main method to process this validator instructions.
             It's in verify mode by default.
             If verifyMode parameter is False, it'll run in fix mode.
@@ -34,7 +35,7 @@ class UnusedNodeCleaner(dpBaseValidatorClass.ValidatorStartClass):
         """
         # starting
         self.verifyMode = verifyMode
-        self.cleanUpToStart()
+        self.cleanUpToStart(context)
         
         # ---
         # --- validator code --- beginning
@@ -55,7 +56,7 @@ class UnusedNodeCleaner(dpBaseValidatorClass.ValidatorStartClass):
                     if self.verbose:
                         # Update progress window
                         progressAmount += 1
-                        cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(self.dpUIinst.lang[self.title]+': '+repr(progressAmount)))
+                        self.updateProgress(progressAmount, maxProcess)
                     issueMatList = sorted(list(set(allMatList) - set(usedMatList)))
                     self.checkedObjList.append(str(", ".join(issueMatList)))
                     self.foundIssueList.append(True)
@@ -1,6 +1,10 @@
 # importing libraries:
 from maya import cmds
-from ..Modules.Library import dpUtils
+from ..Modules.Library import dpLogStream
+from ..Modules.Library import dpProgress
+from . import dpValidationContext
+from . import dpValidationCache
+from . import dpValidatorRunner
 import time
 import getpass
 
@@ -10,7 +14,7 @@ CHECKED_COLOR = (0.7, 1.0, 0.7)
 WARNING_COLOR = (1.0, 1.0, 0.5)
 ISSUE_COLOR = (1.0, 0.7, 0.7)
 
-DP_VALIDATORSTARTCLASS_VERSION = 2.1
+DP_VALIDATORSTARTCLASS_VERSION = 2.8
 
 
 class ValidatorStartClass(object):
@@ -29,6 +33,18 @@ class ValidatorStartClass(object):
         self.validatorCB = None
         self.verifyBT = None
         self.fixBT = None
+        # runner declarations: verify mode only reads the scene and the node types to read in the shared snapshot
+        self.readOnly = False
+        self.snapshotTypeList = []
+        self.analysisData = None
+        self.context = None
+        self.progress = None
+        # incremental verify mode: only analyze the nodes changed since the last verify
+        self.verifyMode = True
+        self.incremental = False
+        self.validationCache = None
+        self.fullScene = True
+        self.skippedCount = 0
         # returned lists
         self.checkedObjList = []
         self.foundIssueList = []
@@ -48,8 +64,10 @@ class ValidatorStartClass(object):
             cmds.button(self.fixBT, edit=True, enable=value)
 
 
-    def cleanUpToStart(self, *args):
+    def cleanUpToStart(self, context=None, *args):
         """ Just redeclare variables and close openned window to run the code properly.
+            The context is the runValidator context parameter of all validators: the validation context created by the validator runner
+            to share the scene data read by the validators of one run. Without it, a new one reads the live scene when needed.
         """
         # redeclare variables
         self.checkedObjList = []
@@ -57,12 +75,16 @@ class ValidatorStartClass(object):
         self.resultOkList = []
         self.messageList = []
         self.dataLogDic = {}
+        self.context = context or dpValidationContext.ValidationContext()
+        if self.analysisData is None:
+            self.startIncremental()
         # close info log window if it exists
         if cmds.window('dpInfoWindow', query=True, exists=True):
             cmds.deleteUI('dpInfoWindow', window=True)
         if self.verbose:
             # Starting progress window
-            cmds.progressWindow(title="dpValidator", progress=0, status=self.dpUIinst.lang[self.title]+': 0%', isInterruptable=False)
+            self.progress = dpProgress.Progress("dpValidator", status=self.dpUIinst.lang[self.title]+': 0%')
+            self.progress.start()
 
 
     def updateButtonColors(self, *args):
@@ -107,27 +129,29 @@ class ValidatorStartClass(object):
         foundIssueText = self.dpUIinst.lang['v006_foundIssue']
         everythingOkText = self.dpUIinst.lang['v007_allOk']
         # header
-        logText = "\n"+nameText+": "+titleText+"\n"
+        logTextList = ["\n"+nameText+": "+titleText+"\n"]
         # mode
-        logText += modeText+": "
         checkText = fixText
         if self.verifyMode:
             checkText = verifyText
-        logText += checkText+"\n"
+        logTextList.append(modeText+": "+checkText+"\n")
         # issues
         if True in self.foundIssueList:
-            logText += foundIssueText+":\n"
+            logTextList.append(foundIssueText+":\n")
             for i, item in enumerate(self.foundIssueList):
                 if item == True:
-                    logText += self.checkedObjList[i]
+                    logTextList.append(self.checkedObjList[i])
                     if i != len(self.checkedObjList)-1:
-                        logText += "\n"
+                        logTextList.append("\n")
         else:
-            logText += everythingOkText
+            logTextList.append(everythingOkText)
+        # incremental
+        if self.skippedCount:
+            self.messageList.append(self.dpUIinst.lang['v089_skippedNodes']+": "+str(self.skippedCount))
         # messages
-        if self.messageList:
-            for msg in self.messageList:
-                logText += "\n"+msg
+        for msg in self.messageList:
+            logTextList.append("\n"+msg)
+        logText = "".join(logTextList)
         # dataLog
         self.dataLogDic["user"] = getpass.getuser()
         self.dataLogDic["time"] = thisTime
@@ -138,18 +162,33 @@ class ValidatorStartClass(object):
         self.dataLogDic["foundIssueList"] = self.foundIssueList
         self.dataLogDic["resultOkList"] = self.resultOkList
         self.dataLogDic["messageList"] = self.messageList
+        self.dataLogDic["skippedCount"] = self.skippedCount
         self.dataLogDic["logText"] = logText
+        if self.validationCache:
+            self.validationCache.save()
         # verbose call info window
         if self.verbose:
             self.dpUIinst.info('i019_log', 'v000_validator', thisTime+"\n"+logText, "left", 250, 250)
             print("\n-------------\n"+self.dpUIinst.lang['v000_validator']+"\n"+thisTime+"\n"+logText)
-            if not dpUtils.exportLogDicToJson(self.dataLogDic, subFolder=self.dpUIinst.dpData+"/"+self.dpUIinst.dpLog):
+            logStore = dpLogStream.getLogStore(self.dpUIinst.dpData+"/"+self.dpUIinst.dpLog)
+            if logStore:
+                logStore.exportLogDic(self.dataLogDic)
+                logStore.runMaintenance()
+            else:
                 print(self.dpUIinst.lang['i201_saveScene'])
 
 
+    def updateProgress(self, progressAmount, maxProcess, itemName=None, *args):
+        """ Update the progress window of this validator, the shown status is throttled by the progress helper.
+        """
+        if self.progress:
+            self.progress.update(progressAmount, maxProcess, lambda: self.dpUIinst.lang[self.title]+': '+repr(progressAmount)+(' '+itemName if itemName else ''))
+
+
     def endProgressBar(self, *args):
-        if self.verbose:
-            cmds.progressWindow(endProgress=True)
+        if self.progress:
+            self.progress.end()
+            self.progress = None
 
     
     def notFoundNodes(self, item=None, *args):
@@ -159,3 +198,75 @@ class ValidatorStartClass(object):
         self.foundIssueList.append(False)
         self.resultOkList.append(True)
         self.messageList.append(self.dpUIinst.lang['v014_notFoundNodes'])
+
+
+    def fetchSceneData(self, context, objList=None, *args):
+        """ Return the scene data to analyze from the validation context or from the given object list.
+            It runs in the main thread, so it can use Maya commands without changing the scene.
+        """
+        return context
+
+
+    def analyzeSceneData(self, sceneData, *args):
+        """ Return the analysis result of the fetched scene data.
+            It can run in a worker thread, so it must be pure Python without Maya commands.
+            Override it with fetchSceneData to let the validator runner prepare this validator in parallel.
+        """
+        return None
+
+
+    def hasSceneAnalysis(self, *args):
+        """ Return True if this validator overrides the scene data analysis.
+        """
+        return type(self).analyzeSceneData is not ValidatorStartClass.analyzeSceneData
+
+
+    def getAnalysisData(self, objList=None, *args):
+        """ Return the analysis data prepared by the validator runner and clear it.
+            Without prepared data or with a given object list, it fetches the scene data and runs the analysis now.
+        """
+        analysisData, self.analysisData = self.analysisData, None
+        if objList or analysisData is None:
+            # the incremental cache only removes the deleted nodes after a full scene analysis:
+            self.fullScene = not objList
+            analysisData = self.analyzeSceneData(self.fetchSceneData(self.context, objList))
+        return analysisData
+
+
+    def startIncremental(self, *args):
+        """ Get the validation cache of the current scene if the incremental mode is active and reset the skipped node counter.
+            It runs in the main thread before the analysis.
+        """
+        self.skippedCount = 0
+        self.validationCache = None
+        self.fullScene = True
+        if self.incremental:
+            self.validationCache = dpValidationCache.getCache(self.dpUIinst.dpData+"/"+self.dpUIinst.dpLog)
+
+
+    def getIncrementalResultList(self, nodeDataList, function, *args):
+        """ Return the function result for the data of each given (node, data) item.
+            In incremental verify mode, the nodes with the same data fingerprint of the last verify reuse the stored result
+            and they're counted as skipped. The new fingerprints and results are stored to be used in the next incremental run.
+            A run of selected nodes keeps the stored results of the other nodes.
+            The node data is still fetched to get its fingerprint, so only the analysis is skipped.
+            The nodes must be unique keys, like the full dag paths.
+            It doesn't use Maya commands, so it can run in the analysis worker thread.
+        """
+        if not (self.verifyMode and self.validationCache):
+            return dpValidatorRunner.threadMap(lambda nodeData: function(nodeData[1]), nodeDataList)
+        storedDic = self.validationCache.getNodeDic(self.guideModuleName)
+        fingerprintList = [dpValidationCache.getFingerprint(data) for node, data in nodeDataList]
+        resultList = [None]*len(nodeDataList)
+        toRunList = []
+        for n, (node, data) in enumerate(nodeDataList):
+            storedData = storedDic.get(node)
+            if storedData and storedData[0] == fingerprintList[n]:
+                resultList[n] = storedData[1]
+            else:
+                toRunList.append(n)
+        for n, result in zip(toRunList, dpValidatorRunner.threadMap(lambda n: function(nodeDataList[n][1]), toRunList)):
+            resultList[n] = result
+        self.skippedCount = len(nodeDataList)-len(toRunList)
+        self.validationCache.setNodeDic(self.guideModuleName, dict((node, [fingerprintList[n], resultList[n]]) for n, (node, data) in enumerate(nodeDataList)), self.fullScene)
+        return resultList
@@ -0,0 +1,182 @@
+# importing libraries:
+from maya import cmds
+import os
+import json
+import array
+import hashlib
+
+# global variables to this module:
+CACHE_PREFIX = "dpValidationCache_"
+INCREMENTAL_OPTVAR = "dpAutoRigIncrementalValidation"
+
+DP_VALIDATIONCACHE_VERSION = 1.1
+
+
+def updateHash(hashObj, data):
+    """ Add the given data to the hash object.
+        Number sequences, like the API arrays, are hashed by their packed values.
+    """
+    if data is None or isinstance(data, (bool, int, float)):
+        hashObj.update(repr(data).encode())
+    elif isinstance(data, str):
+        hashObj.update(data.encode())
+    elif isinstance(data, bytes):
+        hashObj.update(data)
+    elif hasattr(data, "tobytes"):
+        hashObj.update(data.tobytes())
+    elif isinstance(data, dict):
+        for key in sorted(data):
+            updateHash(hashObj, key)
+            updateHash(hashObj, data[key])
+    else:
+        # pack the integer or the float sequences at once:
+        for typeCode in ["q", "d"]:
+            try:
+                hashObj.update(typeCode.encode()+array.array(typeCode, data).tobytes())
+                break
+            except (TypeError, OverflowError):
+                pass
+        else:
+            for item in data:
+                updateHash(hashObj, item)
+    # separate the items to not get the same hash for different splits:
+    hashObj.update(b"|")
+
+
+def getFingerprint(data):
+    """ Return the hash string of the given node data.
+    """
+    hashObj = hashlib.sha1()
+    updateHash(hashObj, data)
+    return hashObj.hexdigest()
+
+
+def getIncrementalMode():
+    """ Return True if the incremental validation is active in the user optionVar.
+    """
+    try:
+        if cmds.optionVar(exists=INCREMENTAL_OPTVAR):
+            return bool(cmds.optionVar(query=INCREMENTAL_OPTVAR))
+    except:
+        pass
+    return False
+
+
+def setIncrementalMode(value):
+    """ Store the incremental validation mode in the user optionVar and return it.
+    """
+    try:
+        cmds.optionVar(intValue=(INCREMENTAL_OPTVAR, int(bool(value))))
+    except:
+        pass
+    return bool(value)
+
+
+def getCachePath(subFolder=None):
+    """ Return the cache file path in the given sub folder of the current scene folder.
+        Returns None if the scene isn't saved.
+    """
+    path = cmds.file(query=True, sceneName=True)
+    if path:
+        dpFolder = path[:path.rfind("/")]
+        if subFolder:
+            dpFolder = dpFolder+"/"+subFolder
+        name = path[path.rfind("/")+1:path.rfind(".")]
+        return dpFolder+"/"+CACHE_PREFIX+name+".json"
+    return None
+
+
+def getCache(subFolder=None):
+    """ Return the validation cache of the current scene, loaded once by file path.
+        An unsaved scene gets a cache only kept in memory.
+    """
+    cachePath = getCachePath(subFolder)
+    if not cachePath in cacheDic:
+        cacheDic[cachePath] = ValidationCache(cachePath)
+    return cacheDic[cachePath]
+
+
+class ValidationCache(object):
+    """ Last verify result of each node by validator with the fingerprint of the node data.
+        It's saved as a json file in the dpLog folder to be used by the incremental validation in the next runs.
+    """
+    def __init__(self, cachePath=None, *args):
+        """ Initialize the class.
+        """
+        # defining variables:
+        self.cachePath = cachePath
+        self.validatorDic = None
+        self.changed = False
+
+
+    def load(self, *args):
+        """ Read the cache file if it exists and has the same version.
+        """
+        self.validatorDic = {}
+        if self.cachePath and os.path.exists(self.cachePath):
+            try:
+                with open(self.cachePath, "r") as cacheFile:
+                    loadedDic = json.load(cacheFile)
+                if loadedDic.get("version") == DP_VALIDATIONCACHE_VERSION:
+                    self.validatorDic = loadedDic["validators"]
+            except:
+                pass
+        self.changed = False
+
+
+    def save(self, *args):
+        """ Write the cache file if any validator result changed.
+        """
+        if self.changed and self.cachePath:
+            try:
+                cacheFolder = os.path.dirname(self.cachePath)
+                if not os.path.exists(cacheFolder):
+                    os.makedirs(cacheFolder)
+                with open(self.cachePath, "w") as cacheFile:
+                    json.dump({"version" : DP_VALIDATIONCACHE_VERSION, "validators" : self.validatorDic}, cacheFile)
+                self.changed = False
+            except:
+                pass
+
+
+    def getNodeDic(self, validatorName, *args):
+        """ Return the stored dictionary of the validator with the node as key and a list of fingerprint and result as value.
+        """
+        if self.validatorDic is None:
+            self.load()
+        return self.validatorDic.get(validatorName, {})
+
+
+    def setNodeDic(self, validatorName, nodeDic, fullScene=True, *args):
+        """ Store the new node fingerprints and results of the validator.
+            A full scene run replaces the stored nodes, removing the deleted ones.
+            A run of selected nodes only updates their entries and keeps the other stored nodes.
+        """
+        if self.validatorDic is None:
+            self.load()
+        storedDic = self.validatorDic.get(validatorName)
+        if not fullScene:
+            nodeDic = dict(storedDic or {}, **nodeDic)
+        if storedDic != nodeDic:
+            self.validatorDic[validatorName] = nodeDic
+            self.changed = True
+
+
+    def clear(self, validatorName=None, *args):
+        """ Remove the stored results of the given validator or of all validators to run a full validation next time.
+        """
+        if self.validatorDic is None:
+            self.load()
+        if validatorName:
+            if self.validatorDic.pop(validatorName, None) is not None:
+                self.changed = True
+        elif self.validatorDic:
+            self.validatorDic = {}
+            self.changed = True
+
+
+# keep the loaded caches when this module is reloaded:
+try:
+    cacheDic
+except NameError:
+    cacheDic = {}
@@ -0,0 +1,105 @@
+# importing libraries:
+from maya import cmds
+from ..Modules.Library import dpSceneIndex
+
+# global variables to this module:
+ALL_NODES = "*"
+
+DP_VALIDATIONCONTEXT_VERSION = 1.0
+
+
+class ValidationContext(object):
+    """ Scene data shared by the validators of one run.
+        It lists the nodes by type, maps the DAG parents and children and caches the attribute reads,
+        so each validator doesn't need to query the same scene data again.
+        Everything is read on demand, so a new context works like live queries when a validator runs standalone.
+        The data is kept until invalidate() is called, then it'll be read again on the next query.
+    """
+    def __init__(self, *args):
+        """ Initialize the class.
+        """
+        self.invalidate()
+
+
+    def invalidate(self, *args):
+        """ Clear all stored scene data.
+            It must be called after changing the scene.
+        """
+        self.nodeListDic = {}
+        self.parentDic = None
+        self.childrenDic = None
+        self.attrValueDic = {}
+        self.sceneIndex = dpSceneIndex.SceneIndex()
+
+
+    def getNodeList(self, nodeType=ALL_NODES, long=True, *args):
+        """ Return the scene nodes of the given type, or all scene nodes using ALL_NODES.
+            The long names are used by default, otherwise it returns the short names like cmds.ls does.
+            It returns a copy, so the caller can change the list.
+        """
+        key = (nodeType, long)
+        if not key in self.nodeListDic:
+            if nodeType == ALL_NODES:
+                self.nodeListDic[key] = cmds.ls(selection=False, long=long) or []
+            else:
+                self.nodeListDic[key] = cmds.ls(selection=False, type=nodeType, long=long) or []
+        return list(self.nodeListDic[key])
+
+
+    def prefetch(self, nodeTypeList, *args):
+        """ List the scene nodes of the given types in advance.
+        """
+        for nodeType in nodeTypeList:
+            self.getNodeList(nodeType)
+
+
+    def buildHierarchy(self, *args):
+        """ Map the parent and the children of each DAG node from one list of the DAG long names.
+        """
+        self.parentDic = {}
+        self.childrenDic = {}
+        for node in cmds.ls(selection=False, dag=True, long=True) or []:
+            parentNode = node[:node.rfind("|")] or None
+            self.parentDic[node] = parentNode
+            self.childrenDic.setdefault(node, [])
+            if parentNode:
+                self.childrenDic.setdefault(parentNode, []).append(node)
+
+
+    def getParent(self, node, *args):
+        """ Return the long name of the parent of the given DAG long name or None if it's a world child.
+        """
+        if self.parentDic is None:
+            self.buildHierarchy()
+        return self.parentDic.get(node)
+
+
+    def getParentList(self, nodeList, *args):
+        """ Return the unique parent long names of the given DAG long names keeping their order.
+        """
+        parentList = []
+        parentSet = set()
+        for node in nodeList:
+            parentNode = self.getParent(node)
+            if parentNode and not parentNode in parentSet:
+                parentSet.add(parentNode)
+                parentList.append(parentNode)
+        return parentList
+
+
+    def getChildren(self, node, *args):
+        """ Return the long names of the children of the given DAG long name.
+        """
+        if self.childrenDic is None:
+            self.buildHierarchy()
+        return self.childrenDic.get(node, [])
+
+
+    def getAttr(self, node, attr, *args):
+        """ Return the attribute value read once in this context.
+            It raises the Maya error like cmds.getAttr if the attribute doesn't exist.
+        """
+        plug = node+"."+attr
+        if not plug in self.attrValueDic:
+            self.attrValueDic[plug] = cmds.getAttr(plug)
+        return self.attrValueDic[plug]
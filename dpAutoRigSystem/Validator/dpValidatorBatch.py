@@ -0,0 +1,368 @@
+# importing libraries:
+import os
+import sys
+import json
+import time
+import heapq
+import shutil
+import argparse
+import tempfile
+import traceback
+import subprocess
+
+# Validate a directory of scenes without interface from mayapy and write a consolidated json report:
+#   mayapy -m dpAutoRigSystem.Validator.dpValidatorBatch /project/rigs --preset AllOn --workers 4 --report /project/dpValidatorReport.json
+
+
+def initializeMaya():
+    """ Start Maya standalone when running from mayapy.
+        Returns True if it was started here and must be uninitialized at the end.
+    """
+    try:
+        import maya.standalone
+        maya.standalone.initialize(name="python")
+        return True
+    except (ImportError, RuntimeError):
+        # already running inside of Maya:
+        return False
+
+
+def uninitializeMaya():
+    """ Close Maya standalone before leaving mayapy to avoid a crash on exit.
+    """
+    try:
+        import maya.standalone
+        maya.standalone.uninitialize()
+    except (ImportError, RuntimeError):
+        pass
+
+
+# from the command line, the main process and each worker start Maya standalone before importing any dpAutoRigSystem module:
+MAYA_STANDALONE = initializeMaya() if __name__ == "__main__" else False
+
+# the dpAutoRig module isn't imported here because it builds the UI:
+from maya import cmds
+from ..Modules.Library import dpConstants
+from ..Modules.Library import dpUtils
+from ..Modules.Library import dpManifest
+from ..Modules.Library import dpControls
+from . import dpValidatorRunner
+
+# global variables to this module:
+SCENE_EXTENSION_LIST = [".ma", ".mb"]
+DEFAULT_PRESET = "AllOn"
+DEFAULT_REPORT = "dpValidatorReport.json"
+# this module name for the worker processes, also when it's running as __main__:
+MODULE_NAME = __package__+".dpValidatorBatch"
+DPAR_PATH = dpConstants.DPAR_PATH
+DPAR_VERSION = dpConstants.getDPARVersion()
+OK = "ok"
+ISSUES = "issues"
+ERROR = "error"
+
+DP_VALIDATORBATCH_VERSION = 1.1
+
+
+class BatchUI(object):
+    """ Headless stand-in of the DP_AutoRig_UI instance with the data used by the validators.
+        It loads the language and the validator classes from the dpAutoRigSystem folder without creating any window.
+    """
+    def __init__(self, langName=dpConstants.ENGLISH, *args):
+        """ Initialize the class.
+        """
+        # defining variables:
+        self.dpARVersion = DPAR_VERSION
+        self.dpData = dpConstants.DPDATA
+        self.dpLog = dpConstants.DPLOG
+        self.path = DPAR_PATH
+        self.lang = self.getLangDic(langName)
+        self.infoList = []
+        self.ctrls = dpControls.ControlClass(self)
+
+
+    def getLangDic(self, langName, *args):
+        """ Return the dictionary of the given language, completed with the English texts for the missing keys.
+        """
+        with open(os.path.join(self.path, dpConstants.LANGUAGES, dpConstants.ENGLISH+".json"), encoding="utf-8") as langFile:
+            langDic = json.load(langFile)
+        if langName != dpConstants.ENGLISH:
+            with open(os.path.join(self.path, dpConstants.LANGUAGES, langName+".json"), encoding="utf-8") as langFile:
+                langDic.update(json.load(langFile))
+        return langDic
+
+
+    def getValidatorModuleList(self, *args):
+        """ Return the validator module names of the CheckIn and CheckOut folders in the order shown by the UI.
+        """
+        moduleList = []
+        for validatorDir in [dpConstants.CHECKIN, dpConstants.CHECKOUT]:
+            guideModuleList = dpUtils.findAllModules(self.path, validatorDir)
+            guideModuleList.sort()
+            moduleList.extend(MODULE_NAME.rsplit(".", 2)[0]+"."+validatorDir.replace("/", ".")+"."+guideModule for guideModule in guideModuleList)
+        return moduleList
+
+
+    def initValidatorModule(self, guideModule, *args):
+        """ Import the validator and return its class instance without UI.
+        """
+        guide = dpManifest.importModule(guideModule)
+        return getattr(guide, guide.CLASS_NAME)(self, ui=False, verbose=False)
+
+
+    def getValidatorInstList(self, presetDic, *args):
+        """ Return the validator instances activated by the given preset dictionary like the setValidatorPreset does.
+            The validators not found in the preset keep active.
+        """
+        validatorInstList = [self.initValidatorModule(guideModule) for guideModule in self.getValidatorModuleList()]
+        for validatorInst in validatorInstList:
+            if validatorInst.guideModuleName in presetDic:
+                validatorInst.changeActive(presetDic[validatorInst.guideModuleName])
+        return validatorInstList
+
+
+    def info(self, *args):
+        """ Store the info instead of opening a window.
+        """
+        self.infoList.append(args)
+
+
+def getPresetDic(preset, *args):
+    """ Return the validator preset dictionary from the given preset name of the Validator/Presets folder or json file path.
+    """
+    presetPath = preset
+    if not os.path.isfile(presetPath):
+        presetPath = os.path.join(DPAR_PATH, dpConstants.VALIDATOR_PRESETS, preset+".json")
+    if not os.path.isfile(presetPath):
+        raise ValueError("Validator preset not found: "+preset)
+    with open(presetPath, encoding="utf-8") as presetFile:
+        return json.load(presetFile)
+
+
+def findScenes(pathList, *args):
+    """ Return the Maya scene files of the given files and directories, searching the directories recursively.
+        The list is sorted and without repeated files.
+    """
+    sceneList = []
+    for path in pathList:
+        if os.path.isdir(path):
+            for root, dirList, fileList in os.walk(path):
+                dirList.sort()
+                for fileName in sorted(fileList):
+                    if os.path.splitext(fileName)[1].lower() in SCENE_EXTENSION_LIST:
+                        sceneList.append(os.path.join(root, fileName))
+        elif os.path.isfile(path):
+            sceneList.append(path)
+    sceneList = [os.path.abspath(scene).replace("\\", "/") for scene in sceneList]
+    return sorted(set(sceneList))
+
+
+def scheduleScenes(sceneList, workerCount, sizeDic=None, *args):
+    """ Split the scene list in balanced job lists, one for each worker process.
+        The biggest scenes are given first to the worker with less work, so a big scene doesn't delay the end of the batch.
+        Each job is the scene index in the given list and its path, the sizes are read from the files if not given.
+        Returns the job lists without the empty ones.
+    """
+    if sizeDic is None:
+        sizeDic = dict((scene, os.path.getsize(scene) if os.path.isfile(scene) else 0) for scene in sceneList)
+    workerCount = max(1, min(workerCount, len(sceneList)))
+    jobListList = [[] for w in range(workerCount)]
+    loadHeap = [(0, w) for w in range(workerCount)]
+    for size, index, scene in sorted(((sizeDic.get(scene, 0), index, scene) for index, scene in enumerate(sceneList)), key=lambda item: (-item[0], item[1])):
+        load, w = heapq.heappop(loadHeap)
+        jobListList[w].append([index, scene])
+        heapq.heappush(loadHeap, (load+size, w))
+    for jobList in jobListList:
+        jobList.sort()
+    return [jobList for jobList in jobListList if jobList]
+
+
+def getResultPath(resultFolder, index, *args):
+    """ Return the result file path of the scene index.
+    """
+    return os.path.join(resultFolder, "%06i.json" % index)
+
+
+def writeResult(resultDic, pathFile, *args):
+    """ Write the scene result to a temporary file and replace the result file, so a killed worker doesn't leave a broken file.
+    """
+    tempPath = pathFile+".tmp"
+    with open(tempPath, "w", encoding="utf-8") as resultFile:
+        json.dump(resultDic, resultFile)
+    os.replace(tempPath, pathFile)
+
+
+def getSceneResult(scene, validationResultData, elapsedTime, *args):
+    """ Return the summary of the validation result of one scene with the nodes with issues of each validator.
+    """
+    validatorDic = {}
+    for name, dataLogDic in validationResultData.items():
+        checkedObjList = dataLogDic.get("checkedObjList", [])
+        validatorDic[name] = {
+                                "checked" : len(checkedObjList),
+                                "issues" : [str(item) for item, found in zip(checkedObjList, dataLogDic.get("foundIssueList", [])) if found],
+                                "messages" : dataLogDic.get("messageList", [])
+                            }
+    status = ISSUES if any(validatorDic[name]["issues"] for name in validatorDic) else OK
+    return {"scene" : scene, "status" : status, "time" : elapsedTime, "validators" : validatorDic}
+
+
+def validateScene(scene, validatorInstList, maxWorkers=dpValidatorRunner.MAX_WORKERS, *args):
+    """ Open the scene and run the active validators in verify mode.
+        Returns the scene result, with the error instead of the validators if the scene failed.
+    """
+    startTime = time.perf_counter()
+    try:
+        cmds.file(scene, open=True, force=True)
+        validationResultData = dpValidatorRunner.runValidators(validatorInstList, True, maxWorkers=maxWorkers)[0]
+        return getSceneResult(scene, validationResultData, time.perf_counter()-startTime)
+    except Exception:
+        return {"scene" : scene, "status" : ERROR, "time" : time.perf_counter()-startTime, "error" : traceback.format_exc()}
+
+
+def runJobs(jobList, presetDic, resultFolder, langName=dpConstants.ENGLISH, *args):
+    """ Validate the scenes of the job list in this Maya session and write the result file of each one.
+    """
+    batchUI = BatchUI(langName)
+    validatorInstList = batchUI.getValidatorInstList(presetDic)
+    for j, (index, scene) in enumerate(jobList):
+        resultDic = validateScene(scene, validatorInstList)
+        writeResult(resultDic, getResultPath(resultFolder, index))
+        print("dpValidatorBatch: %i/%i %s: %s (%.1f s)" % (j+1, len(jobList), scene, resultDic["status"], resultDic["time"]))
+        sys.stdout.flush()
+
+
+def aggregateResults(sceneList, resultFolder, *args):
+    """ Read the result files of all scenes and return the scene results in the scene list order with the summary.
+        A scene without result file is reported as an error, because its worker process failed before writing it.
+    """
+    sceneResultList = []
+    for index, scene in enumerate(sceneList):
+        pathFile = getResultPath(resultFolder, index)
+        try:
+            with open(pathFile, encoding="utf-8") as resultFile:
+                sceneResultList.append(json.load(resultFile))
+        except (IOError, ValueError):
+            sceneResultList.append({"scene" : scene, "status" : ERROR, "time" : 0.0, "error" : "No result, the worker process failed before finishing this scene."})
+    summaryDic = {"scenes" : len(sceneResultList), OK : 0, ISSUES : 0, ERROR : 0, "time" : 0.0}
+    validatorDic = {}
+    for sceneResult in sceneResultList:
+        summaryDic[sceneResult["status"]] += 1
+        summaryDic["time"] += sceneResult["time"]
+        for name, resultDic in sceneResult.get("validators", {}).items():
+            validatorSummary = validatorDic.setdefault(name, {"scenes" : 0, "issueScenes" : 0, "issues" : 0})
+            validatorSummary["scenes"] += 1
+            if resultDic["issues"]:
+                validatorSummary["issueScenes"] += 1
+                validatorSummary["issues"] += len(resultDic["issues"])
+    return {"summary" : summaryDic, "validators" : validatorDic, "scenes" : sceneResultList}
+
+
+def getWorkerCmd(mayapy, jobPath, resultFolder, preset, langName, *args):
+    """ Return the command line of a worker process.
+    """
+    return [mayapy, "-m", MODULE_NAME, "--jobs", jobPath, "--results", resultFolder, "--preset", preset, "--lang", langName]
+
+
+def runBatch(sceneList, preset=DEFAULT_PRESET, reportPath=DEFAULT_REPORT, workerCount=1, mayapy=None, timeout=None, langName=dpConstants.ENGLISH, *args):
+    """ Validate the scenes in verify mode with the validator preset and write the consolidated report.
+            workerCount = 1 validates in this Maya session.
+                        > 1 starts this number of mayapy processes, each one validating a balanced job list.
+            timeout = the maximum seconds of each worker process, its not finished scenes are reported as errors.
+        Returns the report dictionary.
+    """
+    presetDic = getPresetDic(preset)
+    startTime = time.perf_counter()
+    resultFolder = tempfile.mkdtemp(prefix="dpValidatorBatch_")
+    try:
+        jobListList = scheduleScenes(sceneList, workerCount)
+        if len(jobListList) == 1 and workerCount <= 1:
+            runJobs(jobListList[0], presetDic, resultFolder, langName)
+        else:
+            # the workers find this package from the PYTHONPATH:
+            env = dict(os.environ)
+            packagePath = os.path.dirname(DPAR_PATH)
+            env["PYTHONPATH"] = os.pathsep.join([packagePath]+[path for path in env.get("PYTHONPATH", "").split(os.pathsep) if path])
+            processList = []
+            for w, jobList in enumerate(jobListList):
+                jobPath = os.path.join(resultFolder, "jobs_%03i.json" % w)
+                with open(jobPath, "w", encoding="utf-8") as jobFile:
+                    json.dump(jobList, jobFile)
+                processList.append(subprocess.Popen(getWorkerCmd(mayapy or sys.executable, jobPath, resultFolder, preset, langName), env=env))
+            for process in processList:
+                try:
+                    process.wait(None if timeout is None else max(0, startTime+timeout-time.perf_counter()))
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+        reportDic = {
+                        "dpARVersion" : DPAR_VERSION,
+                        "preset" : preset,
+                        "date" : time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+                        "workers" : len(jobListList),
+                        "elapsedTime" : 0.0
+                    }
+        reportDic.update(aggregateResults(sceneList, resultFolder))
+        reportDic["elapsedTime"] = time.perf_counter()-startTime
+    finally:
+        shutil.rmtree(resultFolder, ignore_errors=True)
+    if reportPath:
+        writeResult(reportDic, reportPath)
+    return reportDic
+
+
+def printReport(reportDic, *args):
+    """ Print the summary of the report.
+    """
+    summaryDic = reportDic["summary"]
+    print("dpValidatorBatch: %i scenes in %.1f s with %i workers, %i ok, %i with issues, %i errors" % (summaryDic["scenes"], reportDic["elapsedTime"], reportDic["workers"], summaryDic[OK], summaryDic[ISSUES], summaryDic[ERROR]))
+    for name, validatorSummary in sorted(reportDic["validators"].items()):
+        if validatorSummary["issueScenes"]:
+            print("    %-28s %i scenes, %i issues" % (name, validatorSummary["issueScenes"], validatorSummary["issues"]))
+    for sceneResult in reportDic["scenes"]:
+        if sceneResult["status"] == ERROR:
+            print("    error: "+sceneResult["scene"])
+
+
+def main(argList=None):
+    """ Run the batch validation from the command line.
+        The --jobs argument is used by the worker processes.
+    """
+    parser = argparse.ArgumentParser(description="Validate Maya scenes with dpAutoRigSystem validators without interface.")
+    parser.add_argument("paths", nargs="*", help="scene files or directories to search them recursively")
+    parser.add_argument("--preset", default=DEFAULT_PRESET, help="validator preset name or json file, "+DEFAULT_PRESET+" by default")
+    parser.add_argument("--report", default=DEFAULT_REPORT, help="consolidated json report path")
+    parser.add_argument("--workers", type=int, default=1, help="number of mayapy processes validating in parallel")
+    parser.add_argument("--mayapy", default=None, help="mayapy executable of the workers, the current one by default")
+    parser.add_argument("--timeout", type=float, default=None, help="maximum seconds of each worker process")
+    parser.add_argument("--lang", default=dpConstants.ENGLISH, help="language of the validator messages")
+    parser.add_argument("--jobs", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--results", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argList)
+    if not args.jobs and not args.paths:
+        parser.error("give the scene files or directories to validate")
+    try:
+        getPresetDic(args.preset)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.jobs:
+        # worker process:
+        with open(args.jobs, encoding="utf-8") as jobFile:
+            runJobs(json.load(jobFile), getPresetDic(args.preset), args.results, args.lang)
+        return 0
+    sceneList = findScenes(args.paths)
+    if not sceneList:
+        print("dpValidatorBatch: no scenes found.")
+        return 1
+    reportDic = runBatch(sceneList, args.preset, args.report, args.workers, args.mayapy, args.timeout, args.lang)
+    printReport(reportDic)
+    print("dpValidatorBatch: report "+os.path.abspath(args.report))
+    return 1 if reportDic["summary"][ERROR] else 0
+
+
+if __name__ == "__main__":
+    try:
+        exitCode = main()
+    finally:
+        if MAYA_STANDALONE:
+            uninitializeMaya()
+    sys.exit(exitCode)
@@ -0,0 +1,108 @@
+# importing libraries:
+from concurrent import futures
+from . import dpValidationContext
+import os
+
+# global variables to this module:
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+# stop status of a run cancelled by the user, it's True like a found block to stop the callers only checking if it stopped:
+CANCELLED = "cancelled"
+
+DP_VALIDATORRUNNER_VERSION = 1.5
+
+
+def threadMap(function, itemList, maxWorkers=MAX_WORKERS, *args):
+    """ Return the function result for each item, running them in a thread pool if there's more than one item.
+        The function must not use Maya commands. It runs in parallel only while the GIL is released, like in NumPy array operations.
+    """
+    if len(itemList) > 1 and maxWorkers > 1:
+        with futures.ThreadPoolExecutor(max_workers=min(maxWorkers, len(itemList))) as executor:
+            return list(executor.map(function, itemList))
+    return [function(item) for item in itemList]
+
+
+def prepareValidators(validatorInstList, context, maxWorkers=MAX_WORKERS, *args):
+    """ Read the scene data of the given read-only validators from the shared validation context and run their analysis in a thread pool.
+        Maya commands aren't thread safe, so the context queries and each fetchSceneData run in the main thread
+        and only the pure Python analyzeSceneData runs in the worker threads.
+        The result is stored in the validator analysisData to be used by its next runValidator call.
+        A failed analysis is ignored here and the validator runs it again by itself.
+    """
+    nodeTypeList = []
+    for validatorInst in validatorInstList:
+        nodeTypeList.extend(validatorInst.snapshotTypeList)
+    context.prefetch(nodeTypeList)
+    sceneDataList = []
+    for validatorInst in validatorInstList:
+        if validatorInst.hasSceneAnalysis():
+            validatorInst.verifyMode = True
+            validatorInst.startIncremental()
+            # the runner progress window shows the validators, not their fetched nodes:
+            verbose, validatorInst.verbose = validatorInst.verbose, False
+            try:
+                sceneDataList.append((validatorInst, validatorInst.fetchSceneData(context)))
+            finally:
+                validatorInst.verbose = verbose
+    if len(sceneDataList) > 1 and maxWorkers > 1:
+        with futures.ThreadPoolExecutor(max_workers=min(maxWorkers, len(sceneDataList))) as executor:
+            futureDic = dict((executor.submit(validatorInst.analyzeSceneData, sceneData), validatorInst) for validatorInst, sceneData in sceneDataList)
+            for future in futures.as_completed(futureDic):
+                try:
+                    futureDic[future].analysisData = future.result()
+                except Exception as e:
+                    print("dpValidatorRunner: "+futureDic[future].guideModuleName+" : "+str(e))
+    else:
+        for validatorInst, sceneData in sceneDataList:
+            try:
+                validatorInst.analysisData = validatorInst.analyzeSceneData(sceneData)
+            except Exception as e:
+                print("dpValidatorRunner: "+validatorInst.guideModuleName+" : "+str(e))
+
+
+def runValidators(validatorInstList, verifyMode, stopIfFoundBlock=False, maxWorkers=MAX_WORKERS, logWriter=None, progress=None, *args):
+    """ Run the active validators in the given order.
+        In verify mode, each sequence of read-only validators shares one validation context and gets its analysis prepared in parallel.
+        A validator that can change the scene ends the sequence, so the next ones read a new context after it runs.
+        Fix mode runs strictly in order without prepared data and each validator reads its own context.
+        The result of each validator is appended to the given log writer as soon as it runs.
+        The given progress shows the running validator and, if the user cancels it, the run stops before the next validator.
+        Returns the validation result dictionary, the stop status and the stopped validator index.
+            The stop status is False if all validators ran, True if it stopped by a blocking issue and CANCELLED if it was cancelled,
+            then the result dictionary has only the validators that ran before the cancel.
+    """
+    validationResultData = {}
+    activeList = [(v, validatorInst) for v, validatorInst in enumerate(validatorInstList) if validatorInst.active]
+    maxProcess = len(validatorInstList)
+    preparedIndex = -1
+    context = None
+    try:
+        for a, (v, validatorInst) in enumerate(activeList):
+            if verifyMode and getattr(validatorInst, "readOnly", False):
+                if a > preparedIndex:
+                    # prepare this validator and the next read-only ones together:
+                    preparedIndex = a
+                    while preparedIndex+1 < len(activeList) and getattr(activeList[preparedIndex+1][1], "readOnly", False):
+                        preparedIndex += 1
+                    context = dpValidationContext.ValidationContext()
+                    prepareValidators([readOnlyInst for i, readOnlyInst in activeList[a:preparedIndex+1]], context, maxWorkers)
+            else:
+                context = None
+            if progress:
+                if progress.isCancelled():
+                    return validationResultData, CANCELLED, v
+                progress.update(a+1, maxProcess, lambda: validatorInst.guideModuleName+': '+repr(a+1))
+            validatorInst.verbose = False
+            # the context is given as a positional argument to keep the add-ons without it working:
+            validationResultData[validatorInst.guideModuleName] = validatorInst.runValidator(verifyMode, None, context)
+            validatorInst.verbose = True
+            if logWriter:
+                logWriter.writeDic(validationResultData[validatorInst.guideModuleName], [validatorInst.guideModuleName])
+            if stopIfFoundBlock:
+                if True in validatorInst.foundIssueList:
+                    if False in validatorInst.resultOkList:
+                        return validationResultData, True, v
+    finally:
+        # don't keep prepared data of not run validators to the next call:
+        for v, validatorInst in activeList:
+            validatorInst.analysisData = None
+    return validationResultData, False, 0
@@ -48,7 +48,9 @@ def dpARLoadingWindow():
     cmds.showWindow('dpARLoadWin')
     cmds.window('dpARLoadWin', edit=True, widthHeight=(285, 203))
 
-dpARLoadingWindow()
+# there's no window to show without interface, like in mayapy:
+if not cmds.about(batch=True):
+    dpARLoadingWindow()
 
 ###################### End: Loading.
 
@@ -69,10 +71,20 @@ try:
     import platform
     from maya import mel
     from functools import partial
+    from .Modules.Library import dpConstants
+    from .Modules.Library import dpSceneIndex
+    from .Modules.Library import dpManifest
     from .Modules.Library import dpUtils
     from .Modules.Library import dpControls
+    from .Modules.Library import dpProfiler
+    from .Modules.Library import dpLogStream
+    from .Modules.Library import dpProgress
     from .Modules import dpBaseClass
     from .Modules import dpLayoutClass
+    from .Validator import dpValidationContext
+    from .Validator import dpValidationCache
+    from .Validator import dpValidatorRunner
+    from .Validator import dpBaseValidatorClass
     from .Extras import dpUpdateRigInfo
     from .Extras import dpReorderAttr
     from .Extras import dpCustomAttr
@@ -82,11 +94,21 @@ try:
     from .Pipeline import dpPackager
     from .Deforms import dpSkinning
     from importlib import reload
+    reload(dpConstants)
+    reload(dpSceneIndex)
+    reload(dpManifest)
     reload(dpUtils)
     reload(dpControls)
+    reload(dpProfiler)
+    reload(dpLogStream)
+    reload(dpProgress)
     reload(dpUpdateRigInfo)
     reload(dpBaseClass)
     reload(dpLayoutClass)
+    reload(dpValidationContext)
+    reload(dpValidationCache)
+    reload(dpValidatorRunner)
+    reload(dpBaseValidatorClass)
     reload(dpPublisher)
     reload(dpPipeliner)
     reload(dpPackager)
@@ -102,18 +124,18 @@ except Exception as e:
         pass
 
 # declaring member variables
-ENGLISH = "English"
+ENGLISH = dpConstants.ENGLISH
 MODULES = "Modules"
 SCRIPTS = "Scripts"
 CONTROLS = "Controls"
 COMBINED = "Controls/Combined"
 CONTROLS_PRESETS = "Controls/Presets"
 EXTRAS = "Extras"
-LANGUAGES = "Languages"
-VALIDATOR = "Validator"
-CHECKIN = "Validator/CheckIn"
-CHECKOUT = "Validator/CheckOut"
-VALIDATOR_PRESETS = "Validator/Presets"
+LANGUAGES = dpConstants.LANGUAGES
+VALIDATOR = dpConstants.VALIDATOR
+CHECKIN = dpConstants.CHECKIN
+CHECKOUT = dpConstants.CHECKOUT
+VALIDATOR_PRESETS = dpConstants.VALIDATOR_PRESETS
 BASE_NAME = "dpAR_"
 EYE = "Eye"
 HEAD = "Head"
@@ -144,9 +166,10 @@ DPAR_WHATSCHANGED = "https://github.com/nilouco/dpAutoRigSystem/commits/master"
 DONATE = "https://www.paypal.com/cgi-bin/webscr?cmd=_donations&business=nilouco%40gmail.com&item_name=Support+dpAutoRigSystem+and+Tutorials+by+Danilo+Pinheiro+%28nilouco%29&currency_code="
 LOCATION_URL = "https://ipinfo.io/json"
 MASTER_ATTR = "masterGrp"
-DPDATA = "dpData"
+DPDATA = dpConstants.DPDATA
 DPSHAPE = "dpShape"
-DPLOG = "dpLog"
+DPSKIN = "dpSkin"
+DPLOG = dpConstants.DPLOG
 
 
 class DP_AutoRig_UI(object):
@@ -157,6 +180,7 @@ class DP_AutoRig_UI(object):
         """ Start the window, menus and main layout for dpAutoRig UI.
         """
         self.dpARVersion = DPAR_VERSION_PY3
+        self.startupTime = time.perf_counter()
         self.loadedPath = False
         self.loadedModules = False
         self.loadedScripts = False
@@ -177,6 +201,7 @@ class DP_AutoRig_UI(object):
         self.userDefAgreeTerms = 1
         self.dpData = DPDATA
         self.dpShape = DPSHAPE
+        self.dpSkin = DPSKIN
         self.dpLog = DPLOG
         self.optionCtrl = None
         self.pipeliner = dpPipeliner.Pipeliner()
@@ -258,6 +283,9 @@ class DP_AutoRig_UI(object):
             # window menu:
             self.allUIs["windowMenu"] = cmds.menu( 'windowMenu', label='Window')
             cmds.menuItem('reloadUI_MI', label='Reload UI', command=self.jobReloadUI)
+            cmds.menuItem('traceCmds_MI', label=self.langDic[ENGLISH]['i300_traceCmds'], checkBox=dpProfiler.isTracing(), command=self.toggleCmdsTracing)
+            cmds.menuItem('devMode_MI', label='Development Mode', checkBox=dpManifest.devMode, command=self.toggleDevMode)
+            cmds.menuItem('compressLog_MI', label='Compress Logs', checkBox=dpLogStream.getCompressMode(), command=self.toggleCompressLog)
             cmds.menuItem('quit_MI', label='Quit', command=self.deleteExistWindow)
             # help menu:
             self.allUIs["helpMenu"] = cmds.menu( 'helpMenu', label='Help', helpMenu=True)
@@ -301,6 +329,10 @@ class DP_AutoRig_UI(object):
         #print self.pDockCtrl
         self.ctrls.startCorrectiveEditMode()
         clearDPARLoadingWindow()
+        # store the UI startup time to compare the manifest module discovery:
+        self.startupTime = time.perf_counter()-self.startupTime
+        if dpUtils.DPAR_PROFILE_MODE:
+            print("dpAutoRigSystem UI startup: %.3f s" % self.startupTime)
         
 
     def deleteExistWindow(self, *args):
@@ -393,6 +425,8 @@ class DP_AutoRig_UI(object):
         # optimize dictionaries
         self.lang = self.langDic[self.langName]
         self.ctrlPreset = self.presetDic[self.presetName]
+        # translate the menu items created before loading the language:
+        cmds.menuItem('traceCmds_MI', edit=True, label=self.lang['i300_traceCmds'])
         
         # initialize some objects here:
         self.ctrls = dpControls.ControlClass(self)
@@ -488,7 +522,7 @@ class DP_AutoRig_UI(object):
                         )
         
         # create the job of selected guide module and when new scene is created:
-        self.iDeleteJobId = cmds.scriptJob(event=('deleteAll', self.jobReloadUI), parent='dpAutoRigWindow', replacePrevious=True, killWithScene=False, compressUndo=False, force=True)
+        self.iDeleteJobId = cmds.scriptJob(event=('deleteAll', partial(self.jobRefreshUI, True)), parent='dpAutoRigWindow', replacePrevious=True, killWithScene=False, compressUndo=False, force=True)
         self.iSelChangeJobId = cmds.scriptJob(event=('SelectionChanged', self.jobSelectedGuide), parent='languageMenu', replacePrevious=True, killWithScene=True, compressUndo=True, force=True)
         
         # --
@@ -551,6 +585,12 @@ class DP_AutoRig_UI(object):
         self.allUIs["skinCopyOneSourceBT"] = cmds.button("skinCopyOneSourceBT", label=self.lang['i290_oneSource'], backgroundColor=(0.4, 0.8, 0.9), command=partial(self.skin.copySkinFromOneSource, None, True), annotation=self.lang['i288_copySkinDesc'], parent=self.allUIs["skinCopy2Layout"])
         self.allUIs["skinCopyMultiSourceBT"] = cmds.button("skinCopyMultiSourceBT", label=self.lang['i146_same']+" "+self.lang['m222_name'], backgroundColor=(0.5, 0.8, 0.9), command=partial(self.skin.copySkinSameName, None, True), annotation=self.lang['i289_sameNameSkinDesc'], parent=self.allUIs["skinCopy2Layout"])
         cmds.radioCollection(self.allUIs["skinSurfAssociationCollection"], edit=True, select=closestPoint)
+        
+        #skinWeights - layout
+        self.allUIs["skinWeightsFL"] = cmds.frameLayout('skinWeightsFL', label=self.lang['i295_skinWeights'], collapsable=True, collapse=False, marginHeight=10, marginWidth=10, parent=self.allUIs["skinLayout"])
+        self.allUIs["skinWeights2Layout"] = cmds.paneLayout("skinWeights2Layout", configuration="vertical2", separatorThickness=2.0, parent=self.allUIs["skinWeightsFL"])
+        self.allUIs["skinExportWeightsBT"] = cmds.button("skinExportWeightsBT", label=self.lang['i164_export'], backgroundColor=(0.4, 0.8, 0.9), command=partial(self.skin.exportSkinWeights, None, None, True), annotation=self.lang['i298_exportSkinDesc'], parent=self.allUIs["skinWeights2Layout"])
+        self.allUIs["skinImportWeightsBT"] = cmds.button("skinImportWeightsBT", label=self.lang['i196_import'], backgroundColor=(0.5, 0.8, 0.9), command=partial(self.skin.importSkinWeights, None, None, True), annotation=self.lang['i299_importSkinDesc'], parent=self.allUIs["skinWeights2Layout"])
         cmds.setParent( self.allUIs["mainTabLayout"] )
         
         # edit formLayout in order to get a good scalable window:
@@ -678,6 +718,7 @@ class DP_AutoRig_UI(object):
         # validatorMainLayout - scrollLayout:
         self.allUIs["validatorMainLayout"] = cmds.scrollLayout("validatorMainLayout", parent=self.allUIs["validatorTabLayout"])
         self.allUIs["validatorLayout"] = cmds.columnLayout("validatorLayout", adjustableColumn=True, rowSpacing=3, parent=self.allUIs["validatorMainLayout"])
+        self.allUIs["incrementalValidatorCB"] = cmds.checkBox("incrementalValidatorCB", label=self.lang['v088_incremental'], annotation=self.lang['v090_incrementalDesc'], value=dpValidationCache.getIncrementalMode(), changeCommand=self.toggleIncrementalValidation, parent=self.allUIs["validatorLayout"])
         self.allUIs["validatorCheckInLayout"] = cmds.frameLayout('validatorCheckInLayout', label=self.lang['i208_checkin'].upper(), collapsable=True, collapse=False, backgroundShade=True, marginHeight=10, marginWidth=10, parent=self.allUIs["validatorLayout"])
         # check-in
         self.validatorCheckInModuleList = self.startGuideModules(CHECKIN, "start", "validatorCheckInLayout")
@@ -726,13 +767,52 @@ class DP_AutoRig_UI(object):
         cmds.select(clear=True)
 
 
+    def toggleCmdsTracing(self, *args):
+        """ Start or stop to trace the maya.cmds calls of all dpAutoRigSystem modules.
+            When it stops, the report sorted by cost is printed and saved in the dpLog folder if the scene is saved.
+        """
+        tracing = dpProfiler.toggleTracing(self.dpData+"/"+self.dpLog)
+        if cmds.menuItem('traceCmds_MI', exists=True):
+            cmds.menuItem('traceCmds_MI', edit=True, checkBox=tracing)
+    
+    
+    def toggleDevMode(self, value=None, *args):
+        """ Turn on or off the development mode that always reloads the guide modules.
+            In production mode the imported modules are reused and only reloaded if their file changed.
+        """
+        if value is None:
+            value = not dpManifest.devMode
+        devMode = dpManifest.setDevMode(value)
+        if cmds.menuItem('devMode_MI', exists=True):
+            cmds.menuItem('devMode_MI', edit=True, checkBox=devMode)
+        print("dpAutoRigSystem development mode: "+str(devMode))
+    
+    
+    def toggleCompressLog(self, value=None, *args):
+        """ Turn on or off the gzip compression of the new log files.
+        """
+        if value is None:
+            value = not dpLogStream.getCompressMode()
+        compress = dpLogStream.setCompressMode(value)
+        if cmds.menuItem('compressLog_MI', exists=True):
+            cmds.menuItem('compressLog_MI', edit=True, checkBox=compress)
+    
+    
     def jobReloadUI(self, *args):
-        """ This scriptJob active when we got one new scene in order to reload the UI.
+        """ Re-create the whole UI, used when the language or presets change.
         """
         from maya import cmds
         cmds.select(clear=True)
         cmds.evalDeferred("import sys; sys.modules['dpAutoRigSystem.dpAutoRig'].DP_AutoRig_UI()", lowestPriority=True)
         self.checkImportedGuides()
+    
+    
+    def jobRefreshUI(self, sceneChanged=False, *args):
+        """ This scriptJob active when we got one new scene in order to refresh the created guide modules in the UI.
+        """
+        cmds.select(clear=True)
+        cmds.evalDeferred(partial(self.refreshGuideModules, sceneChanged), lowestPriority=True)
+        self.checkImportedGuides()
   
     
     def jobWinClose(self, *args):
@@ -773,7 +853,7 @@ class DP_AutoRig_UI(object):
                     else:
                         selectedGuideNodeList.append(selectedItem)
             if needUpdateSelect:
-                self.jobReloadUI()
+                self.jobRefreshUI()
                 cmds.select(updatedGuideNodeList)
 
         # re-create module layout:
@@ -1187,9 +1267,11 @@ class DP_AutoRig_UI(object):
             # change guide module list for alphabetic order:
             guideModuleList.sort()
             if action == "start":
+                # read the guide buttons data from the module manifest without importing them:
+                entryList = dpManifest.moduleManifest.getEntryList(path, guideDir, guideModuleList)
                 # create guide buttons:
-                for guideModule in guideModuleList:
-                    self.createGuideButton(guideModule, guideDir, layout, path)
+                for entryDic in entryList:
+                    self.createGuideButton(entryDic["module"], guideDir, layout, path, entryDic)
             elif action == "check":
                 notFoundModuleList = []
                 # verify the list if exists all elements in the folder:
@@ -1228,39 +1310,44 @@ class DP_AutoRig_UI(object):
         return guideModuleList
     
     
-    def createGuideButton(self, guideModule, guideDir, layout, path=None):
+    def createGuideButton(self, guideModule, guideDir, layout, path=None, entryDic=None):
         """ Create a guideButton for guideModule in the respective colMiddleLeftA guidesLayout.
+            Modules, scripts and extras use the manifest entry data and are only imported when the button is pressed.
+            Controls and validators are imported here because the UI uses their instances.
         """
         # especific import command for guides storing theses guides modules in a variable:
         #guide = __import__("dpAutoRigSystem."+guideDir+"."+guideModule, {}, {}, [guideModule])
         basePath = dpUtils.findEnv("PYTHONPATH", "dpAutoRigSystem")
-
-        # Sandbox the module import process so a single guide cannot crash the whole Autorig.
-        # https://github.com/SqueezeStudioAnimation/dpAutoRigSystem/issues/28
-        try:
-            if guideDir:
-                guideDir = guideDir.replace("/", ".")
-                guide = __import__(basePath+"."+guideDir+"."+guideModule, {}, {}, [guideModule])
-                reload(guide)
-            else:
-                sys.path.append(path)
-                guide = __import__(guideModule, {}, {}, [guideModule])
-                reload(guide)
-        except Exception as e:
-            errorString = self.lang['e017_loadingExtension']+" "+guideModule+" : "+str(e.args)
-            mel.eval('warning \"'+errorString+'\";')
-            return
+        if guideDir:
+            guideDir = guideDir.replace("/", ".")
+        elif not path in sys.path:
+            sys.path.append(path)
+        
+        guideInfoDic = entryDic
+        if not entryDic or not all(key in entryDic for key in dpManifest.MANIFEST_KEY_LIST) or not guideDir in [MODULES, SCRIPTS, EXTRAS]:
+            # Sandbox the module import process so a single guide cannot crash the whole Autorig.
+            # https://github.com/SqueezeStudioAnimation/dpAutoRigSystem/issues/28
+            try:
+                if guideDir:
+                    guide = dpManifest.importModule(basePath+"."+guideDir+"."+guideModule)
+                else:
+                    guide = dpManifest.importModule(guideModule)
+            except Exception as e:
+                errorString = self.lang['e017_loadingExtension']+" "+guideModule+" : "+str(e.args)
+                mel.eval('warning \"'+errorString+'\";')
+                return
+            guideInfoDic = {"CLASS_NAME" : guide.CLASS_NAME, "TITLE" : guide.TITLE, "DESCRIPTION" : guide.DESCRIPTION, "ICON" : guide.ICON}
 
         # getting data from guide module:
-        title = self.lang[guide.TITLE]
-        description = self.lang[guide.DESCRIPTION]
-        icon = guide.ICON
+        title = self.lang[guideInfoDic["TITLE"]]
+        description = self.lang[guideInfoDic["DESCRIPTION"]]
+        icon = guideInfoDic["ICON"]
         if guideDir:
             # find path where 'dpAutoRig.py' is been executed to get the icon:
             path = dpUtils.findPath("dpAutoRig.py")
         iconDir = path+icon
         iconInfo = dpUtils.findPath("dpAutoRig.py")+"/Icons/"+INFO_ICON
-        guideName = guide.CLASS_NAME
+        guideName = guideInfoDic["CLASS_NAME"]
         
         # creating a basic layout for guide buttons:
         if guideDir == CONTROLS or guideDir == COMBINED.replace("/", "."):
@@ -1299,7 +1386,7 @@ class DP_AutoRig_UI(object):
                     if validatorInstance.customName:
                         cmds.checkBox(validatorCB, edit=True, label=validatorInstance.customName)
 
-            cmds.iconTextButton(image=iconInfo, height=30, width=17, style='iconOnly', command=partial(self.info, guide.TITLE, guide.DESCRIPTION, None, 'center', 305, 250), parent=moduleLayout)
+            cmds.iconTextButton(image=iconInfo, height=30, width=17, style='iconOnly', command=partial(self.info, guideInfoDic["TITLE"], guideInfoDic["DESCRIPTION"], None, 'center', 305, 250), parent=moduleLayout)
         cmds.setParent('..')
     
     
@@ -1323,8 +1410,7 @@ class DP_AutoRig_UI(object):
         userSpecName = BASE_NAME + str(newSuffix)
         # especific import command for guides storing theses guides modules in a variable:
         basePath = dpUtils.findEnv("PYTHONPATH", "dpAutoRigSystem")
-        self.guide = __import__(basePath+"."+guideDir+"."+guideModule, {}, {}, [guideModule])
-        reload(self.guide)
+        self.guide = dpManifest.importModule(basePath+"."+guideDir+"."+guideModule)
         # get the CLASS_NAME from guideModule:
         guideClass = getattr(self.guide, self.guide.CLASS_NAME)
         # initialize this guideModule as an guide Instance:
@@ -1344,10 +1430,9 @@ class DP_AutoRig_UI(object):
         if guideDir:
             # especific import command for guides storing theses guides modules in a variable:
             basePath = dpUtils.findEnv("PYTHONPATH", "dpAutoRigSystem")
-            self.guide = __import__(basePath+"."+guideDir+"."+guideModule, {}, {}, [guideModule])
+            self.guide = dpManifest.importModule(basePath+"."+guideDir.replace("/", ".")+"."+guideModule)
         else:
-            self.guide = __import__(guideModule, {}, {}, [guideModule])
-        reload(self.guide)
+            self.guide = dpManifest.importModule(guideModule)
         # get the CLASS_NAME from extraModule:
         guideClass = getattr(self.guide, self.guide.CLASS_NAME)
         # initialize this extraModule as an Instance:
@@ -1360,12 +1445,12 @@ class DP_AutoRig_UI(object):
             Returns the guide instance initialised.
         """
         # especific import command for guides storing theses guides modules in a variable:
-        self.guide = __import__(guideModule, {}, {}, [guideModule])
-        reload(self.guide)
+        self.guide = dpManifest.importModule(guideModule)
         # get the CLASS_NAME from extraModule:
         guideClass = getattr(self.guide, self.guide.CLASS_NAME)
         # initialize this extraModule as an Instance:
         guideInstance = guideClass(self)
+        guideInstance.incremental = dpValidationCache.getIncrementalMode()
         return guideInstance
     
     
@@ -1380,20 +1465,18 @@ class DP_AutoRig_UI(object):
         """
         # import this scripted module:
         basePath = dpUtils.findEnv("PYTHONPATH", "dpAutoRigSystem")
-        guide = __import__(basePath+"."+guideDir+"."+guideModule, {}, {}, [guideModule])
-        reload(guide)
+        guide = dpManifest.importModule(basePath+"."+guideDir+"."+guideModule)
         # get the CLASS_NAME from guideModule:
         startScriptFunction = getattr(guide, guide.CLASS_NAME)
         # execute this scriptedGuideModule:
         startScriptFunction(self)
     
     
-    def populateCreatedGuideModules(self, *args):
-        """ Read all guide modules loaded in the scene and re-create the elements in the moduleLayout.
+    def getSceneGuideList(self, *args):
+        """ Find the created guide modules in the scene by their namespaces.
+            Returns a list with the module name, userSpecName and guide base name of each guide found.
         """
-        # create a new list in order to store all created guide modules in the scene and its userSpecNames:
-        self.allGuidesList = []
-        self.moduleInstancesList = []
+        sceneGuideList = []
         # list all namespaces:
         cmds.namespace(setNamespace=":")
         namespaceList = cmds.namespaceInfo(listOnlyNamespaces=True)
@@ -1416,42 +1499,109 @@ class DP_AutoRig_UI(object):
                     # check if there is this module guide base in the scene:
                     curGuideName = validModuleNames[index]+"__"+userSpecName+":"+GUIDE_BASE_NAME
                     if cmds.objExists(curGuideName):
-                        self.allGuidesList.append([validModules[index], userSpecName, curGuideName])
-                        
+                        sceneGuideList.append([validModules[index], userSpecName, curGuideName])
+        return sceneGuideList
+    
+    
+    def createModuleInstance(self, module, *args):
+        """ Re-create the guide module instance of a guide found in the scene and its module layout.
+            Returns the module instance.
+        """
+        guideFolder = dpUtils.findEnv("PYTHONPATH", "dpAutoRigSystem")+"."+MODULES
+        mod = dpManifest.importModule(guideFolder+"."+module[0])
+        # identify the guide modules and add to the moduleInstancesList:
+        moduleClass = getattr(mod, mod.CLASS_NAME)
+        dpUIinst = self
+        if cmds.attributeQuery("rigType", node=module[2], ex=True):
+            curRigType = cmds.getAttr(module[2] + ".rigType")
+            moduleInst = moduleClass(dpUIinst, module[1], curRigType)
+        else:
+            if cmds.attributeQuery("Style", node=module[2], ex=True):
+                iStyle = cmds.getAttr(module[2] + ".Style")
+                if (iStyle == 0 or iStyle == 1):
+                    moduleInst = moduleClass(dpUIinst, module[1], dpBaseClass.RigType.biped)
+                else:
+                    moduleInst = moduleClass(dpUIinst, module[1], dpBaseClass.RigType.quadruped)
+            else:
+                moduleInst = moduleClass(dpUIinst, module[1], dpBaseClass.RigType.default)
+        # reload pinGuide scriptJob:
+        self.ctrls.startPinGuide(module[2])
+        return moduleInst
+    
+    
+    def populateCreatedGuideModules(self, *args):
+        """ Read all guide modules loaded in the scene and re-create the elements in the moduleLayout.
+        """
+        startTime = time.perf_counter()
+        startReloadCount = dpManifest.reloadCount
+        # create a new list in order to store all created guide modules in the scene and its userSpecNames:
+        self.moduleInstancesList = []
+        self.allGuidesList = self.getSceneGuideList()
+        
         # if exists any guide module in the scene, recreate its instance as objectClass:
         if self.allGuidesList:
             # clear current layout before reload modules:
             cmds.deleteUI(self.allUIs["modulesLayoutA"])
             self.allUIs["modulesLayoutA"] = cmds.columnLayout("modulesLayoutA", adjustableColumn=True, width=200, parent=self.allUIs["colMiddleRightA"])
-            # load again the modules:
-            guideFolder = dpUtils.findEnv("PYTHONPATH", "dpAutoRigSystem")+"."+MODULES
-            # this list will be used to rig all modules pressing the RIG button:
+            # load again the modules, this list will be used to rig all modules pressing the RIG button:
             for module in self.allGuidesList:
-                mod = __import__(guideFolder+"."+module[0], {}, {}, [module[0]])
-                reload(mod)
-                # identify the guide modules and add to the moduleInstancesList:
-                moduleClass = getattr(mod, mod.CLASS_NAME)
-                dpUIinst = self
-                if cmds.attributeQuery("rigType", node=module[2], ex=True):
-                    curRigType = cmds.getAttr(module[2] + ".rigType")
-                    moduleInst = moduleClass(dpUIinst, module[1], curRigType)
-                else:
-                    if cmds.attributeQuery("Style", node=module[2], ex=True):
-                        iStyle = cmds.getAttr(module[2] + ".Style")
-                        if (iStyle == 0 or iStyle == 1):
-                            moduleInst = moduleClass(dpUIinst, module[1], dpBaseClass.RigType.biped)
-                        else:
-                            moduleInst = moduleClass(dpUIinst, module[1], dpBaseClass.RigType.quadruped)
-                    else:
-                        moduleInst = moduleClass(dpUIinst, module[1], dpBaseClass.RigType.default)
-                self.moduleInstancesList.append(moduleInst)
-                # reload pinGuide scriptJob:
-                self.ctrls.startPinGuide(module[2])
-        # edit the footer A text:
+                self.moduleInstancesList.append(self.createModuleInstance(module))
+        self.updateModulesFooter(startTime, startReloadCount)
+    
+    
+    def refreshGuideModules(self, sceneChanged=False, *args):
+        """ Update the created module layouts comparing the guides in the scene with the moduleInstancesList.
+            Only the layouts of the removed or new guides are deleted or created instead of re-creating the whole UI.
+            The module instances of a changed scene are all re-created because their guides come from another file.
+        """
+        if not cmds.window('dpAutoRigWindow', exists=True) or not cmds.columnLayout(self.allUIs["modulesLayoutA"], exists=True):
+            self.jobReloadUI()
+            return
+        startTime = time.perf_counter()
+        startReloadCount = dpManifest.reloadCount
+        self.allGuidesList = self.getSceneGuideList()
+        sceneGuideDic = dict((module[2], module) for module in self.allGuidesList)
+        # remove the module layouts of the guides that aren't in the scene anymore:
+        keptGuideList = []
+        for moduleInstance in list(self.moduleInstancesList):
+            if not sceneChanged and moduleInstance.moduleGrp in sceneGuideDic and cmds.getAttr(moduleInstance.moduleGrp+"."+MODULE_INSTANCE_INFO_ATTR) == str(moduleInstance):
+                keptGuideList.append(moduleInstance.moduleGrp)
+            else:
+                if cmds.frameLayout(moduleInstance.moduleFrameLayout, exists=True):
+                    cmds.deleteUI(moduleInstance.moduleFrameLayout)
+                self.moduleInstancesList.remove(moduleInstance)
+        if len(keptGuideList) < len(sceneGuideDic) or sceneChanged:
+            # clear the edit selected module layout:
+            try:
+                cmds.frameLayout('editSelectedModuleLayoutA', edit=True, label=self.lang['i011_editSelected']+" "+self.lang['i143_module'])
+                cmds.deleteUI("selectedModuleColumn")
+            except:
+                pass
+        # create the module instances of the new guides:
+        for module in self.allGuidesList:
+            if not module[2] in keptGuideList:
+                self.moduleInstancesList.append(self.createModuleInstance(module))
+        if sceneChanged:
+            # the selection job was killed with the scene:
+            self.iSelChangeJobId = cmds.scriptJob(event=('SelectionChanged', self.jobSelectedGuide), parent='languageMenu', replacePrevious=True, killWithScene=True, compressUndo=True, force=True)
+            # populate the joint and geometries lists of the new scene:
+            self.populateJoints()
+            self.reloadPopulatedGeoms()
+        self.updateModulesFooter(startTime, startReloadCount)
+    
+    
+    def updateModulesFooter(self, startTime=None, startReloadCount=0, *args):
+        """ Edit the footer A text with the number of modules to be rigged and log the guide modules populate time.
+        """
         self.modulesToBeRiggedList = dpUtils.getModulesToBeRigged(self.moduleInstancesList)
         cmds.text(self.allUIs["footerAText"], edit=True, label=str(len(self.modulesToBeRiggedList)) +" "+ self.lang['i005_footerA'])
+        # log the populate time:
+        if startTime:
+            self.populateTime = time.perf_counter()-startTime
+            if dpUtils.DPAR_PROFILE_MODE or dpManifest.devMode:
+                print("dpAutoRigSystem populate guides: %i guides, %i reloaded modules, %.3f s" % (len(self.allGuidesList), dpManifest.reloadCount-startReloadCount, self.populateTime))
+    
     
-
     def checkImportedGuides(self, askUser=True, *args):
         """ This method will check if there's imported dpGuides in the scene and ask if the user wants to delete the namespace.
             Use a recursive method to remove imported of imported guides.
@@ -1542,6 +1692,17 @@ class DP_AutoRig_UI(object):
                         validatorModule.changeActive(self.validatorPresetDic[self.validatorPresetName][validatorModule.guideModuleName])
 
 
+    def toggleIncrementalValidation(self, value, *args):
+        """ Set the incremental verify mode of all validator instances and store it in the user optionVar.
+            In incremental mode, the validators skip the nodes not changed since their last verify.
+        """
+        value = dpValidationCache.setIncrementalMode(value)
+        for validatorInstList in [self.checkInInstanceList, self.checkOutInstanceList, self.checkAddOnsInstanceList]:
+            if validatorInstList:
+                for validatorInst in validatorInstList:
+                    validatorInst.incremental = value
+
+
     def changeActiveAllValidators(self, validatorInstList, value, *args):
         """ Set all validator instances active attribute as True or False.
         """
@@ -1554,51 +1715,65 @@ class DP_AutoRig_UI(object):
         """ Run the code for each active validator instance.
             verifyMode = True for verify
                        = False for fix
+            The read-only validators share a scene snapshot in verify mode and the fix mode runs strictly in order.
+            The results are streamed to the daily log archive of the scene as each validator runs.
+            Cancelling the progress window stops the run before the next validator, logs it as cancelled and returns the dpValidatorRunner.CANCELLED status.
         """
         validationResultData = {}
-        logText = ""
+        logTextList = []
         if publishLog:
-            logText = "\nPublisher"
-            logText += "\nScene: "+publishLog["scene"]
-            logText += "\nPublished: "+publishLog["published"]
-            logText += "\nExported: "+publishLog["exportPath"]
-            logText += "\nComments: "+publishLog["comments"]+"\n"
-        if validatorInstList:
-            progressAmount = 0
-            maxProcess = len(validatorInstList)
-            cmds.progressWindow(title="dpValidator", progress=progressAmount, status='dpValidator: 0%', isInterruptable=False)
-            for v, validatorInst in enumerate(validatorInstList):
-                if validatorInst.active:
-                    progressAmount += 1
-                    cmds.progressWindow(edit=True, maxValue=maxProcess, progress=progressAmount, status=(validatorInst.guideModuleName+': '+repr(progressAmount)))
-                    validatorInst.verbose = False
-                    validationResultData[validatorInst.guideModuleName] = validatorInst.runValidator(verifyMode)
-                    validatorInst.verbose = True
-                    if stopIfFoundBlock:
-                        if True in validatorInst.foundIssueList:
-                            if False in validatorInst.resultOkList:
-                                return validationResultData, True, v
-        if validationResultData:
-            dataList = list(validationResultData.keys())
-            dataList.sort()
-            for i, dataItem in enumerate(dataList):
-                logText += validationResultData[dataItem]["logText"]
-                if i != len(dataList)-1:
-                    logText += "\n"
-            heightSize = len(dataList)
-        else:
-            logText += "\n"+self.lang['i207_notMarked']
-            heightSize = 2
-        thisTime = str(time.asctime(time.localtime(time.time())))
-        logText = thisTime+"\n"+logText
+            logTextList.append("\nPublisher")
+            logTextList.append("\nScene: "+publishLog["scene"])
+            logTextList.append("\nPublished: "+publishLog["published"])
+            logTextList.append("\nExported: "+publishLog["exportPath"])
+            logTextList.append("\nComments: "+publishLog["comments"]+"\n")
+        # stream the results to the log archive while the validators run:
+        logStore = None
+        logWriter = None
         if verbose:
-            self.info('i019_log', 'v000_validator', logText, "left", 250, (150+(heightSize)*13))
-            print("\n-------------\n"+self.lang['v000_validator']+"\n"+logText)
-            if publishLog:
-                validationResultData["Publisher"] = publishLog
-            if not dpUtils.exportLogDicToJson(validationResultData, subFolder=self.dpData+"/"+self.dpLog):
-                print(self.lang['i201_saveScene'])
-        cmds.progressWindow(endProgress=True)
+            logStore = dpLogStream.getLogStore(self.dpData+"/"+self.dpLog)
+            if logStore:
+                logWriter = logStore.startLog()
+                print("\nLog file", logWriter.pathFile)
+                if publishLog:
+                    logWriter.writeDic(publishLog, ["Publisher"])
+        progress = dpProgress.Progress("dpValidator", len(validatorInstList or []), 'dpValidator: 0%', interruptable=True)
+        try:
+            if validatorInstList:
+                progress.start()
+                validationResultData, stopStatus, stoppedIndex = dpValidatorRunner.runValidators(validatorInstList, verifyMode, stopIfFoundBlock, logWriter=logWriter, progress=progress)
+                if stopStatus == dpValidatorRunner.CANCELLED:
+                    cancelledLog = {"status" : dpValidatorRunner.CANCELLED, "stoppedValidator" : validatorInstList[stoppedIndex].guideModuleName, "ranValidators" : sorted(validationResultData)}
+                    if logWriter:
+                        logWriter.writeDic(cancelledLog, ["Cancelled"])
+                    if verbose:
+                        print("\n-------------\n"+self.lang['v000_validator']+"\n"+self.lang['i038_canceled']+" "+cancelledLog["stoppedValidator"])
+                    return validationResultData, dpValidatorRunner.CANCELLED, stoppedIndex
+                if stopStatus:
+                    return validationResultData, True, stoppedIndex
+            if validationResultData:
+                dataList = list(validationResultData.keys())
+                dataList.sort()
+                logTextList.append("\n".join(validationResultData[dataItem]["logText"] for dataItem in dataList))
+                heightSize = len(dataList)
+            else:
+                logTextList.append("\n"+self.lang['i207_notMarked'])
+                heightSize = 2
+            thisTime = str(time.asctime(time.localtime(time.time())))
+            logText = thisTime+"\n"+"".join(logTextList)
+            if verbose:
+                self.info('i019_log', 'v000_validator', logText, "left", 250, (150+(heightSize)*13))
+                print("\n-------------\n"+self.lang['v000_validator']+"\n"+logText)
+                if publishLog:
+                    validationResultData["Publisher"] = publishLog
+                if not logWriter:
+                    print(self.lang['i201_saveScene'])
+        finally:
+            if logWriter:
+                logWriter.close()
+                logStore.indexLog(logWriter, validationResultData)
+                logStore.runMaintenance()
+            progress.end()
         return validationResultData, False, 0
 
 
@@ -2249,13 +2424,25 @@ class DP_AutoRig_UI(object):
     
     
     def rigAll(self, integrate=None, *args):
+        """ Create the RIG based in the Guide Modules in the scene.
+            It always stops the build profiler, so the cmds functions are restored even if the rigging fails.
+        """
+        # the build profiler only records if DPAR_PROFILE_MODE is True:
+        self.buildProfiler = dpProfiler.BuildProfiler(self, dpUtils.DPAR_PROFILE_MODE)
+        try:
+            self.rigAllModules(integrate)
+        finally:
+            self.buildProfiler.stop()
+    
+    
+    def rigAllModules(self, integrate=None, *args):
         """ Create the RIG based in the Guide Modules in the scene.
             Most important function to automate the process.
         """
         print('\ndpAutoRigSystem Log: ' + self.lang['i178_startRigging'] + '...\n')
         # force refresh in order to avoid calculus error is creating Rig at the same time of guides:
         cmds.refresh()
-        self.jobReloadUI()
+        self.jobRefreshUI()
         
         # get a list of modules to be rigged and re-declare the riggedModuleDic to store for log in the end:
         self.modulesToBeRiggedList = dpUtils.getModulesToBeRigged(self.moduleInstancesList)
@@ -2283,24 +2470,31 @@ class DP_AutoRig_UI(object):
                     else:
                         break
             
+            # start the build profiler:
+            self.buildProfiler.start("rigAll")
+            
             # force unPin all Guides:
             self.unPinAllGuides()
             
             # Starting progress window
             rigProgressAmount = 0
-            cmds.progressWindow(title='dpAutoRigSystem', progress=rigProgressAmount, status='Rigging : 0%', isInterruptable=False)
             maxProcess = len(self.modulesToBeRiggedList)
+            rigProgress = dpProgress.Progress('dpAutoRigSystem', maxProcess, 'Rigging : 0%')
+            rigProgress.start()
             
             # clear all duplicated names in order to run without find same names if they exists:
             if cmds.objExists(self.guideMirrorGrp):
                 cmds.delete(self.guideMirrorGrp)
             
             # regenerate mirror information for all guides:
+            self.buildProfiler.startPhase("hook")
             for guideModule in self.modulesToBeRiggedList:
                 guideModule.checkFatherMirror()
             
             # store hierarchy from guides:
-            self.hookDic = dpUtils.hook()
+            self.sceneIndex = dpSceneIndex.SceneIndex(verbose=dpUtils.DPAR_PROFILE_MODE)
+            self.hookDic = dpUtils.hook(self.sceneIndex)
+            self.buildProfiler.endPhase()
             
             # get prefix:
             self.prefix = cmds.textField("prefixTextField", query=True, text=True)
@@ -2320,7 +2514,9 @@ class DP_AutoRig_UI(object):
                 pass
 
             if integrate == 1:
+                self.buildProfiler.startPhase("createBaseRigNode")
                 self.createBaseRigNode()
+                self.buildProfiler.endPhase()
             # run RIG function for each guideModule:
             for guideModule in self.modulesToBeRiggedList:
                 # create the rig for this guideModule:
@@ -2328,10 +2524,12 @@ class DP_AutoRig_UI(object):
                 
                 # Update progress window
                 rigProgressAmount += 1
-                cmds.progressWindow(edit=True, maxValue=maxProcess, progress=rigProgressAmount, status=('Rigging : ' + repr(rigProgressAmount) + ' '+str(guideModuleCustomName)))
+                rigProgress.update(rigProgressAmount, maxProcess, 'Rigging : ' + repr(rigProgressAmount) + ' '+str(guideModuleCustomName))
                 
                 # Rig it :)
+                self.buildProfiler.startPhase("rigModule", guideModule.moduleGrp)
                 guideModule.rigModule()
+                self.buildProfiler.endPhase()
                 # get rigged module name:
                 self.riggedModuleDic[guideModule.moduleGrp.split(":")[0]] = guideModuleCustomName
                 # get integrated information:
@@ -2340,6 +2538,7 @@ class DP_AutoRig_UI(object):
             
             #Colorize all controller in yellow as a base
             if bColorize:
+                self.buildProfiler.startPhase("colorize")
                 aBCtrl = [self.globalCtrl, self.rootCtrl, self.optionCtrl]
                 aAllCtrls = cmds.ls("*_Ctrl")
                 lPattern = re.compile(self.lang['p002_left'] + '_.*._Ctrl')
@@ -2356,14 +2555,17 @@ class DP_AutoRig_UI(object):
                                 self.ctrls.colorShape([pCtrl], "black")
                             else:
                                 self.ctrls.colorShape([pCtrl], "yellow")
+                self.buildProfiler.endPhase()
             
             if integrate == 1:
+                self.buildProfiler.startPhase("integration")
                 # Update progress window
                 rigProgressAmount += 1
-                cmds.progressWindow(edit=True, maxValue=maxProcess, progress=rigProgressAmount, status=('Rigging : ' + repr(rigProgressAmount) + ' '+self.lang['i010_integrateCB']))
+                rigProgress.update(rigProgressAmount, maxProcess, 'Rigging : ' + repr(rigProgressAmount) + ' '+self.lang['i010_integrateCB'])
                 
                 # get all parent info from rigged modules:
-                self.originedFromDic = dpUtils.getOriginedFromDic()
+                self.sceneIndex.invalidate()
+                self.originedFromDic = dpUtils.getOriginedFromDic(self.sceneIndex)
                 
                 # verify if is necessary organize the hierarchies for each module:
                 for guideModule in self.modulesToBeRiggedList:
@@ -3011,19 +3213,17 @@ class DP_AutoRig_UI(object):
                                 self.customAttr.removeAttr("dpControl", [worldRef])
 
                 # atualise the number of rigged guides by type
+                self.sceneIndex.invalidate()
+                dpARTypeList = ['dp'+dpARType for dpARType in self.sceneIndex.getValueDic('dpAR_type').values()]
                 for guideType in self.guideModuleList:
-                    typeCounter = 0
-                    newTranformList = cmds.ls(selection=False, type="transform")
-                    for transf in newTranformList:
-                        if cmds.objExists(transf+'.dpAR_type'):
-                            dpARType = ( 'dp'+(cmds.getAttr(transf+'.dpAR_type')) )
-                            if ( dpARType == guideType ):
-                                typeCounter = typeCounter + 1
+                    typeCounter = dpARTypeList.count(guideType)
                     if ( typeCounter != cmds.getAttr(self.masterGrp+'.'+guideType+'Count') ):
                         cmds.setAttr(self.masterGrp+'.'+guideType+'Count', typeCounter)
+                self.buildProfiler.endPhase()
         
             # Close progress window
-            cmds.progressWindow(endProgress=True)
+            rigProgress.end()
+            self.buildProfiler.startPhase("finishing")
         
             #Actualise all controls (All_Grp.controlList) for this rig:
             dpUpdateRigInfo.UpdateRigInfo.updateRigInfoLists()
@@ -3120,6 +3320,10 @@ class DP_AutoRig_UI(object):
                     print("\n\n")
                     print(self.bugMessage)
                     cmds.confirmDialog(title=self.lang['i078_detectedBug'], message=self.bugMessage, button=["OK"])
+            
+            # stop the build profiler and export its report to the dpLog folder:
+            self.buildProfiler.stop()
+            self.buildProfiler.exportReport()
 
         # re-declaring guideMirror and previewMirror groups:
         if cmds.objExists(self.guideMirrorGrp):